@@ -0,0 +1,138 @@
+from bluesky import plan_stubs as bps
+from bluesky.utils import MsgGenerator
+from dodal.devices.detector import DetectorParams, TriggerMode
+from dodal.devices.eiger import EigerDetector
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import record_detector_arming
+from mx_bluesky.common.utils.virtual_clock import monotonic
+
+# The parameters that are sent to the detector and file writer when arming, so the
+# detector must be armed again if they change
+ARMING_FIELDS = (
+    "expected_energy_ev",
+    "exposure_time_s",
+    "directory",
+    "full_filename",
+    "detector_distance",
+    "omega_start",
+    "omega_increment",
+    "num_images_per_trigger",
+    "num_triggers",
+    "use_roi_mode",
+    "det_dist_to_beam_converter_path",
+    "trigger_mode",
+    "enable_dev_shm",
+)
+# The arming parameters that are only sent to the detector when it is to take a set
+# number of frames
+SET_FRAMES_ONLY_FIELDS = ("num_triggers",)
+
+
+def _arming_changes(armed: DetectorParams, final: DetectorParams) -> list[str]:
+    """The arming parameters that differ between those the detector was armed with and
+    the final ones. Parameters that are not yet known in the final ones, e.g. an energy
+    to be filled in from the DCM, keep what the detector was armed with, and parameters
+    that are not sent for the final trigger mode are ignored."""
+    return [
+        field
+        for field in ARMING_FIELDS
+        if getattr(final, field) is not None
+        and getattr(final, field) != getattr(armed, field)
+        and (
+            final.trigger_mode == TriggerMode.SET_FRAMES
+            or field not in SET_FRAMES_ONLY_FIELDS
+        )
+    ]
+
+
+class DetectorArming:
+    """Keeps track of the detector being armed in the background while a sample is
+    centred, so that the arming time is hidden behind pin-tip centring and grid
+    detection.
+
+    Arming is started with the parameters known once the sample is loaded. When the
+    parameters for the collection are finalised, the detector is stopped and armed
+    again if any that it was armed with have changed. When the collection waits for
+    arming, the time arming took that was hidden behind the preparation is reported.
+    """
+
+    def __init__(self):
+        self._armed_with: DetectorParams | None = None
+        self._started_s: float | None = None
+        self._finished_s: float | None = None
+        self.rearms = 0
+
+    def start(self, eiger: EigerDetector, group: str) -> MsgGenerator:
+        """Start arming the detector with its current parameters."""
+        self._armed_with = eiger.detector_params
+        self._started_s = monotonic()
+        self._finished_s = None
+        status = yield from bps.abs_set(eiger.do_arm, 1, group=group)  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
+        if status is not None:
+            started_s = self._started_s
+            status.add_callback(lambda _: self._record_finished(started_s))
+
+    def _record_finished(self, started_s: float):
+        if started_s == self._started_s:
+            self._finished_s = monotonic()
+
+    def finalise(
+        self, eiger: EigerDetector, detector_params: DetectorParams, group: str
+    ) -> MsgGenerator:
+        """Set the final parameters for the collection, arming the detector again if it
+        is being armed with parameters that have since changed.
+
+        Args:
+            eiger: The detector
+            detector_params: The final parameters for the collection
+            group: The group the detector is being armed in
+        """
+        armed_with = self._armed_with
+        eiger.set_detector_parameters(detector_params)
+        if armed_with is None:
+            return
+        changes = _arming_changes(armed_with, detector_params)
+        if not changes:
+            return
+        LOGGER.warning(f"Arming the detector again as {', '.join(changes)} changed")
+        self.rearms += 1
+        # Stopping the detector while it is arming blocks until arming is finished, so
+        # wait for that without blocking the RunEngine
+        yield from bps.wait(group)
+        yield from bps.stop(eiger)  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
+        yield from self.start(eiger, group)
+
+    def wait_until_armed(self, group: str) -> MsgGenerator:
+        """Wait for the group the detector is being armed in, then report how long
+        arming took that was hidden behind whatever was done since it started."""
+        needed_s = monotonic()
+        yield from bps.wait(group)
+        if self._started_s is None:
+            return
+        ready_s = monotonic()
+        finished_s = self._finished_s if self._finished_s is not None else ready_s
+        hidden_s = max(0.0, min(finished_s, needed_s) - self._started_s)
+        waited_s = max(0.0, finished_s - needed_s)
+        LOGGER.info(
+            f"Detector arming took {finished_s - self._started_s:.3f}s, "
+            f"{hidden_s:.3f}s hidden by preparation, {waited_s:.3f}s waited for, "
+            f"armed {self.rearms + 1} time(s)"
+        )
+        record_detector_arming(hidden_s, waited_s)
+        self.forget()
+
+    def forget(self):
+        """Stop keeping track of the arming, e.g. once the collection is over."""
+        self._armed_with = None
+        self._started_s = None
+        self._finished_s = None
+        self.rearms = 0
+
+
+_detector_arming = DetectorArming()
+
+
+def get_detector_arming() -> DetectorArming:
+    """Get the detector arming manager for this instance."""
+    return _detector_arming
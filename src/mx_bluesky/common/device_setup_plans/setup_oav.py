@@ -1,6 +1,7 @@
-from functools import partial
+from typing import Any
 
 import bluesky.plan_stubs as bps
+from bluesky.protocols import Movable
 from dodal.devices.areadetector.plugins.cam import ColorMode
 from dodal.devices.oav.oav_detector import OAV
 from dodal.devices.oav.oav_parameters import OAVParameters
@@ -9,67 +10,64 @@ from dodal.devices.oav.pin_image_recognition import PinTipDetection
 from mx_bluesky.common.parameters.constants import (
     PlanGroupCheckpointConstants,
 )
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
 
 
-def setup_pin_tip_detection_params(
+def _pin_tip_detection_settings(
     pin_tip_detect_device: PinTipDetection,
     parameters: OAVParameters,
-):
-    set_using_group = partial(
-        bps.abs_set, group=PlanGroupCheckpointConstants.READY_FOR_OAV
-    )
-    # select which blur to apply to image
-    yield from set_using_group(
-        pin_tip_detect_device.preprocess_operation, parameters.preprocess
-    )
+) -> dict[Movable, Any]:
+    return {
+        # select which blur to apply to image
+        pin_tip_detect_device.preprocess_operation: parameters.preprocess,
+        # sets length scale for blurring
+        pin_tip_detect_device.preprocess_ksize: parameters.preprocess_K_size,
+        # Canny edge detect - lower
+        pin_tip_detect_device.canny_lower_threshold: parameters.canny_edge_lower_threshold,
+        # Canny edge detect - upper
+        pin_tip_detect_device.canny_upper_threshold: parameters.canny_edge_upper_threshold,
+        # "Close" morphological operation
+        pin_tip_detect_device.close_ksize: parameters.close_ksize,
+        # Sample detection direction
+        pin_tip_detect_device.scan_direction: parameters.direction,
+        # Minimum height
+        pin_tip_detect_device.min_tip_height: parameters.minimum_height,
+    }
 
-    # sets length scale for blurring
-    yield from set_using_group(
-        pin_tip_detect_device.preprocess_ksize, parameters.preprocess_K_size
-    )
 
-    # Canny edge detect - lower
-    yield from set_using_group(
-        pin_tip_detect_device.canny_lower_threshold,
-        parameters.canny_edge_lower_threshold,
-    )
+def _general_oav_settings(oav: OAV, parameters: OAVParameters) -> dict[Movable, Any]:
+    return {
+        oav.cam.color_mode: ColorMode.RGB1,
+        oav.cam.acquire_period: parameters.acquire_period,
+        oav.cam.acquire_time: parameters.exposure,
+        oav.cam.gain: parameters.gain,
+    }
 
-    # Canny edge detect - upper
-    yield from set_using_group(
-        pin_tip_detect_device.canny_upper_threshold,
-        parameters.canny_edge_upper_threshold,
-    )
 
-    # "Close" morphological operation
-    yield from set_using_group(
-        pin_tip_detect_device.close_ksize, parameters.close_ksize
-    )
+def _zoom_level_str(parameters: OAVParameters) -> str:
+    return f"{float(parameters.zoom)}x"
 
-    # Sample detection direction
-    yield from set_using_group(
-        pin_tip_detect_device.scan_direction, parameters.direction
-    )
 
-    # Minimum height
-    yield from set_using_group(
-        pin_tip_detect_device.min_tip_height,
-        parameters.minimum_height,
+def setup_pin_tip_detection_params(
+    pin_tip_detect_device: PinTipDetection,
+    parameters: OAVParameters,
+):
+    yield from set_concurrently(
+        _pin_tip_detection_settings(pin_tip_detect_device, parameters),
+        group=PlanGroupCheckpointConstants.READY_FOR_OAV,
+        wait=False,
     )
 
 
 def setup_general_oav_params(oav: OAV, parameters: OAVParameters):
-    set_using_group = partial(
-        bps.abs_set, group=PlanGroupCheckpointConstants.READY_FOR_OAV
+    yield from set_concurrently(
+        _general_oav_settings(oav, parameters),
+        group=PlanGroupCheckpointConstants.READY_FOR_OAV,
+        wait=False,
     )
-    yield from set_using_group(oav.cam.color_mode, ColorMode.RGB1)
-    yield from set_using_group(oav.cam.acquire_period, parameters.acquire_period)
-    yield from set_using_group(oav.cam.acquire_time, parameters.exposure)
-    yield from set_using_group(oav.cam.gain, parameters.gain)
-
-    zoom_level_str = f"{float(parameters.zoom)}x"
     yield from bps.abs_set(
         oav.zoom_controller,
-        zoom_level_str,
+        _zoom_level_str(parameters),
         wait=True,
     )
 
@@ -80,8 +78,11 @@ def pre_centring_setup_oav(
     pin_tip_detection_device: PinTipDetection,
 ):
     """
-    Setup OAV PVs with required values.
+    Setup OAV PVs with required values. The zoom is waited for before the pin tip
+    detection is set up, everything else is set at the same time.
     """
     yield from setup_general_oav_params(oav, parameters)
-    yield from setup_pin_tip_detection_params(pin_tip_detection_device, parameters)
-    yield from bps.wait(PlanGroupCheckpointConstants.READY_FOR_OAV)
+    yield from set_concurrently(
+        _pin_tip_detection_settings(pin_tip_detection_device, parameters),
+        group=PlanGroupCheckpointConstants.READY_FOR_OAV,
+    )
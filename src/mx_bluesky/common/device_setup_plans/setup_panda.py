@@ -1,9 +1,109 @@
-from ophyd_async.core import YamlSettingsProvider
+from collections.abc import Collection
+from pathlib import Path
+
+from bluesky.utils import MsgGenerator
+from ophyd_async.core import Settings, SignalW, Table, YamlSettingsProvider
 from ophyd_async.fastcs.panda import HDFPanda
 from ophyd_async.plan_stubs import apply_panda_settings, retrieve_settings
 
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, get_setpoint_cache
+
+
+class PandAConfigManager:
+    """Applies PandA settings from yaml files, only writing the signals that are not
+    already set to the value in the file.
+
+    Each file is read once per PandA, and again whenever it is modified. The values
+    applied are remembered in a SetpointCache, which forgets a signal as soon as it
+    changes, e.g. when the PandA is armed for a scan or reconfigured by hand, so that it
+    is written next time.
+    """
+
+    def __init__(self):
+        self.applied = SetpointCache()
+        self._panda: HDFPanda | None = None
+        self._settings: dict[tuple[str, str], tuple[float, Settings[HDFPanda]]] = {}
+
+    def load_from_yaml(
+        self,
+        yaml_directory: str,
+        yaml_file_name: str,
+        panda: HDFPanda,
+        overridden: Collection[SignalW] = (),
+    ) -> MsgGenerator:
+        if panda is not self._panda:
+            self.clear()
+            self._panda = panda
+        key = (yaml_directory, yaml_file_name)
+        modified = (Path(yaml_directory) / f"{yaml_file_name}.yaml").stat().st_mtime
+        if key not in self._settings or self._settings[key][0] != modified:
+            provider = YamlSettingsProvider(yaml_directory)
+            settings = yield from retrieve_settings(provider, yaml_file_name, panda)
+            self._settings[key] = (modified, _with_tables_parsed(settings))
+        _, settings = self._settings[key]
+        changed, _ = settings.partition(
+            lambda signal: (
+                settings[signal] is not None
+                and signal not in overridden
+                and not self.applied.is_set_to(signal, settings[signal])
+            )
+        )
+        LOGGER.info(
+            f"Applying {len(changed)} of {len(settings)} PandA settings from "
+            f"{yaml_file_name}, the rest are unchanged"
+        )
+        yield from apply_panda_settings(changed)
+        for signal, value in changed.items():
+            self.applied.confirm(signal, value)
+
+    def clear(self):
+        """Forget the settings read and applied, so that they are all applied again."""
+        self.applied.clear()
+        self._panda = None
+        self._settings.clear()
+
+
+def _with_tables_parsed(settings: Settings[HDFPanda]) -> Settings[HDFPanda]:
+    """Tables are read from yaml as dicts, parse them so that they can be compared
+    with the tables read back from the PandA."""
+    for signal, value in settings.items():
+        datatype = signal.datatype
+        if isinstance(value, dict) and datatype and issubclass(datatype, Table):
+            settings[signal] = datatype(**value)
+    return settings
+
+
+_panda_config_manager = PandAConfigManager()
+
+
+def get_panda_config_manager() -> PandAConfigManager:
+    return _panda_config_manager
+
+
+def get_panda_setpoint_cache() -> SetpointCache | None:
+    """The setpoints applied to the PandA, if unchanged setpoints are not being written
+    again for this instance."""
+    return _panda_config_manager.applied if get_setpoint_cache() else None
+
+
+def load_panda_from_yaml(
+    yaml_directory: str,
+    yaml_file_name: str,
+    panda: HDFPanda,
+    overridden: Collection[SignalW] = (),
+):
+    """Apply the PandA settings in the yaml file.
 
-def load_panda_from_yaml(yaml_directory: str, yaml_file_name: str, panda: HDFPanda):
-    provider = YamlSettingsProvider(yaml_directory)
-    settings = yield from retrieve_settings(provider, yaml_file_name, panda)
-    yield from apply_panda_settings(settings)
+    Args:
+        overridden: Signals that the caller sets straight afterwards. If unchanged
+            setpoints are being skipped, these are left out rather than set twice.
+    """
+    if get_setpoint_cache():
+        yield from _panda_config_manager.load_from_yaml(
+            yaml_directory, yaml_file_name, panda, overridden
+        )
+    else:
+        provider = YamlSettingsProvider(yaml_directory)
+        settings = yield from retrieve_settings(provider, yaml_file_name, panda)
+        yield from apply_panda_settings(settings)
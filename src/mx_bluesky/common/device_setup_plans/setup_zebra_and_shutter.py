@@ -1,6 +1,7 @@
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
 import bluesky.plan_stubs as bps
+from bluesky.protocols import Movable
 from bluesky.utils import MsgGenerator
 from dodal.devices.zebra.zebra import (
     ArmDemand,
@@ -15,6 +16,7 @@ from dodal.devices.zebra.zebra_controlled_shutter import (
 )
 
 from mx_bluesky.common.parameters.constants import ZEBRA_STATUS_TIMEOUT
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
 from mx_bluesky.common.utils.log import LOGGER
 
 """Plans in this file will work as intended if the zebra has the following configuration:
@@ -53,20 +55,19 @@ def setup_zebra_for_gridscan(
     """
     zebra = composite.zebra
     ttl_detector = ttl_input_for_detector_to_use or zebra.mapping.outputs.TTL_DETECTOR
-    # Set shutter to automatic and to trigger via motion controller GPIO signal (IN4_TTL)
-    yield from configure_zebra_and_shutter_for_auto_shutter(
-        zebra, composite.sample_shutter, zebra.mapping.sources.IN4_TTL, group=group
-    )
-
-    yield from bps.abs_set(
-        zebra.output.out_pvs[ttl_detector],
-        zebra.mapping.sources.IN3_TTL,
+    yield from set_concurrently(
+        {
+            # Set shutter to automatic and to trigger via motion controller GPIO signal (IN4_TTL)
+            **auto_shutter_settings(
+                zebra, composite.sample_shutter, zebra.mapping.sources.IN4_TTL
+            ),
+            zebra.output.out_pvs[ttl_detector]: zebra.mapping.sources.IN3_TTL,
+        },
         group=group,
+        wait=wait,
+        timeout=ZEBRA_STATUS_TIMEOUT,
     )
 
-    if wait:
-        yield from bps.wait(group, timeout=ZEBRA_STATUS_TIMEOUT)
-
 
 def set_shutter_auto_input(zebra: Zebra, input: int, group="set_shutter_trigger"):
     """Set the signal that controls the shutter. We use the second input to the
@@ -84,28 +85,34 @@ def configure_zebra_and_shutter_for_auto_shutter(
     """Set the shutter to auto mode, and configure the zebra to trigger the shutter on
     an input source. For the input, use one of the source constants in zebra.py
 
-    When the shutter is in auto/manual, logic in EPICS sets the Zebra's
-    SOFT_IN1 to low/high respectively. The Zebra's AND_GATE_FOR_AUTO_SHUTTER should be used to control the shutter while in auto mode.
-    To do this, we need (AND_GATE_FOR_AUTO_SHUTTER = SOFT_IN1 AND input), where input is the zebra signal we want to control the shutter when in auto mode.
+    See auto_shutter_settings for how this works.
     """
-
-    # Set shutter to auto mode
-    yield from bps.abs_set(
-        zebra_shutter.control_mode, ZebraShutterControl.AUTO, group=group
+    yield from set_concurrently(
+        auto_shutter_settings(zebra, zebra_shutter, input), group=group, wait=False
     )
 
-    auto_gate = zebra.mapping.AND_GATE_FOR_AUTO_SHUTTER
 
-    # Set first input of AND_GATE_FOR_AUTO_SHUTTER to SOFT_IN1, which is high when shutter is in auto mode
-    # Note the Zebra should ALWAYS be setup this way. See https://github.com/DiamondLightSource/mx-bluesky/issues/551
-    yield from bps.abs_set(
-        zebra.logic_gates.and_gates[auto_gate].sources[1],
-        zebra.mapping.sources.SOFT_IN1,
-        group=group,
-    )
+def auto_shutter_settings(
+    zebra: Zebra, zebra_shutter: ZebraShutter, input: int
+) -> dict[Movable, Any]:
+    """The settings to put the shutter in auto mode, triggered by the given zebra input,
+    for use with set_concurrently.
 
-    # Set the second input of AND_GATE_FOR_AUTO_SHUTTER to the requested zebra input source
-    yield from set_shutter_auto_input(zebra, input, group=group)
+    When the shutter is in auto/manual, logic in EPICS sets the Zebra's
+    SOFT_IN1 to low/high respectively. The Zebra's AND_GATE_FOR_AUTO_SHUTTER should be used to control the shutter while in auto mode.
+    To do this, we need (AND_GATE_FOR_AUTO_SHUTTER = SOFT_IN1 AND input), where input is the zebra signal we want to control the shutter when in auto mode.
+    """
+    auto_gate = zebra.mapping.AND_GATE_FOR_AUTO_SHUTTER
+    auto_shutter_control = zebra.logic_gates.and_gates[auto_gate]
+    return {
+        # Set shutter to auto mode
+        zebra_shutter.control_mode: ZebraShutterControl.AUTO,
+        # Set first input of AND_GATE_FOR_AUTO_SHUTTER to SOFT_IN1, which is high when shutter is in auto mode
+        # Note the Zebra should ALWAYS be setup this way. See https://github.com/DiamondLightSource/mx-bluesky/issues/551
+        auto_shutter_control.sources[1]: zebra.mapping.sources.SOFT_IN1,
+        # Set the second input of AND_GATE_FOR_AUTO_SHUTTER to the requested zebra input source
+        auto_shutter_control.sources[2]: input,
+    }
 
 
 def tidy_up_zebra_after_gridscan(
@@ -131,18 +138,18 @@ def tidy_up_zebra_after_gridscan(
 
     ttl_detector = ttl_input_for_detector_to_use or zebra.mapping.outputs.TTL_DETECTOR
 
-    yield from bps.abs_set(
-        zebra.output.out_pvs[ttl_detector],
-        zebra.mapping.sources.PC_PULSE,
+    auto_gate = zebra.mapping.AND_GATE_FOR_AUTO_SHUTTER
+    auto_shutter_control = zebra.logic_gates.and_gates[auto_gate]
+    yield from set_concurrently(
+        {
+            zebra.output.out_pvs[ttl_detector]: zebra.mapping.sources.PC_PULSE,
+            zebra_shutter.control_mode: ZebraShutterControl.MANUAL,
+            auto_shutter_control.sources[2]: zebra.mapping.sources.PC_GATE,
+        },
         group=group,
+        wait=wait,
+        timeout=ZEBRA_STATUS_TIMEOUT,
     )
-    yield from bps.abs_set(
-        zebra_shutter.control_mode, ZebraShutterControl.MANUAL, group=group
-    )
-    yield from set_shutter_auto_input(zebra, zebra.mapping.sources.PC_GATE, group=group)
-
-    if wait:
-        yield from bps.wait(group, timeout=ZEBRA_STATUS_TIMEOUT)
 
 
 def setup_zebra_for_rotation(
@@ -188,38 +195,36 @@ def setup_zebra_for_rotation(
             "Disallowed rotation direction provided to Zebra setup plan. "
             "Use RotationDirection.POSITIVE or RotationDirection.NEGATIVE."
         )
-    yield from bps.abs_set(zebra.pc.dir, direction.value, group=group)
     LOGGER.info("ZEBRA SETUP: START")
     # Set gate start, adjust for shutter opening time if necessary
     LOGGER.info(f"ZEBRA SETUP: degrees to adjust for shutter = {shutter_opening_deg}")
     LOGGER.info(f"ZEBRA SETUP: start angle start: {start_angle}")
     LOGGER.info(f"ZEBRA SETUP: start angle adjusted, gate start set to: {start_angle}")
-    yield from bps.abs_set(zebra.pc.gate_start, start_angle, group=group)
-    # set gate width to total width
-    yield from bps.abs_set(
-        zebra.pc.gate_width, scan_width + shutter_opening_deg, group=group
-    )
     LOGGER.info(
         f"Pulse start set to shutter open time, set to: {abs(shutter_opening_s)}"
     )
-    yield from bps.abs_set(zebra.pc.pulse_start, abs(shutter_opening_s), group=group)
-    # Set gate position to be angle of interest
-    yield from bps.abs_set(zebra.pc.gate_trigger, axis.value, group=group)
-    # Set shutter to automatic and to trigger via PC_GATE
-    yield from configure_zebra_and_shutter_for_auto_shutter(
-        zebra, zebra_shutter, zebra.mapping.sources.PC_GATE, group=group
-    )
-    # Trigger the detector with a pulse
-    yield from bps.abs_set(
-        zebra.output.out_pvs[ttl_detector],
-        zebra.mapping.sources.PC_PULSE,
+    LOGGER.info(f"ZEBRA SETUP: END - {'' if wait else 'not'} waiting for completion")
+    yield from set_concurrently(
+        {
+            zebra.pc.dir: direction.value,
+            zebra.pc.gate_start: start_angle,
+            # set gate width to total width
+            zebra.pc.gate_width: scan_width + shutter_opening_deg,
+            zebra.pc.pulse_start: abs(shutter_opening_s),
+            # Set gate position to be angle of interest
+            zebra.pc.gate_trigger: axis.value,
+            # Set shutter to automatic and to trigger via PC_GATE
+            **auto_shutter_settings(
+                zebra, zebra_shutter, zebra.mapping.sources.PC_GATE
+            ),
+            # Trigger the detector with a pulse
+            zebra.output.out_pvs[ttl_detector]: zebra.mapping.sources.PC_PULSE,
+        },
         group=group,
+        wait=wait,
+        timeout=ZEBRA_STATUS_TIMEOUT,
     )
 
-    LOGGER.info(f"ZEBRA SETUP: END - {'' if wait else 'not'} waiting for completion")
-    if wait:
-        yield from bps.wait(group, timeout=ZEBRA_STATUS_TIMEOUT)
-
 
 def tidy_up_zebra_after_rotation_scan(
     zebra: Zebra,
@@ -237,9 +242,12 @@ def tidy_up_zebra_after_rotation_scan(
         wait: If true, block until completion.
     """
 
-    yield from bps.abs_set(zebra.pc.arm, ArmDemand.DISARM, group=group)
-    yield from bps.abs_set(
-        zebra_shutter.control_mode, ZebraShutterControl.MANUAL, group=group
+    yield from set_concurrently(
+        {
+            zebra.pc.arm: ArmDemand.DISARM,
+            zebra_shutter.control_mode: ZebraShutterControl.MANUAL,
+        },
+        group=group,
+        wait=wait,
+        timeout=ZEBRA_STATUS_TIMEOUT,
     )
-    if wait:
-        yield from bps.wait(group, timeout=ZEBRA_STATUS_TIMEOUT)
@@ -7,6 +7,9 @@ from dodal.devices.detector.detector_motion import DetectorMotion, ShutterState
 from dodal.devices.eiger import EigerDetector
 from dodal.devices.mx_phase1.beamstop import Beamstop, BeamstopPositions
 
+from mx_bluesky.common.device_setup_plans.detector_arming import (
+    get_detector_arming,
+)
 from mx_bluesky.common.device_setup_plans.position_detector import (
     set_detector_z_position,
     set_shutter,
@@ -29,10 +32,14 @@ def start_preparing_data_collection_then_do_plan(
      * Moving the detector to the specified position
      * Opening the detect shutter
      If the plan fails it will disarm the eiger.
+
+     The arming is tracked by the detector arming manager, so that the plan can arm
+     again if the detector parameters change, see DetectorArming.
     """
+    detector_arming = get_detector_arming()
 
     def wrapped_plan():
-        yield from bps.abs_set(eiger.do_arm, 1, group=group)  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
+        yield from detector_arming.start(eiger, group)
         yield from bps.abs_set(
             beamstop.selected_pos, BeamstopPositions.DATA_COLLECTION, group=group
         )
@@ -42,8 +49,10 @@ def start_preparing_data_collection_then_do_plan(
             )
         yield from set_shutter(detector_motion, ShutterState.OPEN, group)
         yield from plan_to_run
+        detector_arming.forget()
+
+    def disarm(e: Exception):
+        detector_arming.forget()
+        yield from bps.stop(eiger)  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
 
-    yield from bpp.contingency_wrapper(
-        wrapped_plan(),
-        except_plan=lambda e: (yield from bps.stop(eiger)),  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
-    )
+    yield from bpp.contingency_wrapper(wrapped_plan(), except_plan=disarm)
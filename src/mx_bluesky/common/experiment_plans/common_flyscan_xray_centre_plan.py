@@ -21,6 +21,9 @@ from dodal.devices.zocalo.zocalo_results import (
     get_full_processing_results,
 )
 
+from mx_bluesky.common.device_setup_plans.detector_arming import (
+    get_detector_arming,
+)
 from mx_bluesky.common.experiment_plans.inner_plans.do_fgs import (
     ZOCALO_STAGE_GROUP,
     kickoff_and_complete_gridscan,
@@ -36,11 +39,13 @@ from mx_bluesky.common.parameters.constants import (
 )
 from mx_bluesky.common.parameters.device_composites import FlyScanEssentialDevices
 from mx_bluesky.common.parameters.gridscan import SpecifiedThreeDGridScan
+from mx_bluesky.common.utils.collection_duration import estimate_gridscan_s
 from mx_bluesky.common.utils.exceptions import (
     CrystalNotFoundError,
     SampleError,
 )
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase, record_duration
 from mx_bluesky.common.utils.tracing import TRACER
 from mx_bluesky.common.xrc_result import XRayCentreResult
 
@@ -193,7 +198,11 @@ def common_flyscan_xray_centre(
 
         yield from run_gridscan_and_tidy(composite, parameters, beamline_specific)
 
-    composite.eiger.set_detector_parameters(parameters.detector_params)
+    yield from get_detector_arming().finalise(
+        composite.eiger,
+        parameters.detector_params,
+        PlanGroupCheckpointConstants.GRID_READY_FOR_DC,
+    )
     yield from _decorated_flyscan()
 
 
@@ -210,9 +219,10 @@ def _fetch_xrc_results_from_zocalo(
 
     LOGGER.info("Getting X-ray center Zocalo results...")
 
-    yield from bps.trigger(zocalo_results)
-    LOGGER.info("Zocalo triggered and read, interpreting results.")
-    xrc_results = yield from get_full_processing_results(zocalo_results)
+    with record_duration(Phase.ZOCALO_WAIT):
+        yield from bps.trigger(zocalo_results)
+        LOGGER.info("Zocalo triggered and read, interpreting results.")
+        xrc_results = yield from get_full_processing_results(zocalo_results)
     LOGGER.info(f"Got xray centres, top 5: {xrc_results[:5]}")
     filtered_results = [
         result
@@ -281,7 +291,9 @@ def run_gridscan(
             ) from e
 
     LOGGER.info("Waiting for arming to finish")
-    yield from bps.wait(PlanGroupCheckpointConstants.GRID_READY_FOR_DC)
+    yield from get_detector_arming().wait_until_armed(
+        PlanGroupCheckpointConstants.GRID_READY_FOR_DC
+    )
     yield from bps.stage(fgs_composite.eiger, wait=True)
 
     yield from kickoff_and_complete_gridscan(
@@ -290,6 +302,7 @@ def run_gridscan(
         fgs_composite.synchrotron,
         [parameters.scan_points_first_grid, parameters.scan_points_second_grid],
         plan_during_collection=beamline_specific.read_during_collection_plan,
+        estimated_duration_s=estimate_gridscan_s(parameters),
     )
 
     # GDA's 3D gridscans requires Z steps to be at 0, so make sure we leave this device
@@ -1,5 +1,4 @@
 from collections.abc import Callable
-from time import time
 
 import bluesky.plan_stubs as bps
 import bluesky.preprocessors as bpp
@@ -11,7 +10,6 @@ from dodal.devices.zocalo.zocalo_results import (
     ZOCALO_STAGE_GROUP,
 )
 from dodal.log import LOGGER
-from dodal.plan_stubs.check_topup import check_topup_and_wait_if_necessary
 from scanspec.core import AxesPoints, Axis
 
 from mx_bluesky.common.experiment_plans.inner_plans.read_hardware import (
@@ -23,6 +21,9 @@ from mx_bluesky.common.external_interaction.callbacks.xray_centre.ispyb_callback
 from mx_bluesky.common.parameters.constants import (
     PlanNameConstants,
 )
+from mx_bluesky.common.plan_stubs.check_topup import prepare_then_check_topup
+from mx_bluesky.common.utils.collection_duration import get_duration_estimator
+from mx_bluesky.common.utils.metrics import Phase, record_duration
 from mx_bluesky.common.utils.tracing import TRACER
 
 
@@ -31,37 +32,41 @@ def _wait_for_zocalo_to_stage_then_do_fgs(
     detector: EigerDetector,
     synchrotron: Synchrotron,
     during_collection_plan: Callable[[], MsgGenerator] | None = None,
+    estimated_duration_s: float | None = None,
 ):
     expected_images = yield from bps.rd(grid_scan_device.expected_images)
     exposure_sec_per_image = yield from bps.rd(detector.cam.acquire_time)  # type: ignore # Fix types in ophyd-async (https://github.com/DiamondLightSource/mx-bluesky/issues/855)
-    LOGGER.info("waiting for topup if necessary...")
-    yield from check_topup_and_wait_if_necessary(
+
+    def prepare_for_gridscan():
+        # Make sure ZocaloResults queue is clear and ready to accept our new data. Zocalo MUST
+        # have been staged using ZOCALO_STAGE_GROUP prior to this
+        LOGGER.info("Waiting for Zocalo device queue to have been cleared...")
+        yield from bps.wait(ZOCALO_STAGE_GROUP)
+
+        # Triggers Zocalo if run_engine is subscribed to ZocaloCallback
+        yield from read_hardware_for_zocalo(detector)
+        LOGGER.info("Wait for all moves with no assigned group")
+        yield from bps.wait()
+
+    yield from prepare_then_check_topup(
         synchrotron,
         expected_images * exposure_sec_per_image,
         30.0,
+        prepare_for_gridscan,
     )
 
-    # Make sure ZocaloResults queue is clear and ready to accept our new data. Zocalo MUST
-    # have been staged using ZOCALO_STAGE_GROUP prior to this
-    LOGGER.info("Waiting for Zocalo device queue to have been cleared...")
-    yield from bps.wait(ZOCALO_STAGE_GROUP)
-
-    # Triggers Zocalo if run_engine is subscribed to ZocaloCallback
-    yield from read_hardware_for_zocalo(detector)
-    LOGGER.info("Wait for all moves with no assigned group")
-    yield from bps.wait()
-
     LOGGER.info("kicking off FGS")
-    yield from bps.kickoff(grid_scan_device, wait=True)
-    gridscan_start_time = time()
-    if during_collection_plan:
-        yield from during_collection_plan()
-    LOGGER.info("completing FGS")
-    yield from bps.complete(grid_scan_device, wait=True)
-    # Remove this logging statement once metrics have been added
-    LOGGER.info(
-        f"Grid scan motion program took {round(time() - gridscan_start_time, 2)} to complete"
-    )
+    with (
+        record_duration(Phase.FLYSCAN),
+        get_duration_estimator().compare_with_estimate(
+            Phase.FLYSCAN, estimated_duration_s
+        ),
+    ):
+        yield from bps.kickoff(grid_scan_device, wait=True)
+        if during_collection_plan:
+            yield from during_collection_plan()
+        LOGGER.info("completing FGS")
+        yield from bps.complete(grid_scan_device, wait=True)
 
 
 def kickoff_and_complete_gridscan(
@@ -70,6 +75,7 @@ def kickoff_and_complete_gridscan(
     synchrotron: Synchrotron,
     scan_points: list[AxesPoints[Axis]],
     plan_during_collection: Callable[[], MsgGenerator] | None = None,
+    estimated_duration_s: float | None = None,
 ):
     """Triggers a grid scan motion program and waits for completion, accounting for synchrotron topup.
     If the RunEngine is subscribed to ZocaloCallback, this plan will also trigger Zocalo.
@@ -84,6 +90,9 @@ def kickoff_and_complete_gridscan(
                                                 Two elements in this list indicates that two grid scans will be done, eg for Hyperion's 3D grid scans.
         plan_during_collection (Optional, MsgGenerator): Generic plan called in between kickoff and completion,
                                                 eg waiting on zocalo.
+        estimated_duration_s (Optional, float): Expected time from kickoff to completion, see
+                                                estimate_gridscan_s. If given, the actual time is
+                                                recorded against it to correct later estimates.
     """
 
     plan_name = PlanNameConstants.DO_FGS
@@ -111,6 +120,7 @@ def kickoff_and_complete_gridscan(
             detector,
             synchrotron,
             during_collection_plan=plan_during_collection,
+            estimated_duration_s=estimated_duration_s,
         )
 
     yield from _decorated_do_fgs()
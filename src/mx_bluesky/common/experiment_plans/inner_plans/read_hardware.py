@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import bluesky.plan_stubs as bps
 from bluesky.protocols import Readable
 from dodal.devices.aperturescatterguard import ApertureScatterguard
 from dodal.devices.attenuator.attenuator import BinaryFilterAttenuator
@@ -15,6 +14,7 @@ from dodal.devices.undulator import Undulator
 from mx_bluesky.common.parameters.constants import (
     DocDescriptorNames,
 )
+from mx_bluesky.common.plan_stubs.read_concurrently import read_concurrently
 from mx_bluesky.common.utils.log import LOGGER
 
 
@@ -23,10 +23,7 @@ def read_hardware_plan(
     event_name: str,
 ):
     LOGGER.info(f"Reading status of beamline for event, {event_name}")
-    yield from bps.create(name=event_name)
-    for signal in signals:
-        yield from bps.read(signal)
-    yield from bps.save()
+    yield from read_concurrently(signals, event_name)
 
 
 def read_hardware_for_zocalo(detector: EigerDetector):
@@ -24,6 +24,7 @@ from mx_bluesky.common.parameters.device_composites import OavGridDetectionCompo
 from mx_bluesky.common.utils.context import device_composite_from_context
 from mx_bluesky.common.utils.exceptions import catch_exception_and_warn
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase, timed
 
 if TYPE_CHECKING:
     from dodal.devices.oav.oav_parameters import OAVParameters
@@ -60,6 +61,7 @@ def optimum_grid_detect_angles(smargon: Smargon) -> MsgGenerator[list[float]]:
         return [0, -90]
 
 
+@timed(Phase.GRID_DETECTION)
 def grid_detection_plan(
     composite: OavGridDetectionComposite,
     parameters: OAVParameters,
@@ -53,9 +53,9 @@ def oav_snapshot_plan(
         return
     if parameters.use_grid_snapshots:
         yield from _generate_oav_snapshots(composite, parameters)
-    else:
+    if parameters.snapshot_omegas_deg:
         yield from _setup_oav(composite, parameters, oav_parameters)
-        for omega in parameters.snapshot_omegas_deg or []:
+        for omega in parameters.snapshot_omegas_deg:
             yield from _take_oav_snapshot(composite, omega)
 
 
@@ -98,6 +98,8 @@ def _take_oav_snapshot(composite: OavSnapshotComposite, omega: float):
     yield from bps.trigger(composite.oav.snapshot, wait=True)
     yield from bps.create(DocDescriptorNames.OAV_ROTATION_SNAPSHOT_TRIGGERED)
     yield from bps.read(composite.oav)
+    # Read as for generated snapshots, which may be events of the same run
+    yield from bps.read(composite.smargon)
     yield from bps.save()
 
 
@@ -0,0 +1,93 @@
+from collections.abc import Callable, Collection, Mapping
+from typing import Any
+
+# The data keys that a callback reads from the events of each named descriptor, or None
+# if it needs all of them. Events from descriptors that are not listed are not used.
+EventDataNeeded = Mapping[str, Collection[str] | None]
+
+
+def merge_event_data_needed(
+    *needed: EventDataNeeded,
+) -> dict[str, frozenset[str] | None]:
+    """Combine what several callbacks need into what all of them need together."""
+    merged: dict[str, frozenset[str] | None] = {}
+    for event_data_needed in needed:
+        for descriptor_name, data_keys in event_data_needed.items():
+            if descriptor_name in merged and merged[descriptor_name] is None:
+                continue
+            if data_keys is None:
+                merged[descriptor_name] = None
+            else:
+                merged[descriptor_name] = frozenset(data_keys).union(
+                    merged.get(descriptor_name) or ()
+                )
+    return merged
+
+
+class DocumentForwardingFilter:
+    """Forwards documents to a callback, such as a 0MQ publisher, leaving out the event
+    data that no external callback uses so that less is serialised and sent.
+
+    Descriptors that are not needed are dropped along with all of their events. For
+    the descriptors that are needed, only the needed data keys are kept in the
+    descriptor and its events. All other documents are forwarded unchanged. The
+    documents given to the filter are never modified.
+
+    Args:
+        callback: The callback to forward documents to
+        event_data_needed: The event data needed by the external callbacks, see
+            merge_event_data_needed
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str, dict[str, Any]], Any],
+        event_data_needed: EventDataNeeded,
+    ):
+        self._callback = callback
+        self._event_data_needed = event_data_needed
+        self._run_of_descriptor: dict[str, str] = {}
+        self._data_keys_to_forward: dict[str, Collection[str] | None] = {}
+
+    def __call__(self, name: str, doc: dict[str, Any]):
+        match name:
+            case "descriptor":
+                self._run_of_descriptor[doc["uid"]] = doc["run_start"]
+                if doc.get("name") not in self._event_data_needed:
+                    return
+                data_keys = self._event_data_needed[doc["name"]]
+                self._data_keys_to_forward[doc["uid"]] = data_keys
+                doc = _with_only(doc, data_keys, "data_keys")
+            case "event" | "event_page":
+                if doc["descriptor"] in self._run_of_descriptor:
+                    if doc["descriptor"] not in self._data_keys_to_forward:
+                        return
+                    data_keys = self._data_keys_to_forward[doc["descriptor"]]
+                    doc = _with_only(doc, data_keys, "data", "timestamps")
+            case "stop":
+                self._forget_descriptors_of(doc["run_start"])
+        self._callback(name, doc)
+
+    def _forget_descriptors_of(self, run_start: str):
+        for descriptor in [
+            descriptor
+            for descriptor, run in self._run_of_descriptor.items()
+            if run == run_start
+        ]:
+            del self._run_of_descriptor[descriptor]
+            self._data_keys_to_forward.pop(descriptor, None)
+
+
+def _with_only(
+    doc: dict[str, Any], data_keys: Collection[str] | None, *fields: str
+) -> dict[str, Any]:
+    if data_keys is None:
+        return doc
+    return {
+        **doc,
+        **{
+            field: {key: value for key, value in doc[field].items() if key in data_keys}
+            for field in fields
+            if field in doc
+        },
+    }
@@ -0,0 +1,133 @@
+import pickle
+from queue import Full, Queue
+from threading import Thread
+from typing import Any
+
+import msgpack
+import msgpack_numpy
+from bluesky.callbacks.zmq import Publisher
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import record_dropped_document, record_queue_depth
+
+# Documents that can be dropped when the queue is full without the callbacks missing
+# anything they use. Events are needed by the ISPyB, NeXus and Zocalo callbacks, so
+# like the run structure documents they are always sent
+DROPPABLE_DOCUMENTS = {"resource", "datum", "datum_page"}
+
+_PICKLE_PROTOCOL_OPCODE = b"\x80"
+
+
+def serialise_document(doc: dict[str, Any]) -> bytes:
+    """Serialise a document with msgpack, which is more compact and faster than pickle
+    for documents containing numpy arrays. Enums are sent as their values."""
+    return msgpack.packb(doc, default=msgpack_numpy.encode)  # type: ignore
+
+
+def deserialise_document(data: bytes) -> dict[str, Any]:
+    """Deserialise a document sent by either a QueuedPublisher or a plain bluesky
+    Publisher, so that the callbacks can receive documents from either.
+
+    Pickled documents always start with the protocol opcode, which as msgpack would
+    be an empty map and so is never the start of a longer msgpack document.
+    """
+    if len(data) > 1 and data[:1] == _PICKLE_PROTOCOL_OPCODE:
+        return pickle.loads(data)
+    return msgpack.unpackb(data, object_hook=msgpack_numpy.decode, strict_map_key=False)
+
+
+class DocumentPublishingError(Exception):
+    """A document could not be serialised or sent to the callbacks."""
+
+
+class QueuedPublisher(Publisher):
+    """A 0MQ publisher that serialises and sends documents on its own thread, so that
+    the RunEngine is not held up by large documents or a slow callback process.
+
+    Documents are put on a bounded queue. If the queue is full, resources and datums
+    are dropped and reported, whereas events and the documents that make up the
+    structure of a run wait for space so that the callbacks always see complete runs.
+
+    Documents must not be modified after they are emitted, as they are serialised
+    later on another thread. If a document cannot be serialised or sent, the next
+    document emitted in the same run raises a DocumentPublishingError, so that the run
+    fails rather than the callbacks silently missing it. The publisher must be closed
+    to send the documents still queued, e.g. on shutdown.
+    """
+
+    def __init__(self, address: str | tuple[str, int], max_queue_size: int = 1000):
+        super().__init__(address, serializer=serialise_document)
+        self.documents_dropped = 0
+        # Publishing failures, by the uid of the run start the document belonged to
+        self._failures: dict[str | None, DocumentPublishingError] = {}
+        self._runs_of_descriptors: dict[str, str] = {}
+        self._runs_of_resources: dict[str, str] = {}
+        self._queue: Queue[tuple[str, dict[str, Any], str | None] | None] = Queue(
+            max_queue_size
+        )
+        self._thread = Thread(
+            target=self._send_documents, name="document_publisher", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, name: str, doc: dict[str, Any]):
+        run_uid = self._run_of(name, doc)
+        if (failure := self._failures.pop(run_uid, None)) is not None:
+            raise failure
+        if name not in DROPPABLE_DOCUMENTS:
+            self._queue.put((name, doc, run_uid))
+            return
+        try:
+            self._queue.put_nowait((name, doc, run_uid))
+        except Full:
+            self.documents_dropped += 1
+            record_dropped_document(name)
+            LOGGER.warning(
+                f"Document publisher queue full, dropped {name} document "
+                f"({self.documents_dropped} dropped in total)"
+            )
+
+    def _run_of(self, name: str, doc: dict[str, Any]) -> str | None:
+        match name:
+            case "start":
+                return doc.get("uid")
+            case "descriptor":
+                self._runs_of_descriptors[doc["uid"]] = doc["run_start"]
+                return doc["run_start"]
+            case "resource" if "run_start" in doc:
+                self._runs_of_resources[doc["uid"]] = doc["run_start"]
+                return doc["run_start"]
+            case "event" | "event_page":
+                return self._runs_of_descriptors.get(doc.get("descriptor", ""))
+            case "datum" | "datum_page":
+                return self._runs_of_resources.get(doc.get("resource", ""))
+            case "stop":
+                run_uid = doc.get("run_start")
+                for runs in (self._runs_of_descriptors, self._runs_of_resources):
+                    for uid in [uid for uid, run in runs.items() if run == run_uid]:
+                        del runs[uid]
+                return run_uid
+        return None
+
+    def _send_documents(self):
+        while (item := self._queue.get()) is not None:
+            record_queue_depth("document_publisher", self._queue.qsize())
+            name, doc, run_uid = item
+            try:
+                self._socket.send(
+                    b" ".join([self._prefix, name.encode(), self._serializer(doc)])
+                )
+            except Exception as e:
+                LOGGER.error(f"Failed to publish {name} document", exc_info=e)
+                failure = DocumentPublishingError(f"Failed to publish {name} document")
+                failure.__cause__ = e
+                self._failures[run_uid] = failure
+            if name == "stop" and self._failures.pop(run_uid, None) is not None:
+                # The run has already finished, so there is nothing left to fail
+                LOGGER.error(f"Run {run_uid} finished without all its documents sent")
+
+    def close(self):
+        """Send the documents already queued then close the socket."""
+        self._queue.put(None)
+        self._thread.join()
+        super().close()
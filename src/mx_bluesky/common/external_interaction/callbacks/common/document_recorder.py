@@ -0,0 +1,69 @@
+import gzip
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+from mx_bluesky.common.utils.log import LOGGER
+
+
+class DocumentRecorder:
+    """Records every document it is given to a gzipped file, so that the document
+    stream of real runs can later be replayed into the callbacks, see
+    read_recorded_documents.
+
+    Each document is stored with its name and the time in seconds since the first
+    document. Documents are pickled, as they are when published over 0MQ to the external
+    callbacks, so that values such as enums and numpy arrays are replayed unchanged.
+
+    This can be subscribed directly to the RunEngine or to a RemoteDispatcher listening
+    on the 0MQ proxy, e.g.
+
+        with DocumentRecorder(Path("udc_run.pkl.gz")) as recorder:
+            run_engine.subscribe(recorder)
+            run_engine(my_plan())
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.documents_recorded = 0
+        self._file = gzip.open(path, "wb")
+        self._first_document_time: float | None = None
+
+    def __call__(self, name: str, doc: dict[str, Any]):
+        now = monotonic()
+        if self._first_document_time is None:
+            self._first_document_time = now
+        pickle.dump((now - self._first_document_time, name, doc), self._file)
+        self.documents_recorded += 1
+        if name == "stop":
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+        LOGGER.info(f"Recorded {self.documents_recorded} documents to {self.path}")
+
+    def __enter__(self) -> "DocumentRecorder":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def read_recorded_documents(
+    path: Path,
+) -> Iterator[tuple[float, str, dict[str, Any]]]:
+    """Read back a document stream written by DocumentRecorder. Only read recordings
+    from trusted sources, as they are unpickled.
+
+    Returns:
+        An iterator of the time since the first document, the document name and the
+        document
+    """
+    with gzip.open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
@@ -3,13 +3,16 @@ from __future__ import annotations
 from abc import abstractmethod
 from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
 from dodal.beamline_specific_utils.i03 import beam_size_from_aperture
 from dodal.devices.detector import DetectorParams
 from dodal.devices.detector.det_resolution import resolution
 from dodal.devices.synchrotron import SynchrotronMode
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.logging_callback import (
     format_doc_for_log,
 )
@@ -56,6 +59,26 @@ def _update_based_on_energy(
 
 
 class BaseISPyBCallback(PlanReactiveCallback):
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        DocDescriptorNames.HARDWARE_READ_PRE: {
+            "synchrotron-synchrotron_mode",
+            "undulator-current_gap",
+            "s4_slit_gaps-xgap",
+            "s4_slit_gaps-ygap",
+            "smargon-x",
+            "smargon-y",
+            "smargon-z",
+            "dcm-energy_in_keV",
+        },
+        DocDescriptorNames.HARDWARE_READ_DURING: {
+            "aperture_scatterguard-selected_aperture",
+            "aperture_scatterguard-radius",
+            "flux-flux_reading",
+            "attenuator-actual_transmission",
+            "dcm-energy_in_keV",
+        },
+    }
+
     def __init__(
         self,
         *,
@@ -69,7 +92,6 @@ class BaseISPyBCallback(PlanReactiveCallback):
         self._oav_snapshot_event_idx: int = 0
         self.params: DiffractionExperimentWithSample | None = None
         self.ispyb: StoreInIspyb
-        self.descriptors: dict[str, EventDescriptor] = {}
         self.ispyb_config = get_ispyb_config()
         ISPYB_ZOCALO_CALLBACK_LOGGER.info(
             f"Using ISPyB configuration from {self.ispyb_config}"
@@ -122,8 +144,8 @@ class BaseISPyBCallback(PlanReactiveCallback):
         ISPYB_ZOCALO_CALLBACK_LOGGER.info(
             "ISPyB handler received event from read hardware"
         )
-        synchrotron_mode = doc["data"]["synchrotron-synchrotron_mode"]
-        assert isinstance(synchrotron_mode, SynchrotronMode)
+        # Documents published with msgpack carry the value rather than the enum
+        synchrotron_mode = SynchrotronMode(doc["data"]["synchrotron-synchrotron_mode"])
 
         hwscan_data_collection_info = DataCollectionInfo(
             undulator_gap1=doc["data"]["undulator-current_gap"],
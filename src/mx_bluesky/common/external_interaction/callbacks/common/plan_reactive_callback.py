@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, Any
 
 from bluesky.callbacks import CallbackBase
 
+from mx_bluesky.common.external_interaction.callbacks.common.run_scoped_state import (
+    RunScopedDescriptors,
+)
+
 if TYPE_CHECKING:
     from event_model.documents import Event, EventDescriptor, RunStart, RunStop
 
@@ -38,6 +42,8 @@ class PlanReactiveCallback(CallbackBase):
         self.active = False
         self.activity_uid = ""
         self.log = log
+        # Descriptors of runs that have not yet stopped, for subclasses to record
+        self.descriptors = RunScopedDescriptors(log)
 
     def _run_activity_gated(self, name: str, func, doc, override=False):
         # Runs `func` if self.active is True or override is true. Override can be used
@@ -77,13 +83,16 @@ class PlanReactiveCallback(CallbackBase):
         if doc.get("run_start") == self.activity_uid:
             self.active = False
             self.activity_uid = ""
-        return (
-            self._run_activity_gated(
-                "stop", self.activity_gated_stop, doc, override=True
+        try:
+            return (
+                self._run_activity_gated(
+                    "stop", self.activity_gated_stop, doc, override=True
+                )
+                if do_stop
+                else doc
             )
-            if do_stop
-            else doc
-        )
+        finally:
+            self.descriptors.forget_run(doc.get("run_start"))
 
     def activity_gated_start(self, doc: RunStart) -> RunStart | None:
         return doc
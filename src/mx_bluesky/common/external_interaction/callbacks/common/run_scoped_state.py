@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from logging import Logger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from event_model.documents import EventDescriptor
+
+# Far more descriptors than any one run of UDC has open at once
+MAX_DESCRIPTORS = 1000
+
+
+class RunScopedDescriptors(MutableMapping[str, "EventDescriptor"]):
+    """The descriptors a callback has seen, by uid, which are forgotten when the run
+    they belong to stops so that a long-running callback process does not keep every
+    descriptor it has ever received.
+
+    In case stop documents are missed, e.g. if a run is never closed, at most
+    max_descriptors are kept, the oldest being forgotten first.
+
+    Args:
+        log: The logger to warn on if descriptors are forgotten before their run stops
+        max_descriptors: The most descriptors to keep
+    """
+
+    def __init__(self, log: Logger, max_descriptors: int = MAX_DESCRIPTORS):
+        self._log = log
+        self._max_descriptors = max_descriptors
+        self._descriptors: dict[str, EventDescriptor] = {}
+
+    def __getitem__(self, uid: str) -> EventDescriptor:
+        return self._descriptors[uid]
+
+    def __setitem__(self, uid: str, descriptor: EventDescriptor):
+        self._descriptors[uid] = descriptor
+        if len(self._descriptors) > self._max_descriptors:
+            oldest = next(iter(self._descriptors))
+            self._log.warning(
+                f"More than {self._max_descriptors} descriptors held, forgetting "
+                f"descriptor {oldest} of run {self._descriptors[oldest].get('run_start')}"
+            )
+            del self._descriptors[oldest]
+
+    def __delitem__(self, uid: str):
+        del self._descriptors[uid]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._descriptors)
+
+    def __len__(self) -> int:
+        return len(self._descriptors)
+
+    def forget_run(self, run_start: str | None):
+        """Forget the descriptors of a run, called when the run stops."""
+        self._descriptors = {
+            uid: descriptor
+            for uid, descriptor in self._descriptors.items()
+            if descriptor.get("run_start") != run_start
+        }
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Generator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from bluesky.callbacks import CallbackBase
 from dodal.devices.zocalo import ZocaloStartInfo, ZocaloTrigger
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.run_scoped_state import (
+    RunScopedDescriptors,
+)
 from mx_bluesky.common.parameters.constants import (
     DocDescriptorNames,
 )
@@ -40,6 +46,10 @@ class ZocaloCallback(CallbackBase):
             one or more ZocaloStartInfo which will each be submitted to zocalo as a job.
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        DocDescriptorNames.ZOCALO_HW_READ: {"eiger_odin_file_writer_id"}
+    }
+
     def __init__(
         self,
         triggering_plan: str,
@@ -50,13 +60,13 @@ class ZocaloCallback(CallbackBase):
         self._info_generator_factory = start_info_generator_factory
         self.triggering_plan = triggering_plan
         self.zocalo_interactor = ZocaloTrigger(zocalo_environment)
+        self.descriptors = RunScopedDescriptors(ISPYB_ZOCALO_CALLBACK_LOGGER)
         self._reset_state()
 
     def _reset_state(self):
         self.run_uid: str | None = None
         self.zocalo_info: list[ZocaloStartInfo] = []
         self._started_zocalo_collections: list[ZocaloStartInfo] = []
-        self.descriptors: dict[str, EventDescriptor] = {}
         self._info_generator = self._info_generator_factory()
         # Prime the generator
         next(self._info_generator)
@@ -84,6 +94,7 @@ class ZocaloCallback(CallbackBase):
         return doc
 
     def stop(self, doc: RunStop):
+        self.descriptors.forget_run(doc.get("run_start"))
         if doc.get("run_start") == self.run_uid:
             ISPYB_ZOCALO_CALLBACK_LOGGER.info(
                 f"Zocalo handler received stop document, for run {doc.get('run_start')}."
@@ -4,12 +4,16 @@ from collections.abc import Callable, Sequence
 from enum import StrEnum
 from math import isclose
 from time import time
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from bluesky import preprocessors as bpp
 from bluesky.utils import MsgGenerator, make_decorator
 from dodal.devices.zocalo import ZocaloStartInfo
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+    merge_event_data_needed,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.ispyb_callback_base import (
     BaseISPyBCallback,
     D,
@@ -93,6 +97,25 @@ class GridscanISPyBCallback(BaseISPyBCallback):
     See: https://blueskyproject.io/bluesky/callbacks.html#ways-to-invoke-callbacks
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = merge_event_data_needed(
+        BaseISPyBCallback.EVENT_DATA_NEEDED,
+        {
+            DocDescriptorNames.OAV_GRID_SNAPSHOT_TRIGGERED: {
+                "smargon-omega",
+                "oav-grid_snapshot-last_path_full_overlay",
+                "oav-grid_snapshot-last_path_outer",
+                "oav-grid_snapshot-last_saved_path",
+                "oav-grid_snapshot-num_boxes_x",
+                "oav-grid_snapshot-num_boxes_y",
+                "oav-grid_snapshot-box_width",
+                "oav-grid_snapshot-top_left_x",
+                "oav-grid_snapshot-top_left_y",
+                "oav-microns_per_pixel_x",
+                "oav-microns_per_pixel_y",
+            }
+        },
+    )
+
     def __init__(
         self,
         param_type: type[T],
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar, TypeVar
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.plan_reactive_callback import (
     PlanReactiveCallback,
 )
@@ -39,13 +42,21 @@ class GridscanNexusFileCallback(PlanReactiveCallback):
     See: https://blueskyproject.io/bluesky/callbacks.html#ways-to-invoke-callbacks
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        DocDescriptorNames.HARDWARE_READ_DURING: {
+            "dcm-energy_in_keV",
+            "flux-flux_reading",
+            "attenuator-actual_transmission",
+            "eiger_bit_depth",
+        }
+    }
+
     def __init__(self, param_type: type[T]) -> None:
         super().__init__(NEXUS_LOGGER)
         self.param_type = param_type
         self.run_start_uid: str | None = None
         self.nexus_writer_1: NexusWriter | None = None
         self.nexus_writer_2: NexusWriter | None = None
-        self.descriptors: dict[str, EventDescriptor] = {}
         self.log = NEXUS_LOGGER
 
     def activity_gated_start(self, doc: RunStart):
@@ -22,6 +22,7 @@ from mx_bluesky.common.external_interaction.ispyb.ispyb_utils import (
     get_session_id_from_visit,
 )
 from mx_bluesky.common.utils.log import ISPYB_ZOCALO_CALLBACK_LOGGER
+from mx_bluesky.common.utils.metrics import Phase, timed
 from mx_bluesky.common.utils.tracing import TRACER
 
 if TYPE_CHECKING:
@@ -41,6 +42,7 @@ class StoreInIspyb:
     def __init__(self, ispyb_config: str) -> None:
         self.ISPYB_CONFIG_PATH: str = ispyb_config
 
+    @timed(Phase.ISPYB, operation="begin_deposition")
     def begin_deposition(
         self,
         data_collection_group_info: DataCollectionGroupInfo,
@@ -56,6 +58,7 @@ class StoreInIspyb:
             ispyb_ids, data_collection_group_info, scan_data_infos
         )
 
+    @timed(Phase.ISPYB, operation="update_deposition")
     def update_deposition(
         self,
         ispyb_ids,
@@ -116,6 +119,7 @@ class StoreInIspyb:
             )
         return ispyb_ids
 
+    @timed(Phase.ISPYB, operation="end_deposition")
     def end_deposition(self, ispyb_ids: IspybIds, success: str, reason: str):
         assert ispyb_ids.data_collection_ids, (
             "Can't end ISPyB deposition, data_collection IDs are missing"
@@ -141,6 +145,7 @@ class StoreInIspyb:
                 ispyb_ids.data_collection_group_id,
             )
 
+    @timed(Phase.ISPYB, operation="append_to_comment")
     def append_to_comment(
         self, data_collection_id: int, comment: str, delimiter: str = " "
     ) -> None:
@@ -157,6 +162,7 @@ class StoreInIspyb:
                 exc_info=e,
             )
 
+    @timed(Phase.ISPYB, operation="update_data_collection_group_table")
     def update_data_collection_group_table(
         self,
         dcg_info: DataCollectionGroupInfo,
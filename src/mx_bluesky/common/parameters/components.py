@@ -5,7 +5,7 @@ from abc import abstractmethod
 from collections.abc import Sequence
 from enum import StrEnum
 from pathlib import Path
-from typing import Literal, Self, SupportsInt, cast
+from typing import Literal, SupportsInt, cast
 
 from dodal.devices.aperturescatterguard import ApertureValue
 from dodal.devices.detector import (
@@ -122,8 +122,11 @@ class WithSnapshot(BaseModel):
             gridscans, this attribute is ignored.
         use_grid_snapshots: This may be specified for rotation snapshots to speed up rotation
             execution. If set to True then rotation snapshots are generated from the
-            previously captured grid snapshots. Otherwise they are captured using
-            freshly captured snapshots during the rotation plan.
+            previously captured grid snapshots, as well as being taken at any
+            snapshot_omegas_deg. Otherwise they are captured using freshly captured
+            snapshots during the rotation plan, unless the grid snapshots are known to
+            show the sample at the requested omegas, see
+            can_generate_rotation_snapshots.
     """
 
     snapshot_directory: Path
@@ -134,13 +137,6 @@ class WithSnapshot(BaseModel):
     def take_snapshots(self) -> bool:
         return bool(self.snapshot_omegas_deg) or self.use_grid_snapshots
 
-    @model_validator(mode="after")
-    def _validate_omegas_with_grid_snapshots(self) -> Self:
-        assert not self.use_grid_snapshots or not self.snapshot_omegas_deg, (
-            "snapshot_omegas may not be specified with use_grid_snapshots"
-        )
-        return self
-
 
 class WithOptionalEnergyChange(BaseModel):
     demand_energy_ev: float | None = Field(default=None, gt=0)
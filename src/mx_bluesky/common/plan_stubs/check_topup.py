@@ -0,0 +1,95 @@
+from collections.abc import Callable
+
+from bluesky import plan_stubs as bps
+from bluesky.utils import MsgGenerator
+from dodal.common.beamlines.beamline_parameters import get_beamline_parameters
+from dodal.devices.synchrotron import Synchrotron
+from dodal.plan_stubs.check_topup import (
+    ALLOWED_MODES,
+    DECAY_MODE_COUNTDOWN,
+    DEFAULT_THRESHOLD_EXPOSURE_S,
+    DEFAULT_TOPUP_GATE_DELAY_S,
+    TopupConfig,
+    check_topup_and_wait_if_necessary,
+)
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import record_topup_wait
+from mx_bluesky.common.utils.virtual_clock import monotonic
+
+
+def predict_topup_wait(
+    synchrotron: Synchrotron, total_exposure_time: float, ops_time: float
+) -> MsgGenerator[float]:
+    """Predict how long check_topup_and_wait_if_necessary would wait for topup if it
+    were called now, using the same gating rules.
+
+    Returns:
+        The time until topup is expected to be over, in seconds, or 0 if collection
+        would not be gated
+    """
+    machine_mode = yield from bps.rd(synchrotron.synchrotron_mode)
+    time_to_topup = yield from bps.rd(synchrotron.top_up_start_countdown)
+    if (
+        machine_mode not in ALLOWED_MODES
+        or time_to_topup == DECAY_MODE_COUNTDOWN
+        or total_exposure_time + ops_time <= time_to_topup
+    ):
+        return 0.0
+    topup_configuration = get_beamline_parameters().params
+    if total_exposure_time >= topup_configuration.get(
+        TopupConfig.THRESHOLD_EXPOSURE_S, DEFAULT_THRESHOLD_EXPOSURE_S
+    ):
+        return 0.0
+    end_topup = yield from bps.rd(synchrotron.top_up_end_countdown)
+    return end_topup + topup_configuration.get(
+        TopupConfig.TOPUP_GATE_DELAY_S, DEFAULT_TOPUP_GATE_DELAY_S
+    )
+
+
+def prepare_then_check_topup(
+    synchrotron: Synchrotron,
+    total_exposure_time: float,
+    ops_time: float,
+    beam_independent_work: Callable[[], MsgGenerator],
+) -> MsgGenerator:
+    """Do the work needed before a collection that doesn't need beam, e.g. taking
+    snapshots, arming the detector or waiting for moves, then wait for topup if it is
+    due during the collection.
+
+    Doing the work first means that when a topup is due it overlaps the wait, rather
+    than starting after it, and that topup is checked as close to the start of the
+    collection as possible. The time the work overlapped the predicted wait and the time
+    left idle waiting for topup afterwards are recorded.
+
+    Args:
+        synchrotron: Synchrotron device
+        total_exposure_time: Expected total exposure time for the collection, in s
+        ops_time: Additional time to allow for the collection, e.g. for the rotation
+            to accelerate, in s
+        beam_independent_work: Plan to run before checking topup
+    """
+    start = monotonic()
+    predicted_wait_s = yield from predict_topup_wait(
+        synchrotron, total_exposure_time, ops_time
+    )
+    if predicted_wait_s:
+        LOGGER.info(
+            f"Topup predicted to be over in {predicted_wait_s}s, preparing for "
+            "collection while waiting"
+        )
+    yield from beam_independent_work()
+    work_done = monotonic()
+
+    LOGGER.info("Waiting for topup if necessary...")
+    yield from check_topup_and_wait_if_necessary(
+        synchrotron, total_exposure_time, ops_time
+    )
+    idle_s = monotonic() - work_done
+    if predicted_wait_s or idle_s > 0.1:
+        overlapped_s = min(work_done - start, predicted_wait_s)
+        LOGGER.info(
+            f"Overlapped {overlapped_s:.1f}s of topup with preparation, then waited "
+            f"{idle_s:.1f}s"
+        )
+        record_topup_wait(overlapped_s, idle_s)
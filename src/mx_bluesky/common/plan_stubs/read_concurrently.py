@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from bluesky import plan_stubs as bps
+from bluesky.protocols import Configurable, Readable, Reading
+from bluesky.utils import MsgGenerator, maybe_await
+from event_model import DataKey
+from ophyd_async.core import merge_gathered_dicts
+
+
+@dataclass(frozen=True)
+class ConcurrentReadable:
+    """Reads a number of readables at the same time, as a single readable.
+
+    The RunEngine reads each readable in an event one after another, so bundling them
+    into one readable means an event takes as long as its slowest read rather than the
+    sum of all of them. The data keys are in the order the readables are given.
+
+    Instances with the same name and readables are equal, so reading the same
+    readables into an event stream again matches the stream's existing descriptor.
+
+    Args:
+        name: The name of the readable, e.g. the name of the event it is read into
+        readables: The readables to read, whose data keys must not overlap
+    """
+
+    name: str
+    readables: tuple[Readable, ...]
+    parent: None = None
+
+    async def read(self) -> dict[str, Reading]:
+        return await merge_gathered_dicts(
+            maybe_await(readable.read()) for readable in self.readables
+        )
+
+    async def describe(self) -> dict[str, DataKey]:
+        descriptions = await asyncio.gather(
+            *(maybe_await(readable.describe()) for readable in self.readables)
+        )
+        _check_for_colliding_keys(self.readables, descriptions)
+        return {key: value for d in descriptions for key, value in d.items()}
+
+    async def read_configuration(self) -> dict[str, Reading]:
+        return await merge_gathered_dicts(
+            maybe_await(readable.read_configuration())
+            for readable in self._configurables()
+        )
+
+    async def describe_configuration(self) -> dict[str, DataKey]:
+        return await merge_gathered_dicts(
+            maybe_await(readable.describe_configuration())
+            for readable in self._configurables()
+        )
+
+    def _configurables(self) -> Iterable[Configurable]:
+        return (r for r in self.readables if isinstance(r, Configurable))
+
+
+def _check_for_colliding_keys(
+    readables: Sequence[Readable], descriptions: Sequence[dict[str, DataKey]]
+):
+    seen: dict[str, Readable] = {}
+    for readable, description in zip(readables, descriptions, strict=True):
+        for key in description:
+            if key in seen:
+                raise ValueError(
+                    f"Data key {key} from {readable.name} collides with that from "
+                    f"{seen[key].name}"
+                )
+            seen[key] = readable
+
+
+def read_concurrently(readables: Sequence[Readable], event_name: str) -> MsgGenerator:
+    """Read all of the given readables at the same time and save them as one event.
+
+    Args:
+        readables: The readables to read, whose data keys must not overlap
+        event_name: The name of the event stream to save the readings in
+    """
+    yield from bps.create(name=event_name)
+    if readables:
+        yield from bps.read(ConcurrentReadable(event_name, tuple(readables)))
+    yield from bps.save()
@@ -0,0 +1,90 @@
+from collections.abc import Mapping
+from typing import Any
+
+from bluesky import plan_stubs as bps
+from bluesky.protocols import Movable, Status
+from bluesky.utils import MsgGenerator
+from ophyd_async.core import SignalRW
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.setpoint_cache import (
+    SetpointCache,
+    get_setpoint_cache,
+)
+from mx_bluesky.common.utils.virtual_clock import monotonic
+
+SLOWEST_SETS_TO_REPORT = 3
+
+
+def set_concurrently(
+    values: Mapping[Movable, Any],
+    group: str,
+    wait: bool = True,
+    timeout: float | None = None,
+    setpoint_cache: SetpointCache | None = None,
+) -> MsgGenerator:
+    """Set all of the given devices to their values at the same time, in one group.
+
+    Setting devices one after another with wait=True takes as long as all of the sets
+    added together, whereas setting them all at once takes as long as the slowest. When
+    waiting, the slowest sets are logged, or the sets that had not finished if the
+    timeout expires.
+
+    If a setpoint cache is given or in use for this instance, signals that were already
+    set to their value and have not changed since are not set again.
+
+    Args:
+        values: The value to set each device to
+        group: The group to add the sets to, anything else already in the group is
+            also waited on
+        wait: If true, wait for everything in the group to finish
+        timeout: How long to wait for the group, or None to wait forever
+        setpoint_cache: The setpoint cache to use rather than the one for this instance
+    """
+    start_time = monotonic()
+    statuses: dict[str, Status] = {}
+    set_times_s: dict[str, float] = {}
+
+    setpoint_cache = setpoint_cache or get_setpoint_cache()
+
+    def record_set_time(name: str):
+        return lambda _: set_times_s.setdefault(name, monotonic() - start_time)
+
+    def confirm_setpoint(cache: SetpointCache, signal: SignalRW, value: Any):
+        def confirm(status: Status):
+            if status.success:
+                cache.confirm(signal, value)
+
+        return confirm
+
+    for device, value in values.items():
+        if setpoint_cache and isinstance(device, SignalRW):
+            if setpoint_cache.is_set_to(device, value):
+                LOGGER.debug(f"Not setting {device.name}, it is already {value}")
+                setpoint_cache.record_elided_write()
+                continue
+            setpoint_cache.forget(device)
+        status = yield from bps.abs_set(device, value, group=group)
+        if status is not None:
+            name = getattr(device, "name", repr(device))
+            statuses[name] = status
+            status.add_callback(record_set_time(name))
+            if setpoint_cache and isinstance(device, SignalRW):
+                status.add_callback(confirm_setpoint(setpoint_cache, device, value))
+
+    if not wait:
+        return
+    try:
+        yield from bps.wait(group, timeout=timeout)
+    except TimeoutError:
+        unfinished = [name for name, status in statuses.items() if not status.done]
+        LOGGER.error(f"Timed out waiting for {group}, sets not finished: {unfinished}")
+        raise
+    slowest = sorted(set_times_s.items(), key=lambda item: item[1], reverse=True)
+    slowest_str = ", ".join(
+        f"{name} {time_s:.3f}s" for name, time_s in slowest[:SLOWEST_SETS_TO_REPORT]
+    )
+    LOGGER.debug(
+        f"Set {len(statuses)} devices in {group} in {monotonic() - start_time:.3f}s, "
+        f"slowest: {slowest_str}"
+    )
@@ -0,0 +1,107 @@
+from asyncio import Task, ensure_future, sleep
+from collections.abc import Callable
+from typing import Any
+
+from bluesky import plan_stubs as bps
+from bluesky import preprocessors as bpp
+from bluesky.utils import MsgGenerator
+from ophyd_async.core import SignalR, wait_for_value
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.virtual_clock import get_virtual_clock, monotonic
+
+DEFAULT_POLL_INTERVAL_S = 0.1
+# Sleeps take no real time in virtual time, so each poll also waits this long in real
+# time to stop the RunEngine spinning while a signal is set from outside, e.g. the baton
+VIRTUAL_TIME_POLL_YIELD_S = 0.01
+
+
+def wait_for_signal_value(
+    signal: Any,
+    match: Any | Callable[[Any], bool],
+    timeout_s: float | None = None,
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+) -> MsgGenerator[bool]:
+    """Wait until a signal has a matching value.
+
+    For ophyd-async signals the wait is driven by a subscription to the signal, so the
+    RunEngine does no work until the value changes. If the signal does not support
+    monitoring, subscribing to it fails or plans are running in virtual time, this falls
+    back to reading the signal every poll_interval_s. In virtual time each poll
+    advances the clock by poll_interval_s and also waits VIRTUAL_TIME_POLL_YIELD_S in
+    real time.
+
+    Args:
+        signal: The signal to wait on
+        match: The value to wait for, or a callable that returns True when passed a
+            matching value
+        timeout_s: How long to wait before giving up, or None to wait forever
+        poll_interval_s: The interval between reads if falling back to polling
+
+    Returns:
+        True if the signal matched, False if the timeout expired first
+    """
+
+    def matches(value: Any) -> bool:
+        return bool(match(value)) if callable(match) else bool(value == match)
+
+    if matches((yield from bps.rd(signal))):
+        return True
+
+    start_time = monotonic()
+    in_virtual_time = get_virtual_clock() is not None
+    if isinstance(signal, SignalR) and not in_virtual_time:
+        monitor_result = yield from _wait_for_monitored_value(signal, match, timeout_s)
+        if monitor_result is not None:
+            return monitor_result
+
+    LOGGER.debug(f"Polling {signal.name} every {poll_interval_s}s")
+    while True:
+        if matches((yield from bps.rd(signal))):
+            return True
+        if timeout_s is not None and monotonic() - start_time >= timeout_s:
+            return False
+        yield from bps.sleep(poll_interval_s)
+        if in_virtual_time:
+            yield from bps.wait_for(
+                [lambda: ensure_future(sleep(VIRTUAL_TIME_POLL_YIELD_S))]
+            )
+
+
+def _wait_for_monitored_value(
+    signal: SignalR, match: Any, timeout_s: float | None
+) -> MsgGenerator[bool | None]:
+    """Wait on a subscription to the signal.
+
+    Returns:
+        True if the signal matched, False on timeout or None if the monitor could not be
+        used and the caller should poll instead.
+    """
+    monitor_tasks: list[Task] = []
+
+    def start_monitor() -> Task:
+        task = ensure_future(wait_for_value(signal, match, timeout_s))
+        monitor_tasks.append(task)
+        return task
+
+    def cancel_monitor() -> MsgGenerator:
+        # The RunEngine does not cancel the awaitable if the plan is interrupted, which
+        # would leave a stale subscription on the signal
+        for task in monitor_tasks:
+            task.cancel()
+        yield from bps.null()
+
+    tasks: list[Task] | None = yield from bpp.finalize_wrapper(
+        bps.wait_for([start_monitor]), cancel_monitor
+    )
+    if not tasks:
+        return None
+    exception = tasks[0].exception()
+    if exception is None:
+        return True
+    if isinstance(exception, TimeoutError):
+        return False
+    LOGGER.warning(
+        f"Unable to monitor {signal.name}, falling back to polling", exc_info=exception
+    )
+    return None
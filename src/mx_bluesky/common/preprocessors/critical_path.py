@@ -0,0 +1,123 @@
+from dataclasses import dataclass, field
+
+from mx_bluesky.common.preprocessors.profiling import (
+    PlanProfile,
+    StatusTiming,
+    WaitTiming,
+)
+
+# Waits blocked for less than this are not worth reporting
+DEFAULT_MIN_BLOCKED_S = 0.05
+
+
+@dataclass
+class WaitAnalysis:
+    """The critical path through a single wait on a group.
+
+    Attributes:
+        wait: The wait that was analysed
+        critical: The status in the group that finished last
+        idle_s: For each of the other statuses, how long it sat finished before the
+            critical status finished
+        suggestions: Moves that are worth parallelising or starting earlier
+    """
+
+    wait: WaitTiming
+    critical: StatusTiming
+    idle_s: list[tuple[StatusTiming, float]] = field(default_factory=list)
+    suggestions: list[str] = field(default_factory=list)
+
+    @property
+    def blocked_s(self) -> float:
+        return self.wait.end_s - self.wait.start_s
+
+
+def analyse_waits(
+    profile: PlanProfile, min_blocked_s: float = DEFAULT_MIN_BLOCKED_S
+) -> list[WaitAnalysis]:
+    """Find the critical path through each wait on a non-empty group in a profiled
+    plan, see profile_plan_wrapper.
+
+    A status that finishes long before the critical one is not worth speeding up. If the
+    critical status was started well after the others in its group, or only after an
+    earlier wait had finished, then it may be worth starting it earlier so that it runs
+    in parallel.
+
+    Args:
+        profile: The profile of the plan
+        min_blocked_s: Waits blocked for less than this are not given suggestions
+    Returns:
+        The analysis of each wait, in the order the waits happened
+    """
+    analyses: list[WaitAnalysis] = []
+    previous: WaitAnalysis | None = None
+    for wait in profile.wait_timings:
+        if not wait.statuses:
+            continue
+        critical = max(wait.statuses, key=lambda s: _finished_s(wait, s))
+        critical_finished_s = _finished_s(wait, critical)
+        analysis = WaitAnalysis(
+            wait,
+            critical,
+            [
+                (status, critical_finished_s - _finished_s(wait, status))
+                for status in wait.statuses
+                if status is not critical
+            ],
+        )
+        if analysis.blocked_s >= min_blocked_s:
+            analysis.suggestions = _suggestions(analysis, previous, min_blocked_s)
+        analyses.append(analysis)
+        previous = analysis
+    return analyses
+
+
+def critical_path_report(analyses: list[WaitAnalysis]) -> str:
+    """Format the analyses of waits as a human-readable report."""
+    lines = []
+    for analysis in analyses:
+        wait = analysis.wait
+        critical = analysis.critical
+        lines.append(
+            f"wait on {wait.group} in {'/'.join(wait.stack) or 'plan'}: blocked "
+            f"{analysis.blocked_s:.3f}s, last to finish {_describe(critical)}"
+        )
+        for status, idle_s in sorted(analysis.idle_s, key=lambda i: -i[1]):
+            lines.append(f"    {_describe(status)} idle for {idle_s:.3f}s")
+        for suggestion in analysis.suggestions:
+            lines.append(f"    suggestion: {suggestion}")
+    return "\n".join(lines)
+
+
+def _finished_s(wait: WaitTiming, status: StatusTiming) -> float:
+    return status.finished_s if status.finished_s is not None else wait.end_s
+
+
+def _describe(status: StatusTiming) -> str:
+    return f"{status.command} {status.device}"
+
+
+def _suggestions(
+    analysis: WaitAnalysis, previous: WaitAnalysis | None, min_saving_s: float
+) -> list[str]:
+    critical = analysis.critical
+    wait = analysis.wait
+    suggestions = []
+    first_started_s = min(status.started_s for status in wait.statuses)
+    late_start_s = critical.started_s - first_started_s
+    if late_start_s >= min_saving_s:
+        suggestions.append(
+            f"start {_describe(critical)} earlier, it started {late_start_s:.3f}s "
+            f"after the first move in group {wait.group}"
+        )
+    if previous is not None and critical.started_s >= previous.wait.end_s:
+        saving_s = min(
+            previous.blocked_s, _finished_s(wait, critical) - critical.started_s
+        )
+        if saving_s >= min_saving_s:
+            suggestions.append(
+                f"start {_describe(critical)} before the wait on "
+                f"{previous.wait.group} to run it in parallel, saving up to "
+                f"{saving_s:.3f}s"
+            )
+    return suggestions
@@ -0,0 +1,227 @@
+import csv
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+from bluesky.utils import Msg, MsgGenerator, make_decorator
+
+from mx_bluesky.common.utils.log import LOGGER
+
+PROFILE_SUMMARY_FILENAME = "profile_summary.csv"
+PROFILE_FOLDED_FILENAME = "profile.folded"
+
+# Messages during which the RunEngine is waiting on hardware or time to pass
+WAITING_COMMANDS = frozenset({"wait", "sleep", "wait_for"})
+
+
+@dataclass
+class MsgTiming:
+    """The time the RunEngine spent processing a single message."""
+
+    command: str
+    device: str | None
+    group: str | None
+    stack: tuple[str, ...]
+    start_s: float
+    duration_s: float
+
+
+@dataclass
+class StatusTiming:
+    """A status returned for a message in a group, and when it finished."""
+
+    command: str
+    device: str | None
+    group: str | None
+    started_s: float
+    finished_s: float | None = None
+
+
+@dataclass
+class WaitTiming:
+    """A wait on a group, with the statuses that were being waited on and how long the
+    wait was blocked by each of them."""
+
+    group: str | None
+    stack: tuple[str, ...]
+    start_s: float
+    end_s: float
+    statuses: list[StatusTiming] = field(default_factory=list)
+
+    def blocked_s(self, status: StatusTiming) -> float:
+        finished_s = status.finished_s if status.finished_s is not None else self.end_s
+        return max(0.0, min(finished_s, self.end_s) - self.start_s)
+
+
+@dataclass
+class MsgSummary:
+    command: str
+    device: str | None
+    group: str | None
+    count: int = 0
+    total_s: float = 0
+    max_s: float = 0
+
+
+class PlanProfile:
+    """Records how long the RunEngine spends on each message of a plan, see
+    profile_plan_wrapper."""
+
+    def __init__(self):
+        self.msg_timings: list[MsgTiming] = []
+        self.wait_timings: list[WaitTiming] = []
+        self._pending_statuses: dict[str | None, list[StatusTiming]] = defaultdict(list)
+        self._stack: list[str] = []
+
+    def summary(self) -> list[MsgSummary]:
+        """Aggregate the message timings by command, device and group. Waits are
+        additionally broken down by the device that each wait was blocked on.
+
+        Returns:
+            The summaries, in descending order of total time
+        """
+        summaries: dict[tuple[str, str | None, str | None], MsgSummary] = {}
+
+        def add(command: str, device: str | None, group: str | None, time_s: float):
+            key = (command, device, group)
+            summary = summaries.setdefault(key, MsgSummary(command, device, group))
+            summary.count += 1
+            summary.total_s += time_s
+            summary.max_s = max(summary.max_s, time_s)
+
+        for timing in self.msg_timings:
+            add(timing.command, timing.device, timing.group, timing.duration_s)
+        for wait in self.wait_timings:
+            for status in wait.statuses:
+                add(
+                    f"wait:{status.command}",
+                    status.device,
+                    wait.group,
+                    wait.blocked_s(status),
+                )
+        return sorted(summaries.values(), key=lambda s: s.total_s, reverse=True)
+
+    def waiting_s(self) -> float:
+        """The total time spent in messages that wait on hardware or sleep, anything
+        else is the overhead of running the plan itself."""
+        return sum(
+            timing.duration_s
+            for timing in self.msg_timings
+            if timing.command in WAITING_COMMANDS
+        )
+
+    def folded_stacks(self) -> list[str]:
+        """Return the message timings in the collapsed stack format used by
+        flamegraph.pl and speedscope, with values in microseconds."""
+        totals: dict[str, int] = defaultdict(int)
+        for timing in self.msg_timings:
+            frames = [*timing.stack, timing.command]
+            if timing.device:
+                frames.append(timing.device)
+            totals[";".join(frames)] += round(timing.duration_s * 1e6)
+        return [f"{stack} {micros}" for stack, micros in totals.items()]
+
+    def write_reports(self, directory: Path):
+        """Write the summary as CSV and the folded stacks for a flame graph into the
+        given directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / PROFILE_SUMMARY_FILENAME, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["command", "device", "group", "count", "total_s", "max_s"])
+            for s in self.summary():
+                writer.writerow(
+                    [s.command, s.device, s.group, s.count, s.total_s, s.max_s]
+                )
+        (directory / PROFILE_FOLDED_FILENAME).write_text(
+            "\n".join(self.folded_stacks()) + "\n"
+        )
+        LOGGER.info(f"Plan profile written to {directory}")
+
+    def record_msg(self, msg: Msg, start_s: float, end_s: float, response: Any):
+        """Record that the RunEngine processed msg between start_s and end_s."""
+        group = msg.kwargs.get("group")
+        stack = tuple(self._stack)
+        self.msg_timings.append(
+            MsgTiming(
+                msg.command, _device_name(msg), group, stack, start_s, end_s - start_s
+            )
+        )
+        match msg.command:
+            case "open_run":
+                self._stack.append(
+                    msg.kwargs.get("subplan_name") or msg.run or "unnamed_run"
+                )
+            case "close_run":
+                if self._stack:
+                    self._stack.pop()
+            case "wait":
+                self.wait_timings.append(
+                    WaitTiming(
+                        group,
+                        stack,
+                        start_s,
+                        end_s,
+                        self._pending_statuses.pop(group, []),
+                    )
+                )
+        if _is_status(response):
+            self._add_status(msg, group, start_s, response)
+
+    def _add_status(self, msg: Msg, group: str | None, start_s: float, status: Any):
+        timing = StatusTiming(msg.command, _device_name(msg), group, start_s)
+
+        def on_finished(_):
+            timing.finished_s = monotonic()
+
+        status.add_callback(on_finished)
+        self._pending_statuses[group].append(timing)
+
+
+def _device_name(msg: Msg) -> str | None:
+    return getattr(msg.obj, "name", None) if msg.obj is not None else None
+
+
+def _is_status(response: Any) -> bool:
+    return callable(getattr(response, "add_callback", None)) and hasattr(
+        response, "done"
+    )
+
+
+def profile_plan_wrapper(plan: MsgGenerator, profile: PlanProfile) -> MsgGenerator:
+    """Record how long the RunEngine spends processing each message of the plan and,
+    for each wait, how long it was blocked by each status in the group.
+
+    This wraps any plan, including those run in a simulated RunEngine with mock
+    devices, so that slow sets and waits can be found without hardware.
+
+    Args:
+        plan: The plan to profile
+        profile: The profile to record the timings into
+    """
+    response: Any = None
+    exception: BaseException | None = None
+    while True:
+        try:
+            if exception is not None:
+                msg = plan.throw(exception)
+            else:
+                msg = plan.send(response)
+        except StopIteration as e:
+            return e.value
+        exception = None
+        start_s = monotonic()
+        try:
+            response = yield msg
+        except GeneratorExit:
+            plan.close()
+            raise
+        except BaseException as e:
+            profile.record_msg(msg, start_s, monotonic(), None)
+            response, exception = None, e
+        else:
+            profile.record_msg(msg, start_s, monotonic(), response)
+
+
+profile_plan_decorator = make_decorator(profile_plan_wrapper)
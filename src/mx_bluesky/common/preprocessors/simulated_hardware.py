@@ -0,0 +1,202 @@
+import asyncio
+import random
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from bluesky import preprocessors as bpp
+from bluesky.run_engine import RunEngine
+from bluesky.utils import Msg, MsgGenerator, make_decorator
+from ophyd_async.core import AsyncStatus
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.virtual_clock import VirtualClock, set_virtual_clock
+
+# Returns how long a simulated action should take, in seconds
+Distribution = Callable[[], float]
+
+SIMULATED_COMMANDS = {"set", "trigger", "kickoff", "complete"}
+
+
+def fixed(duration_s: float) -> Distribution:
+    return lambda: duration_s
+
+
+def uniform(
+    low_s: float, high_s: float, rng: random.Random | None = None
+) -> Distribution:
+    rng = rng or random.Random()
+    return lambda: rng.uniform(low_s, high_s)
+
+
+def normal(
+    mean_s: float, standard_deviation_s: float, rng: random.Random | None = None
+) -> Distribution:
+    """A normal distribution of durations, truncated at zero."""
+    rng = rng or random.Random()
+    return lambda: max(0.0, rng.gauss(mean_s, standard_deviation_s))
+
+
+@dataclass
+class SimulatedHardwareTimings:
+    """How long actions on simulated devices should take to complete.
+
+    Attributes:
+        durations: The distribution of durations for each device, keyed by the device
+            name or the name of a parent device, e.g. "robot" applies to every action
+            on the robot and its children. The longest matching name is used.
+        default: The distribution for devices without a duration, if None these
+            complete as soon as the mock device does
+    """
+
+    durations: dict[str, Distribution] = field(default_factory=dict)
+    default: Distribution | None = None
+
+    def distribution_for(self, device_name: str) -> Distribution | None:
+        matches = [
+            name
+            for name in self.durations
+            if device_name == name or device_name.startswith(f"{name}-")
+        ]
+        if matches:
+            return self.durations[max(matches, key=len)]
+        return self.default
+
+
+class _SlowedDevice:
+    """Stands in for a device in a single message so that the status it returns
+    finishes no sooner than the given duration after it was started."""
+
+    def __init__(self, device: Any, duration_s: float):
+        self._device = device
+        self._duration_s = duration_s
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._device, name)
+
+    def set(self, *args, **kwargs) -> AsyncStatus:
+        return self._slowed(self._device.set(*args, **kwargs))
+
+    def trigger(self) -> AsyncStatus:
+        return self._slowed(self._device.trigger())
+
+    def kickoff(self) -> AsyncStatus:
+        return self._slowed(self._device.kickoff())
+
+    def complete(self) -> AsyncStatus:
+        return self._slowed(self._device.complete())
+
+    def _slowed(self, status: Any) -> AsyncStatus:
+        return AsyncStatus(_finish_no_sooner_than(status, self._duration_s))
+
+
+async def _finish_no_sooner_than(status: Any, duration_s: float):
+    await asyncio.gather(_wait_for_status(status), asyncio.sleep(duration_s))
+
+
+async def _wait_for_status(status: Any):
+    if isinstance(status, AsyncStatus):
+        await status
+        return
+    loop = asyncio.get_running_loop()
+    finished = loop.create_future()
+    status.add_callback(
+        lambda _: loop.call_soon_threadsafe(
+            lambda: finished.done() or finished.set_result(None)
+        )
+    )
+    await finished
+    if (exception := status.exception()) is not None:
+        raise exception
+
+
+def simulated_hardware_wrapper(
+    plan: MsgGenerator, timings: SimulatedHardwareTimings
+) -> MsgGenerator:
+    """Make the sets, triggers, kickoffs and completes of mocked devices take as long
+    as they would on real hardware, so that simulated runs can be benchmarked.
+
+    Each time a device is acted on, a duration is drawn from its distribution and the
+    status for the action finishes no sooner than that duration after it was started.
+    Actions on different devices still run in parallel, as they would on a beamline.
+
+    Args:
+        plan: The plan to run against mocked devices
+        timings: How long actions on each device should take
+    """
+
+    def slow_msg(msg: Msg) -> Msg:
+        device_name = getattr(msg.obj, "name", None)
+        if msg.command not in SIMULATED_COMMANDS or not device_name:
+            return msg
+        distribution = timings.distribution_for(device_name)
+        if distribution is None:
+            return msg
+        return msg._replace(obj=_SlowedDevice(msg.obj, distribution()))
+
+    return (yield from bpp.msg_mutator(plan, slow_msg))
+
+
+simulated_hardware_decorator = make_decorator(simulated_hardware_wrapper)
+
+
+def virtual_time_wrapper(
+    plan: MsgGenerator,
+    clock: VirtualClock,
+    timings: SimulatedHardwareTimings | None = None,
+) -> MsgGenerator:
+    """Run a plan against mocked devices in virtual time, so that it takes only as long
+    as the plan's own processing.
+
+    Sleeps in the plan advance the clock rather than waiting. Sets, triggers, kickoffs
+    and completes are given a finishing time on the clock, drawn from the timings, and
+    waiting on their group advances the clock to the latest finishing time in the group.
+    The mocked devices themselves still finish immediately.
+
+    Args:
+        plan: The plan to run against mocked devices
+        clock: The clock to advance
+        timings: How long actions on each device take in virtual time, if None they
+            take no time
+    """
+    finishing_times: dict[str | None, list[float]] = defaultdict(list)
+
+    def advance_clock(msg: Msg) -> Msg:
+        group = msg.kwargs.get("group")
+        match msg.command:
+            case "sleep":
+                clock.advance(msg.args[0])
+                return Msg("null")
+            case "wait":
+                clock.advance_to(max(finishing_times.pop(group, []), default=0))
+            case command if command in SIMULATED_COMMANDS and timings:
+                device_name = getattr(msg.obj, "name", None)
+                distribution = timings.distribution_for(device_name or "")
+                if distribution is not None:
+                    finishing_times[group].append(clock.monotonic() + distribution())
+        return msg
+
+    return (yield from bpp.msg_mutator(plan, advance_clock))
+
+
+def use_virtual_time(
+    run_engine: RunEngine, timings: SimulatedHardwareTimings | None = None
+) -> VirtualClock:
+    """Run every plan on the RunEngine in virtual time, see virtual_time_wrapper. This
+    should only be used with mocked devices.
+
+    Without timings, device actions such as moves take no virtual time, so the virtual
+    time a plan takes only covers its sleeps and timeouts, not how long the hardware
+    would take.
+
+    Returns:
+        The virtual clock, which is also used by plans to measure timeouts
+    """
+    clock = VirtualClock()
+    set_virtual_clock(clock)
+    run_engine.preprocessors.append(
+        lambda plan: virtual_time_wrapper(plan, clock, timings)
+    )
+    LOGGER.info("Running plans in virtual time")
+    return clock
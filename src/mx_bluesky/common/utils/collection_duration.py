@@ -0,0 +1,104 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from mx_bluesky.common.parameters.constants import HardwareConstants
+from mx_bluesky.common.parameters.gridscan import SpecifiedThreeDGridScan
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase
+from mx_bluesky.common.utils.virtual_clock import monotonic
+
+# Time for the sample stage to turn around between rows of a gridscan. This is only a
+# starting point, it is corrected by how long gridscans actually take
+GRIDSCAN_ROW_TURNAROUND_S = 0.1
+# How quickly correction factors follow recorded durations, from 0 (never) to 1
+# (entirely replaced by the latest duration)
+CORRECTION_SMOOTHING = 0.2
+# How many times longer than estimated a collection must take to be reported as slow
+REGRESSION_TOLERANCE = 1.5
+
+
+def estimate_gridscan_s(
+    params: SpecifiedThreeDGridScan,
+    detector_deadtime_s: float = HardwareConstants.PANDA_FGS_EIGER_DEADTIME_S,
+) -> float:
+    """Estimate how long both grids of a 3D gridscan take to collect, from the
+    exposure and detector deadtime of each image and the stage turning around between
+    rows, not including any time to set up for the gridscan."""
+    rows = params.y_steps + params.z_steps
+    images = params.x_steps * rows
+    return (
+        images * (params.exposure_time_s + detector_deadtime_s)
+        + rows * GRIDSCAN_ROW_TURNAROUND_S
+    )
+
+
+class DurationEstimator:
+    """Learns how long collections actually take compared to their estimated
+    durations, so that estimates, e.g. from estimate_gridscan_s, can be corrected for
+    planning around topup and reporting progress, and collections that take much longer
+    than usual can be reported.
+
+    A correction factor is kept for each phase, following the ratio of actual to
+    estimated duration of recent collections.
+    """
+
+    def __init__(
+        self,
+        smoothing: float = CORRECTION_SMOOTHING,
+        regression_tolerance: float = REGRESSION_TOLERANCE,
+    ):
+        self.smoothing = smoothing
+        self.regression_tolerance = regression_tolerance
+        self.correction_factors: dict[Phase, float] = {}
+
+    def corrected(self, phase: Phase, estimate_s: float) -> float:
+        """The estimated duration corrected by how long the phase has actually taken
+        compared to its estimates."""
+        return estimate_s * self.correction_factors.get(phase, 1.0)
+
+    def record(self, phase: Phase, estimate_s: float, actual_s: float):
+        """Learn from how long a phase took compared to its uncorrected estimate."""
+        if estimate_s <= 0:
+            return
+        expected_s = self.corrected(phase, estimate_s)
+        if actual_s > expected_s * self.regression_tolerance:
+            LOGGER.warning(
+                f"{phase} took {actual_s:.1f}s, expected {expected_s:.1f}s from previous "
+                "collections"
+            )
+        ratio = actual_s / estimate_s
+        factor = self.correction_factors.get(phase)
+        self.correction_factors[phase] = (
+            ratio if factor is None else factor + self.smoothing * (ratio - factor)
+        )
+
+    @contextmanager
+    def compare_with_estimate(
+        self, phase: Phase, estimate_s: float | None
+    ) -> Iterator[None]:
+        """Record how long a phase actually takes against its estimate, if it succeeds.
+
+        This can be used around plan stubs as well as ordinary code, e.g.
+
+            with estimator.compare_with_estimate(Phase.FLYSCAN, estimate_s):
+                yield from bps.complete(gridscan, wait=True)
+        """
+        if estimate_s is None:
+            yield
+            return
+        LOGGER.info(
+            f"Expecting {phase} to take {self.corrected(phase, estimate_s):.1f}s"
+        )
+        start_time = monotonic()
+        yield
+        self.record(phase, estimate_s, monotonic() - start_time)
+
+    def clear(self):
+        self.correction_factors.clear()
+
+
+_duration_estimator = DurationEstimator()
+
+
+def get_duration_estimator() -> DurationEstimator:
+    return _duration_estimator
@@ -1,4 +1,6 @@
 import dataclasses
+import time
+from functools import cache
 from typing import Any, ClassVar, Protocol, TypeVar, get_type_hints
 
 from blueapi.core import BlueskyContext
@@ -42,6 +44,23 @@ def find_device_in_context(
     return device
 
 
+@dataclasses.dataclass(frozen=True)
+class _CompositeFieldSpec:
+    name: str
+    expected_type: Any
+
+
+@cache
+def _resolve_composite_fields(dc: type) -> tuple[_CompositeFieldSpec, ...]:
+    """Resolve the device names and expected types of a composite. The result depends
+    only on the composite type so is cached, as resolving the type hints is slow."""
+    dc_type_hints: dict[str, Any] = get_type_hints(dc)
+    return tuple(
+        _CompositeFieldSpec(field.name, dc_type_hints.get(field.name, Device))
+        for field in dataclasses.fields(dc)
+    )
+
+
 def device_composite_from_context(context: BlueskyContext, dc: type[DT]) -> DT:
     """
     Initializes all of the devices referenced in a given dataclass from a provided
@@ -56,13 +75,49 @@ def device_composite_from_context(context: BlueskyContext, dc: type[DT]) -> DT:
     )
 
     devices: dict[str, Any] = {}
-    dc_type_hints: dict[str, Any] = get_type_hints(dc)
 
-    for field in dataclasses.fields(dc):
+    for field in _resolve_composite_fields(dc):
         device = find_device_in_context(
-            context, field.name, expected_type=dc_type_hints.get(field.name, Device)
+            context, field.name, expected_type=field.expected_type
         )
 
         devices[field.name] = device
 
     return dc(**devices)
+
+
+class DeviceCompositeFactory:
+    """Creates device composites from a blueapi context, for plans that are invoked
+    repeatedly with the same devices.
+
+    The most recently created composite of each type is reused for as long as every
+    device it references is still the device registered under that name in the context,
+    so it is rebuilt whenever the devices in the context are reloaded.
+    """
+
+    def __init__(self, context: BlueskyContext):
+        self._context = context
+        self._composites: dict[type, Any] = {}
+
+    def create(self, dc: type[DT]) -> DT:
+        start_time = time.monotonic()
+        composite = self._composites.get(dc)
+        if composite is not None and self._devices_unchanged(composite):
+            action = "Reused"
+        else:
+            action = "Created"
+            composite = device_composite_from_context(self._context, dc)
+            self._composites[dc] = composite
+        LOGGER.info(
+            f"{action} {dc.__name__} in {(time.monotonic() - start_time) * 1000:.1f}ms"
+        )
+        return composite
+
+    def clear(self):
+        self._composites.clear()
+
+    def _devices_unchanged(self, composite: _IsDataclass) -> bool:
+        return all(
+            self._context.find_device(field.name) is getattr(composite, field.name)
+            for field in _resolve_composite_fields(type(composite))
+        )
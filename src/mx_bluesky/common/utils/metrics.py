@@ -0,0 +1,167 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from functools import wraps
+from inspect import isgeneratorfunction
+from pathlib import Path
+from time import monotonic
+from typing import Any, ParamSpec, TypeVar, cast
+
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics.export import ConsoleMetricExporter, MetricsData
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+METER = metrics.get_meter(__name__)
+
+
+class Phase(StrEnum):
+    ROBOT_LOAD = "robot_load"
+    PIN_TIP_CENTRING = "pin_tip_centring"
+    GRID_DETECTION = "grid_detection"
+    FLYSCAN = "flyscan"
+    ZOCALO_WAIT = "zocalo_wait"
+    ROTATION = "rotation"
+    ISPYB = "ispyb"
+    AGAMEMNON = "agamemnon"
+
+
+class Outcome(StrEnum):
+    SUCCESS = "success"
+    FAILURE = "failure"
+
+
+PHASE_DURATIONS = {
+    phase: METER.create_histogram(
+        f"mx_bluesky.{phase}.duration",
+        unit="s",
+        description=f"Time taken by {phase.replace('_', ' ')}",
+    )
+    for phase in Phase
+}
+SAMPLES = METER.create_counter(
+    "mx_bluesky.samples",
+    unit="{sample}",
+    description="Number of samples collected, by outcome",
+)
+QUEUE_DEPTH = METER.create_gauge(
+    "mx_bluesky.queue_depth",
+    unit="{item}",
+    description="Number of items waiting in a queue, by queue",
+)
+DROPPED_DOCUMENTS = METER.create_counter(
+    "mx_bluesky.dropped_documents",
+    unit="{document}",
+    description="Number of documents dropped before reaching the callbacks, by name",
+)
+ELIDED_WRITES = METER.create_counter(
+    "mx_bluesky.elided_writes",
+    unit="{write}",
+    description="Number of writes skipped because the signal already had the value",
+)
+
+TOPUP_WAIT = METER.create_histogram(
+    "mx_bluesky.topup_wait.duration",
+    unit="s",
+    description="Time spent waiting for topup before a collection, by whether it was "
+    "overlapped with preparation or idle",
+)
+DETECTOR_ARMING = METER.create_histogram(
+    "mx_bluesky.detector_arming.duration",
+    unit="s",
+    description="Time taken arming the detector, by whether it was hidden behind "
+    "preparing for the collection or waited for",
+)
+
+
+@contextmanager
+def record_duration(phase: Phase, **attributes: str) -> Iterator[None]:
+    """Record the time taken by a phase of an experiment, along with whether it
+    succeeded.
+
+    This can be used around plan stubs as well as ordinary code, e.g.
+
+        with record_duration(Phase.ZOCALO_WAIT):
+            yield from bps.trigger(zocalo, wait=True)
+    """
+    start_time = monotonic()
+    outcome = Outcome.FAILURE
+    try:
+        yield
+        outcome = Outcome.SUCCESS
+    finally:
+        PHASE_DURATIONS[phase].record(
+            monotonic() - start_time, {**attributes, "outcome": outcome}
+        )
+
+
+def timed(
+    phase: Phase, **attributes: str
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator to record the time taken by a plan or a function, see record_duration.
+
+    For plans the duration covers the execution of the plan by the RunEngine rather than
+    the creation of the generator.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if isgeneratorfunction(func):
+
+            @wraps(func)
+            def timed_plan(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with record_duration(phase, **attributes):
+                    return (yield from cast(Any, func(*args, **kwargs)))
+
+            return cast(Callable[P, R], timed_plan)
+
+        @wraps(func)
+        def timed_func(*args: P.args, **kwargs: P.kwargs) -> R:
+            with record_duration(phase, **attributes):
+                return func(*args, **kwargs)
+
+        return timed_func
+
+    return decorator
+
+
+def record_sample(outcome: Outcome):
+    SAMPLES.add(1, {"outcome": outcome})
+
+
+def record_queue_depth(queue: str, depth: int):
+    QUEUE_DEPTH.set(depth, {"queue": queue})
+
+
+def record_dropped_document(name: str):
+    DROPPED_DOCUMENTS.add(1, {"document": name})
+
+
+def record_elided_write():
+    ELIDED_WRITES.add(1)
+
+
+def record_topup_wait(overlapped_s: float, idle_s: float):
+    TOPUP_WAIT.record(overlapped_s, {"use": "overlapped"})
+    TOPUP_WAIT.record(idle_s, {"use": "idle"})
+
+
+def record_detector_arming(hidden_s: float, waited_s: float):
+    DETECTOR_ARMING.record(hidden_s, {"use": "hidden"})
+    DETECTOR_ARMING.record(waited_s, {"use": "waited"})
+
+
+class FileMetricExporter(ConsoleMetricExporter):
+    """Exporter that appends metrics to a file as JSON lines, so that they can be
+    analysed without an OpenTelemetry collector running."""
+
+    def __init__(self, path: Path):
+        self._file = path.open("a", encoding="utf-8")
+        super().__init__(out=self._file, formatter=_to_json_line)
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs: Any) -> None:
+        self._file.close()
+
+
+def _to_json_line(metrics_data: MetricsData) -> str:
+    return metrics_data.to_json(indent=None) + "\n"
@@ -0,0 +1,90 @@
+from functools import partial
+from typing import Any
+
+import numpy as np
+from bluesky.protocols import Reading
+from ophyd_async.core import SignalRW, Table
+
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import record_elided_write
+
+
+class SetpointCache:
+    """The last setpoint confirmed for each signal, so that setup plans can skip writing
+    values that signals already have, see set_concurrently.
+
+    Once a signal has been set, it is monitored and its setpoint forgotten as soon as
+    it changes to anything else, e.g. because something other than mx-bluesky has set
+    it, or goes into alarm, e.g. because it has disconnected. Everything should be
+    forgotten with clear() whenever devices are reconnected, as the monitors are on the
+    old connections.
+    """
+
+    def __init__(self):
+        self._setpoints: dict[SignalRW, Any] = {}
+        self._monitors: dict[SignalRW, partial] = {}
+        self.writes_elided = 0
+
+    def is_set_to(self, signal: SignalRW, value: Any) -> bool:
+        return signal in self._setpoints and _equal(self._setpoints[signal], value)
+
+    def record_elided_write(self):
+        self.writes_elided += 1
+        record_elided_write()
+
+    def confirm(self, signal: SignalRW, value: Any):
+        """Remember the value that a signal has successfully been set to."""
+        self._setpoints[signal] = value
+        if signal not in self._monitors:
+            self._monitors[signal] = partial(self._on_update, signal)
+            signal.subscribe_reading(self._monitors[signal])
+
+    def forget(self, signal: SignalRW):
+        self._setpoints.pop(signal, None)
+
+    def clear(self):
+        """Forget all setpoints and stop monitoring their signals."""
+        for signal, monitor in self._monitors.items():
+            signal.clear_sub(monitor)
+        self._monitors.clear()
+        self._setpoints.clear()
+        self.writes_elided = 0
+
+    def _on_update(self, signal: SignalRW, reading: dict[str, Reading]):
+        if signal not in self._setpoints:
+            return
+        update = reading[signal.name]
+        if update.get("alarm_severity", 0) or not _equal(
+            update["value"], self._setpoints[signal]
+        ):
+            LOGGER.debug(f"{signal.name} has changed, forgetting its setpoint")
+            del self._setpoints[signal]
+
+
+def _equal(value: Any, other: Any) -> bool:
+    """Whether two values are definitely equal. Tables are equal if all their columns
+    are, other values such as arrays, which cannot simply be compared, are never equal
+    so they are always written."""
+    if isinstance(value, Table) and isinstance(other, Table):
+        return type(value) is type(other) and all(
+            np.array_equal(getattr(value, column), getattr(other, column))
+            for column in type(value).model_fields
+        )
+    try:
+        return bool(value == other)
+    except ValueError:
+        return False
+
+
+_setpoint_cache: SetpointCache | None = None
+
+
+def get_setpoint_cache() -> SetpointCache | None:
+    """Get the setpoint cache for this instance, or None if writes are never skipped."""
+    return _setpoint_cache
+
+
+def set_setpoint_cache(cache: SetpointCache | None):
+    """Set the setpoint cache for this instance, or None to never skip writes."""
+    global _setpoint_cache
+    _setpoint_cache = cache
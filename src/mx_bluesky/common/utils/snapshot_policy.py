@@ -0,0 +1,184 @@
+import dataclasses
+from collections.abc import Sequence
+from math import cos, radians, sin
+
+from bluesky.callbacks import CallbackBase
+from event_model import Event, EventDescriptor
+
+from mx_bluesky.common.parameters.constants import DocDescriptorNames
+from mx_bluesky.common.utils.log import LOGGER
+
+# How far chi and phi may be from where they were for the grid snapshots, and how far
+# a requested snapshot omega may be from the omega of a grid snapshot, for the grid
+# snapshot to show the sample as it would be seen in a new snapshot
+ANGLE_TOLERANCE_DEG = 0.5
+# The number of rotation snapshots generated, from the first grid snapshots in turn,
+# see oav_snapshot_plan and BeamDrawingCallback
+GENERATED_SNAPSHOTS = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class GridSnapshotGeometry:
+    """Where the sample was, and how the OAV saw it, when a grid snapshot was taken."""
+
+    sample_pos_mm: tuple[float, float, float]
+    omega_deg: float
+    chi_deg: float
+    phi_deg: float
+    beam_centre_px: tuple[int, int]
+    microns_per_pixel: tuple[float, float]
+
+
+def project_to_image_plane_mm(
+    xyz_mm: tuple[float, float, float], omega_deg: float
+) -> tuple[float, float]:
+    """Project a sample displacement onto the plane of an OAV image taken at the given
+    omega."""
+    return (
+        xyz_mm[0],
+        xyz_mm[1] * cos(-radians(omega_deg)) + xyz_mm[2] * sin(-radians(omega_deg)),
+    )
+
+
+class GridSnapshotEventHandler(CallbackBase):
+    """Records the geometry of the grid snapshots taken during grid detection, so that
+    rotation snapshots can be generated from them rather than taken afresh."""
+
+    def __init__(self):
+        super().__init__()
+        self.grid_snapshots: list[GridSnapshotGeometry] = []
+        self._descriptor_uid: str | None = None
+
+    def descriptor(self, doc: EventDescriptor) -> EventDescriptor | None:
+        if doc.get("name") == DocDescriptorNames.OAV_GRID_SNAPSHOT_TRIGGERED:
+            self._descriptor_uid = doc["uid"]
+        return doc
+
+    def event(self, doc: Event) -> Event:
+        if doc["descriptor"] == self._descriptor_uid:
+            data = doc["data"]
+            self.grid_snapshots.append(
+                GridSnapshotGeometry(
+                    sample_pos_mm=(
+                        data.get("smargon-x", 0.0),
+                        data.get("smargon-y", 0.0),
+                        data.get("smargon-z", 0.0),
+                    ),
+                    omega_deg=round(data.get("smargon-omega", 0.0)),
+                    chi_deg=data.get("smargon-chi", 0.0),
+                    phi_deg=data.get("smargon-phi", 0.0),
+                    beam_centre_px=(
+                        data["oav-beam_centre_i"],
+                        data["oav-beam_centre_j"],
+                    ),
+                    microns_per_pixel=(
+                        data["oav-microns_per_pixel_x"],
+                        data["oav-microns_per_pixel_y"],
+                    ),
+                )
+            )
+        return doc
+
+
+def _angles_match(a_deg: float, b_deg: float) -> bool:
+    difference_deg = (a_deg - b_deg) % 360
+    return min(difference_deg, 360 - difference_deg) <= ANGLE_TOLERANCE_DEG
+
+
+def _in_frame(
+    snapshot: GridSnapshotGeometry,
+    sample_pos_mm: tuple[float, float, float],
+    image_size_px: tuple[int, int],
+) -> bool:
+    offset_mm = project_to_image_plane_mm(
+        (
+            sample_pos_mm[0] - snapshot.sample_pos_mm[0],
+            sample_pos_mm[1] - snapshot.sample_pos_mm[1],
+            sample_pos_mm[2] - snapshot.sample_pos_mm[2],
+        ),
+        snapshot.omega_deg,
+    )
+    return all(
+        0 <= beam_centre + offset * 1000 / microns_per_pixel < size
+        for offset, beam_centre, microns_per_pixel, size in zip(
+            offset_mm,
+            snapshot.beam_centre_px,
+            snapshot.microns_per_pixel,
+            image_size_px,
+            strict=True,
+        )
+    )
+
+
+def omegas_not_generated(
+    grid_snapshots: Sequence[GridSnapshotGeometry],
+    snapshot_omegas_deg: Sequence[float],
+) -> list[float]:
+    """The requested omegas that no rotation snapshot is generated at, where snapshots
+    must still be taken when the others are generated, see
+    can_generate_rotation_snapshots."""
+    generated_from = grid_snapshots[:GENERATED_SNAPSHOTS]
+    return [
+        omega_deg
+        for omega_deg in snapshot_omegas_deg
+        if not any(_angles_match(omega_deg, s.omega_deg) for s in generated_from)
+    ]
+
+
+def can_generate_rotation_snapshots(
+    grid_snapshots: Sequence[GridSnapshotGeometry],
+    snapshot_omegas_deg: Sequence[float],
+    sample_pos_mm: tuple[float, float, float],
+    chi_deg: float,
+    phi_deg: float,
+    image_size_px: tuple[int, int],
+) -> bool:
+    """Whether rotation snapshots can be generated from the grid snapshots instead of
+    moving omega to each angle and triggering the OAV. Snapshots are still taken at any
+    other requested omegas, see omegas_not_generated.
+
+    Only the first grid snapshots are used to generate rotation snapshots. This is the
+    case if each of those was taken at a requested omega, the sample has not been
+    rotated in chi or phi since, and it is still within the frame of each of them, so
+    the beam can be drawn on them where the sample is now. Omegas are compared modulo
+    360, but a snapshot from 180 degrees away would show the sample mirrored, so does
+    not count.
+
+    Args:
+        grid_snapshots: Geometry of the grid snapshots, see GridSnapshotEventHandler
+        snapshot_omegas_deg: The omegas rotation snapshots were requested at
+        sample_pos_mm: Where the sample will be when the snapshots are taken
+        chi_deg: Chi when the snapshots are taken
+        phi_deg: Phi when the snapshots are taken
+        image_size_px: The size of the OAV images
+    """
+    if len(grid_snapshots) < GENERATED_SNAPSHOTS:
+        LOGGER.info("Taking rotation snapshots as there are no grid snapshots")
+        return False
+    generated_from = grid_snapshots[:GENERATED_SNAPSHOTS]
+    for snapshot in generated_from:
+        if not any(
+            _angles_match(omega_deg, snapshot.omega_deg)
+            for omega_deg in snapshot_omegas_deg
+        ):
+            LOGGER.info(
+                f"Taking rotation snapshots as none was requested at the grid "
+                f"snapshot at {snapshot.omega_deg}"
+            )
+            return False
+        if not (
+            _angles_match(chi_deg, snapshot.chi_deg)
+            and _angles_match(phi_deg, snapshot.phi_deg)
+        ):
+            LOGGER.info(
+                f"Taking rotation snapshots as chi, phi {chi_deg}, {phi_deg} differ "
+                f"from the grid snapshot at {snapshot.omega_deg}"
+            )
+            return False
+        if not _in_frame(snapshot, sample_pos_mm, image_size_px):
+            LOGGER.info(
+                f"Taking rotation snapshots as {sample_pos_mm} is outside the grid "
+                f"snapshot at {snapshot.omega_deg}"
+            )
+            return False
+    return True
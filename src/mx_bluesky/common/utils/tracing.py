@@ -1,27 +1,50 @@
+from pathlib import Path
+
 from opentelemetry import metrics, trace
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import (
+    MetricReader,
+    PeriodicExportingMetricReader,
+)
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
+from mx_bluesky.common.utils.metrics import FileMetricExporter
+
+
+def setup_tracing(
+    service_name: str = "Hyperion",
+    metrics_file: Path | None = None,
+    export_otlp: bool = True,
+):
+    """Set up the tracer and meter providers.
 
-def setup_tracing(service_name: str = "Hyperion"):
+    Args:
+        service_name: The name of the service the traces and metrics are from
+        metrics_file: If given, metrics are also appended to this file
+        export_otlp: Whether to export traces and metrics to a local OTLP collector
+    """
     resource = Resource(attributes={SERVICE_NAME: service_name})
 
-    trace_provider = TracerProvider(resource=resource)
-    processor = BatchSpanProcessor(
-        OTLPSpanExporter(endpoint="http://0.0.0.0:4318/v1/traces")
-    )
-    trace_provider.add_span_processor(processor)
-    trace.set_tracer_provider(trace_provider)
-
-    reader = PeriodicExportingMetricReader(
-        OTLPMetricExporter(endpoint="http://0.0.0.0:4318/v1/metrics")
-    )
-    meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
+    readers: list[MetricReader] = []
+    if export_otlp:
+        trace_provider = TracerProvider(resource=resource)
+        processor = BatchSpanProcessor(
+            OTLPSpanExporter(endpoint="http://0.0.0.0:4318/v1/traces")
+        )
+        trace_provider.add_span_processor(processor)
+        trace.set_tracer_provider(trace_provider)
+        readers.append(
+            PeriodicExportingMetricReader(
+                OTLPMetricExporter(endpoint="http://0.0.0.0:4318/v1/metrics")
+            )
+        )
+    if metrics_file:
+        readers.append(PeriodicExportingMetricReader(FileMetricExporter(metrics_file)))
+    meter_provider = MeterProvider(resource=resource, metric_readers=readers)
     metrics.set_meter_provider(meter_provider)
 
 
@@ -0,0 +1,40 @@
+import time
+
+
+class VirtualClock:
+    """A clock that only moves when it is advanced, so that plans run against mocked
+    devices can be simulated much faster than they would run on a beamline, see
+    virtual_time_wrapper."""
+
+    def __init__(self, start_s: float = 0.0):
+        self._now_s = start_s
+
+    def monotonic(self) -> float:
+        return self._now_s
+
+    def advance(self, duration_s: float):
+        self._now_s += max(0.0, duration_s)
+
+    def advance_to(self, time_s: float):
+        """Advance the clock to the given time, if it is not already later."""
+        self._now_s = max(self._now_s, time_s)
+
+
+_virtual_clock: VirtualClock | None = None
+
+
+def get_virtual_clock() -> VirtualClock | None:
+    """Get the virtual clock for this instance, or None if running in real time."""
+    return _virtual_clock
+
+
+def set_virtual_clock(clock: VirtualClock | None):
+    """Set the virtual clock for this instance, or None to run in real time."""
+    global _virtual_clock
+    _virtual_clock = clock
+
+
+def monotonic() -> float:
+    """The time for plans to measure timeouts with, which is virtual when running in
+    virtual time."""
+    return _virtual_clock.monotonic() if _virtual_clock else time.monotonic()
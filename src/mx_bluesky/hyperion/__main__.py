@@ -14,19 +14,21 @@ from mx_bluesky.common.external_interaction.alerting.log_based_service import (
     LoggingAlertService,
 )
 from mx_bluesky.common.parameters.constants import Actions, Status
+from mx_bluesky.common.preprocessors.simulated_hardware import use_virtual_time
 from mx_bluesky.common.utils.log import (
     LOGGER,
     do_default_logging_setup,
     flush_debug_handler,
 )
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, set_setpoint_cache
+from mx_bluesky.common.utils.tracing import setup_tracing
 from mx_bluesky.hyperion.baton_handler import run_forever
 from mx_bluesky.hyperion.experiment_plans.experiment_registry import (
     PLAN_REGISTRY,
     PlanNotFoundError,
 )
 from mx_bluesky.hyperion.external_interaction.agamemnon import (
-    compare_params,
-    update_params_from_agamemnon,
+    AgamemnonComparisonService,
 )
 from mx_bluesky.hyperion.parameters.cli import (
     HyperionArgs,
@@ -34,7 +36,6 @@ from mx_bluesky.hyperion.parameters.cli import (
     parse_cli_args,
 )
 from mx_bluesky.hyperion.parameters.constants import CONST, HyperionConstants
-from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
 from mx_bluesky.hyperion.plan_runner import PlanRunner
 from mx_bluesky.hyperion.plan_runner_api import create_server_for_udc
 from mx_bluesky.hyperion.runner import (
@@ -43,9 +44,15 @@ from mx_bluesky.hyperion.runner import (
     make_error_status_and_message,
 )
 from mx_bluesky.hyperion.utils.context import setup_context
+from mx_bluesky.hyperion.utils.simulated_hardware_timings import i03_hardware_timings
 
 
-def compose_start_args(context: BlueskyContext, plan_name: str, action: Actions):
+def compose_start_args(
+    context: BlueskyContext,
+    plan_name: str,
+    action: Actions,
+    agamemnon_comparison: AgamemnonComparisonService,
+):
     experiment_registry_entry = PLAN_REGISTRY.get(plan_name)
     if experiment_registry_entry is None:
         raise PlanNotFoundError(f"Experiment plan '{plan_name}' not found in registry.")
@@ -62,9 +69,7 @@ def compose_start_args(context: BlueskyContext, plan_name: str, action: Actions)
         )
     try:
         parameters = experiment_internal_param_type(**json.loads(request.data))
-        parameters = update_params_from_agamemnon(parameters)
-        if isinstance(parameters, LoadCentreCollect):
-            compare_params(parameters)
+        parameters = agamemnon_comparison.update_and_compare(parameters)
         if parameters.model_extra:
             raise ValueError(f"Extra fields not allowed {parameters.model_extra}")
     except Exception as e:
@@ -75,17 +80,23 @@ def compose_start_args(context: BlueskyContext, plan_name: str, action: Actions)
 
 
 class RunExperiment(Resource):
-    def __init__(self, runner: GDARunner, context: BlueskyContext) -> None:
+    def __init__(
+        self,
+        runner: GDARunner,
+        context: BlueskyContext,
+        agamemnon_comparison: AgamemnonComparisonService,
+    ) -> None:
         super().__init__()
         self.runner = runner
         self.context = context
+        self.agamemnon_comparison = agamemnon_comparison
 
     def put(self, plan_name: str, action: Actions):
         status_and_message = StatusAndMessage(Status.FAILED, f"{action} not understood")
         if action == Actions.START.value:
             try:
                 plan, params, plan_name = compose_start_args(
-                    self.context, plan_name, action
+                    self.context, plan_name, action, self.agamemnon_comparison
                 )
                 status_and_message = self.runner.start(plan, params, plan_name)
             except Exception as e:
@@ -135,7 +146,11 @@ class FlushLogs(Resource):
         return asdict(status_and_message)
 
 
-def create_app(runner: GDARunner, test_config=None) -> Flask:
+def create_app(
+    runner: GDARunner,
+    test_config=None,
+    comparison_service: AgamemnonComparisonService | None = None,
+) -> Flask:
     app = Flask(__name__)
     if test_config:
         app.config.update(test_config)
@@ -144,7 +159,11 @@ def create_app(runner: GDARunner, test_config=None) -> Flask:
     api.add_resource(
         RunExperiment,
         "/<string:plan_name>/<string:action>",
-        resource_class_args=[runner, runner.context],
+        resource_class_args=[
+            runner,
+            runner.context,
+            comparison_service or AgamemnonComparisonService(),
+        ],
     )
 
     api.add_resource(
@@ -166,6 +185,8 @@ def initialise_globals(args: HyperionArgs):
     )
     LOGGER.info(f"Hyperion launched with args:{argv}")
     alerting.set_alerting_service(LoggingAlertService(CONST.GRAYLOG_STREAM_ID))
+    if args.metrics_file:
+        setup_tracing(metrics_file=args.metrics_file, export_otlp=False)
 
 
 def main():
@@ -174,10 +195,17 @@ def main():
     initialise_globals(args)
     hyperion_port = HyperionConstants.HYPERION_PORT
     context = setup_context(dev_mode=args.dev_mode)
+    if args.virtual_time:
+        use_virtual_time(context.run_engine, i03_hardware_timings())
 
     if args.mode == HyperionMode.GDA:
-        runner = GDARunner(context=context)
-        app = create_app(runner)
+        runner = GDARunner(
+            context=context,
+            queued_publisher=args.queued_publisher,
+            filter_published_documents=args.filter_published_documents,
+        )
+        comparison_service = AgamemnonComparisonService()
+        app = create_app(runner, comparison_service=comparison_service)
         flask_thread = threading.Thread(
             target=lambda: app.run(
                 host="0.0.0.0", port=hyperion_port, debug=True, use_reloader=False
@@ -188,12 +216,28 @@ def main():
         LOGGER.info(
             f"Hyperion now listening on {hyperion_port} ({'IN DEV' if args.dev_mode else ''})"
         )
-        runner.wait_on_queue()
+        try:
+            runner.wait_on_queue()
+        finally:
+            comparison_service.shutdown()
+            runner.close_publisher()
     else:
-        plan_runner = PlanRunner(context, args.dev_mode)
+        if args.elide_unchanged_setpoints:
+            set_setpoint_cache(SetpointCache())
+        plan_runner = PlanRunner(
+            context,
+            args.dev_mode,
+            args.incremental_device_reconnect,
+            args.prefetch_agamemnon_instructions,
+            args.queued_publisher,
+            args.filter_published_documents,
+        )
         create_server_for_udc(plan_runner)
         _register_sigterm_handler(plan_runner)
-        run_forever(plan_runner)
+        try:
+            run_forever(plan_runner)
+        finally:
+            plan_runner.close_publisher()
 
 
 def _register_sigterm_handler(runner: PlanRunner):
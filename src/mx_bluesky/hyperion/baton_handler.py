@@ -1,10 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from functools import partial
-from typing import Any
 
 from blueapi.core.context import BlueskyContext
 from bluesky import plan_stubs as bps
 from bluesky import preprocessors as bpp
+from bluesky.callbacks import CallbackBase
 from bluesky.utils import MsgGenerator, RunEngineInterrupted
 from dodal.common.beamlines.commissioning_mode import set_commissioning_signal
 from dodal.devices.aperturescatterguard import ApertureScatterguard
@@ -13,8 +13,10 @@ from dodal.devices.detector.detector_motion import DetectorMotion, ShutterState
 from dodal.devices.motors import XYZStage
 from dodal.devices.robot import BartRobot
 from dodal.devices.smargon import Smargon
+from event_model import RunStart, RunStop
 
 from mx_bluesky.common.device_setup_plans.robot_load_unload import robot_unload
+from mx_bluesky.common.device_setup_plans.setup_panda import get_panda_config_manager
 from mx_bluesky.common.experiment_plans.inner_plans.udc_default_state import (
     UDCDefaultDevices,
     move_to_udc_default_state,
@@ -24,29 +26,37 @@ from mx_bluesky.common.external_interaction.alerting import (
     get_alerting_service,
 )
 from mx_bluesky.common.parameters.components import MxBlueskyParameters
+from mx_bluesky.common.parameters.constants import Status
+from mx_bluesky.common.plan_stubs.wait_for_signal import wait_for_signal_value
 from mx_bluesky.common.utils.context import (
     device_composite_from_context,
     find_device_in_context,
 )
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Outcome, record_sample
+from mx_bluesky.common.utils.setpoint_cache import get_setpoint_cache
 from mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan import (
-    create_devices,
+    LoadCentreCollectComposite,
     load_centre_collect_full,
 )
 from mx_bluesky.hyperion.external_interaction.agamemnon import (
+    AgamemnonInstructionPrefetcher,
     create_parameters_from_agamemnon,
 )
 from mx_bluesky.hyperion.external_interaction.alerting.constants import Subjects
 from mx_bluesky.hyperion.parameters.components import Wait
+from mx_bluesky.hyperion.parameters.constants import CONST
 from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
 from mx_bluesky.hyperion.plan_runner import PlanError, PlanRunner
 from mx_bluesky.hyperion.utils.context import (
     clear_all_device_caches,
+    reconnect_devices,
     setup_devices,
 )
 
 HYPERION_USER = "Hyperion"
 NO_USER = "None"
+BATON_MONITOR_TIMEOUT_S = 60
 
 
 def run_forever(runner: PlanRunner):
@@ -107,7 +117,7 @@ def run_udc_when_requested(context: BlueskyContext, runner: PlanRunner):
         current_visit: str | None = None
         while (yield from _is_requesting_baton(baton)):
             current_visit = yield from _fetch_and_process_agamemnon_instruction(
-                baton, runner, current_visit
+                baton, runner, current_visit, prefetcher
             )
         if current_visit:
             yield from _clean_up_udc(runner.context, current_visit)
@@ -124,41 +134,79 @@ def run_udc_when_requested(context: BlueskyContext, runner: PlanRunner):
     def collect_then_release() -> MsgGenerator:
         yield from bpp.contingency_wrapper(collect(), final_plan=release_baton)
 
+    prefetcher = (
+        AgamemnonInstructionPrefetcher(create_parameters_from_agamemnon)
+        if runner.prefetch_agamemnon_instructions
+        else None
+    )
+
     context.run_engine(acquire_baton())
-    _initialise_udc(context, runner.is_dev_mode)
-    context.run_engine(collect_then_release())
+    _initialise_udc(context, runner.is_dev_mode, runner.incremental_device_reconnect)
+    # Don't hold on to composites of devices from the previous session
+    runner.composite_factory.clear()
+    try:
+        context.run_engine(collect_then_release())
+    finally:
+        if prefetcher:
+            prefetcher.discard()
+        if setpoint_cache := get_setpoint_cache():
+            LOGGER.info(
+                f"Skipped {setpoint_cache.writes_elided} writes of unchanged setpoints "
+                "during UDC"
+            )
 
 
-def _initialise_udc(context: BlueskyContext, dev_mode: bool):
+def _initialise_udc(
+    context: BlueskyContext, dev_mode: bool, incremental_reconnect: bool = False
+):
     """
     Perform all initialisation that happens at the start of UDC just after the
     baton is acquired, but before we execute any plans or move hardware.
 
-    Beamline devices are unloaded and reloaded in order to pick up any new configuration,
-    bluesky context gets new set of devices.
+    By default, beamline devices are unloaded and reloaded in order to pick up any new
+    configuration, bluesky context gets new set of devices. If incremental_reconnect is
+    set, existing healthy devices are kept and only stale or failed devices are
+    reconnected.
     """
     LOGGER.info("Initialising mx-bluesky for UDC start...")
-    clear_all_device_caches(context)
-    LOGGER.debug("Reinitialising beamline devices")
-    setup_devices(context, dev_mode)
+    if setpoint_cache := get_setpoint_cache():
+        # The devices may be replaced, and if not may not be as we left them
+        setpoint_cache.clear()
+        get_panda_config_manager().clear()
+    if incremental_reconnect:
+        LOGGER.debug("Reconnecting stale beamline devices")
+        reconnect_devices(context, dev_mode)
+    else:
+        clear_all_device_caches(context)
+        LOGGER.debug("Reinitialising beamline devices")
+        setup_devices(context, dev_mode)
     set_commissioning_signal(_get_baton(context).commissioning)
 
 
 def _wait_for_hyperion_requested(baton: Baton):
+    """Wait on a monitor of the baton's requested user. The monitor is periodically
+    re-established in case it is silently lost."""
     LOGGER.debug("Hyperion waiting for baton...")
-    sleep_per_check = 0.1
-    while True:
-        requested_user = yield from bps.rd(baton.requested_user)
-        if requested_user == HYPERION_USER:
-            LOGGER.debug("Baton requested for Hyperion")
-            break
-        yield from bps.sleep(sleep_per_check)
+    while not (
+        yield from wait_for_signal_value(
+            baton.requested_user, HYPERION_USER, timeout_s=BATON_MONITOR_TIMEOUT_S
+        )
+    ):
+        LOGGER.debug("Baton not requested, re-subscribing to requested user")
+    LOGGER.debug("Baton requested for Hyperion")
 
 
 def _fetch_and_process_agamemnon_instruction(
-    baton: Baton, runner: PlanRunner, current_visit: str | None
+    baton: Baton,
+    runner: PlanRunner,
+    current_visit: str | None,
+    prefetcher: AgamemnonInstructionPrefetcher | None = None,
 ) -> MsgGenerator[str | None]:
-    parameter_list: Sequence[MxBlueskyParameters] = create_parameters_from_agamemnon()
+    parameter_list: Sequence[MxBlueskyParameters] = (
+        prefetcher.next_instruction()
+        if prefetcher
+        else create_parameters_from_agamemnon()
+    )
     if parameter_list:
         for parameters in parameter_list:
             LOGGER.info(
@@ -167,10 +215,22 @@ def _fetch_and_process_agamemnon_instruction(
             match parameters:
                 case LoadCentreCollect():
                     current_visit = parameters.visit
-                    devices: Any = create_devices(runner.context)
-                    yield from runner.execute_plan(
-                        partial(load_centre_collect_full, devices, parameters)
+                    devices = runner.composite_factory.create(
+                        LoadCentreCollectComposite
                     )
+                    plan = partial(load_centre_collect_full, devices, parameters)
+                    if prefetcher and parameters is parameter_list[-1]:
+                        plan = _prefetching_when_collected(
+                            plan, prefetcher, parameters.sample_id
+                        )
+                    try:
+                        yield from runner.execute_plan(plan)
+                    finally:
+                        record_sample(
+                            Outcome.SUCCESS
+                            if runner.current_status == Status.IDLE
+                            else Outcome.FAILURE
+                        )
                 case Wait():
                     yield from runner.execute_plan(partial(_runner_sleep, parameters))
                 case _:
@@ -207,6 +267,38 @@ def _raise_udc_completed_alert(alert_service: AlertService):
     )
 
 
+class _PrefetchWhenCollected(CallbackBase):
+    """Starts prefetching the next agamemnon instruction once all the rotations of a
+    sample have been collected, as agamemnon moves on from the sample then, while the
+    plan is still cleaning up."""
+
+    def __init__(self, prefetcher: AgamemnonInstructionPrefetcher, sample_id: int):
+        super().__init__()
+        self._prefetcher = prefetcher
+        self._sample_id = sample_id
+        self._rotation_uid: str | None = None
+
+    def start(self, doc: RunStart) -> RunStart:
+        if doc.get("subplan_name") == CONST.PLAN.ROTATION_MULTI:
+            self._rotation_uid = doc["uid"]
+        return doc
+
+    def stop(self, doc: RunStop) -> RunStop:
+        if doc["run_start"] == self._rotation_uid and doc["exit_status"] == "success":
+            self._prefetcher.start(self._sample_id)
+        return doc
+
+
+def _prefetching_when_collected(
+    plan: Callable[[], MsgGenerator],
+    prefetcher: AgamemnonInstructionPrefetcher,
+    sample_id: int,
+) -> Callable[[], MsgGenerator]:
+    return lambda: bpp.subs_wrapper(
+        plan(), _PrefetchWhenCollected(prefetcher, sample_id)
+    )
+
+
 def _runner_sleep(parameters: Wait) -> MsgGenerator:
     yield from bps.sleep(parameters.duration_s)
 
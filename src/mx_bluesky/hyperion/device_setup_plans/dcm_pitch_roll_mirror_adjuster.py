@@ -1,10 +1,16 @@
 import json
+import os
+from collections.abc import Callable
+from functools import partial
+from typing import Any, TypeVar
 
 import bluesky.plan_stubs as bps
+from bluesky.utils import MsgGenerator
 from dodal.devices.focusing_mirror import (
     FocusingMirrorWithStripes,
     MirrorStripe,
     MirrorVoltages,
+    SingleMirrorVoltage,
 )
 from dodal.devices.i03.undulator_dcm import UndulatorDCM
 from dodal.devices.util.adjuster_plans import lookup_table_adjuster
@@ -13,6 +19,7 @@ from dodal.devices.util.lookup_tables import (
     parse_lookup_table,
 )
 
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
 from mx_bluesky.common.utils.log import LOGGER
 from mx_bluesky.common.utils.utils import (
     energy_to_bragg_angle,
@@ -21,14 +28,43 @@ from mx_bluesky.common.utils.utils import (
 MIRROR_VOLTAGE_GROUP = "MIRROR_VOLTAGE_GROUP"
 DCM_GROUP = "DCM_GROUP"
 YAW_LAT_TIMEOUT_S = 30
+# The most bimorph channels that are slewed to a new voltage at the same time. Slewing
+# several at once is quicker, but is only done if the power supply is known to cope
+MAX_CHANNELS_SLEWING = 1
+# How far the DCM energy may be from a demand for the beamline to be at that energy
+ENERGY_TOLERANCE_KEV = 0.001
+# How far the DCM pitch and roll may be from their lookup table values
+PITCH_ROLL_TOLERANCE_MRAD = 0.0001
+
+T = TypeVar("T")
+
+_parsed_files: dict[tuple[str, Callable], tuple[int, Any]] = {}
+
+
+def _parse_if_modified(path: str, parse: Callable[[str], T]) -> T:
+    """Parse a configuration file, or return what it was parsed to last time if it
+    has not been modified since."""
+    modified_ns = os.stat(path).st_mtime_ns
+    cached = _parsed_files.get((path, parse))
+    if cached is None or cached[0] != modified_ns:
+        cached = _parsed_files[(path, parse)] = (modified_ns, parse(path))
+    return cached[1]
+
+
+def _load_json(path: str) -> Any:
+    with open(path) as json_file:
+        return json.load(json_file)
+
+
+def _load_lookup_table(path: str) -> Callable[[float], float]:
+    return linear_interpolation_lut(*parse_lookup_table(path))
 
 
 def _apply_and_wait_for_voltages_to_settle(
     stripe: MirrorStripe,
     mirror_voltages: MirrorVoltages,
 ):
-    with open(mirror_voltages.voltage_lookup_table_path) as lut_file:
-        json_obj = json.load(lut_file)
+    json_obj = _parse_if_modified(mirror_voltages.voltage_lookup_table_path, _load_json)
 
     # sample mode is the only mode supported
     sample_data = json_obj["sample"]
@@ -39,21 +75,29 @@ def _apply_and_wait_for_voltages_to_settle(
     elif stripe == MirrorStripe.PLATINUM:
         stripe_key = "pt"
 
+    required_voltages: dict[SingleMirrorVoltage, int] = {}
     for mirror_key, channels in {
         "hfm": mirror_voltages.horizontal_voltages,
         "vfm": mirror_voltages.vertical_voltages,
     }.items():
-        required_voltages = sample_data[stripe_key][mirror_key]
+        required_voltages.update(
+            zip(channels.values(), sample_data[stripe_key][mirror_key], strict=True)
+        )
 
-        for voltage_channel, required_voltage in zip(
-            channels.values(), required_voltages, strict=True
-        ):
-            LOGGER.info(
-                f"Applying and waiting for voltage {voltage_channel.name} = {required_voltage}"
-            )
-            yield from bps.abs_set(
-                voltage_channel, required_voltage, group=MIRROR_VOLTAGE_GROUP, wait=True
+    all_channels = list(required_voltages)
+    for start in range(0, len(all_channels), MAX_CHANNELS_SLEWING):
+        channels_to_slew = {
+            channel: required_voltages[channel]
+            for channel in all_channels[start : start + MAX_CHANNELS_SLEWING]
+        }
+        LOGGER.info(
+            "Applying and waiting for voltages "
+            + ", ".join(
+                f"{channel.name} = {voltage}"
+                for channel, voltage in channels_to_slew.items()
             )
+        )
+        yield from set_concurrently(channels_to_slew, group=MIRROR_VOLTAGE_GROUP)
 
 
 def adjust_mirror_stripe(
@@ -96,6 +140,61 @@ def adjust_mirror_stripe(
         yield from _apply_and_wait_for_voltages_to_settle(new_stripe, mirror_voltages)
 
 
+def _bragg_angle_deg(undulator_dcm: UndulatorDCM, energy_kev) -> MsgGenerator[float]:
+    d_spacing_a: float = yield from bps.rd(
+        undulator_dcm.dcm_ref().crystal_metadata_d_spacing_a
+    )
+    return energy_to_bragg_angle(energy_kev, d_spacing_a)
+
+
+def is_adjusted_for_energy(
+    undulator_dcm: UndulatorDCM, vfm: FocusingMirrorWithStripes, energy_kev
+) -> MsgGenerator[bool]:
+    """Whether the DCM energy, offset, pitch and roll, the undulator gap and the VFM
+    stripe are already where an energy change to the given energy would put them, so
+    the change can be skipped."""
+    dcm = undulator_dcm.dcm_ref()
+    undulator = undulator_dcm.undulator_ref()
+    # Skipping the energy change must not get round the undulator being disabled
+    [enabled] = yield from bps.wait_for([undulator.raise_if_not_enabled])
+    enabled.result()
+    energy_setpoint_kev = yield from bps.rd(dcm.energy_in_keV.user_setpoint)
+    energy_readback_kev = yield from bps.rd(dcm.energy_in_keV.user_readback)
+    if (
+        abs(energy_setpoint_kev - energy_kev) > ENERGY_TOLERANCE_KEV
+        or abs(energy_readback_kev - energy_kev) > ENERGY_TOLERANCE_KEV
+    ):
+        return False
+
+    [target_gap] = yield from bps.wait_for(
+        [partial(undulator._get_gap_to_match_energy, energy_kev)]  # noqa: SLF001
+    )
+    current_gap_mm = yield from bps.rd(undulator.current_gap)
+    gap_tolerance_mm = yield from bps.rd(undulator.gap_discrepancy_tolerance_mm)
+    if abs(current_gap_mm - target_gap.result()) > gap_tolerance_mm:
+        return False
+
+    offset_mm = yield from bps.rd(dcm.offset_in_mm.user_readback)
+    if (
+        abs(offset_mm - undulator_dcm.dcm_fixed_offset_mm)
+        > undulator_dcm.DCM_PERP_TOLERANCE
+    ):
+        return False
+
+    bragg_deg = yield from _bragg_angle_deg(undulator_dcm, energy_kev)
+    for motor, table_path in (
+        (dcm.xtal_1.pitch_in_mrad, undulator_dcm.pitch_energy_table_path),
+        (dcm.xtal_1.roll_in_mrad, undulator_dcm.roll_energy_table_path),
+    ):
+        lookup_table = _parse_if_modified(table_path, _load_lookup_table)
+        setpoint_mrad = yield from bps.rd(motor.user_setpoint)
+        if abs(setpoint_mrad - lookup_table(bragg_deg)) > PITCH_ROLL_TOLERANCE_MRAD:
+            return False
+
+    current_stripe = yield from bps.rd(vfm.stripe)
+    return current_stripe == vfm.energy_to_stripe(energy_kev)["stripe"]
+
+
 def adjust_dcm_pitch_roll_vfm_from_lut(
     undulator_dcm: UndulatorDCM,
     vfm: FocusingMirrorWithStripes,
@@ -111,15 +210,10 @@ def adjust_dcm_pitch_roll_vfm_from_lut(
     # Adjust DCM Pitch
     dcm = undulator_dcm.dcm_ref()
     LOGGER.info(f"Adjusting DCM and VFM for {energy_kev} keV")
-    d_spacing_a: float = yield from bps.rd(
-        undulator_dcm.dcm_ref().crystal_metadata_d_spacing_a
-    )
-    bragg_deg = energy_to_bragg_angle(energy_kev, d_spacing_a)
+    bragg_deg = yield from _bragg_angle_deg(undulator_dcm, energy_kev)
     LOGGER.info(f"Target Bragg angle = {bragg_deg} degrees")
     dcm_pitch_adjuster = lookup_table_adjuster(
-        linear_interpolation_lut(
-            *parse_lookup_table(undulator_dcm.pitch_energy_table_path)
-        ),
+        _parse_if_modified(undulator_dcm.pitch_energy_table_path, _load_lookup_table),
         dcm.xtal_1.pitch_in_mrad,
         bragg_deg,
     )
@@ -129,9 +223,7 @@ def adjust_dcm_pitch_roll_vfm_from_lut(
 
     # DCM Roll
     dcm_roll_adjuster = lookup_table_adjuster(
-        linear_interpolation_lut(
-            *parse_lookup_table(undulator_dcm.roll_energy_table_path)
-        ),
+        _parse_if_modified(undulator_dcm.roll_energy_table_path, _load_lookup_table),
         dcm.xtal_1.roll_in_mrad,
         bragg_deg,
     )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import bluesky.plan_stubs as bps
 from bluesky.utils import MsgGenerator
@@ -9,13 +9,18 @@ from dodal.common.beamlines.beamline_utils import get_path_provider
 from dodal.common.types import UpdatingPathProvider
 from dodal.devices.fast_grid_scan import PandAGridScanParams
 from dodal.devices.smargon import Smargon
+from ophyd_async.core import SignalW
 from ophyd_async.fastcs.panda import (
     HDFPanda,
     SeqTable,
     SeqTrigger,
 )
 
-from mx_bluesky.common.device_setup_plans.setup_panda import load_panda_from_yaml
+from mx_bluesky.common.device_setup_plans.setup_panda import (
+    get_panda_setpoint_cache,
+    load_panda_from_yaml,
+)
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
 from mx_bluesky.common.utils.log import LOGGER
 from mx_bluesky.hyperion.parameters.constants import DeviceSettingsConstants
 
@@ -125,7 +130,9 @@ def setup_panda_for_flyscan(
     """Configures the PandA device for a flyscan.
     Sets PVs from a yaml file, calibrates the encoder, and
     adjusts the sequencer table based off the grid parameters. Yaml file can be
-    created using ophyd_async.core.save_device()
+    created using ophyd_async.core.save_device(). PVs that are still set to the same
+    values as for the previous gridscan, including the sequencer table, are not set
+    again.
 
     Args:
         panda (HDFPanda): The PandA Ophyd device
@@ -147,52 +154,42 @@ def setup_panda_for_flyscan(
 
     yield from bps.stage(panda, group="panda-config")
 
+    exposure_distance_mm = sample_velocity_mm_per_s * exposure_time_s
+    table = _get_seq_table(parameters, exposure_distance_mm, time_between_x_steps_ms)
+    flyscan_settings = {
+        panda.pulse[1].width: exposure_time_s,
+        panda.seq[1].table: table,
+        panda.pcap.enable: Enabled.ENABLED.value,  # type: ignore
+    }
+
     yield from load_panda_from_yaml(
         DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_DIR,
         DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_FILENAME,
         panda,
+        overridden=flyscan_settings.keys() | _gridscan_arm_settings(panda).keys(),
     )
 
     initial_x = yield from bps.rd(smargon.x.user_readback)
     initial_y = yield from bps.rd(smargon.y.user_readback)
     initial_z = yield from bps.rd(smargon.z.user_readback)
 
-    # Home the PandA X, Y, and Z encoders using current motor position
-    yield from bps.abs_set(
-        panda.inenc[1].setp,  # type: ignore
-        initial_x * MM_TO_ENCODER_COUNTS,
-        wait=True,
-    )
-
-    yield from bps.abs_set(
-        panda.inenc[2].setp,  # type: ignore
-        initial_y * MM_TO_ENCODER_COUNTS,
-        wait=True,
-    )
-
-    yield from bps.abs_set(
-        panda.inenc[3].setp,  # type: ignore
-        initial_z * MM_TO_ENCODER_COUNTS,
-        wait=True,
-    )
-
-    yield from bps.abs_set(panda.pulse[1].width, exposure_time_s, group="panda-config")
-
-    exposure_distance_mm = sample_velocity_mm_per_s * exposure_time_s
-
-    table = _get_seq_table(parameters, exposure_distance_mm, time_between_x_steps_ms)
-
-    yield from bps.abs_set(panda.seq[1].table, table, group="panda-config")
+    # Home the PandA X, Y, and Z encoders using current motor position, one at a time
+    # and before anything else is configured
+    for encoder, initial_position in enumerate((initial_x, initial_y, initial_z), 1):
+        yield from bps.abs_set(
+            panda.inenc[encoder].setp,  # type: ignore
+            initial_position * MM_TO_ENCODER_COUNTS,
+            wait=True,
+        )
 
-    yield from bps.abs_set(
-        panda.pcap.enable,  # type: ignore
-        Enabled.ENABLED.value,
+    # Values need to be set before blocks are enabled, so wait here
+    yield from set_concurrently(
+        flyscan_settings,
         group="panda-config",
+        timeout=GENERAL_TIMEOUT,
+        setpoint_cache=get_panda_setpoint_cache(),
     )
 
-    # Values need to be set before blocks are enabled, so wait here
-    yield from bps.wait(group="panda-config", timeout=GENERAL_TIMEOUT)
-
     LOGGER.info(f"PandA sequencer table has been set to: {str(table)}")
     table_readback = yield from bps.rd(panda.seq[1].table)
     LOGGER.debug(f"PandA sequencer table readback is: {str(table_readback)}")
@@ -200,11 +197,18 @@ def setup_panda_for_flyscan(
     yield from arm_panda_for_gridscan(panda)
 
 
+def _gridscan_arm_settings(panda: HDFPanda) -> dict[SignalW, Any]:
+    return {
+        panda.seq[1].enable: Enabled.ENABLED.value,  # type: ignore
+        panda.pulse[1].enable: Enabled.ENABLED.value,  # type: ignore
+        panda.counter[1].enable: Enabled.ENABLED.value,  # type: ignore
+        panda.pcap.arm: PcapArm.ARMED.value,  # type: ignore
+    }
+
+
 def arm_panda_for_gridscan(panda: HDFPanda, group="arm_panda_gridscan"):
-    yield from bps.abs_set(panda.seq[1].enable, Enabled.ENABLED.value, group=group)  # type: ignore
-    yield from bps.abs_set(panda.pulse[1].enable, Enabled.ENABLED.value, group=group)  # type: ignore
-    yield from bps.abs_set(panda.counter[1].enable, Enabled.ENABLED.value, group=group)  # type: ignore
-    yield from bps.abs_set(panda.pcap.arm, PcapArm.ARMED.value, group=group)  # type: ignore
+    for signal, value in _gridscan_arm_settings(panda).items():
+        yield from bps.abs_set(signal, value, group=group)
     yield from bps.wait(group=group, timeout=GENERAL_TIMEOUT)
     LOGGER.info("PandA has been armed")
 
@@ -8,9 +8,10 @@ from dodal.devices.zebra.zebra_controlled_shutter import (
 )
 
 from mx_bluesky.common.device_setup_plans.setup_zebra_and_shutter import (
-    configure_zebra_and_shutter_for_auto_shutter,
+    auto_shutter_settings,
 )
 from mx_bluesky.common.parameters.constants import ZEBRA_STATUS_TIMEOUT
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
 
 
 def arm_zebra(zebra: Zebra):
@@ -23,29 +24,19 @@ def setup_zebra_for_panda_flyscan(
     group="setup_zebra_for_panda_flyscan",
     wait=True,
 ):
-    # Forwards eiger trigger signal from panda
-    yield from bps.abs_set(
-        zebra.output.out_pvs[zebra.mapping.outputs.TTL_DETECTOR],
-        zebra.mapping.sources.IN1_TTL,
+    outputs, sources = zebra.mapping.outputs, zebra.mapping.sources
+    out_pvs = zebra.output.out_pvs
+    yield from set_concurrently(
+        {
+            # Forwards eiger trigger signal from panda
+            out_pvs[outputs.TTL_DETECTOR]: sources.IN1_TTL,
+            # Set shutter to automatic and to trigger via motion controller GPIO signal (IN4_TTL)
+            **auto_shutter_settings(zebra, zebra_shutter, sources.IN4_TTL),
+            out_pvs[outputs.TTL_XSPRESS3]: sources.DISCONNECT,
+            # Tells panda that motion is beginning/changing direction
+            out_pvs[outputs.TTL_PANDA]: sources.IN3_TTL,
+        },
         group=group,
+        wait=wait,
+        timeout=ZEBRA_STATUS_TIMEOUT,
     )
-
-    # Set shutter to automatic and to trigger via motion controller GPIO signal (IN4_TTL)
-    yield from configure_zebra_and_shutter_for_auto_shutter(
-        zebra, zebra_shutter, zebra.mapping.sources.IN4_TTL, group=group
-    )
-
-    yield from bps.abs_set(
-        zebra.output.out_pvs[zebra.mapping.outputs.TTL_XSPRESS3],
-        zebra.mapping.sources.DISCONNECT,
-        group=group,
-    )
-
-    yield from bps.abs_set(
-        zebra.output.out_pvs[zebra.mapping.outputs.TTL_PANDA],
-        zebra.mapping.sources.IN3_TTL,
-        group=group,
-    )  # Tells panda that motion is beginning/changing direction
-
-    if wait:
-        yield from bps.wait(group, timeout=ZEBRA_STATUS_TIMEOUT)
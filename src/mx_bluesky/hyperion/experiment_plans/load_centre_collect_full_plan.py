@@ -16,6 +16,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
 from mx_bluesky.common.utils.context import device_composite_from_context
 from mx_bluesky.common.utils.exceptions import CrystalNotFoundError
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.snapshot_policy import GridSnapshotEventHandler
 from mx_bluesky.common.xrc_result import XRayCentreEventHandler
 from mx_bluesky.hyperion.experiment_plans.robot_load_then_centre_plan import (
     RobotLoadThenCentreComposite,
@@ -24,6 +25,7 @@ from mx_bluesky.hyperion.experiment_plans.robot_load_then_centre_plan import (
 from mx_bluesky.hyperion.experiment_plans.rotation_scan_plan import (
     RotationScan,
     RotationScanComposite,
+    calculate_motion_profile,
     rotation_scan_internal,
 )
 from mx_bluesky.hyperion.external_interaction.config_server import (
@@ -32,6 +34,11 @@ from mx_bluesky.hyperion.external_interaction.config_server import (
 from mx_bluesky.hyperion.parameters.constants import CONST, I03Constants
 from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
 from mx_bluesky.hyperion.parameters.rotation import RotationScanPerSweep
+from mx_bluesky.hyperion.utils.travel_order import (
+    order_for_least_travel,
+    read_gonio_motion,
+    travel_time_s,
+)
 
 
 @pydantic.dataclasses.dataclass(config={"arbitrary_types_allowed": True})
@@ -86,12 +93,13 @@ def load_centre_collect_full(
     )
     def plan_with_callback_subs():
         flyscan_event_handler = XRayCentreEventHandler()
+        grid_snapshot_handler = GridSnapshotEventHandler()
         try:
             yield from subs_wrapper(
                 robot_load_then_xray_centre(
                     composite, parameters.robot_load_then_centre, oav_config_file
                 ),
-                flyscan_event_handler,
+                [flyscan_event_handler, grid_snapshot_handler],
             )
         except CrystalNotFoundError:
             if parameters.select_centres.ignore_xtal_not_found:
@@ -109,23 +117,26 @@ def load_centre_collect_full(
         multi_rotation = parameters.multi_rotation_scan
         rotation_template = multi_rotation.rotation_scans.copy()
 
-        multi_rotation.rotation_scans.clear()
-
         is_alternating = I03Constants.ALTERNATE_ROTATION_DIRECTION
 
-        generator = rotation_scan_generator(is_alternating)
-        next(generator)
-        for sample_id, location in sample_ids_and_locations:
-            for rot in rotation_template:
-                combination = generator.send((rot, location, sample_id))
-                multi_rotation.rotation_scans.append(combination)
+        sample_ids_and_locations = yield from _order_for_least_travel(
+            composite, sample_ids_and_locations, multi_rotation, is_alternating
+        )
+        multi_rotation.rotation_scans = _rotation_scans_at(
+            sample_ids_and_locations, rotation_template, is_alternating
+        )
         multi_rotation = RotationScan.model_validate(multi_rotation)
 
         assert (
             multi_rotation.demand_energy_ev
             == parameters.robot_load_then_centre.demand_energy_ev
         ), "Setting a different energy for gridscan and rotation is not supported"
-        yield from rotation_scan_internal(composite, multi_rotation, oav_params)
+        yield from rotation_scan_internal(
+            composite,
+            multi_rotation,
+            oav_params,
+            grid_snapshots=grid_snapshot_handler.grid_snapshots,
+        )
 
     yield from plan_with_callback_subs()
 
@@ -175,6 +186,94 @@ def _x_coordinate(sample_and_location: tuple[int, np.ndarray]) -> float:
     return sample_and_location[1][0]  # type: ignore
 
 
+def _rotation_scans_at(
+    sample_ids_and_locations: Sequence[tuple[int, np.ndarray]],
+    rotation_template: Sequence[RotationScanPerSweep],
+    is_alternating: bool,
+) -> list[RotationScanPerSweep]:
+    generator = rotation_scan_generator(is_alternating)
+    next(generator)
+    return [
+        generator.send((rot, location, sample_id))
+        for sample_id, location in sample_ids_and_locations
+        for rot in rotation_template
+    ]
+
+
+def _order_for_least_travel(
+    composite: LoadCentreCollectComposite,
+    sample_ids_and_locations: list[tuple[int, np.ndarray]],
+    multi_rotation: RotationScan,
+    is_alternating: bool,
+) -> MsgGenerator[list[tuple[int, np.ndarray]]]:
+    """Order the collections at each location so that the goniometer spends as little
+    time as possible moving between them, including moving omega to the start of the
+    motion of the first rotation at each location, and log the time saved over the
+    order given."""
+    if len(sample_ids_and_locations) < 2:
+        return sample_ids_and_locations
+    motion = yield from read_gonio_motion(composite.smargon)
+    x_mm = yield from bps.rd(composite.smargon.x.user_readback)
+    y_mm = yield from bps.rd(composite.smargon.y.user_readback)
+    z_mm = yield from bps.rd(composite.smargon.z.user_readback)
+    start_um = np.array([x_mm, y_mm, z_mm]) * 1000
+    omega_deg = yield from bps.rd(composite.smargon.omega.user_readback)
+
+    # Which rotation comes next, and so how far omega moves to get to it, only depends
+    # on how many locations have already been collected at
+    rotation_template = multi_rotation.rotation_scans
+    scans = multi_rotation.model_copy(
+        update={
+            "rotation_scans": _rotation_scans_at(
+                sample_ids_and_locations, rotation_template, is_alternating
+            )
+        }
+    ).single_rotation_scans
+    profiles = [
+        calculate_motion_profile(
+            scan, motion.omega.acceleration_time_s, motion.omega.velocity
+        )
+        for scan in scans
+    ]
+    rotations_per_location = len(rotation_template)
+    omega_move_s = []
+    for first in range(0, len(profiles), rotations_per_location):
+        previous_end_deg = (
+            profiles[first - 1].start_motion_deg
+            + profiles[first - 1].distance_to_move_deg
+            if first
+            else omega_deg
+        )
+        omega_move_s.append(
+            motion.omega.move_time_s(
+                profiles[first].start_motion_deg - previous_end_deg
+            )
+        )
+
+    # Snapshots are taken once the goniometer has reached the location, before omega
+    # moves to the start of the rotation
+    omega_after_translation = multi_rotation.take_snapshots
+    locations_um = [location for _, location in sample_ids_and_locations]
+    order = order_for_least_travel(
+        motion, start_um, locations_um, omega_move_s, omega_after_translation
+    )
+    given_s = travel_time_s(
+        motion, start_um, locations_um, omega_move_s, omega_after_translation
+    )
+    ordered_s = travel_time_s(
+        motion,
+        start_um,
+        [locations_um[i] for i in order],
+        omega_move_s,
+        omega_after_translation,
+    )
+    LOGGER.info(
+        f"Moving between {len(order)} collection locations expected to take "
+        f"{ordered_s:.1f}s, {given_s - ordered_s:.1f}s less than in order of x"
+    )
+    return [sample_ids_and_locations[i] for i in order]
+
+
 def rotation_scan_generator(
     is_alternating: bool,
 ) -> Generator[
@@ -1,3 +1,4 @@
+import math
 from enum import Enum
 
 import bluesky.plan_stubs as bps
@@ -5,6 +6,7 @@ import bluesky.preprocessors as bpp
 import numpy as np
 import pydantic
 from blueapi.core import BlueskyContext
+from bluesky.utils import MsgGenerator
 from dodal.devices.attenuator.attenuator import BinaryFilterAttenuator
 from dodal.devices.xspress3.xspress3 import Xspress3
 from dodal.devices.zebra.zebra_controlled_shutter import ZebraShutter, ZebraShutterState
@@ -22,6 +24,20 @@ class Direction(Enum):
     NEGATIVE = "negative"
 
 
+class Search(Enum):
+    """How the transmission for each cycle of the optimisation is chosen.
+
+    STEPWISE steps the transmission by the increment (deadtime) or scales it by the
+    last counts (total counts) every cycle. MODEL predicts the transmission that will
+    hit the target from a model of the detector response, while keeping within the
+    range of transmissions already found to be too low and too high, so it converges
+    in fewer cycles.
+    """
+
+    STEPWISE = "stepwise"
+    MODEL = "model"
+
+
 @pydantic.dataclasses.dataclass(config={"arbitrary_types_allowed": True})
 class OptimizeAttenuationComposite:
     """All devices which are directly or indirectly required by this plan"""
@@ -146,6 +162,7 @@ def do_device_optimise_iteration(
             composite.attenuator, transmission, group="set_transmission"
         )
         yield from bps.abs_set(composite.xspress3mini.set_num_images, 1, wait=True)
+        yield from bps.wait(group="set_transmission")
         yield from bps.abs_set(
             composite.sample_shutter, ZebraShutterState.OPEN, wait=True
         )
@@ -176,6 +193,26 @@ def is_deadtime_optimised(
     return False
 
 
+def read_deadtime(composite: OptimizeAttenuationComposite) -> MsgGenerator[float]:
+    total_time = yield from bps.rd(composite.xspress3mini.channels[1].total_time)
+    reset_ticks = yield from bps.rd(composite.xspress3mini.channels[1].reset_ticks)
+
+    LOGGER.info(f"Current total time = {total_time}")
+    LOGGER.info(f"Current reset ticks = {reset_ticks}")
+    deadtime = 0
+
+    """
+        The reset ticks PV stops ticking while the detector is unable to process events, so the absolute difference between the total time and the
+        reset ticks time gives the deadtime in unit time. Divide by total time to get it as a percentage.
+    """
+
+    if total_time != reset_ticks:
+        deadtime = 1 - abs(total_time - reset_ticks) / (total_time)
+
+    LOGGER.info(f"Deadtime is now at {deadtime}")
+    return deadtime
+
+
 def deadtime_optimisation(
     composite: OptimizeAttenuationComposite,
     transmission: float,
@@ -231,23 +268,7 @@ def deadtime_optimisation(
     optimised_transmission: float = 0
     for cycle in range(0, max_cycles):
         yield from do_device_optimise_iteration(composite, transmission)
-
-        total_time = yield from bps.rd(composite.xspress3mini.channels[1].total_time)
-        reset_ticks = yield from bps.rd(composite.xspress3mini.channels[1].reset_ticks)
-
-        LOGGER.info(f"Current total time = {total_time}")
-        LOGGER.info(f"Current reset ticks = {reset_ticks}")
-        deadtime = 0
-
-        """
-            The reset ticks PV stops ticking while the detector is unable to process events, so the absolute difference between the total time and the
-            reset ticks time gives the deadtime in unit time. Divide by total time to get it as a percentage.
-        """
-
-        if total_time != reset_ticks:
-            deadtime = 1 - abs(total_time - reset_ticks) / (total_time)
-
-        LOGGER.info(f"Deadtime is now at {deadtime}")
+        deadtime = yield from read_deadtime(composite)
 
         # Check if new deadtime is OK
 
@@ -381,6 +402,190 @@ def total_counts_optimisation(
     return optimised_transmission
 
 
+class TransmissionBracket:
+    """The range of transmissions the optimised transmission is known to be in, from
+    the highest transmission measured to be below the target and the lowest measured
+    to be above it."""
+
+    def __init__(
+        self, upper_transmission_limit: float, lower_transmission_limit: float
+    ):
+        self.upper_transmission_limit = upper_transmission_limit
+        self.lower_transmission_limit = lower_transmission_limit
+        self.below_target: float | None = None
+        self.above_target: float | None = None
+
+    def add(self, transmission: float, is_above_target: bool):
+        if is_above_target:
+            if self.above_target is None or transmission < self.above_target:
+                self.above_target = transmission
+        elif self.below_target is None or transmission > self.below_target:
+            self.below_target = transmission
+
+    def ratio(self) -> float:
+        """The ratio of the upper to the lower end of the bracket, infinite if either
+        end has not been found yet"""
+        if self.below_target is None or self.above_target is None:
+            return math.inf
+        return self.above_target / self.below_target
+
+    def next_transmission(self, predicted: float, min_step: float) -> float:
+        """Keep a predicted transmission inside the bracket, at least a factor of
+        min_step from either end of it, so that every cycle narrows the bracket even
+        if the prediction is poor.
+
+        Raises:
+            AttenuationOptimisationFailedError: If the transmission would be below the
+            lower transmission limit
+        """
+        transmission = predicted
+        if self.below_target is not None:
+            transmission = max(transmission, self.below_target * min_step)
+        if self.above_target is not None:
+            transmission = min(transmission, self.above_target / min_step)
+        if (
+            self.below_target is not None
+            and self.above_target is not None
+            and self.ratio() <= min_step**2
+        ):
+            transmission = math.sqrt(self.below_target * self.above_target)
+        transmission = min(transmission, self.upper_transmission_limit)
+        if transmission < self.lower_transmission_limit:
+            raise AttenuationOptimisationFailedError(
+                f"Transmission has gone below lower threshold {self.lower_transmission_limit}"
+            )
+        return transmission
+
+
+def predict_deadtime_transmission(
+    transmission: float, deadtime: float, deadtime_threshold: float
+) -> float:
+    """Predict the transmission which gives the threshold deadtime, modelling the
+    detector as paralysable so that the deadtime is 1 - exp(-k * transmission)"""
+    if deadtime <= 0:
+        return math.inf
+    if deadtime >= 1:
+        return 0
+    return transmission * math.log(1 - deadtime_threshold) / math.log(1 - deadtime)
+
+
+def deadtime_search_optimisation(
+    composite: OptimizeAttenuationComposite,
+    transmission: float,
+    increment: float,
+    deadtime_threshold: float,
+    max_cycles: int,
+    upper_transmission_limit: float,
+    lower_transmission_limit: float,
+) -> MsgGenerator[float]:
+    """Optimises the attenuation for the Xspress3Mini based on the detector deadtime,
+    taking the same arguments as deadtime_optimisation.
+
+    Rather than stepping by the increment each cycle, the transmission to use next is
+    predicted from the deadtime measured, see predict_deadtime_transmission, and kept
+    within the transmissions already found to be above and below the threshold. The
+    optimisation finishes once these are within a factor of increment of each other,
+    giving the highest transmission found that is below the threshold. With a good
+    prediction this takes two cycles after the first, one either side of the
+    threshold.
+
+    Raises:
+        AttenuationOptimisationFailedError:
+        This error is thrown if the transmission goes below the expected value or the maximum cycles are reached
+    """
+    LOGGER.info(f"Target deadtime is {deadtime_threshold}, using model search")
+    bracket = TransmissionBracket(upper_transmission_limit, lower_transmission_limit)
+    for cycle in range(0, max_cycles):
+        LOGGER.info(
+            f"Setting transmission to {transmission} for attenuation optimisation cycle {cycle}"
+        )
+        yield from do_device_optimise_iteration(composite, transmission)
+        deadtime = yield from read_deadtime(composite)
+
+        if deadtime <= deadtime_threshold and transmission == upper_transmission_limit:
+            return transmission
+        bracket.add(transmission, deadtime > deadtime_threshold)
+        if bracket.ratio() <= increment:
+            assert bracket.below_target is not None
+            return bracket.below_target
+
+        # Aim a little below the threshold so that small errors in the prediction
+        # still give a transmission that is below it
+        transmission = bracket.next_transmission(
+            predict_deadtime_transmission(transmission, deadtime, deadtime_threshold)
+            / increment**0.25,
+            math.sqrt(increment),
+        )
+
+    raise AttenuationOptimisationFailedError(
+        f"Unable to optimise attenuation after maximum cycles. Deadtime did not get lower than threshold: {deadtime_threshold} in maximum cycles {max_cycles}"
+    )
+
+
+def total_counts_search_optimisation(
+    composite: OptimizeAttenuationComposite,
+    transmission: float,
+    low_roi: int,
+    high_roi: int,
+    lower_count_limit: float,
+    upper_count_limit: float,
+    target_count: float,
+    max_cycles: int,
+    upper_transmission_limit: float,
+    lower_transmission_limit: float,
+) -> MsgGenerator[float]:
+    """Optimises the attenuation for the Xspress3Mini based on the total counts,
+    taking the same arguments as total_counts_optimisation.
+
+    The transmission to use next is predicted from the counts, which are proportional
+    to transmission, and kept within the transmissions already found to give too few
+    and too many counts, so that noisy or non-linear counts cannot make it oscillate.
+
+    Raises:
+        AttenuationOptimisationFailedError:
+        This error is thrown if the transmission goes below the expected value or the maximum cycles are reached
+    """
+    LOGGER.info("Using total count optimisation, using model search")
+    bracket = TransmissionBracket(upper_transmission_limit, lower_transmission_limit)
+    total_count = 0
+    # Transmissions giving counts in range span a factor of the count range, so
+    # stepping a fraction of that from a failing transmission can't skip over it
+    count_range = upper_count_limit / lower_count_limit if lower_count_limit else 4
+    min_step = math.sqrt(min(count_range, 4))
+    for cycle in range(0, max_cycles):
+        LOGGER.info(
+            f"Setting transmission to {transmission} for attenuation optimisation cycle {cycle}"
+        )
+        yield from do_device_optimise_iteration(composite, transmission)
+
+        data = np.array(
+            (yield from bps.rd(composite.xspress3mini.dt_corrected_latest_mca[1]))
+        )
+        total_count = sum(data[int(low_roi) : int(high_roi)])
+        LOGGER.info(f"Total count is {total_count}")
+
+        if is_counts_within_target(total_count, lower_count_limit, upper_count_limit):
+            LOGGER.info(
+                f"Total count is within accepted limits: {lower_count_limit}, {total_count}, {upper_count_limit}"
+            )
+            return transmission
+        elif transmission == upper_transmission_limit and total_count < target_count:
+            LOGGER.warning(
+                f"Total count is not within limits: {lower_count_limit} <= {total_count} <= {upper_count_limit} after using maximum transmission {upper_transmission_limit}. Continuing with maximum transmission as optimised value..."
+            )
+            return transmission
+
+        bracket.add(transmission, total_count > upper_count_limit)
+        predicted = (
+            (target_count / total_count) * transmission if total_count else math.inf
+        )
+        transmission = bracket.next_transmission(predicted, min_step)
+
+    raise AttenuationOptimisationFailedError(
+        f"Unable to optimise attenuation after maximum cycles. Total count is not within limits: {lower_count_limit} <= {total_count} <= {upper_count_limit}"
+    )
+
+
 def optimise_attenuation_plan(
     composite: OptimizeAttenuationComposite,
     collection_time=1,  # Comes from self.parameters.acquisitionTime in fluorescence_spectrum.py
@@ -396,6 +601,7 @@ def optimise_attenuation_plan(
     max_cycles=10,
     increment=2,
     deadtime_threshold=0.002,
+    search: Search = Search.MODEL,
 ):
     check_parameters(
         target_count,
@@ -418,7 +624,12 @@ def optimise_attenuation_plan(
             f"Starting Xspress3Mini total counts optimisation routine \nOptimisation will be performed across ROI channels {low_roi} - {high_roi}"
         )
 
-        optimised_transmission = yield from total_counts_optimisation(
+        optimise_total_counts = (
+            total_counts_search_optimisation
+            if search == Search.MODEL
+            else total_counts_optimisation
+        )
+        optimised_transmission = yield from optimise_total_counts(
             composite,
             initial_transmission,
             low_roi,
@@ -435,14 +646,19 @@ def optimise_attenuation_plan(
         LOGGER.info(
             f"Starting Xspress3Mini deadtime optimisation routine \nOptimisation will be performed across ROI channels {low_roi} - {high_roi}"
         )
-        optimised_transmission = yield from deadtime_optimisation(
+        optimise_deadtime = (
+            deadtime_search_optimisation
+            if search == Search.MODEL
+            else deadtime_optimisation
+        )
+        optimised_transmission = yield from optimise_deadtime(
             composite,
             initial_transmission,
-            upper_transmission_limit,
-            lower_transmission_limit,
-            increment,
-            deadtime_threshold,
-            max_cycles,
+            increment=increment,
+            deadtime_threshold=deadtime_threshold,
+            max_cycles=max_cycles,
+            upper_transmission_limit=upper_transmission_limit,
+            lower_transmission_limit=lower_transmission_limit,
         )
 
     yield from bps.abs_set(
@@ -20,6 +20,7 @@ from mx_bluesky.common.device_setup_plans.setup_oav import pre_centring_setup_oa
 from mx_bluesky.common.utils.context import device_composite_from_context
 from mx_bluesky.common.utils.exceptions import SampleError, catch_exception_and_warn
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase, timed
 from mx_bluesky.hyperion.device_setup_plans.smargon import (
     move_smargon_warn_on_out_of_range,
 )
@@ -113,6 +114,7 @@ def move_pin_into_view(
         return (int(tip_xy_px[0]), int(tip_xy_px[1]))
 
 
+@timed(Phase.PIN_TIP_CENTRING)
 def pin_tip_centre_plan(
     composite: PinTipCentringComposite,
     tip_offset_microns: float,
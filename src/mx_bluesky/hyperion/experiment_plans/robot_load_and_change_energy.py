@@ -29,6 +29,7 @@ from mx_bluesky.common.device_setup_plans.robot_load_unload import (
     prepare_for_robot_load,
     wait_for_smargon_not_disabled,
 )
+from mx_bluesky.common.utils.metrics import Phase, timed
 from mx_bluesky.hyperion.experiment_plans.set_energy_plan import (
     SetEnergyComposite,
     set_energy_plan,
@@ -153,6 +154,7 @@ def robot_load_and_snapshots(
     yield from bps.wait(gonio_finished)
 
 
+@timed(Phase.ROBOT_LOAD)
 def robot_load_and_change_energy_plan(
     composite: RobotLoadAndEnergyChangeComposite,
     params: RobotLoadAndEnergyChange,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+from collections.abc import Sequence
 
 import bluesky.plan_stubs as bps
 import bluesky.preprocessors as bpp
@@ -25,11 +26,13 @@ from dodal.devices.undulator import Undulator
 from dodal.devices.xbpm_feedback import XBPMFeedback
 from dodal.devices.zebra.zebra import RotationDirection, Zebra
 from dodal.devices.zebra.zebra_controlled_shutter import ZebraShutter
-from dodal.plan_stubs.check_topup import check_topup_and_wait_if_necessary
 from dodal.plans.preprocessors.verify_undulator_gap import (
     verify_undulator_gap_before_run_decorator,
 )
 
+from mx_bluesky.common.device_setup_plans.detector_arming import (
+    get_detector_arming,
+)
 from mx_bluesky.common.device_setup_plans.manipulate_sample import (
     cleanup_sample_environment,
     setup_sample_environment,
@@ -52,11 +55,19 @@ from mx_bluesky.common.experiment_plans.oav_snapshot_plan import (
     setup_beamline_for_oav,
 )
 from mx_bluesky.common.parameters.components import WithSnapshot
+from mx_bluesky.common.plan_stubs.check_topup import prepare_then_check_topup
 from mx_bluesky.common.preprocessors.preprocessors import (
     transmission_and_xbpm_feedback_for_collection_decorator,
 )
+from mx_bluesky.common.utils.collection_duration import get_duration_estimator
 from mx_bluesky.common.utils.context import device_composite_from_context
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase, timed
+from mx_bluesky.common.utils.snapshot_policy import (
+    GridSnapshotGeometry,
+    can_generate_rotation_snapshots,
+    omegas_not_generated,
+)
 from mx_bluesky.hyperion.device_setup_plans.setup_zebra import (
     arm_zebra,
 )
@@ -116,6 +127,24 @@ class RotationMotionProfile:
     distance_to_move_deg: float
     max_velocity_deg_s: float
 
+    @property
+    def duration_s(self) -> float:
+        """The time taken to rotate through distance_to_move_deg, including the
+        acceleration and shutter opening offsets, at the rotation speed."""
+        return abs(self.distance_to_move_deg) / self.speed_for_rotation_deg_s
+
+
+def estimate_rotation_s(
+    params: SingleRotationScan,
+    motor_time_to_speed_s: float,
+    max_velocity_deg_s: float,
+) -> float:
+    """Estimate how long the rotation of a rotation scan takes, not including any time
+    to set up for it, see calculate_motion_profile."""
+    return calculate_motion_profile(
+        params, motor_time_to_speed_s, max_velocity_deg_s
+    ).duration_s
+
 
 def calculate_motion_profile(
     params: SingleRotationScan,
@@ -210,6 +239,7 @@ def calculate_motion_profile(
     )
 
 
+@timed(Phase.ROTATION)
 def rotation_scan_plan(
     composite: RotationScanComposite,
     params: SingleRotationScan,
@@ -261,39 +291,46 @@ def rotation_scan_plan(
             group=CONST.WAIT.ROTATION_READY_FOR_DC,
         )
 
-        LOGGER.info("Wait for any previous moves...")
-        # wait for all the setup tasks at once
-        yield from bps.wait(CONST.WAIT.ROTATION_READY_FOR_DC)
-        yield from bps.wait(CONST.WAIT.MOVE_GONIO_TO_START)
+        def prepare_for_rotation():
+            LOGGER.info("Wait for any previous moves...")
+            # wait for all the setup tasks at once
+            yield from get_detector_arming().wait_until_armed(
+                CONST.WAIT.ROTATION_READY_FOR_DC
+            )
+            yield from bps.wait(CONST.WAIT.MOVE_GONIO_TO_START)
 
-        # get some information for the ispyb deposition and trigger the callback
-        yield from read_hardware_for_zocalo(composite.eiger)
+            # get some information for the ispyb deposition and trigger the callback
+            yield from read_hardware_for_zocalo(composite.eiger)
 
-        yield from standard_read_hardware_pre_collection(
-            composite.undulator,
-            composite.synchrotron,
-            composite.s4_slit_gaps,
-            composite.dcm,
-            composite.smargon,
-        )
+            yield from standard_read_hardware_pre_collection(
+                composite.undulator,
+                composite.synchrotron,
+                composite.s4_slit_gaps,
+                composite.dcm,
+                composite.smargon,
+            )
 
-        # Get ready for the actual scan
-        yield from bps.abs_set(
-            axis.velocity, motion_values.speed_for_rotation_deg_s, wait=True
-        )
+            # Get ready for the actual scan
+            yield from bps.abs_set(
+                axis.velocity, motion_values.speed_for_rotation_deg_s, wait=True
+            )
 
-        yield from bps.wait("setup_zebra")
-        yield from arm_zebra(composite.zebra)
+            yield from bps.wait("setup_zebra")
+            yield from arm_zebra(composite.zebra)
 
-        # Check topup gate
-        yield from check_topup_and_wait_if_necessary(
+        # Check topup gate, preparing while a topup is in progress
+        yield from prepare_then_check_topup(
             composite.synchrotron,
             motion_values.total_exposure_s,
-            ops_time=10.0,  # Additional time to account for rotation, is s
+            10.0,  # Additional time to account for rotation, is s
+            prepare_for_rotation,
         )  # See #https://github.com/DiamondLightSource/hyperion/issues/932
 
         LOGGER.info("Executing rotation scan")
-        yield from bps.rel_set(axis, motion_values.distance_to_move_deg, wait=True)
+        with get_duration_estimator().compare_with_estimate(
+            Phase.ROTATION, motion_values.duration_s
+        ):
+            yield from bps.rel_set(axis, motion_values.distance_to_move_deg, wait=True)
 
         yield from standard_read_hardware_during_collection(
             composite.aperture_scatterguard,
@@ -345,7 +382,7 @@ def _move_and_rotation(
     if params.take_snapshots:
         yield from bps.wait(CONST.WAIT.MOVE_GONIO_TO_START)
 
-        if not params.use_grid_snapshots:
+        if params.snapshot_omegas_deg:
             yield from setup_beamline_for_oav(
                 composite.smargon,
                 composite.backlight,
@@ -383,11 +420,78 @@ def rotation_scan(
     yield from _wrapped_rotation_scan()
 
 
+def _generate_snapshots_if_possible(
+    composite: RotationScanComposite,
+    params: SingleRotationScan,
+    grid_snapshots: Sequence[GridSnapshotGeometry],
+) -> MsgGenerator[SingleRotationScan]:
+    """Generate the rotation snapshots from the grid snapshots rather than moving omega
+    to each snapshot angle and triggering the OAV, if the sample will still be in view
+    in the grid snapshots, see can_generate_rotation_snapshots. Snapshots are only
+    taken at the requested omegas that none are generated at."""
+    if params.use_grid_snapshots or not params.snapshot_omegas_deg:
+        return params
+    if not grid_snapshots:
+        return params
+    smargon = composite.smargon
+    sample_pos_mm = []
+    for start_um, axis in (
+        (params.x_start_um, smargon.x),
+        (params.y_start_um, smargon.y),
+        (params.z_start_um, smargon.z),
+    ):
+        if start_um is None:
+            sample_pos_mm.append((yield from bps.rd(axis.user_readback)))
+        else:
+            sample_pos_mm.append(start_um / 1000)
+    chi_deg = params.chi_start_deg
+    if chi_deg is None:
+        chi_deg = yield from bps.rd(smargon.chi.user_readback)
+    phi_deg = params.phi_start_deg
+    if phi_deg is None:
+        phi_deg = yield from bps.rd(smargon.phi.user_readback)
+    image_size_px = (
+        (yield from bps.rd(composite.oav.grid_snapshot.x_size)),
+        (yield from bps.rd(composite.oav.grid_snapshot.y_size)),
+    )
+
+    if can_generate_rotation_snapshots(
+        grid_snapshots,
+        params.snapshot_omegas_deg,
+        (sample_pos_mm[0], sample_pos_mm[1], sample_pos_mm[2]),
+        chi_deg,
+        phi_deg,
+        image_size_px,
+    ):
+        still_to_take_deg = omegas_not_generated(
+            grid_snapshots, params.snapshot_omegas_deg
+        )
+        LOGGER.info(
+            f"Generating rotation snapshots from grid snapshots, taking them at "
+            f"{still_to_take_deg}"
+        )
+        return params.model_copy(
+            update={
+                "use_grid_snapshots": True,
+                "snapshot_omegas_deg": still_to_take_deg or None,
+            }
+        )
+    return params
+
+
 def rotation_scan_internal(
     composite: RotationScanComposite,
     parameters: RotationScan,
     oav_params: OAVParameters | None = None,
+    grid_snapshots: Sequence[GridSnapshotGeometry] = (),
 ) -> MsgGenerator:
+    """Do the rotation scans given.
+
+    Args:
+        grid_snapshots: Geometry of the snapshots taken during grid detection for the
+            sample, if any. Rotation snapshots are generated from these rather than
+            taken afresh wherever the sample is still in view in them.
+    """
     if not oav_params:
         oav_params = OAVParameters(context="xrayCentring")
     eiger: EigerDetector = composite.eiger
@@ -412,6 +516,9 @@ def rotation_scan_internal(
     @bpp.finalize_decorator(lambda: _cleanup_plan(composite))
     def _multi_rotation_scan():
         for single_scan in parameters.single_rotation_scans:
+            single_scan = yield from _generate_snapshots_if_possible(
+                composite, single_scan, grid_snapshots
+            )
 
             @verify_undulator_gap_before_run_decorator(composite)
             @bpp.set_run_key_decorator("rotation_scan")
@@ -419,6 +526,9 @@ def rotation_scan_internal(
                 md={
                     "subplan_name": CONST.PLAN.ROTATION_OUTER,
                     "mx_bluesky_parameters": single_scan.model_dump_json(),
+                    "with_snapshot": single_scan.model_dump_json(
+                        include=WithSnapshot.model_fields.keys()  # type: ignore
+                    ),
                 }
             )
             def rotation_scan_core(
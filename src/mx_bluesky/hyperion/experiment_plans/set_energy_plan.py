@@ -19,7 +19,11 @@ from mx_bluesky.common.parameters.constants import PlanNameConstants
 from mx_bluesky.common.preprocessors.preprocessors import (
     transmission_and_xbpm_feedback_for_collection_wrapper,
 )
+from mx_bluesky.common.utils.log import LOGGER
 from mx_bluesky.hyperion.device_setup_plans import dcm_pitch_roll_mirror_adjuster
+from mx_bluesky.hyperion.device_setup_plans.dcm_pitch_roll_mirror_adjuster import (
+    is_adjusted_for_energy,
+)
 
 DESIRED_TRANSMISSION_FRACTION = 0.1
 
@@ -74,6 +78,12 @@ def set_energy_plan(
     )
 
     if energy_ev:
+        already_adjusted = yield from is_adjusted_for_energy(
+            composite.undulator_dcm, composite.vfm, energy_ev / 1000
+        )
+        if already_adjusted:
+            LOGGER.info(f"Beamline is already set up for {energy_ev} eV, not changing")
+            return
         yield from transmission_and_xbpm_feedback_for_collection_wrapper(
             _set_energy_plan(energy_ev / 1000, composite),
             composite_for_wrapper,
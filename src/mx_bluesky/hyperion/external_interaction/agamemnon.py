@@ -3,9 +3,12 @@ import json
 import os
 import re
 import traceback
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import StrEnum
 from os import path
+from threading import Thread, local
+from time import monotonic
 from typing import Any, TypeVar
 
 import requests
@@ -23,6 +26,7 @@ from mx_bluesky.common.parameters.constants import (
     GridscanParamConstants,
 )
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import Phase, timed
 from mx_bluesky.common.utils.utils import convert_angstrom_to_ev
 from mx_bluesky.hyperion.parameters.components import Wait
 from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
@@ -33,6 +37,28 @@ MULTIPIN_FORMAT_DESC = "Expected multipin format is multipin_{number_of_wells}x{
 MULTIPIN_REGEX = rf"^{MULTIPIN_PREFIX}_(\d+)x(\d+(?:\.\d+)?)\+(\d+(?:\.\d+)?)$"
 MX_GENERAL_ROOT_REGEX = r"^/dls/(?P<beamline>[^/]+)/data/[^/]*/(?P<visit>[^/]+)(?:/|$)"
 
+# How long to wait for agamemnon to respond before giving up on a request
+AGAMEMNON_TIMEOUT_S = 10
+# How old a prefetched instruction may be before it is fetched again, in case agamemnon
+# has been told about a different sample since
+MAX_PREFETCH_AGE_S = 120
+
+
+class _ThreadLocalSession(local):
+    """A requests session for each thread, as sessions are not thread safe and requests
+    are made from the prefetch and comparison threads as well as the main one. Each
+    thread reuses its connection to agamemnon between requests, and a request that
+    stalls in one thread cannot hold up another."""
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+
+_session = _ThreadLocalSession()
+
 
 class _InstructionType(StrEnum):
     WAIT = "wait"
@@ -78,7 +104,12 @@ def create_parameters_from_agamemnon() -> Sequence[MxBlueskyParameters]:
         The generated sequence of mx-bluesky parameters, or empty list if
         no instructions."""
     beamline_name = get_beamline_name("i03")
-    agamemnon_instruction = _get_next_instruction(beamline_name)
+    return _parameters_from_instruction(_get_next_instruction(beamline_name))
+
+
+def _parameters_from_instruction(
+    agamemnon_instruction: dict,
+) -> Sequence[MxBlueskyParameters]:
     if agamemnon_instruction:
         match _instruction_and_data(agamemnon_instruction):
             case (_InstructionType.COLLECT, data):
@@ -96,13 +127,167 @@ def create_parameters_from_agamemnon() -> Sequence[MxBlueskyParameters]:
     return []
 
 
-def compare_params(load_centre_collect_params: LoadCentreCollect):
+class AgamemnonInstructionPrefetcher:
+    """Fetches the next instruction from agamemnon in a background thread while the
+    current one is executing, so that it is ready as soon as the RunEngine is free.
+
+    Agamemnon may continue to return the sample currently being collected until that
+    collection has finished, so a prefetched collection of the current sample, or a
+    prefetch that returned nothing, failed, is older than max_age_s or has not finished
+    within timeout_s of being needed, is discarded and fetched again.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Sequence[MxBlueskyParameters]],
+        max_age_s: float = MAX_PREFETCH_AGE_S,
+        timeout_s: float = AGAMEMNON_TIMEOUT_S,
+    ):
+        self._fetch = fetch
+        self._max_age_s = max_age_s
+        self._timeout_s = timeout_s
+        self._prefetch: Future[tuple[float, Sequence[MxBlueskyParameters]]] | None = (
+            None
+        )
+        self._current_sample_id: int | None = None
+
+    def start(self, current_sample_id: int):
+        """Start fetching the instruction that follows the collection of the given
+        sample. This should be once the collection of the sample is complete, so that
+        agamemnon has moved on from the sample. Any prefetch
+        already started for the same sample is replaced."""
+        if current_sample_id == self._current_sample_id:
+            self._prefetch = None
+        else:
+            self.discard()
+        prefetch: Future[tuple[float, Sequence[MxBlueskyParameters]]] = Future()
+
+        def fetch():
+            try:
+                parameter_list = self._fetch()
+                prefetch.set_result((monotonic(), parameter_list))
+            except Exception as e:
+                prefetch.set_exception(e)
+
+        self._prefetch = prefetch
+        self._current_sample_id = current_sample_id
+        Thread(target=fetch, name="agamemnon_prefetch", daemon=True).start()
+
+    def next_instruction(self) -> Sequence[MxBlueskyParameters]:
+        """Return the prefetched instruction if it can be used, otherwise fetch the
+        next instruction from agamemnon."""
+        prefetch, self._prefetch = self._prefetch, None
+        current_sample_id, self._current_sample_id = self._current_sample_id, None
+        if prefetch is not None:
+            try:
+                fetched_s, parameter_list = prefetch.result(timeout=self._timeout_s)
+            except TimeoutError:
+                LOGGER.warning(
+                    f"Prefetch of instruction from agamemnon did not finish within "
+                    f"{self._timeout_s}s, fetching again"
+                )
+            except Exception as e:
+                LOGGER.warning(
+                    "Failed to prefetch instruction from agamemnon, fetching again",
+                    exc_info=e,
+                )
+            else:
+                age_s = monotonic() - fetched_s
+                if age_s > self._max_age_s:
+                    LOGGER.info(
+                        f"Prefetched instruction from agamemnon is {age_s:.0f}s old"
+                    )
+                elif parameter_list and current_sample_id not in _sample_ids(
+                    parameter_list
+                ):
+                    LOGGER.info("Using prefetched instruction from agamemnon")
+                    return parameter_list
+                else:
+                    LOGGER.info("Prefetched instruction from agamemnon is stale")
+        return self._fetch()
+
+    def discard(self):
+        """Discard any prefetched instruction that has not been used."""
+        prefetch, self._prefetch = self._prefetch, None
+        self._current_sample_id = None
+        if prefetch is None:
+            return
+        if not prefetch.done():
+            LOGGER.warning("Discarding incomplete prefetch of agamemnon instruction")
+        elif prefetch.exception(timeout=0) is None:
+            sample_ids = _sample_ids(prefetch.result(timeout=0)[1])
+            if sample_ids:
+                LOGGER.warning(
+                    f"Discarding unused prefetched collection of samples {sample_ids}"
+                )
+
+
+def _sample_ids(parameter_list: Sequence[MxBlueskyParameters]) -> list[int]:
+    return [
+        parameters.sample_id
+        for parameters in parameter_list
+        if isinstance(parameters, LoadCentreCollect)
+    ]
+
+
+class AgamemnonComparisonService:
+    """Fetches the next instruction from agamemnon once for each start from GDA, and
+    uses it both to update the GDA parameters and to compare them with the parameters
+    that would have been created from agamemnon directly. The comparison runs in the
+    background and its result is logged when ready, so that it does not delay the start
+    of the collection."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agamemnon_comparison"
+        )
+
+    def update_and_compare(self, parameters: T) -> T:
+        """Update the supplied parameters from agamemnon and, for a LoadCentreCollect,
+        start comparing them against agamemnon in the background.
+
+        Args:
+            parameters: The parameters supplied by GDA
+        Returns:
+            The updated parameters, or the parameters unchanged if agamemnon could not
+            be reached."""
+        try:
+            agamemnon_instruction = _get_next_instruction(get_beamline_name("i03"))
+        except Exception as e:
+            LOGGER.warning(f"Failed to fetch instruction from agamemnon: {e}")
+            return parameters
+        parameters = update_params_from_agamemnon(parameters, agamemnon_instruction)
+        if isinstance(parameters, LoadCentreCollect):
+            # Copy the parameters so that the comparison isn't affected by the plan
+            self._executor.submit(
+                compare_params,
+                parameters.model_copy(deep=True),
+                agamemnon_instruction,
+            )
+        return parameters
+
+    def shutdown(self):
+        """Cancel any comparisons that have not started and wait for the one in
+        progress to finish, so that the executor does not keep the process alive."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def compare_params(
+    load_centre_collect_params: LoadCentreCollect,
+    agamemnon_instruction: dict | None = None,
+):
     """Compare the supplied parameters (as supplied from GDA) with those directly
     created from agamemnon. Any differences are logged.
     Args:
-        load_centre_collect_params: The parameters from GDA to compare."""
+        load_centre_collect_params: The parameters from GDA to compare.
+        agamemnon_instruction: A previously fetched agamemnon instruction to compare
+            against. If not supplied, the next instruction is fetched from agamemnon."""
     try:
-        lcc_requests = create_parameters_from_agamemnon()
+        lcc_requests = (
+            create_parameters_from_agamemnon()
+            if agamemnon_instruction is None
+            else _parameters_from_instruction(agamemnon_instruction)
+        )
         # Log differences against GDA populated parameters
         if not lcc_requests:
             LOGGER.info("Agamemnon returned no instructions")
@@ -122,7 +307,9 @@ def compare_params(load_centre_collect_params: LoadCentreCollect):
         )
 
 
-def update_params_from_agamemnon(parameters: T) -> T:
+def update_params_from_agamemnon(
+    parameters: T, agamemnon_instruction: dict | None = None
+) -> T:
     """Update the supplied parameters with additional information from agamemnon.
     This is currently necessary for multipin processing and called when Hyperion is invoked
     from GDA.
@@ -130,11 +317,14 @@ def update_params_from_agamemnon(parameters: T) -> T:
     Args:
         parameters: The LoadCentreCollectParameters that will be updated with additional info,
         such as multipin dimensions, number of crystals.
+        agamemnon_instruction: A previously fetched agamemnon instruction to update
+            from. If not supplied, the next instruction is fetched from agamemnon.
     """
     try:
-        beamline_name = get_beamline_name("i03")
-        agamemnon_params = _get_next_instruction(beamline_name)
-        instruction, collect_params = _instruction_and_data(agamemnon_params)
+        if agamemnon_instruction is None:
+            beamline_name = get_beamline_name("i03")
+            agamemnon_instruction = _get_next_instruction(beamline_name)
+        instruction, collect_params = _instruction_and_data(agamemnon_instruction)
         assert instruction == _InstructionType.COLLECT, (
             "Unable to augment GDA parameters from agamemnon, agamemnon reports 'wait'"
         )
@@ -165,8 +355,11 @@ def _instruction_and_data(agamemnon_instruction: dict) -> tuple[str, Any]:
     return instruction, data
 
 
+@timed(Phase.AGAMEMNON)
 def _get_parameters_from_url(url: str) -> dict:
-    response = requests.get(url, headers={"Accept": "application/json"})
+    response = _session.get(
+        url, headers={"Accept": "application/json"}, timeout=AGAMEMNON_TIMEOUT_S
+    )
     response.raise_for_status()
     return json.loads(response.content)
 
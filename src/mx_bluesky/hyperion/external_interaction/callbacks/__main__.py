@@ -1,4 +1,5 @@
 import logging
+import resource
 from collections.abc import Callable, Sequence
 from threading import Thread
 from time import sleep  # noqa
@@ -12,6 +13,9 @@ from mx_bluesky.common.external_interaction.alerting import set_alerting_service
 from mx_bluesky.common.external_interaction.alerting.log_based_service import (
     LoggingAlertService,
 )
+from mx_bluesky.common.external_interaction.callbacks.common.document_publisher import (
+    deserialise_document,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.log_uid_tag_callback import (
     LogUidTaggingCallback,
 )
@@ -59,6 +63,8 @@ from mx_bluesky.hyperion.parameters.gridscan import (
 
 LIVENESS_POLL_SECONDS = 1
 ERROR_LOG_BUFFER_LINES = 5000
+# Log the peak memory of the callback process each time it grows by this fraction
+MEMORY_WATERMARK_STEP = 0.1
 
 
 def create_gridscan_callbacks() -> tuple[
@@ -130,7 +136,10 @@ def setup_logging(dev_mode: bool):
 
 def setup_threads():
     proxy = Proxy(*CONST.CALLBACK_0MQ_PROXY_PORTS)
-    dispatcher = RemoteDispatcher(f"localhost:{CONST.CALLBACK_0MQ_PROXY_PORTS[1]}")
+    dispatcher = RemoteDispatcher(
+        f"localhost:{CONST.CALLBACK_0MQ_PROXY_PORTS[1]}",
+        deserializer=deserialise_document,
+    )
     log_debug("Created proxy and dispatcher objects")
 
     def start_proxy():
@@ -153,13 +162,30 @@ def log_debug(msg, *args, **kwargs):
     NEXUS_LOGGER.debug(msg, *args, **kwargs)
 
 
+def log_new_memory_watermark(watermark_kb: int) -> int:
+    """Log the peak resident memory of the process if it has grown by more than
+    MEMORY_WATERMARK_STEP since the given watermark, so that growth over a long-running
+    process shows in the logs.
+
+    Returns:
+        The new watermark, in kB
+    """
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if peak_kb > watermark_kb * (1 + MEMORY_WATERMARK_STEP):
+        log_info(f"Callback process peak resident memory is now {peak_kb // 1024} MB")
+        return peak_kb
+    return watermark_kb
+
+
 def wait_for_threads_forever(threads: Sequence[Thread]):
     alive = [t.is_alive() for t in threads]
+    memory_watermark_kb = 0
     try:
         log_debug("Trying to wait forever on callback and dispatcher threads")
         while all(alive):
             sleep(LIVENESS_POLL_SECONDS)
             alive = [t.is_alive() for t in threads]
+            memory_watermark_kb = log_new_memory_watermark(memory_watermark_kb)
     except KeyboardInterrupt:
         log_info("Main thread received interrupt - exiting.")
     else:
@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from dodal.utils import get_beamline_name
 from event_model import Event, EventDescriptor, RunStart, RunStop
 
@@ -5,6 +7,9 @@ from mx_bluesky.common.external_interaction.alerting import (
     Metadata,
     get_alerting_service,
 )
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.plan_reactive_callback import (
     PlanReactiveCallback,
 )
@@ -16,12 +21,15 @@ class AlertOnContainerChange(PlanReactiveCallback):
     """Sends an alert to beamline staff when a pin from a new puck has been loaded.
     This tends to be used as a heartbeat so we know that UDC is running."""
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        CONST.DESCRIPTORS.ROBOT_PRE_LOAD: {"robot-current_puck"}
+    }
+
     def __init__(self):
         super().__init__(log=ISPYB_ZOCALO_CALLBACK_LOGGER)
         self._new_container = None
         self._visit = None
         self._sample_id = None
-        self.descriptors: dict[str, EventDescriptor] = {}
 
     def activity_gated_descriptor(self, doc: EventDescriptor) -> EventDescriptor | None:
         self.descriptors[doc["uid"]] = doc
@@ -0,0 +1,47 @@
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    merge_event_data_needed,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.zocalo_callback import (
+    ZocaloCallback,
+)
+from mx_bluesky.common.external_interaction.callbacks.xray_centre.ispyb_callback import (
+    GridscanISPyBCallback,
+)
+from mx_bluesky.common.external_interaction.callbacks.xray_centre.nexus_callback import (
+    GridscanNexusFileCallback,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.alert_on_container_change import (
+    AlertOnContainerChange,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.robot_actions.ispyb_callback import (
+    RobotLoadISPyBCallback,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.rotation.ispyb_callback import (
+    RotationISPyBCallback,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.rotation.nexus_callback import (
+    RotationNexusFileCallback,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.snapshot_callback import (
+    BeamDrawingCallback,
+)
+
+# The external callbacks that read event data, including those that are only emitted to
+CALLBACKS_USING_EVENT_DATA = (
+    GridscanNexusFileCallback,
+    GridscanISPyBCallback,
+    ZocaloCallback,
+    RotationNexusFileCallback,
+    BeamDrawingCallback,
+    RotationISPyBCallback,
+    RobotLoadISPyBCallback,
+    AlertOnContainerChange,
+)
+
+
+def event_data_needed_by_callbacks() -> dict[str, frozenset[str] | None]:
+    """The event data read by the external callbacks, so that Hyperion only needs to
+    publish this."""
+    return merge_event_data_needed(
+        *(callback.EVENT_DATA_NEEDED for callback in CALLBACKS_USING_EVENT_DATA)
+    )
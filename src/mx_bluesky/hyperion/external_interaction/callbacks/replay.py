@@ -0,0 +1,304 @@
+import argparse
+import os
+import tracemalloc
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from itertools import count
+from pathlib import Path
+from time import monotonic, perf_counter
+from time import sleep as time_sleep  # noqa
+from types import ModuleType
+from typing import Any
+
+from dodal.devices.zocalo import ZocaloStartInfo
+from ispyb.sp.mxacquisition import MXAcquisition
+
+import mx_bluesky.common.external_interaction.callbacks.common.zocalo_callback as zocalo_callback
+import mx_bluesky.common.external_interaction.callbacks.sample_handling.sample_handling_callback as sample_handling_callback
+import mx_bluesky.common.external_interaction.callbacks.xray_centre.nexus_callback as gridscan_nexus_callback
+import mx_bluesky.common.external_interaction.ispyb.ispyb_store as ispyb_store
+import mx_bluesky.hyperion.external_interaction.callbacks.robot_actions.ispyb_callback as robot_action_callback
+import mx_bluesky.hyperion.external_interaction.callbacks.rotation.nexus_callback as rotation_nexus_callback
+from mx_bluesky.common.external_interaction.callbacks.common.document_recorder import (
+    read_recorded_documents,
+)
+from mx_bluesky.common.external_interaction.nexus.write_nexus import NexusWriter
+from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    setup_callbacks,
+)
+
+DocumentCallback = Callable[[str, dict[str, Any]], Any]
+
+STAND_IN_ISPYB_CONFIG = "stand_in_ispyb.cfg"
+
+
+@dataclass
+class StandInCalls:
+    """The calls made to the stand-in external services, by service and method."""
+
+    calls: dict[str, int] = field(default_factory=dict)
+    _ids: Iterator[int] = field(default_factory=lambda: count(1))
+
+    def record(self, service: str, method: str) -> int:
+        key = f"{service}.{method}"
+        self.calls[key] = self.calls.get(key, 0) + 1
+        return next(self._ids)
+
+
+class StandInMXAcquisition:
+    def __init__(self, stand_in_calls: StandInCalls):
+        self._calls = stand_in_calls
+
+    get_data_collection_group_params = MXAcquisition.get_data_collection_group_params
+    get_data_collection_params = MXAcquisition.get_data_collection_params
+    get_dc_grid_params = MXAcquisition.get_dc_grid_params
+    get_dc_position_params = MXAcquisition.get_dc_position_params
+
+    def upsert_data_collection_group(self, values: list) -> int:
+        return self._calls.record("ispyb", "upsert_data_collection_group")
+
+    def upsert_data_collection(self, values: list) -> int:
+        return self._calls.record("ispyb", "upsert_data_collection")
+
+    def upsert_dc_grid(self, values: list) -> int:
+        return self._calls.record("ispyb", "upsert_dc_grid")
+
+    def update_dc_position(self, values: list) -> int:
+        return self._calls.record("ispyb", "update_dc_position")
+
+    def update_data_collection_append_comments(
+        self, data_collection_id: int, comment: str, delimiter: str
+    ):
+        self._calls.record("ispyb", "update_data_collection_append_comments")
+
+
+class StandInCore:
+    def __init__(self, stand_in_calls: StandInCalls):
+        self._calls = stand_in_calls
+
+    def retrieve_visit_id(self, visit: str) -> int:
+        return self._calls.record("ispyb", "retrieve_visit_id")
+
+
+class StandInIspybConnection:
+    """Stands in for the connection returned by ispyb.open, accepting every write."""
+
+    def __init__(self, stand_in_calls: StandInCalls):
+        self.mx_acquisition = StandInMXAcquisition(stand_in_calls)
+        self.core = StandInCore(stand_in_calls)
+
+    def __enter__(self) -> "StandInIspybConnection":
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+class StandInZocaloTrigger:
+    def __init__(self, stand_in_calls: StandInCalls):
+        self._calls = stand_in_calls
+
+    def run_start(self, start_info: ZocaloStartInfo):
+        self._calls.record("zocalo", "run_start")
+
+    def run_end(self, data_collection_id: int):
+        self._calls.record("zocalo", "run_end")
+
+
+class StandInExpeyeInteraction:
+    def __init__(self, stand_in_calls: StandInCalls):
+        self._calls = stand_in_calls
+
+    def start_robot_action(self, *args: Any) -> int:
+        return self._calls.record("expeye", "start_robot_action")
+
+    def update_robot_action(self, *args: Any):
+        self._calls.record("expeye", "update_robot_action")
+
+    def end_robot_action(self, *args: Any):
+        self._calls.record("expeye", "end_robot_action")
+
+    def update_sample_status(self, *args: Any):
+        self._calls.record("expeye", "update_sample_status")
+
+
+def _stand_in_nexus_writer(stand_in_calls: StandInCalls) -> type[NexusWriter]:
+    class StandInNexusWriter(NexusWriter):
+        """Prepares the nexus metadata as normal but doesn't write the file."""
+
+        def create_nexus_file(self, *args: Any, **kwargs: Any):
+            stand_in_calls.record("nexus", "create_nexus_file")
+
+    return StandInNexusWriter
+
+
+def _replace(stack: ExitStack, module: ModuleType, name: str, value: Any):
+    stack.callback(setattr, module, name, getattr(module, name))
+    setattr(module, name, value)
+
+
+@contextmanager
+def stand_in_external_services() -> Iterator[StandInCalls]:
+    """Replace ISPyB, Zocalo, ExpEye and the writing of nexus files with local stand-ins
+    so that the callbacks can be created and replayed without any external services.
+
+    The stand-ins must be in place while the callbacks are created and replayed into.
+
+    Returns:
+        The record of calls made to the stand-ins
+    """
+    stand_in_calls = StandInCalls()
+    with ExitStack() as stack:
+        _replace(
+            stack,
+            ispyb_store.ispyb,
+            "open",
+            lambda *_: StandInIspybConnection(stand_in_calls),
+        )
+        _replace(
+            stack,
+            zocalo_callback,
+            "ZocaloTrigger",
+            lambda *_: StandInZocaloTrigger(stand_in_calls),
+        )
+        for module in (sample_handling_callback, robot_action_callback):
+            _replace(
+                stack,
+                module,
+                "ExpeyeInteraction",
+                lambda: StandInExpeyeInteraction(stand_in_calls),
+            )
+        for module in (gridscan_nexus_callback, rotation_nexus_callback):
+            _replace(
+                stack, module, "NexusWriter", _stand_in_nexus_writer(stand_in_calls)
+            )
+        original_config = os.environ.get("ISPYB_CONFIG_PATH")
+        os.environ["ISPYB_CONFIG_PATH"] = STAND_IN_ISPYB_CONFIG
+        stack.callback(_restore_environment, "ISPYB_CONFIG_PATH", original_config)
+        yield stand_in_calls
+
+
+def _restore_environment(name: str, value: str | None):
+    if value is None:
+        os.environ.pop(name, None)
+    else:
+        os.environ[name] = value
+
+
+@dataclass
+class CallbackTiming:
+    """The time a callback spent processing the replayed documents."""
+
+    callback: str
+    documents: int = 0
+    total_s: float = 0
+    max_s: float = 0
+    errors: int = 0
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.documents if self.documents else 0
+
+
+@dataclass
+class ReplayReport:
+    documents: int
+    elapsed_s: float
+    peak_memory_bytes: int | None
+    callback_timings: list[CallbackTiming]
+
+    @property
+    def documents_per_s(self) -> float:
+        return self.documents / self.elapsed_s if self.elapsed_s else 0
+
+    def __str__(self) -> str:
+        lines = [
+            f"Replayed {self.documents} documents in {self.elapsed_s:.3f}s "
+            f"({self.documents_per_s:.1f} documents/s)"
+        ]
+        if self.peak_memory_bytes is not None:
+            lines.append(f"Peak memory {self.peak_memory_bytes / 1e6:.1f}MB")
+        for t in sorted(self.callback_timings, key=lambda t: -t.total_s):
+            lines.append(
+                f"    {t.callback}: total {t.total_s:.3f}s, mean "
+                f"{t.mean_s * 1e3:.3f}ms, max {t.max_s * 1e3:.3f}ms, {t.errors} errors"
+            )
+        return "\n".join(lines)
+
+
+def replay_documents(
+    path: Path,
+    callbacks: Sequence[DocumentCallback],
+    realtime: bool = False,
+    trace_memory: bool = True,
+) -> ReplayReport:
+    """Replay a document stream recorded by DocumentRecorder into the callbacks, timing
+    how long each callback takes to process each document.
+
+    Exceptions raised by a callback are logged and counted, as they would be by the
+    RemoteDispatcher, and the replay continues.
+
+    Args:
+        path: The recorded document stream
+        callbacks: The callbacks to replay the documents into, in order
+        realtime: If true, documents are replayed with their recorded spacing, otherwise
+            they are replayed as fast as the callbacks can process them
+        trace_memory: If true, the peak memory allocated during the replay is measured.
+            This slows down the replay.
+    """
+    timings = [CallbackTiming(type(callback).__name__) for callback in callbacks]
+    documents = 0
+    if trace_memory:
+        tracemalloc.start()
+    start = monotonic()
+    try:
+        for time_s, name, doc in read_recorded_documents(path):
+            if realtime and (delay_s := start + time_s - monotonic()) > 0:
+                time_sleep(delay_s)
+            for callback, timing in zip(callbacks, timings, strict=True):
+                _time_callback(callback, timing, name, doc)
+            documents += 1
+        elapsed_s = monotonic() - start
+        peak_memory_bytes = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return ReplayReport(documents, elapsed_s, peak_memory_bytes, timings)
+
+
+def _time_callback(
+    callback: DocumentCallback,
+    timing: CallbackTiming,
+    name: str,
+    doc: dict[str, Any],
+):
+    callback_start = perf_counter()
+    try:
+        callback(name, doc)
+    except Exception as e:
+        timing.errors += 1
+        LOGGER.warning(f"{timing.callback} failed on {name} document", exc_info=e)
+    duration_s = perf_counter() - callback_start
+    timing.documents += 1
+    timing.total_s += duration_s
+    timing.max_s = max(timing.max_s, duration_s)
+
+
+def main(args: list[str] | None = None):
+    """Replay a recorded document stream into the hyperion callbacks, with stand-ins
+    for the external services, and print how they performed."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("recording", type=Path, help="The recorded document stream")
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Replay the documents with their recorded spacing rather than at maximum "
+        "speed",
+    )
+    parsed = parser.parse_args(args)
+    with stand_in_external_services() as stand_in_calls:
+        report = replay_documents(parsed.recording, setup_callbacks(), parsed.realtime)
+    print(report)
+    print(f"External service calls: {stand_in_calls.calls}")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.ispyb_mapping import (
     get_proposal_and_session_from_visit_string,
 )
@@ -32,13 +35,16 @@ robot_update_mapping = {
 
 
 class RobotLoadISPyBCallback(PlanReactiveCallback):
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        CONST.DESCRIPTORS.ROBOT_UPDATE: robot_update_mapping.keys()
+    }
+
     def __init__(self) -> None:
         ISPYB_ZOCALO_CALLBACK_LOGGER.debug("Initialising ISPyB Robot Load Callback")
         super().__init__(log=ISPYB_ZOCALO_CALLBACK_LOGGER)
         self._sample_id: int | None = None
 
         self.run_uid: str | None = None
-        self.descriptors: dict[str, EventDescriptor] = {}
         self.action_id: RobotActionID | None = None
         self.expeye = ExpeyeInteraction()
 
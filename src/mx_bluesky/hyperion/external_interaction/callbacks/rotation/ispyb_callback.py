@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from dodal.devices.zocalo import ZocaloStartInfo
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+    merge_event_data_needed,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.ispyb_callback_base import (
     BaseISPyBCallback,
 )
@@ -52,6 +56,15 @@ class RotationISPyBCallback(BaseISPyBCallback):
     See: https://blueskyproject.io/bluesky/callbacks.html#ways-to-invoke-callbacks
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = merge_event_data_needed(
+        BaseISPyBCallback.EVENT_DATA_NEEDED,
+        {
+            CONST.DESCRIPTORS.OAV_ROTATION_SNAPSHOT_TRIGGERED: {
+                "oav-snapshot-last_saved_path"
+            }
+        },
+    )
+
     def __init__(
         self,
         *,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.logging_callback import (
     format_doc_for_log,
 )
@@ -35,11 +38,19 @@ class RotationNexusFileCallback(PlanReactiveCallback):
     See: https://blueskyproject.io/bluesky/callbacks.html#ways-to-invoke-callbacks
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        CONST.DESCRIPTORS.HARDWARE_READ_DURING: {
+            "dcm-energy_in_keV",
+            "flux-flux_reading",
+            "attenuator-actual_transmission",
+            "eiger_bit_depth",
+        }
+    }
+
     def __init__(self) -> None:
         super().__init__(NEXUS_LOGGER)
         self.run_uid: str | None = None
         self.writer: NexusWriter | None = None
-        self.descriptors: dict[str, EventDescriptor] = {}
         # used when multiple collections are made in one detector arming event:
         self.full_num_of_images: int | None = None
         self.meta_data_run_number: int | None = None
@@ -3,8 +3,8 @@ import os
 import re
 from collections.abc import Iterator
 from datetime import datetime
-from math import cos, radians, sin
 from pathlib import Path
+from typing import ClassVar
 
 from dodal.devices.oav.snapshots.snapshot_image_processing import (
     compute_beam_centre_pixel_xy_for_mm_position,
@@ -13,12 +13,19 @@ from dodal.devices.oav.snapshots.snapshot_image_processing import (
 from event_model import Event, EventDescriptor, RunStart
 from PIL import Image
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    EventDataNeeded,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.plan_reactive_callback import (
     PlanReactiveCallback,
 )
 from mx_bluesky.common.parameters.components import WithSnapshot
 from mx_bluesky.common.parameters.constants import DocDescriptorNames, PlanNameConstants
 from mx_bluesky.common.utils.log import ISPYB_ZOCALO_CALLBACK_LOGGER as CALLBACK_LOGGER
+from mx_bluesky.common.utils.snapshot_policy import (
+    GENERATED_SNAPSHOTS,
+    project_to_image_plane_mm,
+)
 
 COMPRESSION_LEVEL = 6  # 6 is the default compression level for PIL if not specified
 
@@ -65,8 +72,9 @@ class BeamDrawingCallback(PlanReactiveCallback):
     ...         yield from bps.save()
 
         Generate rotation snapshots from a previously taken base gridscan snapshot.
-        WithSnapshot.snapshot_omegas_deg is ignored and snapshots are generated for the previously captured
-        0, 90 base images named "my_snapshot_prefix_0" and "my_snapshot_prefix_90"
+        Snapshots are generated for the previously captured 0, 90 base images named
+        "my_snapshot_prefix_0" and "my_snapshot_prefix_90", any snapshots taken at
+        WithSnapshot.snapshot_omegas_deg follow them
     >>> from dodal.devices.smargon import Smargon
     >>> def take_snapshot(params: WithSnapshot, oav: OAV, smargon: Smargon, run_engine: RunEngine):
     ...     run_engine.subscribe(BeamDrawingCallback())
@@ -95,12 +103,39 @@ class BeamDrawingCallback(PlanReactiveCallback):
     ...             yield from bps.save()
     """
 
+    EVENT_DATA_NEEDED: ClassVar[EventDataNeeded] = {
+        DocDescriptorNames.OAV_ROTATION_SNAPSHOT_TRIGGERED: {
+            "oav-snapshot-last_saved_path",
+            "oav-snapshot-directory",
+            "oav-beam_centre_i",
+            "oav-beam_centre_j",
+            "oav-microns_per_pixel_x",
+            "oav-microns_per_pixel_y",
+            "smargon-x",
+            "smargon-y",
+            "smargon-z",
+            "smargon-omega",
+        },
+        DocDescriptorNames.OAV_GRID_SNAPSHOT_TRIGGERED: {
+            "oav-grid_snapshot-last_saved_path",
+            "oav-beam_centre_i",
+            "oav-beam_centre_j",
+            "oav-microns_per_pixel_x",
+            "oav-microns_per_pixel_y",
+            "smargon-x",
+            "smargon-y",
+            "smargon-z",
+            "smargon-omega",
+        },
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, log=CALLBACK_LOGGER, **kwargs)
         self._base_snapshots: list[_SnapshotInfo] = []
         self._rotation_snapshot_descriptor: str = ""
         self._grid_snapshot_descriptor: str = ""
         self._next_snapshot_info: Iterator | None = None
+        self._snapshots_generated = 0
         self._use_grid_snapshots: bool = False
 
     def _reset(self):
@@ -112,8 +147,15 @@ class BeamDrawingCallback(PlanReactiveCallback):
             with_snapshot = WithSnapshot.model_validate_json(doc.get("with_snapshot"))  # type: ignore
             self._use_grid_snapshots = with_snapshot.use_grid_snapshots
             CALLBACK_LOGGER.info(f"Snapshot callback initialised with {with_snapshot}")
+        elif doc.get("subplan_name") == PlanNameConstants.ROTATION_OUTER and (
+            with_snapshot_json := doc.get("with_snapshot")
+        ):
+            # Whether snapshots are generated can be decided for each rotation
+            with_snapshot = WithSnapshot.model_validate_json(with_snapshot_json)  # type: ignore
+            self._use_grid_snapshots = with_snapshot.use_grid_snapshots
         elif doc.get("subplan_name") == PlanNameConstants.ROTATION_MAIN:
             self._next_snapshot_info = None
+            self._snapshots_generated = 0
             CALLBACK_LOGGER.info("Snapshot callback start rotation")
         return doc
 
@@ -157,7 +199,9 @@ class BeamDrawingCallback(PlanReactiveCallback):
 
     def _handle_rotation_snapshot(self, doc: Event) -> Event:
         data = doc["data"]
-        if self._use_grid_snapshots:
+        # Any snapshots taken at other omegas follow those generated
+        if self._use_grid_snapshots and self._snapshots_generated < GENERATED_SNAPSHOTS:
+            self._snapshots_generated += 1
             if not self._next_snapshot_info:
                 self._next_snapshot_info = iter(self._base_snapshots)
             snapshot_info = next(self._next_snapshot_info, None)
@@ -217,10 +261,7 @@ class BeamDrawingCallback(PlanReactiveCallback):
     def _project_xyz_to_xy(
         self, xyz: tuple[float, float, float], omega_deg: float
     ) -> tuple[float, float]:
-        return (
-            xyz[0],
-            xyz[1] * cos(-radians(omega_deg)) + xyz[2] * sin(-radians(omega_deg)),
-        )
+        return project_to_image_plane_mm(xyz, omega_deg)
 
     def _generate_snapshot_zero_offset(
         self,
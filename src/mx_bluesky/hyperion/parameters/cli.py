@@ -1,5 +1,6 @@
 import argparse
 from enum import StrEnum
+from pathlib import Path
 
 from pydantic.dataclasses import dataclass
 
@@ -15,6 +16,13 @@ class HyperionMode(StrEnum):
 class HyperionArgs:
     mode: HyperionMode
     dev_mode: bool = False
+    incremental_device_reconnect: bool = False
+    prefetch_agamemnon_instructions: bool = False
+    virtual_time: bool = False
+    queued_publisher: bool = False
+    filter_published_documents: bool = False
+    elide_unchanged_setpoints: bool = False
+    metrics_file: Path | None = None
 
 
 def _add_callback_relevant_args(parser: argparse.ArgumentParser) -> None:
@@ -53,5 +61,59 @@ def parse_cli_args() -> HyperionArgs:
         type=HyperionMode,
         choices=HyperionMode.__members__.values(),
     )
+    parser.add_argument(
+        "--incremental-device-reconnect",
+        action="store_true",
+        help="At the start of UDC, only reconnect devices that are not already "
+        "connected instead of reloading all beamline devices",
+    )
+    parser.add_argument(
+        "--prefetch-agamemnon-instructions",
+        action="store_true",
+        help="Fetch the next instruction from agamemnon while the current sample is "
+        "being collected",
+    )
+    parser.add_argument(
+        "--virtual-time",
+        action="store_true",
+        help="Run plans in virtual time, skipping sleeps and waits on hardware, to "
+        "simulate runs quickly. Hardware actions take roughly as long in virtual time "
+        "as they do on i03. Only available in dev mode",
+    )
+    parser.add_argument(
+        "--queued-publisher",
+        action="store_true",
+        help="Publish documents to the callbacks with msgpack from a separate thread, "
+        "so that the RunEngine does not wait for them to be sent",
+    )
+    parser.add_argument(
+        "--filter-published-documents",
+        action="store_true",
+        help="Only publish the events and event data that the external callbacks use",
+    )
+    parser.add_argument(
+        "--elide-unchanged-setpoints",
+        action="store_true",
+        help="In UDC, skip setting up signals that are still set to the same value as "
+        "for the previous sample",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help="Append metrics such as the duration of each phase of a collection to "
+        "this file as JSON lines",
+    )
     args = parser.parse_args()
-    return HyperionArgs(dev_mode=args.dev or False, mode=args.mode)
+    if args.virtual_time and not args.dev:
+        parser.error("--virtual-time can only be used with --dev")
+    return HyperionArgs(
+        dev_mode=args.dev or False,
+        mode=args.mode,
+        incremental_device_reconnect=args.incremental_device_reconnect,
+        prefetch_agamemnon_instructions=args.prefetch_agamemnon_instructions,
+        virtual_time=args.virtual_time,
+        queued_publisher=args.queued_publisher,
+        filter_published_documents=args.filter_published_documents,
+        elide_unchanged_setpoints=args.elide_unchanged_setpoints,
+        metrics_file=args.metrics_file,
+    )
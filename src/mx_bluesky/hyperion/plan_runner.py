@@ -5,6 +5,7 @@ from blueapi.core import BlueskyContext
 from bluesky.utils import MsgGenerator, RequestAbort
 
 from mx_bluesky.common.parameters.constants import Status
+from mx_bluesky.common.utils.context import DeviceCompositeFactory
 from mx_bluesky.common.utils.exceptions import WarningError
 from mx_bluesky.common.utils.log import LOGGER
 from mx_bluesky.hyperion.runner import BaseRunner
@@ -19,10 +20,21 @@ class PlanError(Exception):
 class PlanRunner(BaseRunner):
     """Runner that executes experiments from inside a running Bluesky plan"""
 
-    def __init__(self, context: BlueskyContext, dev_mode: bool) -> None:
-        super().__init__(context)
+    def __init__(
+        self,
+        context: BlueskyContext,
+        dev_mode: bool,
+        incremental_device_reconnect: bool = False,
+        prefetch_agamemnon_instructions: bool = False,
+        queued_publisher: bool = False,
+        filter_published_documents: bool = False,
+    ) -> None:
+        super().__init__(context, queued_publisher, filter_published_documents)
         self.current_status: Status = Status.IDLE
         self.is_dev_mode = dev_mode
+        self.incremental_device_reconnect = incremental_device_reconnect
+        self.prefetch_agamemnon_instructions = prefetch_agamemnon_instructions
+        self.composite_factory = DeviceCompositeFactory(context)
 
     def execute_plan(
         self,
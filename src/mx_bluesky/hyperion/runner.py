@@ -9,6 +9,12 @@ from blueapi.core import BlueskyContext
 from bluesky.callbacks.zmq import Publisher
 from bluesky.utils import MsgGenerator
 
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    DocumentForwardingFilter,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.document_publisher import (
+    QueuedPublisher,
+)
 from mx_bluesky.common.external_interaction.callbacks.common.log_uid_tag_callback import (
     LogUidTaggingCallback,
 )
@@ -16,8 +22,12 @@ from mx_bluesky.common.parameters.components import MxBlueskyParameters
 from mx_bluesky.common.parameters.constants import Actions, Status
 from mx_bluesky.common.utils.exceptions import WarningError
 from mx_bluesky.common.utils.log import LOGGER
+from mx_bluesky.common.utils.metrics import record_queue_depth
 from mx_bluesky.common.utils.tracing import TRACER
 from mx_bluesky.hyperion.experiment_plans.experiment_registry import PLAN_REGISTRY
+from mx_bluesky.hyperion.external_interaction.callbacks.event_data_needed import (
+    event_data_needed_by_callbacks,
+)
 from mx_bluesky.hyperion.parameters.constants import CONST
 
 
@@ -63,17 +73,38 @@ class BaseRunner:
         Aborts the run engine and terminates the loop waiting for messages."""
         pass
 
-    def __init__(self, context: BlueskyContext):
+    def __init__(
+        self,
+        context: BlueskyContext,
+        queued_publisher: bool = False,
+        filter_published_documents: bool = False,
+    ):
         self.context: BlueskyContext = context
         self.run_engine = context.run_engine
         # These references are necessary to maintain liveness of callbacks because run_engine
         # only keeps a weakref
         self._logging_uid_tag_callback = LogUidTaggingCallback()
-        self._publisher = Publisher(f"localhost:{CONST.CALLBACK_0MQ_PROXY_PORTS[0]}")
+        publisher_address = f"localhost:{CONST.CALLBACK_0MQ_PROXY_PORTS[0]}"
+        self._publisher = (
+            QueuedPublisher(publisher_address)
+            if queued_publisher
+            else Publisher(publisher_address)
+        )
+
+        self._publisher_filter = (
+            DocumentForwardingFilter(self._publisher, event_data_needed_by_callbacks())
+            if filter_published_documents
+            else None
+        )
 
         self.run_engine.subscribe(self._logging_uid_tag_callback)
         LOGGER.info("Connecting to external callback ZMQ proxy...")
-        self.run_engine.subscribe(self._publisher)
+        self.run_engine.subscribe(self._publisher_filter or self._publisher)
+
+    def close_publisher(self):
+        """Send any documents still waiting to be published to the callbacks, such as
+        the stop documents of a run aborted on shutdown, then stop publishing."""
+        self._publisher.close()
 
 
 class GDARunner(BaseRunner):
@@ -82,8 +113,10 @@ class GDARunner(BaseRunner):
     def __init__(
         self,
         context: BlueskyContext,
+        queued_publisher: bool = False,
+        filter_published_documents: bool = False,
     ) -> None:
-        super().__init__(context)
+        super().__init__(context, queued_publisher, filter_published_documents)
         self.current_status: StatusAndMessage = StatusAndMessage(Status.IDLE)
         self._last_run_aborted: bool = False
         self._command_queue: Queue[Command] = Queue()
@@ -113,7 +146,7 @@ class GDARunner(BaseRunner):
             return StatusAndMessage(Status.FAILED, "Bluesky already running")
         else:
             self.current_status = StatusAndMessage(Status.BUSY)
-            self._command_queue.put(
+            self._queue_command(
                 Command(
                     action=Actions.START,
                     devices=devices,
@@ -138,7 +171,7 @@ class GDARunner(BaseRunner):
         """Stops the run engine and the loop waiting for messages."""
         print("Shutting down: Stopping the run engine gracefully")
         self.stop()
-        self._command_queue.put(Command(action=Actions.SHUTDOWN))
+        self._queue_command(Command(action=Actions.SHUTDOWN))
 
     def _stopping_thread(self):
         try:
@@ -150,16 +183,24 @@ class GDARunner(BaseRunner):
         except Exception as e:
             self.current_status = make_error_status_and_message(e)
 
+    def _queue_command(self, command: Command):
+        self._command_queue.put(command)
+        record_queue_depth("gda_commands", self._command_queue.qsize())
+
     def fetch_next_command(self) -> Command:
         """Fetch the next command from the queue, blocks if queue is empty."""
-        return self._command_queue.get()
+        command = self._command_queue.get()
+        record_queue_depth("gda_commands", self._command_queue.qsize())
+        return command
 
     def try_fetch_next_command(self) -> Command | None:
         """Fetch the next command from the queue or return None if no command available."""
         try:
-            return self._command_queue.get(block=False)
+            command = self._command_queue.get(block=False)
         except Empty:
             return None
+        record_queue_depth("gda_commands", self._command_queue.qsize())
+        return command
 
     def wait_on_queue(self):
         while True:
@@ -1,10 +1,39 @@
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+from time import monotonic
+from types import ModuleType
+
 from blueapi.core import BlueskyContext
+from bluesky import plan_stubs as bps
 from dodal.common.beamlines.beamline_utils import clear_devices
-from dodal.utils import collect_factories, get_beamline_based_on_environment_variable
+from dodal.utils import (
+    collect_factories,
+    get_beamline_based_on_environment_variable,
+    make_device,
+)
+from ophyd_async.core import DEFAULT_TIMEOUT, Device, SignalR, walk_devices
 
 import mx_bluesky.hyperion.experiment_plans as hyperion_plans
 from mx_bluesky.common.utils.log import LOGGER
 
+# How long a device may take to respond to a read before it is connected again
+LIVENESS_TIMEOUT_S = 1.0
+
+
+class DeviceConnectionAction(StrEnum):
+    REUSED = "reused"
+    CONNECTED = "connected"
+    FAILED = "failed"
+
+
+@dataclass
+class DeviceConnectionReport:
+    name: str
+    action: DeviceConnectionAction
+    duration_s: float
+    exception: Exception | None = None
+
 
 def setup_context(dev_mode: bool = False) -> BlueskyContext:
     context = BlueskyContext()
@@ -36,3 +65,130 @@ def setup_devices(context: BlueskyContext, dev_mode: bool):
             f"Unable to connect to beamline devices {list(exceptions.keys())}",
             list(exceptions.values()),
         )
+
+
+def reconnect_devices(
+    context: BlueskyContext, dev_mode: bool
+) -> dict[str, DeviceConnectionReport]:
+    """Reconnect only those beamline devices that need it, rather than rebuilding the
+    whole beamline.
+
+    Devices that are connected and still respond to a read of one of their signals are
+    reused as they are. Devices that are missing from the context are created, and any
+    devices that have never connected, whose last connection failed or that no longer
+    respond are reconnected concurrently.
+
+    Returns:
+        A report of the action taken and time spent for each device, by device name
+
+    Raises:
+        ExceptionGroup: If any of the devices could not be created or connected
+    """
+    beamline = get_beamline_based_on_environment_variable()
+    reports = _create_missing_devices(context, beamline, dev_mode)
+
+    async def connect_stale_devices():
+        for report in await asyncio.gather(
+            *[
+                _connect_if_stale(name, device, dev_mode)
+                for name, device in context.devices.items()
+                if isinstance(device, Device)
+            ]
+        ):
+            reports[report.name] = report
+
+    context.run_engine(bps.wait_for([connect_stale_devices]))
+    _log_connection_reports(reports)
+
+    failures = {
+        name: report.exception
+        for name, report in reports.items()
+        if report.exception is not None
+    }
+    if failures:
+        raise ExceptionGroup(
+            f"Unable to connect to beamline devices {list(failures.keys())}",
+            list(failures.values()),
+        )
+    return reports
+
+
+def _create_missing_devices(
+    context: BlueskyContext, beamline: ModuleType, dev_mode: bool
+) -> dict[str, DeviceConnectionReport]:
+    reports: dict[str, DeviceConnectionReport] = {}
+    for name in collect_factories(beamline):
+        if name in context.devices:
+            continue
+        LOGGER.info(f"Device {name} missing from context, creating it")
+        start_time = monotonic()
+        try:
+            devices = make_device(beamline, name, mock=dev_mode)
+        except Exception as e:
+            reports[name] = DeviceConnectionReport(
+                name, DeviceConnectionAction.FAILED, monotonic() - start_time, e
+            )
+            continue
+        for device_name, device in devices.items():
+            if device_name not in context.devices:
+                context.register_device(device)
+    return reports
+
+
+def _representative_signal(device: Device) -> SignalR | None:
+    if isinstance(device, SignalR):
+        return device
+    return next(
+        (d for d in walk_devices(device).values() if isinstance(d, SignalR)), None
+    )
+
+
+async def _is_live(device: Device) -> bool:
+    """Whether the device is connected and still responding, judged by reading one of
+    its signals with a short timeout, so that e.g. a device whose IOC has gone away is
+    connected again."""
+    signal = _representative_signal(device)
+    if signal is None:
+        return False
+    try:
+        await asyncio.wait_for(signal.read(cached=False), LIVENESS_TIMEOUT_S)
+    except Exception as e:
+        LOGGER.info(f"Device {device.name} is not responding, reconnecting: {e!r}")
+        return False
+    return True
+
+
+async def _connect_if_stale(
+    name: str, device: Device, dev_mode: bool
+) -> DeviceConnectionReport:
+    start_time = monotonic()
+    if await _is_live(device):
+        return DeviceConnectionReport(
+            name, DeviceConnectionAction.REUSED, monotonic() - start_time
+        )
+    try:
+        await device.connect(
+            mock=dev_mode, timeout=DEFAULT_TIMEOUT, force_reconnect=True
+        )
+    except Exception as e:
+        return DeviceConnectionReport(
+            name, DeviceConnectionAction.FAILED, monotonic() - start_time, e
+        )
+    return DeviceConnectionReport(
+        name, DeviceConnectionAction.CONNECTED, monotonic() - start_time
+    )
+
+
+def _log_connection_reports(reports: dict[str, DeviceConnectionReport]):
+    counts = {
+        action: len([r for r in reports.values() if r.action == action])
+        for action in DeviceConnectionAction
+    }
+    LOGGER.info(
+        f"Device reconnection complete: {', '.join(f'{n} {a}' for a, n in counts.items())}"
+    )
+    for report in sorted(reports.values(), key=lambda r: r.duration_s, reverse=True):
+        LOGGER.debug(
+            f"{report.name}: {report.action} in {report.duration_s:.3f}s"
+            + (f" ({report.exception!r})" if report.exception else "")
+        )
@@ -0,0 +1,38 @@
+import random
+
+from mx_bluesky.common.preprocessors.simulated_hardware import (
+    SimulatedHardwareTimings,
+    fixed,
+    normal,
+)
+
+
+def i03_hardware_timings(
+    scale: float = 1, rng: random.Random | None = None
+) -> SimulatedHardwareTimings:
+    """How long actions on the i03 devices roughly take, for simulating them.
+
+    Args:
+        scale: Multiplies every duration, e.g. to shorten a benchmark
+        rng: The random number generator to draw durations from, so that runs can be
+            repeated
+    """
+    rng = rng or random.Random()
+    return SimulatedHardwareTimings(
+        {
+            "robot": normal(40 * scale, 5 * scale, rng),
+            "smargon": normal(1 * scale, 0.3 * scale, rng),
+            "aperture_scatterguard": normal(5 * scale, 1 * scale, rng),
+            "undulator_dcm": normal(15 * scale, 3 * scale, rng),
+            "detector_motion": normal(8 * scale, 2 * scale, rng),
+            "beamstop": normal(4 * scale, 1 * scale, rng),
+            "backlight": fixed(1 * scale),
+            "eiger": normal(2 * scale, 0.5 * scale, rng),
+            "zebra_fast_grid_scan": normal(10 * scale, 1 * scale, rng),
+            "panda_fast_grid_scan": normal(10 * scale, 1 * scale, rng),
+            "zocalo": normal(3 * scale, 1 * scale, rng),
+            "oav": fixed(0.2 * scale),
+            "pin_tip_detection": fixed(0.5 * scale),
+        },
+        default=fixed(0.05 * scale),
+    )
@@ -0,0 +1,229 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from math import sqrt
+
+import numpy as np
+from bluesky import plan_stubs as bps
+from bluesky.utils import MsgGenerator
+from dodal.devices.smargon import Smargon
+from ophyd_async.epics.motor import Motor
+
+# Used for axes whose motor reports neither a velocity nor a maximum velocity, e.g. in
+# simulation
+DEFAULT_XYZ_VELOCITY_MM_S = 2.0
+DEFAULT_OMEGA_VELOCITY_DEG_S = 120.0
+DEFAULT_ACCELERATION_TIME_S = 0.2
+# Above this many locations a heuristic ordering is used, as the exact ordering takes
+# time growing exponentially with the number of locations
+EXACT_ORDERING_LIMIT = 9
+
+
+@dataclass(frozen=True)
+class AxisMotion:
+    """How fast an axis moves, as reported by its motor record.
+
+    Attributes:
+        velocity: The velocity the axis moves at, in units per second
+        acceleration_time_s: The time taken to reach velocity from rest
+    """
+
+    velocity: float
+    acceleration_time_s: float
+
+    def move_time_s(self, distance: float) -> float:
+        """The time taken to move the given distance from rest to rest, accelerating
+        uniformly to the velocity and back, or only part of the way for moves
+        too short to reach it."""
+        distance = abs(distance)
+        if distance >= self.velocity * self.acceleration_time_s:
+            return distance / self.velocity + self.acceleration_time_s
+        return 2 * sqrt(distance * self.acceleration_time_s / self.velocity)
+
+
+@dataclass(frozen=True)
+class GonioMotion:
+    """How fast the goniometer axes move, with x, y and z in mm and omega in deg."""
+
+    x: AxisMotion
+    y: AxisMotion
+    z: AxisMotion
+    omega: AxisMotion
+
+    def translation_time_s(self, start_um: np.ndarray, end_um: np.ndarray) -> float:
+        """The time taken to move between two locations, moving all axes together."""
+        return max(
+            axis.move_time_s(distance_mm)
+            for axis, distance_mm in zip(
+                (self.x, self.y, self.z), (end_um - start_um) / 1000, strict=True
+            )
+        )
+
+
+def _read_axis_motion(motor: Motor, default_velocity: float) -> MsgGenerator:
+    # Moves are made at VELO, VMAX is only an upper limit on it
+    velocity = yield from bps.rd(motor.velocity)
+    if velocity <= 0:
+        velocity = yield from bps.rd(motor.max_velocity)
+    if velocity <= 0:
+        velocity = default_velocity
+    acceleration_time_s = yield from bps.rd(motor.acceleration_time)
+    if acceleration_time_s <= 0:
+        acceleration_time_s = DEFAULT_ACCELERATION_TIME_S
+    return AxisMotion(velocity, acceleration_time_s)
+
+
+def read_gonio_motion(smargon: Smargon) -> MsgGenerator[GonioMotion]:
+    x = yield from _read_axis_motion(smargon.x, DEFAULT_XYZ_VELOCITY_MM_S)
+    y = yield from _read_axis_motion(smargon.y, DEFAULT_XYZ_VELOCITY_MM_S)
+    z = yield from _read_axis_motion(smargon.z, DEFAULT_XYZ_VELOCITY_MM_S)
+    omega = yield from _read_axis_motion(smargon.omega, DEFAULT_OMEGA_VELOCITY_DEG_S)
+    return GonioMotion(x, y, z, omega)
+
+
+def _step_s(
+    motion: GonioMotion,
+    previous_um: np.ndarray,
+    location_um: np.ndarray,
+    omega_s: float,
+    omega_after_translation: bool,
+) -> float:
+    translation_s = motion.translation_time_s(previous_um, location_um)
+    if omega_after_translation:
+        return translation_s + omega_s
+    return max(translation_s, omega_s)
+
+
+def travel_time_s(
+    motion: GonioMotion,
+    start_um: np.ndarray,
+    locations_um: Sequence[np.ndarray],
+    omega_move_s: Sequence[float],
+    omega_after_translation: bool = False,
+) -> float:
+    """The total time taken to move to each of the locations in turn.
+
+    Args:
+        motion: How fast the goniometer moves
+        start_um: Where the goniometer starts from
+        locations_um: The locations to move to, in order
+        omega_move_s: The time taken by the omega move made with the move to each
+            location, e.g. to the start of the next rotation
+        omega_after_translation: If True omega only moves once the goniometer has
+            reached each location, e.g. to take snapshots there first, otherwise it
+            moves at the same time
+    """
+    total_s = 0.0
+    previous_um = start_um
+    for location_um, omega_s in zip(locations_um, omega_move_s, strict=True):
+        total_s += _step_s(
+            motion, previous_um, location_um, omega_s, omega_after_translation
+        )
+        previous_um = location_um
+    return total_s
+
+
+def order_for_least_travel(
+    motion: GonioMotion,
+    start_um: np.ndarray,
+    locations_um: Sequence[np.ndarray],
+    omega_move_s: Sequence[float],
+    omega_after_translation: bool = False,
+) -> list[int]:
+    """Find the order to visit the locations in so that the goniometer spends as little
+    time as possible moving between them, see travel_time_s.
+
+    The omega moves depend only on how many locations have been visited, as rotations
+    alternate direction, but when they happen at the same time as moving to the next
+    location they can hide the time taken by some moves and not others.
+
+    Returns:
+        The indices of the locations in the order to visit them. If no order is
+        quicker, this is the order given.
+    """
+
+    def step_s(previous: int | None, location: int, visited: int) -> float:
+        previous_um = start_um if previous is None else locations_um[previous]
+        return _step_s(
+            motion,
+            previous_um,
+            locations_um[location],
+            omega_move_s[visited],
+            omega_after_translation,
+        )
+
+    def total_s(order: Sequence[int]) -> float:
+        return travel_time_s(
+            motion,
+            start_um,
+            [locations_um[i] for i in order],
+            omega_move_s,
+            omega_after_translation,
+        )
+
+    given_order = list(range(len(locations_um)))
+    if len(locations_um) < 2:
+        return given_order
+    if len(locations_um) <= EXACT_ORDERING_LIMIT:
+        order = _exact_order(len(locations_um), step_s)
+    else:
+        order = _improved_order(len(locations_um), step_s, total_s)
+    if total_s(order) < total_s(given_order) - 1e-9:
+        return order
+    return given_order
+
+
+def _exact_order(n: int, step_s: Callable[[int | None, int, int], float]) -> list[int]:
+    """Held-Karp dynamic programming over the subsets of locations visited."""
+    best: dict[tuple[int, int], tuple[float, int | None]] = {
+        (1 << i, i): (step_s(None, i, 0), None) for i in range(n)
+    }
+    for visited in range(1, n):
+        for (subset, last), (time_s, _) in [
+            item for item in best.items() if item[0][0].bit_count() == visited
+        ]:
+            for i in range(n):
+                if subset & (1 << i):
+                    continue
+                key = (subset | (1 << i), i)
+                candidate_s = time_s + step_s(last, i, visited)
+                if key not in best or candidate_s < best[key][0]:
+                    best[key] = (candidate_s, last)
+    everything = (1 << n) - 1
+    last: int | None = min(range(n), key=lambda i: best[(everything, i)][0])
+    order = []
+    subset = everything
+    while last is not None:
+        order.append(last)
+        previous = best[(subset, last)][1]
+        subset &= ~(1 << last)
+        last = previous
+    return order[::-1]
+
+
+def _improved_order(
+    n: int,
+    step_s: Callable[[int | None, int, int], float],
+    total_s: Callable[[Sequence[int]], float],
+) -> list[int]:
+    """Nearest neighbour ordering, then improved by reversing sections of it for as long
+    as that makes it quicker (2-opt)."""
+    order: list[int] = []
+    remaining = set(range(n))
+    while remaining:
+        previous = order[-1] if order else None
+        nearest = min(sorted(remaining), key=lambda i: step_s(previous, i, len(order)))
+        order.append(nearest)
+        remaining.remove(nearest)
+
+    best_s = total_s(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(n - 1):
+            for j in range(i + 1, n):
+                candidate = order[:i] + order[i : j + 1][::-1] + order[j + 1 :]
+                candidate_s = total_s(candidate)
+                if candidate_s < best_s - 1e-9:
+                    order, best_s = candidate, candidate_s
+                    improved = True
+    return order
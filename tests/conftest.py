@@ -6,6 +6,7 @@ import os
 import sys
 import threading
 from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Future
 from contextlib import ExitStack
 from copy import deepcopy
 from functools import partial
@@ -1039,10 +1040,22 @@ def extract_metafile(input_filename, output_filename):
             output_fo.write(metafile_fo.read())
 
 
+def _wait_for_succeeds(msg: Msg) -> list[Future]:
+    # As the RunEngine does, reply with the tasks waited for, here all done with no result
+    tasks = []
+    for _ in msg.args[0]:
+        task = Future()
+        task.set_result(None)
+        tasks.append(task)
+    return tasks
+
+
 @pytest.fixture
 def sim_run_engine():
     logging.getLogger("asyncio").setLevel(logging.DEBUG)
-    return RunEngineSimulator()
+    sim_run_engine = RunEngineSimulator()
+    sim_run_engine.add_handler("wait_for", _wait_for_succeeds)
+    return sim_run_engine
 
 
 class DocumentCapturer:
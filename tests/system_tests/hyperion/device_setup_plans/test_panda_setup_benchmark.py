@@ -0,0 +1,116 @@
+import os
+import statistics
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+from bluesky.run_engine import RunEngine
+from bluesky.utils import Msg, MsgGenerator
+from dodal.devices.fast_grid_scan import PandAGridScanParams
+from dodal.devices.smargon import Smargon
+from ophyd_async.core import YamlSettingsProvider
+from ophyd_async.fastcs.panda import HDFPanda
+from ophyd_async.plan_stubs import store_settings
+
+from mx_bluesky.common.device_setup_plans.setup_panda import get_panda_config_manager
+from mx_bluesky.common.parameters.constants import DeviceSettingsConstants
+from mx_bluesky.common.preprocessors.simulated_hardware import (
+    SimulatedHardwareTimings,
+    fixed,
+    simulated_hardware_wrapper,
+)
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, set_setpoint_cache
+from mx_bluesky.hyperion.device_setup_plans.setup_panda import (
+    disarm_panda_for_gridscan,
+    setup_panda_for_flyscan,
+)
+
+GRIDSCANS = int(os.environ.get("PANDA_BENCHMARK_GRIDSCANS", "20"))
+# How long each write to the PandA takes to be acknowledged
+PANDA_SET_S = float(os.environ.get("PANDA_BENCHMARK_SET_S", "0.005"))
+
+
+def gridscan_setup(
+    panda: HDFPanda, smargon: Smargon, forget_applied: bool
+) -> MsgGenerator:
+    if forget_applied:
+        get_panda_config_manager().clear()
+    start = monotonic()
+    yield from simulated_hardware_wrapper(
+        setup_panda_for_flyscan(
+            panda,
+            PandAGridScanParams(transmission_fraction=0.01),
+            smargon,
+            0.1,
+            101.1,
+            0.1,
+        ),
+        SimulatedHardwareTimings({"panda": fixed(PANDA_SET_S)}),
+    )
+    setup_s = monotonic() - start
+    yield from disarm_panda_for_gridscan(panda)
+    return setup_s
+
+
+def time_gridscan_setups(
+    run_engine: RunEngine, panda: HDFPanda, smargon: Smargon, forget_applied: bool
+) -> tuple[list[float], int]:
+    sets: list[Msg] = []
+
+    def record_sets(msg: Msg):
+        if msg.command == "set":
+            sets.append(msg)
+
+    run_engine.msg_hook = record_sets  # type: ignore
+    setup_times_s = [
+        run_engine(gridscan_setup(panda, smargon, forget_applied)).plan_result  # type: ignore
+        for _ in range(GRIDSCANS)
+    ]
+    return setup_times_s, len(sets)
+
+
+@pytest.mark.timeout(GRIDSCANS * 10)
+def test_panda_setup_benchmark(
+    run_engine: RunEngine, panda: HDFPanda, smargon: Smargon, tmp_path
+):
+    """Set up a mocked PandA for a number of gridscans, both applying every setting
+    each time as used to be done and only applying the settings that have changed, and
+    report the setup time saved per gridscan.
+
+    Deliberately not part of the system tests, run it with:
+
+        pytest -s tests/system_tests/hyperion/device_setup_plans/test_panda_setup_benchmark.py
+    """
+    run_engine(
+        store_settings(
+            YamlSettingsProvider(str(tmp_path)),
+            DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_FILENAME,
+            panda,
+        )
+    )
+    set_setpoint_cache(SetpointCache())
+    try:
+        with patch.object(
+            DeviceSettingsConstants, "PANDA_FLYSCAN_SETTINGS_DIR", str(tmp_path)
+        ):
+            every_time_s, every_time_sets = time_gridscan_setups(
+                run_engine, panda, smargon, forget_applied=True
+            )
+            changed_s, changed_sets = time_gridscan_setups(
+                run_engine, panda, smargon, forget_applied=False
+            )
+    finally:
+        set_setpoint_cache(None)
+        get_panda_config_manager().clear()
+
+    # The first setup applies everything either way
+    saved_s = statistics.mean(every_time_s[1:]) - statistics.mean(changed_s[1:])
+    print(
+        f"\nPandA setup applying every setting: mean {statistics.mean(every_time_s):.3f}s"
+        f", {every_time_sets / GRIDSCANS:.1f} sets per gridscan"
+        f"\nPandA setup applying changed settings: mean "
+        f"{statistics.mean(changed_s):.3f}s, {changed_sets / GRIDSCANS:.1f} sets per "
+        f"gridscan\nSaved {saved_s:.3f}s per gridscan"
+    )
+    assert changed_sets < every_time_sets
+    assert saved_s > 0
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import statistics
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from bluesky.run_engine import RunEngine
+from dodal.beamlines import i03
+from dodal.devices.attenuator.attenuator import BinaryFilterAttenuator
+from ophyd.status import Status
+from ophyd_async.core import AsyncStatus
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.hyperion.experiment_plans.optimise_attenuation_plan import (
+    OptimizeAttenuationComposite,
+    Search,
+    optimise_attenuation_plan,
+)
+
+# Count rates, per unit transmission, of the simulated samples in MHz. The detector
+# is modelled as paralysable, losing events at high rates, with a 1us deadtime
+SAMPLE_RATES_MHZ = [0.3, 1, 3, 10, 30, 100, 300, 1000]
+DEADTIME_S = 1e-6
+INITIAL_TRANSMISSION = 1e-5
+# How long a cycle takes: moving the attenuator, the shutter and a 1s acquisition
+CYCLE_S = float(os.environ.get("ATTENUATION_BENCHMARK_CYCLE_S", "1.5"))
+
+
+@pytest.fixture
+def composite(attenuator: BinaryFilterAttenuator):
+    status = Status()
+    status.set_finished()
+    composite = OptimizeAttenuationComposite(
+        attenuator=attenuator,
+        sample_shutter=i03.sample_shutter(connect_immediately=True, mock=True),
+        xspress3mini=i03.xspress3mini(connect_immediately=True, mock=True),
+    )
+    with (
+        patch.object(composite.xspress3mini, "stage", MagicMock(return_value=status)),
+        patch.object(composite.sample_shutter, "set", MagicMock(return_value=status)),
+    ):
+        yield composite
+
+
+def simulate_sample(composite: OptimizeAttenuationComposite, rate_mhz: float):
+    """Make the xspress3mini measure a sample with the given count rate, setting the
+    counts and deadtime whenever the transmission changes"""
+    rng = np.random.default_rng(0)
+
+    def set_transmission(transmission: float):
+        incident_rate_hz = rate_mhz * 1e6 * transmission
+        deadtime = 1 - np.exp(-incident_rate_hz * DEADTIME_S)
+        counts = rng.poisson(incident_rate_hz * (1 - deadtime))
+        set_mock_value(composite.xspress3mini.channels[1].total_time, 1_000_000)
+        set_mock_value(
+            composite.xspress3mini.channels[1].reset_ticks,
+            round(1_000_000 * deadtime),
+        )
+        set_mock_value(
+            composite.xspress3mini.dt_corrected_latest_mca[1],
+            np.array([0] * 100 + [counts]),
+        )
+        return AsyncStatus(asyncio.sleep(0))
+
+    composite.attenuator.set = MagicMock(side_effect=set_transmission)
+
+
+def cycles_to_optimise(
+    run_engine: RunEngine,
+    composite: OptimizeAttenuationComposite,
+    optimisation_type: str,
+    search: Search,
+) -> list[int]:
+    cycles = []
+    for rate_mhz in SAMPLE_RATES_MHZ:
+        simulate_sample(composite, rate_mhz)
+        composite.xspress3mini.stage.reset_mock()  # type: ignore
+        run_engine(
+            optimise_attenuation_plan(
+                composite,
+                optimisation_type=optimisation_type,
+                initial_transmission=INITIAL_TRANSMISSION,
+                max_cycles=50,
+                search=search,
+            )
+        )
+        cycles.append(composite.xspress3mini.stage.call_count)  # type: ignore
+    return cycles
+
+
+@pytest.mark.parametrize("optimisation_type", ["deadtime", "total_counts"])
+def test_optimise_attenuation_benchmark(
+    run_engine: RunEngine,
+    composite: OptimizeAttenuationComposite,
+    optimisation_type: str,
+):
+    """Optimise the attenuation for simulated samples over a range of count rates with
+    both the stepwise and model searches and report the cycles each took.
+
+    Deliberately not part of the system tests, run it with:
+
+        pytest -s tests/system_tests/hyperion/experiment_plans/test_optimise_attenuation_benchmark.py
+    """
+    stepwise = cycles_to_optimise(
+        run_engine, composite, optimisation_type, Search.STEPWISE
+    )
+    model = cycles_to_optimise(run_engine, composite, optimisation_type, Search.MODEL)
+
+    print(f"\n{optimisation_type} optimisation cycles for sample rates (MHz):")
+    for name, cycles in (("stepwise", stepwise), ("model", model)):
+        print(
+            f"{name:>9}: "
+            + " ".join(
+                f"{rate}: {n}" for rate, n in zip(SAMPLE_RATES_MHZ, cycles, strict=True)
+            )
+            + f", mean {statistics.mean(cycles):.1f} cycles, "
+            f"~{statistics.mean(cycles) * CYCLE_S:.1f}s"
+        )
+    assert sum(model) <= sum(stepwise)
@@ -0,0 +1,131 @@
+import gc
+import os
+import resource
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from bluesky.run_engine import RunEngine
+from dodal.devices.oav.oav_parameters import OAVParameters
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.common.external_interaction.callbacks.common.document_recorder import (
+    DocumentRecorder,
+    read_recorded_documents,
+)
+from mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan import (
+    LoadCentreCollectComposite,
+    load_centre_collect_full,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    setup_callbacks,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.replay import (
+    stand_in_external_services,
+)
+from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
+
+from .....conftest import raw_params_from_file
+
+SAMPLES = int(os.environ.get("CALLBACK_SOAK_SAMPLES", "200"))
+WARM_UP_SAMPLES = 20
+MAX_RESIDENT_MEMORY_GROWTH_MB = 20
+
+UID_FIELDS = ("uid", "run_start", "descriptor")
+
+
+@pytest.fixture
+def sample_documents(
+    load_centre_collect_composite: LoadCentreCollectComposite,
+    oav_parameters_for_rotation: OAVParameters,
+    run_engine: RunEngine,
+    tmp_path: Path,
+) -> list[tuple[str, dict[str, Any]]]:
+    """The documents from collecting one sample with UDC against mock devices."""
+    set_mock_value(
+        load_centre_collect_composite.undulator_dcm.undulator_ref().current_gap, 1.11
+    )
+    parameters = LoadCentreCollect(
+        **raw_params_from_file(
+            "tests/test_data/parameter_json_files/example_load_centre_collect_params.json",
+            tmp_path,
+        )
+    )
+    recording = tmp_path / "sample.pkl.gz"
+    with DocumentRecorder(recording) as recorder:
+        run_engine.subscribe(recorder)
+        run_engine(
+            load_centre_collect_full(
+                load_centre_collect_composite, parameters, oav_parameters_for_rotation
+            )
+        )
+    return [(name, doc) for _, name, doc in read_recorded_documents(recording)]
+
+
+def with_new_uids(
+    documents: list[tuple[str, dict[str, Any]]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """Copies of the documents with fresh uids, so that they look like another run.
+    The documents are copied as they would be when received over 0MQ, as some
+    callbacks modify the documents they are given."""
+    new_uids: dict[str, str] = {}
+
+    def new_uid(uid: str) -> str:
+        return new_uids.setdefault(uid, str(uuid4()))
+
+    return [
+        (
+            name,
+            deepcopy(doc)
+            | {field: new_uid(doc[field]) for field in UID_FIELDS if field in doc},
+        )
+        for name, doc in documents
+    ]
+
+
+def resident_memory_mb() -> float:
+    gc.collect()
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@pytest.mark.timeout(SAMPLES * 10)
+def test_callback_memory_stays_flat_over_many_runs(
+    sample_documents: list[tuple[str, dict[str, Any]]],
+):
+    """Replay the runs from thousands of samples into the external callbacks, as a
+    long-running callback process would receive them, and check that the callbacks do
+    not hold on to anything from runs that have finished.
+
+    Deliberately not part of the system tests because it is SLOW, run it with:
+
+        CALLBACK_SOAK_SAMPLES=1000 pytest -s \\
+            tests/system_tests/hyperion/external_interaction/callbacks/test_callback_soak.py
+    """
+    runs_per_sample = sum(name == "start" for name, _ in sample_documents)
+    with stand_in_external_services():
+        callbacks = setup_callbacks()
+
+        def replay_samples(samples: int):
+            for _ in range(samples):
+                for name, doc in with_new_uids(sample_documents):
+                    for callback in callbacks:
+                        callback(name, doc)
+
+        replay_samples(WARM_UP_SAMPLES)
+        memory_after_warm_up_mb = resident_memory_mb()
+        replay_samples(SAMPLES)
+        memory_growth_mb = resident_memory_mb() - memory_after_warm_up_mb
+
+    print(
+        f"\nReplayed {SAMPLES * runs_per_sample} runs, peak resident memory grew by "
+        f"{memory_growth_mb:.1f} MB"
+    )
+    held_descriptors = {
+        type(callback).__name__: len(descriptors)
+        for callback in callbacks
+        if (descriptors := getattr(callback, "descriptors", None)) is not None
+    }
+    assert all(held == 0 for held in held_descriptors.values()), held_descriptors
+    assert memory_growth_mb < MAX_RESIDENT_MEMORY_GROWTH_MB
@@ -0,0 +1,241 @@
+import dataclasses
+import json
+import os
+import random
+import statistics
+from collections.abc import Generator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from pathlib import Path
+from threading import Thread
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+from bluesky.run_engine import RunEngine
+from dodal.devices.oav.oav_parameters import OAVParameters
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.common.preprocessors.profiling import (
+    PlanProfile,
+    profile_plan_wrapper,
+)
+from mx_bluesky.common.preprocessors.simulated_hardware import (
+    SimulatedHardwareTimings,
+    simulated_hardware_wrapper,
+    virtual_time_wrapper,
+)
+from mx_bluesky.common.utils.virtual_clock import VirtualClock
+from mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan import (
+    LoadCentreCollectComposite,
+    load_centre_collect_full,
+)
+from mx_bluesky.hyperion.external_interaction.agamemnon import (
+    create_parameters_from_agamemnon,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    setup_callbacks,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.replay import (
+    stand_in_external_services,
+)
+from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
+from mx_bluesky.hyperion.utils.simulated_hardware_timings import i03_hardware_timings
+
+SAMPLES = int(os.environ.get("UDC_BENCHMARK_SAMPLES", "10"))
+# If set, simulate the hardware taking its full time in virtual time, which also models
+# the length of the shift
+VIRTUAL_TIME = bool(os.environ.get("UDC_BENCHMARK_VIRTUAL_TIME"))
+# Scales the hardware durations, which are roughly those seen on i03
+TIME_SCALE = float(
+    os.environ.get("UDC_BENCHMARK_TIME_SCALE", "1" if VIRTUAL_TIME else "0.01")
+)
+# If set, fail when the mean overhead per sample exceeds this
+MAX_MEAN_OVERHEAD_S = os.environ.get("UDC_BENCHMARK_MAX_MEAN_OVERHEAD_S")
+
+AGAMEMNON_INSTRUCTION = Path("tests/test_data/agamemnon/example_native.json")
+FIRST_SAMPLE_ID = 6501159
+
+
+@dataclass
+class SampleTiming:
+    sample_id: int
+    elapsed_s: float
+    waiting_s: float
+    simulated_s: float | None = None
+
+    @property
+    def overhead_s(self) -> float:
+        return self.elapsed_s - self.waiting_s
+
+
+@pytest.fixture
+def benchmark_composite(
+    grid_detect_then_xray_centre_composite,
+    composite_for_rotation_scan,
+    beamstop_phase1,
+    thawer,
+    vfm,
+    mirror_voltages,
+    undulator_dcm,
+    webcam,
+    lower_gonio,
+    baton,
+) -> LoadCentreCollectComposite:
+    """The devices for load_centre_collect_full, taken from the system test composites,
+    which share the same mock devices."""
+    devices = {
+        **vars(composite_for_rotation_scan),
+        **vars(grid_detect_then_xray_centre_composite),
+        "beamstop": beamstop_phase1,
+        "thawer": thawer,
+        "vfm": vfm,
+        "mirror_voltages": mirror_voltages,
+        "undulator_dcm": undulator_dcm,
+        "webcam": webcam,
+        "lower_gonio": lower_gonio,
+        "baton": baton,
+    }
+    composite = LoadCentreCollectComposite(
+        **{
+            field.name: devices[field.name]
+            for field in dataclasses.fields(LoadCentreCollectComposite)
+        }
+    )
+    set_mock_value(composite.dcm.bragg_in_degrees.user_readback, 5)
+    return composite
+
+
+@pytest.fixture
+def agamemnon_stand_in() -> Generator[None, None, None]:
+    """Serves the example instruction from agamemnon, with a new sample in a new pin
+    each time so that every sample is robot loaded."""
+    instruction = json.loads(AGAMEMNON_INSTRUCTION.read_text())
+    sample_ids = count(FIRST_SAMPLE_ID)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            sample_id = next(sample_ids)
+            instruction["collect"]["sample"]["id"] = sample_id
+            instruction["collect"]["sample"]["position"] = sample_id % 16 + 1
+            body = json.dumps(instruction).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    with patch.dict(
+        os.environ, {"AGAMEMNON_URL": f"http://localhost:{server.server_port}/"}
+    ):
+        yield
+    server.shutdown()
+    server.server_close()
+
+
+def run_sample(
+    composite: LoadCentreCollectComposite,
+    oav_parameters: OAVParameters,
+    run_engine: RunEngine,
+    timings: SimulatedHardwareTimings,
+    clock: VirtualClock | None,
+) -> SampleTiming:
+    start = monotonic()
+    simulated_start = clock.monotonic() if clock else 0.0
+    parameter_list = create_parameters_from_agamemnon()
+    waiting_s = 0.0
+    for parameters in parameter_list:
+        assert isinstance(parameters, LoadCentreCollect)
+        plan = load_centre_collect_full(composite, parameters, oav_parameters)
+        profile = PlanProfile()
+        run_engine(
+            profile_plan_wrapper(
+                virtual_time_wrapper(plan, clock, timings)
+                if clock
+                else simulated_hardware_wrapper(plan, timings),
+                profile,
+            )
+        )
+        waiting_s += profile.waiting_s()
+    return SampleTiming(
+        parameter_list[0].sample_id,  # type: ignore
+        monotonic() - start,
+        waiting_s,
+        clock.monotonic() - simulated_start if clock else None,
+    )
+
+
+def print_report(sample_timings: list[SampleTiming]):
+    print(f"\n{'sample':>10} {'elapsed_s':>10} {'waiting_s':>10} {'overhead_s':>10}")
+    for t in sample_timings:
+        print(
+            f"{t.sample_id:>10} {t.elapsed_s:>10.3f} {t.waiting_s:>10.3f} "
+            f"{t.overhead_s:>10.3f}"
+        )
+    overheads = [t.overhead_s for t in sample_timings]
+    print(
+        f"Overhead per sample: mean {statistics.mean(overheads):.3f}s, median "
+        f"{statistics.median(overheads):.3f}s, max {max(overheads):.3f}s"
+    )
+    simulated = [t.simulated_s for t in sample_timings if t.simulated_s is not None]
+    if simulated:
+        print(
+            f"Simulated {len(simulated)} samples in {sum(simulated) / 3600:.2f} hours "
+            f"of beamline time, {statistics.mean(simulated):.1f}s per sample"
+        )
+
+
+@pytest.mark.timeout(SAMPLES * 120)
+def test_udc_soak_benchmark(
+    benchmark_composite: LoadCentreCollectComposite,
+    oav_parameters_for_rotation: OAVParameters,
+    run_engine: RunEngine,
+    agamemnon_stand_in: None,
+):
+    """Run UDC against mock devices for a number of samples, with the hardware taking
+    a realistic (scaled) time to respond and local stand-ins for agamemnon, ISPyB,
+    Zocalo and ExpEye. Reports the orchestration overhead per sample, i.e. the time
+    not spent waiting on the simulated hardware, so that regressions in plan,
+    parameter and callback overhead are visible.
+
+    With UDC_BENCHMARK_VIRTUAL_TIME set, the hardware takes its full time in virtual
+    time instead, so that a whole shift can be modelled quickly.
+
+    Deliberately not part of the system tests because it is SLOW, run it with:
+
+        UDC_BENCHMARK_SAMPLES=20 pytest -s \\
+            tests/system_tests/hyperion/external_interaction/test_udc_soak_benchmark.py
+    """
+    set_mock_value(benchmark_composite.undulator_dcm.undulator_ref().current_gap, 1.11)
+    timings = i03_hardware_timings(TIME_SCALE, random.Random(0))
+    clock = VirtualClock() if VIRTUAL_TIME else None
+    with (
+        stand_in_external_services() as stand_in_calls,
+        patch("mx_bluesky.common.utils.virtual_clock._virtual_clock", clock),
+    ):
+        for callback in setup_callbacks():
+            run_engine.subscribe(callback)
+        sample_timings = [
+            run_sample(
+                benchmark_composite,
+                oav_parameters_for_rotation,
+                run_engine,
+                timings,
+                clock,
+            )
+            for _ in range(SAMPLES)
+        ]
+
+    print_report(sample_timings)
+    print(f"External service calls: {stand_in_calls.calls}")
+    assert stand_in_calls.calls["zocalo.run_start"] > 0
+    if MAX_MEAN_OVERHEAD_S is not None:
+        assert statistics.mean(t.overhead_s for t in sample_timings) <= float(
+            MAX_MEAN_OVERHEAD_S
+        )
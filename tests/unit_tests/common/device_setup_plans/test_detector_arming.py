@@ -0,0 +1,208 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator, assert_message_and_return_remaining
+from dodal.devices.detector import TriggerMode
+from dodal.devices.eiger import EigerDetector
+
+from mx_bluesky.common.device_setup_plans.detector_arming import (
+    DetectorArming,
+    _arming_changes,
+)
+from mx_bluesky.common.experiment_plans.common_grid_detect_then_xray_centre_plan import (
+    create_parameters_for_flyscan_xray_centre,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.grid_detection_callback import (
+    GridParamUpdate,
+)
+from mx_bluesky.common.parameters.gridscan import GridCommon, SpecifiedThreeDGridScan
+
+GROUP = "ready_for_data_collection"
+
+
+@pytest.fixture
+def armed_eiger(eiger: EigerDetector, test_fgs_params: SpecifiedThreeDGridScan):
+    eiger.set_detector_parameters(test_fgs_params.detector_params)
+    return eiger
+
+
+def test_parameters_not_yet_known_do_not_count_as_changes(
+    test_fgs_params: SpecifiedThreeDGridScan,
+):
+    armed = test_fgs_params.detector_params.model_copy(
+        update={"expected_energy_ev": 12700}
+    )
+    final = test_fgs_params.detector_params.model_copy(
+        update={"expected_energy_ev": None, "exposure_time_s": 0.5}
+    )
+
+    assert _arming_changes(armed, final) == ["exposure_time_s"]
+    assert _arming_changes(armed, armed) == []
+
+
+@pytest.mark.parametrize(
+    "trigger_mode, expected_changes",
+    [(TriggerMode.FREE_RUN, []), (TriggerMode.SET_FRAMES, ["num_triggers"])],
+)
+def test_num_triggers_only_counts_as_a_change_when_setting_frames(
+    test_fgs_params: SpecifiedThreeDGridScan,
+    trigger_mode: TriggerMode,
+    expected_changes: list[str],
+):
+    armed = test_fgs_params.detector_params.model_copy(
+        update={"trigger_mode": trigger_mode, "num_triggers": 0}
+    )
+    final = armed.model_copy(update={"num_triggers": 1200})
+
+    assert _arming_changes(armed, final) == expected_changes
+
+
+def test_finalising_a_gridscan_with_the_detected_grid_does_not_arm_again(
+    sim_run_engine: RunEngineSimulator,
+    eiger: EigerDetector,
+    test_full_grid_scan_params: GridCommon,
+):
+    test_full_grid_scan_params.detector_distance_mm = 200
+    eiger.set_detector_parameters(test_full_grid_scan_params.detector_params)
+    grid_params = GridParamUpdate(
+        x_start_um=-598.4,
+        y_start_um=-215.3,
+        y2_start_um=-215.3,
+        z_start_um=150.6,
+        z2_start_um=150.6,
+        x_steps=30,
+        y_steps=20,
+        z_steps=13,
+        x_step_size_um=20,
+        y_step_size_um=20,
+        z_step_size_um=20,
+    )
+    flyscan_params = create_parameters_for_flyscan_xray_centre(
+        test_full_grid_scan_params, grid_params, SpecifiedThreeDGridScan
+    )
+    detector_arming = DetectorArming()
+
+    def plan():
+        yield from detector_arming.start(eiger, GROUP)
+        yield from detector_arming.finalise(
+            eiger, flyscan_params.detector_params, GROUP
+        )
+
+    msgs = sim_run_engine.simulate_plan(plan())
+
+    assert flyscan_params.detector_params.num_triggers == 30 * (20 + 13)
+    assert [msg.command for msg in msgs] == ["set"]
+    assert detector_arming.rearms == 0
+
+
+def test_finalising_with_the_armed_parameters_does_not_arm_again(
+    sim_run_engine: RunEngineSimulator,
+    armed_eiger: EigerDetector,
+    test_fgs_params: SpecifiedThreeDGridScan,
+):
+    detector_arming = DetectorArming()
+
+    def plan():
+        yield from detector_arming.start(armed_eiger, GROUP)
+        yield from detector_arming.finalise(
+            armed_eiger, test_fgs_params.detector_params, GROUP
+        )
+
+    msgs = sim_run_engine.simulate_plan(plan())
+
+    assert [msg.command for msg in msgs] == ["set"]
+    assert detector_arming.rearms == 0
+
+
+def test_finalising_with_changed_parameters_stops_and_arms_again(
+    sim_run_engine: RunEngineSimulator,
+    armed_eiger: EigerDetector,
+    test_fgs_params: SpecifiedThreeDGridScan,
+):
+    detector_arming = DetectorArming()
+    final_params = test_fgs_params.detector_params.model_copy(
+        update={"exposure_time_s": 0.5}
+    )
+
+    def plan():
+        yield from detector_arming.start(armed_eiger, GROUP)
+        yield from detector_arming.finalise(armed_eiger, final_params, GROUP)
+
+    msgs = sim_run_engine.simulate_plan(plan())
+
+    msgs = assert_message_and_return_remaining(
+        msgs, lambda msg: msg.command == "set" and msg.obj is armed_eiger.do_arm
+    )
+    # Arming is waited for so that stopping the detector does not block
+    msgs = assert_message_and_return_remaining(
+        msgs[1:], lambda msg: msg.command == "wait" and msg.kwargs["group"] == GROUP
+    )
+    assert msgs[1].command == "stop" and msgs[1].obj is armed_eiger
+    msgs = msgs[2:]
+    assert_message_and_return_remaining(
+        msgs,
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj is armed_eiger.do_arm
+            and msg.kwargs["group"] == GROUP
+        ),
+    )
+    assert armed_eiger.detector_params == final_params
+    assert detector_arming.rearms == 1
+
+
+def test_finalising_without_arming_only_sets_parameters(
+    sim_run_engine: RunEngineSimulator,
+    eiger: EigerDetector,
+    test_fgs_params: SpecifiedThreeDGridScan,
+):
+    msgs = sim_run_engine.simulate_plan(
+        DetectorArming().finalise(eiger, test_fgs_params.detector_params, GROUP)
+    )
+
+    assert msgs == []
+    assert eiger.detector_params == test_fgs_params.detector_params
+
+
+@patch("mx_bluesky.common.device_setup_plans.detector_arming.record_detector_arming")
+@patch("mx_bluesky.common.device_setup_plans.detector_arming.monotonic")
+def test_arming_finished_before_it_was_needed_is_reported_as_hidden(
+    mock_monotonic: MagicMock,
+    mock_record_detector_arming: MagicMock,
+    run_engine: RunEngine,
+    armed_eiger: EigerDetector,
+):
+    # Started, finished, needed, ready
+    mock_monotonic.side_effect = [10, 15, 20, 20]
+    detector_arming = DetectorArming()
+
+    def plan():
+        yield from detector_arming.start(armed_eiger, GROUP)
+        yield from detector_arming.wait_until_armed(GROUP)
+
+    run_engine(plan())
+
+    mock_record_detector_arming.assert_called_once_with(5, 0)
+
+
+@patch("mx_bluesky.common.device_setup_plans.detector_arming.record_detector_arming")
+@patch("mx_bluesky.common.device_setup_plans.detector_arming.monotonic")
+def test_arming_still_going_when_needed_is_reported_as_waited_for(
+    mock_monotonic: MagicMock,
+    mock_record_detector_arming: MagicMock,
+    sim_run_engine: RunEngineSimulator,
+    armed_eiger: EigerDetector,
+):
+    # Started, needed, ready, needed again
+    mock_monotonic.side_effect = [10, 20, 30, 40]
+    detector_arming = DetectorArming()
+
+    def plan():
+        yield from detector_arming.start(armed_eiger, GROUP)
+        yield from detector_arming.wait_until_armed(GROUP)
+        yield from detector_arming.wait_until_armed(GROUP)
+
+    sim_run_engine.simulate_plan(plan())
+
+    mock_record_detector_arming.assert_called_once_with(10, 10)
@@ -1,42 +1,143 @@
-from unittest.mock import MagicMock, patch
+import os
+from collections.abc import Iterator
 
-from bluesky.plan_stubs import null
+import pytest
+import yaml
 from bluesky.run_engine import RunEngine
-from ophyd_async.fastcs.panda import HDFPanda
+from bluesky.utils import Msg
+from ophyd_async.fastcs.panda import HDFPanda, SeqTable, SeqTrigger
+from ophyd_async.testing import set_mock_value
 
-from mx_bluesky.common.device_setup_plans.setup_panda import load_panda_from_yaml
+from mx_bluesky.common.device_setup_plans.setup_panda import (
+    get_panda_config_manager,
+    load_panda_from_yaml,
+)
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, set_setpoint_cache
 
+TEST_FILE = "test"
 
-def get_test_plan(*args):
-    yield from null()
-    return "retrieved_settings"
+
+@pytest.fixture
+def panda_settings_dir(tmpdir) -> str:
+    with open(tmpdir / f"{TEST_FILE}.yaml", "w") as file:
+        yaml.safe_dump(
+            {
+                "pulse.1.width": 0.1,
+                "seq.1.prescale_units": "us",
+                "seq.1.table": {
+                    "repeats": [1],
+                    "trigger": [SeqTrigger.BITA_1.value],
+                    "position": [0],
+                    "time1": [0],
+                    "time2": [1],
+                    **{
+                        f"out{output}{phase}": [False]
+                        for output in "abcdef"
+                        for phase in (1, 2)
+                    },
+                },
+            },
+            file,
+        )
+    return str(tmpdir)
+
+
+@pytest.fixture
+def sets(run_engine: RunEngine) -> Iterator[list[str]]:
+    sets: list[str] = []
+
+    def record_sets(msg: Msg):
+        if msg.command == "set":
+            sets.append(msg.obj.name)
+
+    run_engine.msg_hook = record_sets  # type: ignore
+    set_setpoint_cache(SetpointCache())
+    yield sets
+    set_setpoint_cache(None)
+    get_panda_config_manager().clear()
 
 
-@patch("mx_bluesky.common.device_setup_plans.setup_panda.YamlSettingsProvider")
-@patch("mx_bluesky.common.device_setup_plans.setup_panda.retrieve_settings")
-@patch("mx_bluesky.common.device_setup_plans.setup_panda.apply_panda_settings")
 def test_load_panda_from_yaml(
-    mock_apply_panda_settings: MagicMock,
-    mock_retrieve_settings: MagicMock,
-    mock_settings_provider: MagicMock,
-    panda: HDFPanda,
-    tmpdir,
-    run_engine: RunEngine,
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
 ):
-    test_file = "test"
-    mock_settings_provider.return_value = (mock_settings_return := MagicMock())
-    mock_retrieve_settings.side_effect = get_test_plan
-
-    run_engine(
-        load_panda_from_yaml(
-            tmpdir,
-            test_file,
-            panda,
-        )
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+
+    assert sets == [
+        "panda-seq-1-prescale_units",
+        "panda-pulse-1-width",
+        "panda-seq-1-table",
+    ]
+
+
+async def test_only_settings_that_have_changed_are_applied_again(
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
+):
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    sets.clear()
+
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    assert sets == []
+
+    set_mock_value(panda.pulse[1].width, 0.5)
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    assert sets == ["panda-pulse-1-width"]
+    assert await panda.pulse[1].width.get_value() == 0.1
+
+
+def test_identical_sequencer_tables_are_not_applied_again(
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
+):
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+
+    set_mock_value(panda.seq[1].table, SeqTable.row(trigger=SeqTrigger.BITA_1, time2=1))
+    assert get_panda_config_manager().applied.is_set_to(
+        panda.seq[1].table, SeqTable.row(trigger=SeqTrigger.BITA_1, time2=1)
     )
 
-    mock_settings_provider.assert_called_once_with(tmpdir)
-    mock_retrieve_settings.assert_called_once_with(
-        mock_settings_return, test_file, panda
+    set_mock_value(panda.seq[1].table, SeqTable.row(trigger=SeqTrigger.BITA_0, time2=1))
+    assert not get_panda_config_manager().applied.is_set_to(
+        panda.seq[1].table, SeqTable.row(trigger=SeqTrigger.BITA_1, time2=1)
     )
-    mock_apply_panda_settings.assert_called_once_with("retrieved_settings")
+
+
+def test_all_settings_are_applied_again_once_cleared(
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
+):
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    get_panda_config_manager().clear()
+    sets.clear()
+
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+
+    assert len(sets) == 3
+
+
+def test_every_setting_is_applied_each_time_without_a_setpoint_cache(
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
+):
+    set_setpoint_cache(None)
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    sets.clear()
+
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+
+    assert len(sets) == 3
+
+
+async def test_settings_file_is_read_again_once_modified(
+    panda: HDFPanda, panda_settings_dir: str, run_engine: RunEngine, sets: list[str]
+):
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+    sets.clear()
+    settings_file = f"{panda_settings_dir}/{TEST_FILE}.yaml"
+    with open(settings_file) as file:
+        settings = yaml.safe_load(file)
+    with open(settings_file, "w") as file:
+        yaml.safe_dump({**settings, "pulse.1.width": 0.2}, file)
+    modified = os.stat(settings_file).st_mtime
+    os.utime(settings_file, (modified + 1, modified + 1))
+
+    run_engine(load_panda_from_yaml(panda_settings_dir, TEST_FILE, panda))
+
+    assert sets == ["panda-pulse-1-width"]
+    assert await panda.pulse[1].width.get_value() == 0.2
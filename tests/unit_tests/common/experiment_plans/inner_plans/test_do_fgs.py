@@ -43,9 +43,7 @@ def fgs_devices(run_engine, eiger):
 
 
 @patch("mx_bluesky.common.experiment_plans.inner_plans.do_fgs.read_hardware_for_zocalo")
-@patch(
-    "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary"
-)
+@patch("mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary")
 def test_kickoff_and_complete_gridscan_correct_messages(
     mock_check_topup,
     mock_read_hardware,
@@ -104,6 +104,6 @@ def test_read_hardware_correct_messages(
     msgs = assert_message_and_return_remaining(
         msgs,
         lambda msg: msg.command == "read"
-        and msg.obj.name == "eiger_odin_file_writer_id",
+        and msg.obj.readables == (fake_composite.eiger.odin.file_writer.id,),
     )
     msgs = assert_message_and_return_remaining(msgs, lambda msg: msg.command == "save")
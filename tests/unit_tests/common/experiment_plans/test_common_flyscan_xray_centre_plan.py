@@ -206,7 +206,7 @@ class TestFlyscanXrayCentrePlan:
         beamline_specific.tidy_plan.assert_called_once()  # type: ignore
 
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     )
     def test_waits_for_motion_program(
         self,
@@ -285,7 +285,7 @@ class TestFlyscanXrayCentrePlan:
         spec_set=True,
     )
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
         autospec=True,
     )
     def test_when_grid_scan_ran_then_eiger_disarmed_before_zocalo_end(
@@ -351,7 +351,7 @@ class TestFlyscanXrayCentrePlan:
         autospec=True,
     )
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
         autospec=True,
     )
     def test_fgs_arms_eiger_without_grid_detect(
@@ -384,7 +384,7 @@ class TestFlyscanXrayCentrePlan:
         autospec=True,
     )
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
         autospec=True,
     )
     def test_when_grid_scan_fails_with_exception_then_detector_disarmed_and_correct_exception_returned(
@@ -434,7 +434,7 @@ class TestFlyscanXrayCentrePlan:
         autospec=True,
     )
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
         autospec=True,
     )
     def test_kickoff_and_complete_gridscan_triggers_zocalo(
@@ -495,7 +495,7 @@ class TestFlyscanXrayCentrePlan:
         assert mock_zocalo_trigger.run_end.mock_calls == [call(id_1), call(id_2)]  # type: ignore
 
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
         new=MagicMock(side_effect=lambda *_, **__: iter([Msg("check_topup")])),
     )
     def test_read_hardware_during_collection_occurs_after_eiger_arm(
@@ -531,7 +531,8 @@ class TestFlyscanXrayCentrePlan:
         )
         msgs = assert_message_and_return_remaining(
             msgs,
-            lambda msg: msg.command == "read" and msg.obj.name == "eiger_bit_depth",
+            lambda msg: msg.command == "read"
+            and fake_fgs_composite.eiger.bit_depth in msg.obj.readables,
         )
         msgs = assert_message_and_return_remaining(
             msgs, lambda msg: msg.command == "save"
@@ -160,7 +160,7 @@ def test_oav_snapshot_plan_generates_snapshots_events_without_triggering_oav_whe
     sim_run_engine: RunEngineSimulator,
 ):
     oav_snapshot_params.use_grid_snapshots = True
-    oav_snapshot_params.snapshot_omegas_deg = [0, 90]
+    oav_snapshot_params.snapshot_omegas_deg = None
 
     msgs = sim_run_engine.simulate_plan(
         oav_snapshot_plan(
@@ -206,3 +206,38 @@ def test_oav_snapshot_plan_generates_snapshots_events_without_triggering_oav_whe
         msgs = assert_message_and_return_remaining(
             msgs, lambda msg: msg.command == "save"
         )
+
+
+def test_oav_snapshot_plan_takes_snapshots_at_other_omegas_after_generating_them(
+    oav_snapshot_params: WithSnapshot,
+    oav_snapshot_composite: CompositeImpl,
+    oav_parameters_for_rotation: OAVParameters,
+    sim_run_engine: RunEngineSimulator,
+):
+    oav_snapshot_params.use_grid_snapshots = True
+    oav_snapshot_params.snapshot_omegas_deg = [90, 180]
+
+    msgs = sim_run_engine.simulate_plan(
+        oav_snapshot_plan(
+            oav_snapshot_composite, oav_snapshot_params, oav_parameters_for_rotation
+        )
+    )
+
+    for _ in 0, 270:
+        msgs = assert_message_and_return_remaining(
+            msgs,
+            lambda msg: msg.command == "read"
+            and msg.obj is oav_snapshot_composite.smargon,
+        )
+    for omega in 90, 180:
+        msgs = assert_message_and_return_remaining(
+            msgs,
+            lambda msg: msg.command == "set"
+            and msg.obj is oav_snapshot_composite.smargon.omega
+            and msg.args[0] == omega,
+        )
+        msgs = assert_message_and_return_remaining(
+            msgs,
+            lambda msg: msg.command == "trigger"
+            and msg.obj is oav_snapshot_composite.oav.snapshot,
+        )
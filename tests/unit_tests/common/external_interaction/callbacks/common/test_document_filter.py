@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    DocumentForwardingFilter,
+    merge_event_data_needed,
+)
+
+
+def descriptor(uid: str, name: str, *keys: str) -> dict:
+    return {
+        "uid": uid,
+        "run_start": "run",
+        "name": name,
+        "data_keys": {key: {"source": key} for key in keys},
+    }
+
+
+def event(descriptor_uid: str, *keys: str) -> dict:
+    return {
+        "descriptor": descriptor_uid,
+        "data": dict.fromkeys(keys, 1.0),
+        "timestamps": dict.fromkeys(keys, 0.0),
+    }
+
+
+@pytest.fixture
+def forwarded() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def document_filter(forwarded: MagicMock) -> DocumentForwardingFilter:
+    return DocumentForwardingFilter(
+        forwarded, {"hardware": {"energy", "flux"}, "snapshot": None}
+    )
+
+
+def test_merging_takes_the_union_of_data_keys_and_none_means_all():
+    assert merge_event_data_needed(
+        {"hardware": {"energy"}, "snapshot": {"path"}},
+        {"hardware": ["flux"], "snapshot": None, "robot": None},
+        {"snapshot": {"omega"}},
+    ) == {
+        "hardware": frozenset({"energy", "flux"}),
+        "snapshot": None,
+        "robot": None,
+    }
+
+
+def test_unneeded_descriptors_and_their_events_are_dropped(
+    document_filter: DocumentForwardingFilter, forwarded: MagicMock
+):
+    document_filter("start", {"uid": "run"})
+    document_filter("descriptor", descriptor("d1", "pin_tip_edges", "edge"))
+    document_filter("event", event("d1", "edge"))
+    document_filter("event_page", event("d1", "edge"))
+
+    assert forwarded.call_args_list == [call("start", {"uid": "run"})]
+
+
+def test_only_needed_data_keys_are_forwarded_without_changing_the_originals(
+    document_filter: DocumentForwardingFilter, forwarded: MagicMock
+):
+    hardware_descriptor = descriptor("d1", "hardware", "energy", "flux", "image")
+    hardware_event = event("d1", "energy", "flux", "image")
+
+    document_filter("descriptor", hardware_descriptor)
+    document_filter("event", hardware_event)
+
+    (_, forwarded_descriptor), (_, forwarded_event) = (
+        c.args for c in forwarded.call_args_list
+    )
+    assert forwarded_descriptor["data_keys"].keys() == {"energy", "flux"}
+    assert forwarded_event["data"] == {"energy": 1.0, "flux": 1.0}
+    assert forwarded_event["timestamps"].keys() == {"energy", "flux"}
+    assert forwarded_event["descriptor"] == "d1"
+    assert hardware_descriptor["data_keys"].keys() == {"energy", "flux", "image"}
+    assert hardware_event["data"].keys() == {"energy", "flux", "image"}
+
+
+def test_all_data_is_forwarded_for_descriptors_needing_all_keys(
+    document_filter: DocumentForwardingFilter, forwarded: MagicMock
+):
+    snapshot_descriptor = descriptor("d1", "snapshot", "path", "omega")
+    snapshot_event = event("d1", "path", "omega")
+
+    document_filter("descriptor", snapshot_descriptor)
+    document_filter("event", snapshot_event)
+
+    assert forwarded.call_args_list == [
+        call("descriptor", snapshot_descriptor),
+        call("event", snapshot_event),
+    ]
+
+
+def test_events_for_unknown_descriptors_are_forwarded_unchanged(
+    document_filter: DocumentForwardingFilter, forwarded: MagicMock
+):
+    unknown_event = event("unknown", "edge")
+    document_filter("event", unknown_event)
+    forwarded.assert_called_once_with("event", unknown_event)
+
+
+def test_descriptors_are_forgotten_when_their_run_stops(
+    document_filter: DocumentForwardingFilter, forwarded: MagicMock
+):
+    document_filter("descriptor", descriptor("d1", "hardware", "energy"))
+    document_filter("descriptor", descriptor("d2", "pin_tip_edges", "edge"))
+    document_filter("stop", {"uid": "stop", "run_start": "run"})
+
+    assert document_filter._run_of_descriptor == {}
+    assert document_filter._data_keys_to_forward == {}
+    assert forwarded.call_args_list[-1] == call(
+        "stop", {"uid": "stop", "run_start": "run"}
+    )
@@ -0,0 +1,175 @@
+import pickle
+from collections.abc import Iterator
+from threading import Event, Thread
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from dodal.devices.synchrotron import SynchrotronMode
+
+from mx_bluesky.common.external_interaction.callbacks.common.document_publisher import (
+    DocumentPublishingError,
+    QueuedPublisher,
+    deserialise_document,
+    serialise_document,
+)
+
+
+@pytest.fixture
+def publisher(request: pytest.FixtureRequest) -> Iterator[QueuedPublisher]:
+    with patch("zmq.Context"):
+        publisher = QueuedPublisher(
+            "localhost:5577", max_queue_size=getattr(request, "param", 1)
+        )
+    yield publisher
+    publisher.close()
+
+
+def sent_documents(socket: MagicMock) -> list[tuple[bytes, dict]]:
+    documents = []
+    for call in socket.send.call_args_list:
+        _, name, data = call.args[0].split(b" ", 2)
+        documents.append((name, deserialise_document(data)))
+    return documents
+
+
+def block_sending(publisher: QueuedPublisher) -> Event:
+    """Block the publisher in sending its next document until the returned event is
+    set."""
+    sending, release = Event(), Event()
+
+    def send(_):
+        sending.set()
+        release.wait()
+
+    publisher._socket.send.side_effect = send  # type: ignore
+    publisher("event", {"seq_num": 0})
+    sending.wait(1)
+    publisher._socket.send.side_effect = None  # type: ignore
+    return release
+
+
+def test_msgpack_documents_keep_numpy_arrays_and_send_enums_as_values():
+    doc = {
+        "data": {
+            "array": np.array([[1, 2], [3, 4]], dtype=np.uint16),
+            "gap": np.float64(1.1),
+            "mode": SynchrotronMode.USER,
+        },
+        "shape": (2, 2),
+    }
+
+    received = deserialise_document(serialise_document(doc))
+
+    np.testing.assert_array_equal(received["data"]["array"], [[1, 2], [3, 4]])
+    assert received["data"]["array"].dtype == np.uint16
+    assert received["data"]["gap"] == 1.1
+    assert SynchrotronMode(received["data"]["mode"]) is SynchrotronMode.USER
+    assert received["shape"] == [2, 2]
+
+
+def test_msgpack_documents_are_smaller_than_pickled_ones():
+    doc = {"data": {f"signal-{i}": float(i) for i in range(100)}, "seq_num": 1}
+    assert len(serialise_document(doc)) < len(pickle.dumps(doc))
+
+
+def test_pickled_documents_can_still_be_deserialised():
+    doc = {"uid": "abc", "mode": SynchrotronMode.USER}
+    assert deserialise_document(pickle.dumps(doc)) == doc
+
+
+@pytest.mark.parametrize("publisher", [10], indirect=True)
+def test_documents_are_sent_in_order_on_another_thread(publisher: QueuedPublisher):
+    for i in range(5):
+        publisher("event", {"seq_num": i})
+    socket = publisher._socket
+    publisher.close()
+
+    assert sent_documents(socket) == [  # type: ignore
+        (b"event", {"seq_num": i}) for i in range(5)
+    ]
+
+
+@patch(
+    "mx_bluesky.common.external_interaction.callbacks.common.document_publisher.record_dropped_document"
+)
+def test_resources_and_datums_are_dropped_and_reported_when_the_queue_is_full(
+    record_dropped_document: MagicMock, publisher: QueuedPublisher
+):
+    release = block_sending(publisher)
+    publisher("event", {"seq_num": 1})
+    publisher("resource", {"uid": "a"})
+    publisher("datum", {"datum_id": "a"})
+    release.set()
+    socket = publisher._socket
+    publisher.close()
+
+    assert publisher.documents_dropped == 2
+    assert [call.args for call in record_dropped_document.call_args_list] == [
+        ("resource",),
+        ("datum",),
+    ]
+    assert [doc for _, doc in sent_documents(socket)] == [  # type: ignore
+        {"seq_num": 0},
+        {"seq_num": 1},
+    ]
+
+
+@pytest.mark.parametrize("name", ["stop", "event"])
+def test_events_and_stop_documents_wait_for_space_in_the_queue(
+    name: str, publisher: QueuedPublisher
+):
+    release = block_sending(publisher)
+    publisher("event", {"seq_num": 1})
+    stop_thread = Thread(target=publisher, args=(name, {"uid": "stop"}))
+    stop_thread.start()
+    stop_thread.join(0.1)
+    assert stop_thread.is_alive()
+
+    release.set()
+    stop_thread.join(1)
+    socket = publisher._socket
+    publisher.close()
+
+    assert publisher.documents_dropped == 0
+    assert sent_documents(socket)[-1] == (name.encode(), {"uid": "stop"})  # type: ignore
+
+
+def _wait_for_failure(publisher: QueuedPublisher):
+    for _ in range(100):
+        if publisher._failures:
+            break
+        sleep(0.01)
+
+
+def test_documents_that_cannot_be_published_fail_the_next_document_of_the_run(
+    publisher: QueuedPublisher,
+):
+    publisher("start", {"uid": "run"})
+    publisher(
+        "descriptor",
+        {"uid": "descriptor", "run_start": "run", "unserialisable": object()},
+    )
+    _wait_for_failure(publisher)
+
+    publisher("start", {"uid": "other_run"})
+    with pytest.raises(DocumentPublishingError, match="Failed to publish descriptor"):
+        publisher("event", {"uid": "event", "descriptor": "descriptor"})
+
+
+@pytest.mark.parametrize("publisher", [10], indirect=True)
+@patch(
+    "mx_bluesky.common.external_interaction.callbacks.common.document_publisher.LOGGER"
+)
+def test_failures_of_runs_that_have_finished_are_only_logged(
+    mock_logger: MagicMock, publisher: QueuedPublisher
+):
+    release = block_sending(publisher)
+    publisher("start", {"uid": "run", "unserialisable": object()})
+    publisher("stop", {"uid": "stop", "run_start": "run"})
+    release.set()
+    publisher.close()
+
+    assert not publisher._failures
+    mock_logger.error.assert_any_call("Run run finished without all its documents sent")
@@ -0,0 +1,66 @@
+import gzip
+from pathlib import Path
+
+import numpy as np
+from bluesky import plan_stubs as bps
+from bluesky import preprocessors as bpp
+from bluesky.run_engine import RunEngine
+from dodal.devices.synchrotron import SynchrotronMode
+from ophyd_async.core import soft_signal_rw
+
+from mx_bluesky.common.external_interaction.callbacks.common.document_recorder import (
+    DocumentRecorder,
+    read_recorded_documents,
+)
+
+
+def test_recorded_documents_are_read_back_in_order(
+    run_engine: RunEngine, tmp_path: Path
+):
+    signal = soft_signal_rw(float, initial_value=1.5, name="signal")
+    recording = tmp_path / "run.pkl.gz"
+    documents = []
+
+    @bpp.run_decorator(md={"subplan_name": "recorded"})
+    def plan():
+        yield from bps.trigger_and_read([signal])
+        yield from bps.sleep(0.05)
+
+    with DocumentRecorder(recording) as recorder:
+        run_engine.subscribe(recorder)
+        run_engine.subscribe(lambda name, doc: documents.append((name, doc)))
+        run_engine(plan())
+
+    assert recorder.documents_recorded == len(documents) == 4
+    replayed = list(read_recorded_documents(recording))
+    assert [(name, doc) for _, name, doc in replayed] == documents
+    times = [time_s for time_s, _, _ in replayed]
+    assert times[0] == 0
+    assert times == sorted(times)
+    assert times[-1] >= 0.05
+
+
+def test_enums_and_numpy_values_are_replayed_unchanged(tmp_path: Path):
+    recording = tmp_path / "run.pkl.gz"
+    with DocumentRecorder(recording) as recorder:
+        recorder(
+            "event",
+            {"data": {"array": np.array([1, 2]), "mode": SynchrotronMode.USER}},
+        )
+
+    ((_, name, doc),) = read_recorded_documents(recording)
+    assert name == "event"
+    np.testing.assert_array_equal(doc["data"]["array"], [1, 2])
+    assert doc["data"]["mode"] is SynchrotronMode.USER
+
+
+def test_recording_is_compressed(tmp_path: Path):
+    recording = tmp_path / "run.pkl.gz"
+    with DocumentRecorder(recording) as recorder:
+        for i in range(100):
+            recorder("event", {"seq_num": i, "data": {"x": 1.0}})
+
+    with gzip.open(recording, "rb") as f:
+        uncompressed_size = len(f.read())
+    assert len(list(read_recorded_documents(recording))) == 100
+    assert recording.stat().st_size < uncompressed_size / 2
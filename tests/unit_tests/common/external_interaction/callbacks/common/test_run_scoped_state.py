@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mx_bluesky.common.external_interaction.callbacks.common.run_scoped_state import (
+    RunScopedDescriptors,
+)
+
+
+def descriptor(uid: str, run_start: str) -> dict:
+    return {"uid": uid, "run_start": run_start, "name": "hardware"}
+
+
+@pytest.fixture
+def log() -> MagicMock:
+    return MagicMock()
+
+
+def test_only_the_descriptors_of_the_stopped_run_are_forgotten(log: MagicMock):
+    descriptors = RunScopedDescriptors(log)
+    descriptors["d1"] = descriptor("d1", "outer")  # type: ignore
+    descriptors["d2"] = descriptor("d2", "inner")  # type: ignore
+    descriptors["d3"] = descriptor("d3", "inner")  # type: ignore
+
+    descriptors.forget_run("inner")
+
+    assert dict(descriptors) == {"d1": descriptor("d1", "outer")}
+    log.warning.assert_not_called()
+
+
+def test_forgetting_an_unknown_run_does_nothing(log: MagicMock):
+    descriptors = RunScopedDescriptors(log)
+    descriptors["d1"] = descriptor("d1", "run")  # type: ignore
+
+    descriptors.forget_run(None)
+
+    assert list(descriptors) == ["d1"]
+
+
+def test_oldest_descriptor_is_forgotten_with_a_warning_when_too_many_are_held(
+    log: MagicMock,
+):
+    descriptors = RunScopedDescriptors(log, max_descriptors=2)
+    for i in range(3):
+        descriptors[f"d{i}"] = descriptor(f"d{i}", f"run{i}")  # type: ignore
+
+    assert list(descriptors) == ["d1", "d2"]
+    log.warning.assert_called_once()
+    assert "run0" in log.warning.call_args.args[0]
@@ -96,6 +96,7 @@ def simple_take_grid_snapshot_and_generate_rotation_snapshot_plan(
     chis: Sequence[int] = [0],
     grid_smargon_mm: tuple[float, float, float] = (-0.614, 0.0259, 0.250),
     rotation_smargon_mm: tuple[float, float, float] = (-0.4634, 0.0187, 0.2482),
+    snapshot_omegas_deg: Sequence[int] = (),
 ):
     @set_run_key_decorator(CONST.PLAN.ROTATION_MAIN)
     @run_decorator(
@@ -113,6 +114,13 @@ def simple_take_grid_snapshot_and_generate_rotation_snapshot_plan(
             yield from bps.read(oav)  # Capture path info for generated snapshot
             yield from bps.read(smargon)  # Capture the current sample x, y, z
             yield from bps.save()
+        for omega in snapshot_omegas_deg:
+            yield from bps.abs_set(oav.snapshot.filename, f"snapshot_{omega}")
+            yield from bps.trigger(oav.snapshot, wait=True)
+            yield from bps.create(DocDescriptorNames.OAV_ROTATION_SNAPSHOT_TRIGGERED)
+            yield from bps.read(oav)
+            yield from bps.read(smargon)
+            yield from bps.save()
 
     @set_run_key_decorator(CONST.PLAN.LOAD_CENTRE_COLLECT)
     @run_decorator(
@@ -121,6 +129,7 @@ def simple_take_grid_snapshot_and_generate_rotation_snapshot_plan(
             "with_snapshot": WithSnapshot.model_validate(
                 {
                     "snapshot_directory": snapshot_directory,
+                    "snapshot_omegas_deg": snapshot_omegas_deg,
                     "use_grid_snapshots": True,
                 }
             ).model_dump_json(),
@@ -370,3 +379,64 @@ def test_snapshot_callback_loads_and_saves_updated_snapshot_propagates_event(
         == generated_image_path
     )
     assert downstream_calls[3].args[0] == "stop"
+
+
+@patch(
+    "mx_bluesky.hyperion.external_interaction.callbacks.snapshot_callback.BeamDrawingCallback._generate_snapshot_zero_offset"
+)
+@patch(
+    "mx_bluesky.hyperion.external_interaction.callbacks.snapshot_callback.BeamDrawingCallback._generate_snapshot_at"
+)
+def test_snapshot_callback_annotates_snapshots_taken_after_those_generated(
+    mock_generate_snapshot_at: MagicMock,
+    mock_generate_snapshot_zero_offset: MagicMock,
+    tmp_path: Path,
+    run_engine: RunEngine,
+    oav_with_snapshots: OAV,
+    smargon: Smargon,
+):
+    run_engine.subscribe(BeamDrawingCallback())
+    run_engine(
+        simple_take_grid_snapshot_and_generate_rotation_snapshot_plan(
+            oav_with_snapshots, smargon, tmp_path, [0, 30], snapshot_omegas_deg=[90, 180]
+        )
+    )
+
+    assert mock_generate_snapshot_at.call_count == 4
+    assert [
+        Path(c.args[1]).name for c in mock_generate_snapshot_zero_offset.mock_calls
+    ] == [
+        f"snapshot_{omega}_with_beam_centre.png" for omega in (90, 180, 90, 180)
+    ]
+
+
+def test_snapshot_callback_uses_grid_snapshots_as_decided_for_each_rotation(
+    params_take_snapshots: SingleRotationScan,
+):
+    callback = BeamDrawingCallback()
+    callback.start(
+        {
+            "uid": "activity",
+            "activate_callbacks": ["BeamDrawingCallback"],
+            "with_snapshot": params_take_snapshots.model_dump_json(),
+        }  # type: ignore
+    )
+    assert not callback._use_grid_snapshots
+
+    for use_grid_snapshots in (True, False):
+        with_snapshot = params_take_snapshots.model_copy(
+            update={
+                "use_grid_snapshots": use_grid_snapshots,
+                "snapshot_omegas_deg": None if use_grid_snapshots else [0, 90],
+            }
+        )
+        callback.start(
+            {
+                "uid": f"rotation_{use_grid_snapshots}",
+                "subplan_name": CONST.PLAN.ROTATION_OUTER,
+                "with_snapshot": with_snapshot.model_dump_json(
+                    include=WithSnapshot.model_fields.keys()  # type: ignore
+                ),
+            }  # type: ignore
+        )
+        assert callback._use_grid_snapshots == use_grid_snapshots
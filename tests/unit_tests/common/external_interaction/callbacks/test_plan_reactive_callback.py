@@ -100,6 +100,13 @@ def test_doesnt_activate_on_wrong_metadata(
     callback.activity_gated_stop.assert_not_called()  # type: ignore
 
 
+def test_descriptors_of_a_run_are_forgotten_when_it_stops(mocked_test_callback):
+    mocked_test_callback.descriptors["outer"] = {"uid": "outer", "run_start": "foo"}
+    mocked_test_callback.descriptors["inner"] = {"uid": "inner", "run_start": "bar"}
+    mocked_test_callback.stop({"run_start": "bar"})
+    assert list(mocked_test_callback.descriptors) == ["outer"]
+
+
 def test_cb_logs_and_raises_exception():
     cb = MockReactiveCallback()
     cb.active = True
@@ -1,14 +1,12 @@
-from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 
 import pytest
-from pydantic import ValidationError
 
 from mx_bluesky.common.parameters.components import WithSnapshot
 
 
 @pytest.mark.parametrize(
-    "model, expectation",
+    "model, expected_take_snapshots",
     [
         [
             {
@@ -16,7 +14,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [],
                 "use_grid_snapshots": False,
             },
-            does_not_raise(),
+            False,
         ],
         [
             {
@@ -24,7 +22,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [],
                 "use_grid_snapshots": True,
             },
-            does_not_raise(),
+            True,
         ],
         [
             {
@@ -32,7 +30,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [10, 20, 30, 40],
                 "use_grid_snapshots": False,
             },
-            does_not_raise(),
+            True,
         ],
         [
             {
@@ -40,7 +38,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [0, 270],
                 "use_grid_snapshots": True,
             },
-            pytest.raises(ValidationError),
+            True,
         ],
         [
             {
@@ -48,7 +46,7 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [0],
                 "use_grid_snapshots": True,
             },
-            pytest.raises(ValidationError),
+            True,
         ],
         [
             {
@@ -56,17 +54,18 @@ from mx_bluesky.common.parameters.components import WithSnapshot
                 "snapshot_omegas_deg": [10, 80],
                 "use_grid_snapshots": True,
             },
-            pytest.raises(ValidationError),
+            True,
         ],
         [
             {
                 "snapshot_directory": Path("/tmp"),
                 "use_grid_snapshots": True,
             },
-            does_not_raise(),
+            True,
         ],
     ],
 )
-def test_validate_with_snapshot_omegas_grid_snapshots(model, expectation):
-    with expectation:
-        WithSnapshot.model_validate(model)
+def test_snapshots_taken_if_generated_from_grid_snapshots_or_omegas_given(
+    model, expected_take_snapshots
+):
+    assert WithSnapshot.model_validate(model).take_snapshots == expected_take_snapshots
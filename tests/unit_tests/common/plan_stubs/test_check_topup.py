@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bluesky.plan_stubs import null
+from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator, assert_message_and_return_remaining
+from bluesky.utils import Msg
+from dodal.devices.synchrotron import Synchrotron, SynchrotronMode
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.common.plan_stubs.check_topup import (
+    predict_topup_wait,
+    prepare_then_check_topup,
+)
+
+
+@pytest.fixture
+def synchrotron_before_topup(synchrotron: Synchrotron) -> Synchrotron:
+    set_mock_value(synchrotron.top_up_start_countdown, 10)
+    set_mock_value(synchrotron.top_up_end_countdown, 25)
+    return synchrotron
+
+
+@pytest.mark.parametrize(
+    "mode, start_countdown, total_exposure_time, expected_wait",
+    [
+        (SynchrotronMode.USER, 10, 5, 26),
+        (SynchrotronMode.SPECIAL, 0, 5, 26),
+        (SynchrotronMode.USER, 40, 5, 0),
+        (SynchrotronMode.USER, 10, 200, 0),
+        (SynchrotronMode.USER, -1, 5, 0),
+        (SynchrotronMode.DEV, 10, 5, 0),
+    ],
+)
+def test_predicted_topup_wait_follows_topup_gating(
+    run_engine: RunEngine,
+    synchrotron_before_topup: Synchrotron,
+    mode: SynchrotronMode,
+    start_countdown: float,
+    total_exposure_time: float,
+    expected_wait: float,
+):
+    set_mock_value(synchrotron_before_topup.synchrotron_mode, mode)
+    set_mock_value(synchrotron_before_topup.top_up_start_countdown, start_countdown)
+
+    predicted_wait = run_engine(
+        predict_topup_wait(synchrotron_before_topup, total_exposure_time, 10)
+    ).plan_result  # type: ignore
+
+    assert predicted_wait == expected_wait
+
+
+@patch("mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary")
+def test_work_is_done_before_waiting_for_topup(
+    mock_check_topup: MagicMock,
+    sim_run_engine: RunEngineSimulator,
+    synchrotron: Synchrotron,
+):
+    mock_check_topup.side_effect = lambda *_: iter([Msg("check_topup")])
+
+    msgs = sim_run_engine.simulate_plan(
+        prepare_then_check_topup(synchrotron, 5, 10, null)
+    )
+
+    msgs = assert_message_and_return_remaining(msgs, lambda msg: msg.command == "null")
+    assert_message_and_return_remaining(msgs, lambda msg: msg.command == "check_topup")
+    mock_check_topup.assert_called_once_with(synchrotron, 5, 10)
+
+
+@pytest.mark.parametrize(
+    "times, expected_overlapped_s, expected_idle_s",
+    [
+        ([0, 5, 27], 5, 22),
+        ([0, 30, 30], 26, 0),
+    ],
+)
+@patch("mx_bluesky.common.plan_stubs.check_topup.record_topup_wait")
+@patch("mx_bluesky.common.plan_stubs.check_topup.monotonic")
+@patch("mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary")
+def test_overlap_with_and_time_idle_waiting_for_topup_are_recorded(
+    mock_check_topup: MagicMock,
+    mock_monotonic: MagicMock,
+    mock_record_topup_wait: MagicMock,
+    run_engine: RunEngine,
+    synchrotron_before_topup: Synchrotron,
+    times: list[float],
+    expected_overlapped_s: float,
+    expected_idle_s: float,
+):
+    mock_check_topup.side_effect = lambda *_: null()
+    mock_monotonic.side_effect = times
+
+    run_engine(prepare_then_check_topup(synchrotron_before_topup, 5, 10, null))
+
+    mock_record_topup_wait.assert_called_once_with(
+        expected_overlapped_s, expected_idle_s
+    )
+
+
+@patch("mx_bluesky.common.plan_stubs.check_topup.record_topup_wait")
+@patch("mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary")
+def test_nothing_is_recorded_if_topup_is_not_due(
+    mock_check_topup: MagicMock,
+    mock_record_topup_wait: MagicMock,
+    run_engine: RunEngine,
+    synchrotron_before_topup: Synchrotron,
+):
+    mock_check_topup.side_effect = lambda *_: null()
+    set_mock_value(synchrotron_before_topup.top_up_start_countdown, 600)
+
+    run_engine(prepare_then_check_topup(synchrotron_before_topup, 5, 10, null))
+
+    mock_record_topup_wait.assert_not_called()
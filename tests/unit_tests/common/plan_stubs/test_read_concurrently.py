@@ -0,0 +1,80 @@
+import asyncio
+
+import bluesky.plan_stubs as bps
+import bluesky.preprocessors as bpp
+import pytest
+from bluesky.run_engine import RunEngine
+from ophyd_async.core import SignalRW, soft_signal_rw
+
+from mx_bluesky.common.plan_stubs.read_concurrently import read_concurrently
+
+
+class ReadableThatWaitsForOthers:
+    """Only finishes reading once all the readables sharing its barrier are being read,
+    so reading them one after another times out."""
+
+    def __init__(self, signal: SignalRW[float], barrier: asyncio.Barrier):
+        self.signal = signal
+        self.barrier = barrier
+        self.name = signal.name
+        self.parent = None
+
+    async def read(self):
+        await asyncio.wait_for(self.barrier.wait(), 1)
+        return await self.signal.read()
+
+    async def describe(self):
+        return await self.signal.describe()
+
+
+@pytest.fixture
+def signals(run_engine: RunEngine) -> list[SignalRW[float]]:
+    return [soft_signal_rw(float, float(i), name=f"signal_{i}") for i in (3, 1, 2, 0)]
+
+
+def collect_documents(run_engine: RunEngine, plan) -> list[tuple[str, dict]]:
+    documents = []
+    run_engine(bpp.run_wrapper(plan), lambda name, doc: documents.append((name, doc)))
+    return documents
+
+
+def test_reads_are_made_at_the_same_time(
+    run_engine: RunEngine, signals: list[SignalRW[float]]
+):
+    barrier = asyncio.Barrier(len(signals))
+    readables = [ReadableThatWaitsForOthers(signal, barrier) for signal in signals]
+
+    documents = collect_documents(run_engine, read_concurrently(readables, "event"))
+
+    events = [doc for name, doc in documents if name == "event"]
+    assert len(events) == 1
+    assert list(events[0]["data"]) == [signal.name for signal in signals]
+
+
+def test_repeated_reads_into_a_stream_share_a_descriptor_and_keep_key_order(
+    run_engine: RunEngine, signals: list[SignalRW[float]]
+):
+    def read_twice():
+        yield from read_concurrently(signals, "event")
+        yield from bps.mv(signals[0], 10.0)
+        yield from read_concurrently(signals, "event")
+
+    documents = collect_documents(run_engine, read_twice())
+
+    descriptors = [doc for name, doc in documents if name == "descriptor"]
+    events = [doc for name, doc in documents if name == "event"]
+    assert len(descriptors) == 1
+    assert list(descriptors[0]["data_keys"]) == [signal.name for signal in signals]
+    assert [event["data"]["signal_3"] for event in events] == [3.0, 10.0]
+
+
+def test_readables_with_the_same_data_keys_cannot_be_read_together(
+    run_engine: RunEngine, signals: list[SignalRW[float]]
+):
+    with pytest.raises(ValueError, match="signal_3"):
+        run_engine(bpp.run_wrapper(read_concurrently([*signals, signals[0]], "event")))
+
+
+def test_no_event_is_saved_if_there_is_nothing_to_read(run_engine: RunEngine):
+    documents = collect_documents(run_engine, read_concurrently([], "event"))
+    assert [name for name, _ in documents] == ["start", "stop"]
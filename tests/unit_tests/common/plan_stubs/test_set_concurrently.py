@@ -0,0 +1,105 @@
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator
+from bluesky.utils import Msg
+from ophyd.status import Status
+from ophyd_async.core import SignalRW, soft_signal_rw
+from ophyd_async.sim import SimMotor
+
+from mx_bluesky.common.plan_stubs.set_concurrently import set_concurrently
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, set_setpoint_cache
+
+
+@pytest.fixture
+def signals(run_engine: RunEngine) -> list[SignalRW[float]]:
+    return [soft_signal_rw(float, name=f"signal_{i}") for i in range(3)]
+
+
+def test_all_sets_are_issued_before_waiting_once(
+    sim_run_engine: RunEngineSimulator, signals: list[SignalRW[float]]
+):
+    msgs = sim_run_engine.simulate_plan(
+        set_concurrently(
+            {signal: i for i, signal in enumerate(signals)}, "group", timeout=5
+        )
+    )
+
+    assert [(msg.command, msg.obj, msg.args) for msg in msgs] == [
+        ("set", signal, (i,)) for i, signal in enumerate(signals)
+    ] + [("wait", None, ())]
+    assert all(msg.kwargs["group"] == "group" for msg in msgs)
+    assert msgs[-1].kwargs["timeout"] == 5
+
+
+def test_sets_can_be_left_to_be_waited_on_later(
+    sim_run_engine: RunEngineSimulator, signals: list[SignalRW[float]]
+):
+    msgs = sim_run_engine.simulate_plan(
+        set_concurrently(dict.fromkeys(signals, 1), "group", wait=False)
+    )
+    assert [msg.command for msg in msgs] == ["set"] * len(signals)
+
+
+@patch("mx_bluesky.common.plan_stubs.set_concurrently.LOGGER")
+async def test_values_are_set_and_the_slowest_sets_reported(
+    mock_logger: MagicMock, run_engine: RunEngine, signals: list[SignalRW[float]]
+):
+    run_engine(set_concurrently(dict.fromkeys(signals, 2.5), "group"))
+
+    for signal in signals:
+        assert await signal.get_value() == 2.5
+    report = mock_logger.debug.call_args.args[0]
+    assert "Set 3 devices in group" in report
+    assert all(signal.name in report for signal in signals)
+
+
+@patch("mx_bluesky.common.plan_stubs.set_concurrently.LOGGER")
+def test_sets_that_have_not_finished_are_reported_on_timeout(
+    mock_logger: MagicMock, run_engine: RunEngine, signals: list[SignalRW[float]]
+):
+    stuck_motor = SimMotor(name="stuck_motor")
+    stuck_motor.set = MagicMock(return_value=Status())
+
+    with pytest.raises(TimeoutError):
+        run_engine(
+            set_concurrently({signals[0]: 1, stuck_motor: 1}, "group", timeout=0.1)
+        )
+
+    report = mock_logger.error.call_args.args[0]
+    assert "stuck_motor" in report
+    assert signals[0].name not in report
+
+
+@pytest.fixture
+def setpoint_cache() -> Iterator[SetpointCache]:
+    cache = SetpointCache()
+    set_setpoint_cache(cache)
+    yield cache
+    set_setpoint_cache(None)
+    cache.clear()
+
+
+async def test_unchanged_setpoints_are_not_written_again_if_using_a_setpoint_cache(
+    run_engine: RunEngine,
+    signals: list[SignalRW[float]],
+    setpoint_cache: SetpointCache,
+):
+    sets: list[str] = []
+
+    def record_sets(msg: Msg):
+        if msg.command == "set":
+            sets.append(msg.obj.name)
+
+    run_engine.msg_hook = record_sets  # type: ignore
+
+    run_engine(set_concurrently(dict.fromkeys(signals, 1.0), "group"))
+    await signals[1].set(5.0)
+    run_engine(
+        set_concurrently({signals[0]: 1.0, signals[1]: 1.0, signals[2]: 2.0}, "group")
+    )
+
+    assert sets == [signal.name for signal in signals] + ["signal_1", "signal_2"]
+    assert setpoint_cache.writes_elided == 1
@@ -0,0 +1,141 @@
+from threading import Timer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator
+from ophyd.sim import Signal as SyncSignal
+from ophyd_async.core import SignalRW, init_devices, soft_signal_rw
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.common.plan_stubs.wait_for_signal import wait_for_signal_value
+from mx_bluesky.common.preprocessors.simulated_hardware import virtual_time_wrapper
+from mx_bluesky.common.utils.virtual_clock import VirtualClock
+
+
+@pytest.fixture
+def signal(run_engine: RunEngine) -> SignalRW[str]:
+    with init_devices(mock=True):
+        signal = soft_signal_rw(str, "initial", name="test_signal")
+    return signal
+
+
+def _set_later(run_engine: RunEngine, signal: SignalRW[str], value: str) -> Timer:
+    timer = Timer(
+        0.1,
+        lambda: run_engine.loop.call_soon_threadsafe(set_mock_value, signal, value),
+    )
+    timer.start()
+    return timer
+
+
+def test_wait_for_signal_value_returns_immediately_if_already_matching(
+    sim_run_engine: RunEngineSimulator, signal: SignalRW[str]
+):
+    sim_run_engine.add_handler(
+        "locate", lambda _: {"readback": "expected"}, signal.name
+    )
+    msgs = sim_run_engine.simulate_plan(wait_for_signal_value(signal, "expected"))
+    assert [msg.command for msg in msgs] == ["locate"]
+
+
+@patch("mx_bluesky.common.plan_stubs.wait_for_signal.bps.sleep")
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_is_driven_by_monitor(
+    mock_sleep: MagicMock, run_engine: RunEngine, signal: SignalRW[str]
+):
+    timer = _set_later(run_engine, signal, "expected")
+    result = run_engine(wait_for_signal_value(signal, "expected")).plan_result  # type: ignore
+    timer.join()
+    assert result is True
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_accepts_callable_match(
+    run_engine: RunEngine, signal: SignalRW[str]
+):
+    timer = _set_later(run_engine, signal, "expected")
+    result = run_engine(
+        wait_for_signal_value(signal, lambda value: value.startswith("exp"))
+    ).plan_result  # type: ignore
+    timer.join()
+    assert result is True
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_returns_false_on_timeout(
+    run_engine: RunEngine, signal: SignalRW[str]
+):
+    result = run_engine(
+        wait_for_signal_value(signal, "expected", timeout_s=0.1)
+    ).plan_result  # type: ignore
+    assert result is False
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_polls_signals_that_cannot_be_monitored(
+    run_engine: RunEngine,
+):
+    signal = SyncSignal(name="sync_signal", value="initial")
+    timer = Timer(0.1, lambda: signal.put("expected"))
+    timer.start()
+    result = run_engine(
+        wait_for_signal_value(signal, "expected", poll_interval_s=0.01)
+    ).plan_result  # type: ignore
+    timer.join()
+    assert result is True
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_falls_back_to_polling_if_monitor_fails(
+    run_engine: RunEngine, signal: SignalRW[str]
+):
+    timer = _set_later(run_engine, signal, "expected")
+    with patch(
+        "mx_bluesky.common.plan_stubs.wait_for_signal.wait_for_value",
+        new=AsyncMock(side_effect=RuntimeError("Monitor failed")),
+    ):
+        result = run_engine(
+            wait_for_signal_value(signal, "expected", poll_interval_s=0.01)
+        ).plan_result  # type: ignore
+    timer.join()
+    assert result is True
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_times_out_in_virtual_time(
+    run_engine: RunEngine, signal: SignalRW[str]
+):
+    clock = VirtualClock()
+    run_engine.preprocessors.append(lambda plan: virtual_time_wrapper(plan, clock))
+    with patch(
+        "mx_bluesky.common.utils.virtual_clock._virtual_clock",
+        clock,
+    ):
+        result = run_engine(
+            wait_for_signal_value(signal, "expected", timeout_s=600, poll_interval_s=60)
+        ).plan_result  # type: ignore
+
+    assert result is False
+    assert clock.monotonic() >= 600
+
+
+@pytest.mark.timeout(5)
+def test_wait_for_signal_value_in_virtual_time_waits_in_real_time_between_polls(
+    run_engine: RunEngine, signal: SignalRW[str]
+):
+    clock = VirtualClock()
+    run_engine.preprocessors.append(lambda plan: virtual_time_wrapper(plan, clock))
+    timer = _set_later(run_engine, signal, "expected")
+    with patch(
+        "mx_bluesky.common.utils.virtual_clock._virtual_clock",
+        clock,
+    ):
+        result = run_engine(
+            wait_for_signal_value(signal, "expected", timeout_s=3600)
+        ).plan_result  # type: ignore
+    timer.join()
+
+    assert result is True
+    assert 0 < clock.monotonic() < 3600
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from bluesky import plan_stubs as bps
+from bluesky.run_engine import RunEngine
+from ophyd_async.core import AsyncStatus, Device
+
+from mx_bluesky.common.preprocessors.critical_path import (
+    analyse_waits,
+    critical_path_report,
+)
+from mx_bluesky.common.preprocessors.profiling import PlanProfile, profile_plan_wrapper
+
+
+class SlowDevice(Device):
+    @AsyncStatus.wrap
+    async def set(self, value: float):
+        await asyncio.sleep(value)
+
+
+@pytest.fixture
+def devices(run_engine: RunEngine) -> dict[str, SlowDevice]:
+    return {name: SlowDevice(name=name) for name in ("fast", "slow", "late")}
+
+
+def _profile(run_engine: RunEngine, plan) -> PlanProfile:
+    profile = PlanProfile()
+    run_engine(profile_plan_wrapper(plan, profile))
+    return profile
+
+
+def test_analysis_reports_last_status_to_finish_and_idle_time_of_others(
+    run_engine: RunEngine, devices: dict[str, SlowDevice]
+):
+    def plan():
+        yield from bps.abs_set(devices["fast"], 0.01, group="moves")
+        yield from bps.abs_set(devices["slow"], 0.2, group="moves")
+        yield from bps.wait("moves")
+
+    (analysis,) = analyse_waits(_profile(run_engine, plan()))
+
+    assert analysis.critical.device == "slow"
+    ((idle_status, idle_s),) = analysis.idle_s
+    assert idle_status.device == "fast"
+    assert idle_s >= 0.15
+    assert not analysis.suggestions
+
+
+def test_analysis_suggests_starting_a_late_move_earlier(
+    run_engine: RunEngine, devices: dict[str, SlowDevice]
+):
+    def plan():
+        yield from bps.abs_set(devices["fast"], 0.01, group="moves")
+        yield from bps.sleep(0.1)
+        yield from bps.abs_set(devices["late"], 0.1, group="moves")
+        yield from bps.wait("moves")
+
+    (analysis,) = analyse_waits(_profile(run_engine, plan()))
+
+    assert analysis.critical.device == "late"
+    assert any("start set late earlier" in s for s in analysis.suggestions)
+
+
+def test_analysis_suggests_parallelising_moves_waited_on_in_sequence(
+    run_engine: RunEngine, devices: dict[str, SlowDevice]
+):
+    def plan():
+        yield from bps.abs_set(devices["slow"], 0.2, group="first")
+        yield from bps.wait("first")
+        yield from bps.abs_set(devices["late"], 0.2, group="second")
+        yield from bps.wait("second")
+
+    first, second = analyse_waits(_profile(run_engine, plan()))
+
+    assert not first.suggestions
+    assert any(
+        "start set late before the wait on first" in s for s in second.suggestions
+    )
+
+
+def test_critical_path_report_lists_each_wait(
+    run_engine: RunEngine, devices: dict[str, SlowDevice]
+):
+    def plan():
+        yield from bps.abs_set(devices["fast"], 0.01, group="moves")
+        yield from bps.abs_set(devices["slow"], 0.1, group="moves")
+        yield from bps.wait("moves")
+        yield from bps.wait("nothing_in_group")
+
+    report = critical_path_report(analyse_waits(_profile(run_engine, plan())))
+
+    lines = report.splitlines()
+    assert lines[0].startswith("wait on moves in plan: blocked")
+    assert lines[0].endswith("last to finish set slow")
+    assert lines[1].strip().startswith("set fast idle for")
+    assert len(lines) == 2
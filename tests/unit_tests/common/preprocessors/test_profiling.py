@@ -0,0 +1,161 @@
+import asyncio
+import csv
+from pathlib import Path
+
+import pytest
+from bluesky import plan_stubs as bps
+from bluesky import preprocessors as bpp
+from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator
+from bluesky.utils import FailedStatus
+from ophyd_async.core import AsyncStatus, Device
+
+from mx_bluesky.common.preprocessors.profiling import (
+    PROFILE_FOLDED_FILENAME,
+    PROFILE_SUMMARY_FILENAME,
+    PlanProfile,
+    profile_plan_decorator,
+    profile_plan_wrapper,
+)
+
+
+class SlowDevice(Device):
+    @AsyncStatus.wrap
+    async def set(self, value: float):
+        await asyncio.sleep(value)
+
+
+@pytest.fixture
+def slow_devices(run_engine: RunEngine) -> tuple[SlowDevice, SlowDevice]:
+    return SlowDevice(name="fast_device"), SlowDevice(name="slow_device")
+
+
+def _grouped_moves(fast: SlowDevice, slow: SlowDevice):
+    @bpp.run_decorator(md={"subplan_name": "grouped_moves"})
+    def _inner():
+        yield from bps.abs_set(fast, 0.01, group="moves")
+        yield from bps.abs_set(slow, 0.2, group="moves")
+        yield from bps.wait("moves")
+
+    yield from _inner()
+    return "finished"
+
+
+def test_profile_records_each_message_and_returns_plan_result(
+    run_engine: RunEngine, slow_devices: tuple[SlowDevice, SlowDevice]
+):
+    profile = PlanProfile()
+    result = run_engine(
+        profile_plan_wrapper(_grouped_moves(*slow_devices), profile)
+    ).plan_result  # type: ignore
+
+    assert result == "finished"
+    assert [t.command for t in profile.msg_timings] == [
+        "open_run",
+        "set",
+        "set",
+        "wait",
+        "close_run",
+    ]
+    (wait_timing,) = [t for t in profile.msg_timings if t.command == "wait"]
+    assert wait_timing.duration_s >= 0.15
+    assert wait_timing.stack == ("grouped_moves",)
+
+
+def test_profile_records_how_long_wait_was_blocked_by_each_device(
+    run_engine: RunEngine, slow_devices: tuple[SlowDevice, SlowDevice]
+):
+    profile = PlanProfile()
+    run_engine(profile_plan_wrapper(_grouped_moves(*slow_devices), profile))
+
+    (wait,) = profile.wait_timings
+    assert wait.group == "moves"
+    blocked = {status.device: wait.blocked_s(status) for status in wait.statuses}
+    assert blocked["slow_device"] >= 0.15
+    assert blocked["fast_device"] < 0.1
+
+
+def test_waiting_s_is_time_spent_waiting_on_hardware(
+    run_engine: RunEngine, slow_devices: tuple[SlowDevice, SlowDevice]
+):
+    profile = PlanProfile()
+    run_engine(profile_plan_wrapper(_grouped_moves(*slow_devices), profile))
+
+    (wait_timing,) = [t for t in profile.msg_timings if t.command == "wait"]
+    assert profile.waiting_s() == wait_timing.duration_s
+
+
+def test_summary_is_ordered_by_total_time(
+    run_engine: RunEngine, slow_devices: tuple[SlowDevice, SlowDevice]
+):
+    profile = PlanProfile()
+    run_engine(profile_plan_wrapper(_grouped_moves(*slow_devices), profile))
+
+    summary = profile.summary()
+    assert summary == sorted(summary, key=lambda s: s.total_s, reverse=True)
+    assert summary[0].command in ("wait", "wait:set")
+    wait_on_slow = next(
+        s for s in summary if s.command == "wait:set" and s.device == "slow_device"
+    )
+    assert wait_on_slow.count == 1
+    assert wait_on_slow.group == "moves"
+
+
+def test_write_reports_writes_summary_and_folded_stacks(
+    run_engine: RunEngine,
+    slow_devices: tuple[SlowDevice, SlowDevice],
+    tmp_path: Path,
+):
+    profile = PlanProfile()
+    run_engine(profile_plan_wrapper(_grouped_moves(*slow_devices), profile))
+
+    profile.write_reports(tmp_path)
+
+    with open(tmp_path / PROFILE_SUMMARY_FILENAME) as f:
+        rows = list(csv.DictReader(f))
+    assert {row["command"] for row in rows} >= {"set", "wait", "wait:set"}
+    folded = (tmp_path / PROFILE_FOLDED_FILENAME).read_text().splitlines()
+    assert "grouped_moves;set;slow_device" in [
+        line.rsplit(" ", 1)[0] for line in folded
+    ]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in folded)
+
+
+class FailingDevice(Device):
+    @AsyncStatus.wrap
+    async def set(self, value: float):
+        raise ValueError("Failed")
+
+
+def test_profile_passes_exceptions_into_the_plan(run_engine: RunEngine):
+    profile = PlanProfile()
+    caught = []
+    device = FailingDevice(name="failing_device")
+
+    def plan_that_handles_failure():
+        try:
+            yield from bps.abs_set(device, 1, group="failing")
+            yield from bps.wait("failing")
+        except FailedStatus as e:
+            caught.append(e)
+        yield from bps.null()
+
+    run_engine(profile_plan_wrapper(plan_that_handles_failure(), profile))
+
+    assert len(caught) == 1
+    assert [t.command for t in profile.msg_timings] == ["set", "wait", "null"]
+
+
+def test_profile_decorator_works_in_simulated_run_engine(
+    sim_run_engine: RunEngineSimulator,
+):
+    profile = PlanProfile()
+
+    @profile_plan_decorator(profile)
+    def my_plan():
+        yield from bps.sleep(1)
+        yield from bps.null()
+
+    sim_run_engine.simulate_plan(my_plan())
+
+    assert [t.command for t in profile.msg_timings] == ["sleep", "null"]
@@ -0,0 +1,188 @@
+import asyncio
+import random
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+from bluesky import plan_stubs as bps
+from bluesky.run_engine import RunEngine
+from bluesky.utils import FailedStatus
+from ophyd.sim import NullStatus
+from ophyd.status import Status
+from ophyd_async.core import AsyncStatus, Device
+
+from mx_bluesky.common.preprocessors.simulated_hardware import (
+    SimulatedHardwareTimings,
+    fixed,
+    normal,
+    simulated_hardware_decorator,
+    simulated_hardware_wrapper,
+    uniform,
+    use_virtual_time,
+    virtual_time_wrapper,
+)
+from mx_bluesky.common.utils.virtual_clock import VirtualClock
+
+
+class MockDevice(Device):
+    def __init__(self, name: str, duration_s: float = 0):
+        self.duration_s = duration_s
+        self.values = []
+        super().__init__(name=name)
+
+    @AsyncStatus.wrap
+    async def set(self, value: float):
+        await asyncio.sleep(self.duration_s)
+        self.values.append(value)
+
+
+class FailingDevice(Device):
+    @AsyncStatus.wrap
+    async def set(self, value: float):
+        raise ValueError("Failed")
+
+
+class OphydV1Device:
+    name = "ophyd_v1_device"
+
+    def __init__(self, status: Status):
+        self.status = status
+        self.parent = None
+
+    def set(self, value: float) -> Status:
+        return self.status
+
+
+def _time_plan(run_engine: RunEngine, plan) -> float:
+    start = monotonic()
+    run_engine(plan)
+    return monotonic() - start
+
+
+def test_distribution_for_uses_longest_matching_device_name():
+    robot, robot_gripper, default = fixed(1), fixed(2), fixed(3)
+    timings = SimulatedHardwareTimings(
+        {"robot": robot, "robot-gripper": robot_gripper}, default=default
+    )
+
+    assert timings.distribution_for("robot") is robot
+    assert timings.distribution_for("robot-load") is robot
+    assert timings.distribution_for("robot-gripper-open") is robot_gripper
+    assert timings.distribution_for("robotic_arm") is default
+    assert SimulatedHardwareTimings().distribution_for("robot") is None
+
+
+def test_distributions_are_never_negative():
+    rng = random.Random(0)
+    assert all(normal(0.1, 1, rng)() >= 0 for _ in range(100))
+    assert all(0.1 <= uniform(0.1, 0.2, rng)() <= 0.2 for _ in range(100))
+
+
+def test_sets_take_at_least_the_simulated_duration_and_still_set_the_device(
+    run_engine: RunEngine,
+):
+    device = MockDevice("slow_device")
+    timings = SimulatedHardwareTimings({"slow_device": fixed(0.2)})
+
+    elapsed_s = _time_plan(
+        run_engine,
+        simulated_hardware_wrapper(bps.mv(device, 1), timings),
+    )
+
+    assert elapsed_s >= 0.2
+    assert device.values == [1]
+
+
+def test_simulated_moves_on_different_devices_run_in_parallel(run_engine: RunEngine):
+    first, second = MockDevice("first"), MockDevice("second")
+
+    @simulated_hardware_decorator(SimulatedHardwareTimings(default=fixed(0.2)))
+    def plan():
+        yield from bps.abs_set(first, 1, group="moves")
+        yield from bps.abs_set(second, 1, group="moves")
+        yield from bps.wait("moves")
+
+    assert 0.2 <= _time_plan(run_engine, plan()) < 0.35
+
+
+def test_devices_slower_than_the_simulated_duration_are_waited_for(
+    run_engine: RunEngine,
+):
+    device = MockDevice("slow_device", duration_s=0.2)
+    timings = SimulatedHardwareTimings(default=fixed(0.01))
+
+    assert (
+        _time_plan(run_engine, simulated_hardware_wrapper(bps.mv(device, 1), timings))
+        >= 0.2
+    )
+
+
+def test_failures_are_passed_on(run_engine: RunEngine):
+    device = FailingDevice(name="failing_device")
+    timings = SimulatedHardwareTimings(default=fixed(0.01))
+
+    with pytest.raises(FailedStatus):
+        run_engine(simulated_hardware_wrapper(bps.mv(device, 1), timings))
+
+
+def test_ophyd_v1_statuses_are_slowed(run_engine: RunEngine):
+    device = OphydV1Device(NullStatus())
+    timings = SimulatedHardwareTimings({"ophyd_v1_device": fixed(0.2)})
+
+    assert (
+        _time_plan(run_engine, simulated_hardware_wrapper(bps.mv(device, 1), timings))
+        >= 0.2
+    )
+
+
+def test_devices_without_a_duration_are_not_slowed(run_engine: RunEngine):
+    device = MockDevice("fast_device")
+    timings = SimulatedHardwareTimings({"slow_device": fixed(1)})
+
+    assert (
+        _time_plan(run_engine, simulated_hardware_wrapper(bps.mv(device, 1), timings))
+        < 0.5
+    )
+
+
+def test_virtual_time_skips_sleeps_and_advances_the_clock(run_engine: RunEngine):
+    clock = VirtualClock()
+
+    def plan():
+        yield from bps.sleep(3600)
+        yield from bps.sleep(60)
+
+    elapsed_s = _time_plan(run_engine, virtual_time_wrapper(plan(), clock))
+
+    assert elapsed_s < 0.5
+    assert clock.monotonic() == 3660
+
+
+def test_virtual_time_advances_to_the_slowest_move_in_a_group(run_engine: RunEngine):
+    first, second = MockDevice("first"), MockDevice("second")
+    clock = VirtualClock()
+    timings = SimulatedHardwareTimings({"first": fixed(10), "second": fixed(30)})
+
+    def plan():
+        yield from bps.abs_set(first, 1, group="moves")
+        yield from bps.abs_set(second, 1, group="moves")
+        yield from bps.wait("moves")
+        yield from bps.mv(first, 2)
+
+    elapsed_s = _time_plan(run_engine, virtual_time_wrapper(plan(), clock, timings))
+
+    assert elapsed_s < 0.5
+    assert clock.monotonic() == 40
+    assert first.values == [1, 2]
+
+
+def test_use_virtual_time_applies_to_every_plan(run_engine: RunEngine):
+    with patch(
+        "mx_bluesky.common.preprocessors.simulated_hardware.set_virtual_clock"
+    ) as mock_set_virtual_clock:
+        clock = use_virtual_time(run_engine)
+
+    mock_set_virtual_clock.assert_called_once_with(clock)
+    run_engine(bps.sleep(3600))
+    run_engine(bps.sleep(3600))
+    assert clock.monotonic() == 7200
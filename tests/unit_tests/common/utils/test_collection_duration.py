@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mx_bluesky.common.parameters.gridscan import SpecifiedThreeDGridScan
+from mx_bluesky.common.utils.collection_duration import (
+    GRIDSCAN_ROW_TURNAROUND_S,
+    DurationEstimator,
+    estimate_gridscan_s,
+)
+from mx_bluesky.common.utils.metrics import Phase
+
+
+def test_gridscan_duration_estimated_from_images_exposure_and_rows(
+    test_fgs_params: SpecifiedThreeDGridScan,
+):
+    test_fgs_params.x_steps = 40
+    test_fgs_params.y_steps = 20
+    test_fgs_params.z_steps = 10
+    test_fgs_params.exposure_time_s = 0.004
+
+    estimate_s = estimate_gridscan_s(test_fgs_params, detector_deadtime_s=0.001)
+
+    assert estimate_s == pytest.approx(40 * 30 * 0.005 + 30 * GRIDSCAN_ROW_TURNAROUND_S)
+
+
+def test_estimates_are_corrected_by_recorded_durations():
+    estimator = DurationEstimator(smoothing=0.5)
+    assert estimator.corrected(Phase.FLYSCAN, 10) == 10
+
+    estimator.record(Phase.FLYSCAN, 10, 20)
+    assert estimator.corrected(Phase.FLYSCAN, 5) == 10
+
+    estimator.record(Phase.FLYSCAN, 10, 10)
+    assert estimator.corrected(Phase.FLYSCAN, 10) == 15
+    assert estimator.corrected(Phase.ROTATION, 10) == 10
+
+
+@patch("mx_bluesky.common.utils.collection_duration.LOGGER")
+def test_collections_taking_much_longer_than_expected_are_reported(
+    mock_logger: MagicMock,
+):
+    estimator = DurationEstimator(regression_tolerance=1.5)
+    estimator.record(Phase.ROTATION, 10, 14)
+    mock_logger.warning.assert_not_called()
+
+    estimator.record(Phase.ROTATION, 10, 30)
+    mock_logger.warning.assert_called_once()
+    assert "rotation took 30.0s, expected 14.0s" in mock_logger.warning.call_args[0][0]
+
+
+@patch("mx_bluesky.common.utils.collection_duration.monotonic")
+def test_compare_with_estimate_records_actual_duration_if_successful(
+    mock_monotonic: MagicMock,
+):
+    mock_monotonic.side_effect = [100, 112, 200]
+    estimator = DurationEstimator()
+
+    with estimator.compare_with_estimate(Phase.FLYSCAN, 10):
+        pass
+    with (
+        pytest.raises(ValueError),
+        estimator.compare_with_estimate(Phase.FLYSCAN, 10),
+    ):
+        raise ValueError()
+    with estimator.compare_with_estimate(Phase.FLYSCAN, None):
+        pass
+
+    assert estimator.correction_factors == {Phase.FLYSCAN: 1.2}
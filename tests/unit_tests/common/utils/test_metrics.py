@@ -0,0 +1,147 @@
+import json
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from bluesky import plan_stubs as bps
+from bluesky.run_engine import RunEngine
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    InMemoryMetricReader,
+    PeriodicExportingMetricReader,
+)
+
+from mx_bluesky.common.utils.metrics import (
+    FileMetricExporter,
+    Outcome,
+    Phase,
+    record_duration,
+    record_queue_depth,
+    record_sample,
+    timed,
+)
+
+
+@pytest.fixture
+def metric_reader() -> Generator[InMemoryMetricReader, None, None]:
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+    with (
+        patch.dict(
+            "mx_bluesky.common.utils.metrics.PHASE_DURATIONS",
+            {
+                phase: meter.create_histogram(f"mx_bluesky.{phase}.duration")
+                for phase in Phase
+            },
+        ),
+        patch(
+            "mx_bluesky.common.utils.metrics.SAMPLES",
+            meter.create_counter("mx_bluesky.samples"),
+        ),
+        patch(
+            "mx_bluesky.common.utils.metrics.QUEUE_DEPTH",
+            meter.create_gauge("mx_bluesky.queue_depth"),
+        ),
+    ):
+        yield reader
+
+
+def _data_points(reader: InMemoryMetricReader, name: str) -> list:
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return []
+    return [
+        data_point
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+        if metric.name == name
+        for data_point in metric.data.data_points
+    ]
+
+
+def test_record_duration_records_successful_phase(
+    metric_reader: InMemoryMetricReader,
+):
+    with record_duration(Phase.ROBOT_LOAD, beamline="i03"):
+        pass
+
+    (data_point,) = _data_points(metric_reader, "mx_bluesky.robot_load.duration")
+    assert data_point.count == 1
+    assert data_point.attributes == {"beamline": "i03", "outcome": "success"}
+
+
+def test_record_duration_records_failed_phase_and_reraises(
+    metric_reader: InMemoryMetricReader,
+):
+    with pytest.raises(ValueError), record_duration(Phase.ISPYB):
+        raise ValueError("ISPyB unavailable")
+
+    (data_point,) = _data_points(metric_reader, "mx_bluesky.ispyb.duration")
+    assert data_point.attributes == {"outcome": "failure"}
+
+
+def test_timed_plan_records_duration_of_execution(
+    metric_reader: InMemoryMetricReader, run_engine: RunEngine
+):
+    @timed(Phase.ROTATION)
+    def my_plan():
+        yield from bps.sleep(0.1)
+        return "done"
+
+    plan = my_plan()
+    assert not _data_points(metric_reader, "mx_bluesky.rotation.duration")
+
+    assert run_engine(plan).plan_result == "done"  # type: ignore
+
+    (data_point,) = _data_points(metric_reader, "mx_bluesky.rotation.duration")
+    assert data_point.sum >= 0.1
+
+
+def test_timed_function_records_duration_and_returns_result(
+    metric_reader: InMemoryMetricReader,
+):
+    @timed(Phase.AGAMEMNON)
+    def fetch(value: int) -> int:
+        return value * 2
+
+    assert fetch(2) == 4
+    (data_point,) = _data_points(metric_reader, "mx_bluesky.agamemnon.duration")
+    assert data_point.count == 1
+
+
+def test_samples_and_queue_depth_are_recorded(metric_reader: InMemoryMetricReader):
+    record_sample(Outcome.SUCCESS)
+    record_sample(Outcome.SUCCESS)
+    record_sample(Outcome.FAILURE)
+    record_queue_depth("gda_commands", 3)
+
+    samples = {
+        dp.attributes["outcome"]: dp.value
+        for dp in _data_points(metric_reader, "mx_bluesky.samples")
+    }
+    assert samples == {"success": 2, "failure": 1}
+    (queue_depth,) = _data_points(metric_reader, "mx_bluesky.queue_depth")
+    assert queue_depth.value == 3
+    assert queue_depth.attributes == {"queue": "gda_commands"}
+
+
+def test_file_metric_exporter_writes_json_lines(tmp_path: Path):
+    metrics_file = tmp_path / "metrics.jsonl"
+    reader = PeriodicExportingMetricReader(FileMetricExporter(metrics_file))
+    provider = MeterProvider(metric_readers=[reader])
+    provider.get_meter("test").create_counter("test_counter").add(5)
+
+    provider.shutdown()
+
+    lines = metrics_file.read_text().splitlines()
+    assert lines
+    metric_names = [
+        metric["name"]
+        for line in lines
+        for resource_metrics in json.loads(line)["resource_metrics"]
+        for scope_metrics in resource_metrics["scope_metrics"]
+        for metric in scope_metrics["metrics"]
+    ]
+    assert "test_counter" in metric_names
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from bluesky.run_engine import RunEngine
+from ophyd_async.core import SignalRW, soft_signal_rw
+
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache
+
+
+@pytest.fixture
+def signal(run_engine: RunEngine) -> SignalRW[float]:
+    return soft_signal_rw(float, 1.0, name="signal")
+
+
+async def test_a_confirmed_setpoint_is_remembered_until_it_changes(
+    signal: SignalRW[float],
+):
+    cache = SetpointCache()
+    await signal.set(2.0)
+    cache.confirm(signal, 2.0)
+
+    assert cache.is_set_to(signal, 2.0)
+    assert not cache.is_set_to(signal, 3.0)
+
+    await signal.set(3.0)
+
+    assert not cache.is_set_to(signal, 2.0)
+    assert not cache.is_set_to(signal, 3.0)
+    cache.clear()
+
+
+async def test_setpoints_are_forgotten_and_monitors_removed_on_clear(
+    signal: SignalRW[float],
+):
+    cache = SetpointCache()
+    cache.confirm(signal, 1.0)
+    cache.record_elided_write()
+
+    cache.clear()
+
+    assert not cache.is_set_to(signal, 1.0)
+    assert cache.writes_elided == 0
+    assert not cache._monitors
+
+
+async def test_array_setpoints_are_never_treated_as_unchanged(run_engine: RunEngine):
+    array_signal = soft_signal_rw(np.ndarray, np.array([1.0, 2.0]), name="array")
+    cache = SetpointCache()
+    cache.confirm(array_signal, np.array([1.0, 2.0]))
+
+    assert not cache.is_set_to(array_signal, np.array([1.0, 2.0]))
+    cache.clear()
@@ -0,0 +1,126 @@
+import pytest
+
+from mx_bluesky.common.parameters.constants import DocDescriptorNames
+from mx_bluesky.common.utils.snapshot_policy import (
+    GridSnapshotEventHandler,
+    GridSnapshotGeometry,
+    can_generate_rotation_snapshots,
+    omegas_not_generated,
+)
+
+IMAGE_SIZE_PX = (1024, 768)
+
+
+def _grid_snapshot(omega_deg: float) -> GridSnapshotGeometry:
+    return GridSnapshotGeometry(
+        sample_pos_mm=(1, 2, 3),
+        omega_deg=omega_deg,
+        chi_deg=0,
+        phi_deg=10,
+        beam_centre_px=(512, 384),
+        microns_per_pixel=(2, 2),
+    )
+
+
+GRID_SNAPSHOTS = [_grid_snapshot(0), _grid_snapshot(-90)]
+
+
+@pytest.mark.parametrize(
+    "snapshot_omegas_deg, sample_pos_mm, chi_deg, phi_deg, expected",
+    [
+        ([0, 270], (1, 2, 3), 0, 10, True),
+        ([-90, 360.2], (1.5, 2.5, 3.5), 0, 370, True),
+        ([0.0, 90.0, 180.0, 270.0], (1, 2, 3), 0, 10, True),
+        ([0], (1, 2, 3), 0, 10, False),
+        ([0, 90], (1, 2, 3), 0, 10, False),
+        ([180, 90], (1, 2, 3), 0, 10, False),
+        ([45], (1, 2, 3), 0, 10, False),
+        ([0, 270], (2.1, 2, 3), 0, 10, False),
+        ([0, 270], (1, 2, 2.1), 0, 10, False),
+        ([0, 270], (1, 2, 3), 30, 10, False),
+        ([0, 270], (1, 2, 3), 0, 20, False),
+    ],
+)
+def test_rotation_snapshots_generated_only_if_grid_snapshots_show_sample(
+    snapshot_omegas_deg: list[float],
+    sample_pos_mm: tuple[float, float, float],
+    chi_deg: float,
+    phi_deg: float,
+    expected: bool,
+):
+    assert (
+        can_generate_rotation_snapshots(
+            GRID_SNAPSHOTS,
+            snapshot_omegas_deg,
+            sample_pos_mm,
+            chi_deg,
+            phi_deg,
+            IMAGE_SIZE_PX,
+        )
+        == expected
+    )
+
+
+def test_rotation_snapshots_not_generated_without_grid_snapshots():
+    assert not can_generate_rotation_snapshots(
+        GRID_SNAPSHOTS[:1], [0, 270], (1, 2, 3), 0, 10, IMAGE_SIZE_PX
+    )
+
+
+def test_rotation_snapshots_only_generated_at_the_omegas_of_the_first_grid_snapshots():
+    grid_snapshots = [*GRID_SNAPSHOTS, _grid_snapshot(45)]
+
+    assert not can_generate_rotation_snapshots(
+        grid_snapshots, [45], (1, 2, 3), 0, 10, IMAGE_SIZE_PX
+    )
+
+
+@pytest.mark.parametrize(
+    "snapshot_omegas_deg, expected_omegas_deg",
+    [
+        ([0.0, 90.0, 180.0, 270.0], [90.0, 180.0]),
+        ([0, -90], []),
+        ([360, 45], [45]),
+    ],
+)
+def test_snapshots_still_taken_at_the_omegas_no_grid_snapshot_was_at(
+    snapshot_omegas_deg: list[float], expected_omegas_deg: list[float]
+):
+    assert (
+        omegas_not_generated(GRID_SNAPSHOTS, snapshot_omegas_deg) == expected_omegas_deg
+    )
+
+
+def test_grid_snapshot_geometry_recorded_from_grid_snapshot_events():
+    handler = GridSnapshotEventHandler()
+    handler.descriptor(
+        {"uid": "other", "name": DocDescriptorNames.OAV_ROTATION_SNAPSHOT_TRIGGERED}  # type: ignore
+    )
+    handler.descriptor(
+        {"uid": "grid", "name": DocDescriptorNames.OAV_GRID_SNAPSHOT_TRIGGERED}  # type: ignore
+    )
+    data = {
+        "oav-beam_centre_i": 512,
+        "oav-beam_centre_j": 384,
+        "oav-microns_per_pixel_x": 2,
+        "oav-microns_per_pixel_y": 3,
+        "smargon-x": 1,
+        "smargon-y": 2,
+        "smargon-z": 3,
+        "smargon-omega": -89.99,
+        "smargon-chi": 0,
+        "smargon-phi": 10,
+    }
+    handler.event({"descriptor": "other", "data": data})  # type: ignore
+    handler.event({"descriptor": "grid", "data": data})  # type: ignore
+
+    assert handler.grid_snapshots == [
+        GridSnapshotGeometry(
+            sample_pos_mm=(1, 2, 3),
+            omega_deg=-90,
+            chi_deg=0,
+            phi_deg=10,
+            beam_centre_px=(512, 384),
+            microns_per_pixel=(2, 3),
+        )
+    ]
@@ -0,0 +1,35 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mx_bluesky.common.utils.metrics import FileMetricExporter
+from mx_bluesky.common.utils.tracing import setup_tracing
+
+
+@pytest.mark.parametrize("export_otlp", [True, False])
+@patch("mx_bluesky.common.utils.tracing.trace.set_tracer_provider")
+@patch("mx_bluesky.common.utils.tracing.metrics.set_meter_provider", MagicMock())
+@patch("mx_bluesky.common.utils.tracing.MeterProvider")
+@patch("mx_bluesky.common.utils.tracing.PeriodicExportingMetricReader")
+@patch("mx_bluesky.common.utils.tracing.OTLPMetricExporter")
+@patch("mx_bluesky.common.utils.tracing.OTLPSpanExporter")
+def test_setup_tracing_only_exports_to_otlp_if_requested(
+    mock_span_exporter: MagicMock,
+    mock_metric_exporter: MagicMock,
+    mock_reader: MagicMock,
+    mock_meter_provider: MagicMock,
+    mock_set_tracer_provider: MagicMock,
+    export_otlp: bool,
+    tmp_path: Path,
+):
+    setup_tracing(metrics_file=tmp_path / "metrics.jsonl", export_otlp=export_otlp)
+
+    assert len(mock_meter_provider.call_args.kwargs["metric_readers"]) == (
+        2 if export_otlp else 1
+    )
+    exporters = [c.args[0] for c in mock_reader.call_args_list]
+    assert any(isinstance(e, FileMetricExporter) for e in exporters)
+    assert (mock_metric_exporter.return_value in exporters) == export_otlp
+    assert mock_span_exporter.called == export_otlp
+    assert mock_set_tracer_provider.called == export_otlp
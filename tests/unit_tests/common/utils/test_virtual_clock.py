@@ -0,0 +1,24 @@
+import time
+from unittest.mock import patch
+
+from mx_bluesky.common.utils.virtual_clock import VirtualClock, monotonic
+
+
+def test_virtual_clock_only_moves_forward():
+    clock = VirtualClock(10)
+
+    clock.advance(5)
+    clock.advance(-5)
+    assert clock.monotonic() == 15
+    clock.advance_to(12)
+    assert clock.monotonic() == 15
+    clock.advance_to(20)
+    assert clock.monotonic() == 20
+
+
+def test_monotonic_is_virtual_only_when_a_virtual_clock_is_set():
+    assert abs(monotonic() - time.monotonic()) < 1
+    with patch(
+        "mx_bluesky.common.utils.virtual_clock._virtual_clock", VirtualClock(1e9)
+    ):
+        assert monotonic() == 1e9
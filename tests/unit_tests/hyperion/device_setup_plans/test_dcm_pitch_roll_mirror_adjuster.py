@@ -1,3 +1,5 @@
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -9,13 +11,16 @@ from dodal.devices.focusing_mirror import (
     MirrorVoltages,
 )
 from dodal.devices.i03.undulator_dcm import UndulatorDCM
+from dodal.devices.undulator import AccessError, EnabledDisabledUpper
 from ophyd_async.testing import get_mock_put, set_mock_value
 
 from mx_bluesky.hyperion.device_setup_plans import dcm_pitch_roll_mirror_adjuster
 from mx_bluesky.hyperion.device_setup_plans.dcm_pitch_roll_mirror_adjuster import (
+    MAX_CHANNELS_SLEWING,
     YAW_LAT_TIMEOUT_S,
     adjust_dcm_pitch_roll_vfm_from_lut,
     adjust_mirror_stripe,
+    is_adjusted_for_energy,
 )
 
 
@@ -29,35 +34,27 @@ def test_when_bare_mirror_stripe_selected_then_expected_voltages_set_and_waited(
         )
     )
 
-    for channel, expected_voltage in zip(
-        mirror_voltages.horizontal_voltages.values(),
-        [1, 107, 15, 139, 41, 165, 11, 6, 166, -65, 0, -38, 179, 128],
-        strict=True,
-    ):
-        messages = assert_message_and_return_remaining(
-            messages,
-            lambda msg: msg.command == "set"
-            and msg.obj == channel
-            and msg.args[0] == expected_voltage,
-        )
-        messages = assert_message_and_return_remaining(
-            messages, lambda msg: msg.command == "wait"
+    expected_voltages = list(
+        zip(
+            mirror_voltages.horizontal_voltages.values(),
+            [1, 107, 15, 139, 41, 165, 11, 6, 166, -65, 0, -38, 179, 128],
+            strict=True,
         )
-
-    for channel, expected_voltage in zip(
-        mirror_voltages.vertical_voltages.values(),
-        [140, 100, 70, 30, 30, -65, 24, 15],
-        strict=True,
-    ):
-        messages = assert_message_and_return_remaining(
-            messages,
-            lambda msg: msg.command == "set"
-            and msg.obj == channel
-            and msg.args[0] == expected_voltage,
-        )
-        messages = assert_message_and_return_remaining(
-            messages, lambda msg: msg.command == "wait"
+    ) + list(
+        zip(
+            mirror_voltages.vertical_voltages.values(),
+            [140, 100, 70, 30, 30, -65, 24, 15],
+            strict=True,
         )
+    )
+    # The channels are slewed in batches, waiting for each batch to finish
+    expected_messages = []
+    for start in range(0, len(expected_voltages), MAX_CHANNELS_SLEWING):
+        batch = expected_voltages[start : start + MAX_CHANNELS_SLEWING]
+        expected_messages += [
+            ("set", channel, (voltage,)) for channel, voltage in batch
+        ] + [("wait", None, ())]
+    assert [(msg.command, msg.obj, msg.args) for msg in messages] == expected_messages
 
 
 @pytest.mark.parametrize(
@@ -142,23 +139,29 @@ def test_adjust_dcm_pitch_roll_vfm_from_lut(
     # target bragg angle 15.288352 deg
     messages = assert_message_and_return_remaining(
         messages,
-        lambda msg: msg.command == "set"
-        and msg.obj.name == "dcm-xtal_1-pitch_in_mrad"
-        and abs(msg.args[0] - -0.78229639) < 1e-5
-        and msg.kwargs["group"] == "DCM_GROUP",
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj.name == "dcm-xtal_1-pitch_in_mrad"
+            and abs(msg.args[0] - -0.78229639) < 1e-5
+            and msg.kwargs["group"] == "DCM_GROUP"
+        ),
     )
     messages = assert_message_and_return_remaining(
         messages[1:],
-        lambda msg: msg.command == "set"
-        and msg.obj.name == "dcm-xtal_1-roll_in_mrad"
-        and abs(msg.args[0] - -0.2799) < 1e-5
-        and msg.kwargs["group"] == "DCM_GROUP",
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj.name == "dcm-xtal_1-roll_in_mrad"
+            and abs(msg.args[0] - -0.2799) < 1e-5
+            and msg.kwargs["group"] == "DCM_GROUP"
+        ),
     )
     messages = assert_message_and_return_remaining(
         messages[1:],
-        lambda msg: msg.command == "set"
-        and msg.obj.name == "vfm-stripe"
-        and msg.args == (MirrorStripe.RHODIUM,),
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj.name == "vfm-stripe"
+            and msg.args == (MirrorStripe.RHODIUM,)
+        ),
     )
     messages = assert_message_and_return_remaining(
         messages[1:],
@@ -170,20 +173,24 @@ def test_adjust_dcm_pitch_roll_vfm_from_lut(
     )
     messages = assert_message_and_return_remaining(
         messages[1:],
-        lambda msg: msg.command == "set"
-        and msg.obj is vfm.x_mm
-        and msg.args == (10.0,)
-        and msg.kwargs["timeout"] == YAW_LAT_TIMEOUT_S,
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj is vfm.x_mm
+            and msg.args == (10.0,)
+            and msg.kwargs["timeout"] == YAW_LAT_TIMEOUT_S
+        ),
     )
     messages = assert_message_and_return_remaining(
         messages[1:], lambda msg: msg.command == "wait"
     )
     messages = assert_message_and_return_remaining(
         messages[1:],
-        lambda msg: msg.command == "set"
-        and msg.obj is vfm.yaw_mrad
-        and msg.args == (0.0,)
-        and msg.kwargs["timeout"] == YAW_LAT_TIMEOUT_S,
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj is vfm.yaw_mrad
+            and msg.args == (0.0,)
+            and msg.kwargs["timeout"] == YAW_LAT_TIMEOUT_S
+        ),
     )
     messages = assert_message_and_return_remaining(
         messages[1:], lambda msg: msg.command == "wait"
@@ -193,14 +200,141 @@ def test_adjust_dcm_pitch_roll_vfm_from_lut(
     ):
         messages = assert_message_and_return_remaining(
             messages[1:],
-            lambda msg: msg.command == "set"
-            and msg.obj.name == f"mirror_voltages-horizontal_voltages-{channel}"
-            and msg.args == (expected_voltage,),
+            lambda msg: (
+                msg.command == "set"
+                and msg.obj.name == f"mirror_voltages-horizontal_voltages-{channel}"
+                and msg.args == (expected_voltage,)
+            ),
         )
     for channel, expected_voltage in enumerate([124, 114, 34, 49, 19, -116, 4, -46]):
         messages = assert_message_and_return_remaining(
             messages[1:],
-            lambda msg: msg.command == "set"
-            and msg.obj.name == f"mirror_voltages-vertical_voltages-{channel}"
-            and msg.args == (expected_voltage,),
+            lambda msg: (
+                msg.command == "set"
+                and msg.obj.name == f"mirror_voltages-vertical_voltages-{channel}"
+                and msg.args == (expected_voltage,)
+            ),
         )
+
+
+def test_files_are_only_parsed_again_once_modified(tmp_path: Path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{}")
+    parse = MagicMock(side_effect=lambda path: object())
+    parse_if_modified = dcm_pitch_roll_mirror_adjuster._parse_if_modified
+
+    first = parse_if_modified(str(config_file), parse)
+    assert parse_if_modified(str(config_file), parse) is first
+    parse.assert_called_once_with(str(config_file))
+
+    os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+    assert parse_if_modified(str(config_file), parse) is not first
+    assert parse.call_count == 2
+
+
+@pytest.fixture
+def dcm_adjusted_for_7_5_kev(
+    undulator_dcm: UndulatorDCM, vfm: FocusingMirrorWithStripes
+) -> UndulatorDCM:
+    dcm = undulator_dcm.dcm_ref()
+    set_mock_value(dcm.energy_in_keV.user_setpoint, 7.5)
+    set_mock_value(dcm.energy_in_keV.user_readback, 7.5004)
+    # From the lookup tables for a bragg angle of 15.288352 deg
+    set_mock_value(dcm.xtal_1.pitch_in_mrad.user_setpoint, -0.78229639)
+    set_mock_value(dcm.xtal_1.roll_in_mrad.user_setpoint, -0.2799)
+    set_mock_value(vfm.stripe, MirrorStripe.RHODIUM)
+    # From the undulator lookup table for 7500 eV
+    set_mock_value(undulator_dcm.undulator_ref().current_gap, 6.7655)
+    set_mock_value(dcm.offset_in_mm.user_readback, undulator_dcm.dcm_fixed_offset_mm)
+    return undulator_dcm
+
+
+def test_is_adjusted_for_energy_if_dcm_and_mirror_are_where_the_lookups_put_them(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+):
+    assert run_engine(
+        is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5)
+    ).plan_result  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "signal_name, value",
+    [
+        ("energy_in_keV.user_setpoint", 7.6),
+        ("energy_in_keV.user_readback", 7.4),
+        ("xtal_1.pitch_in_mrad.user_setpoint", -0.7),
+        ("xtal_1.roll_in_mrad.user_setpoint", -0.3),
+    ],
+)
+def test_is_not_adjusted_for_energy_if_the_dcm_is_elsewhere(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+    signal_name: str,
+    value: float,
+):
+    signal = dcm_adjusted_for_7_5_kev.dcm_ref()
+    for attribute in signal_name.split("."):
+        signal = getattr(signal, attribute)
+    set_mock_value(signal, value)  # type: ignore
+
+    assert not run_engine(
+        is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5)
+    ).plan_result  # type: ignore
+
+
+def test_is_not_adjusted_for_energy_if_the_mirror_stripe_is_wrong(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+):
+    set_mock_value(vfm.stripe, MirrorStripe.BARE)
+
+    assert not run_engine(
+        is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5)
+    ).plan_result  # type: ignore
+
+
+@pytest.mark.parametrize("gap_mm", [6.7, 6.8])
+def test_is_not_adjusted_for_energy_if_the_undulator_gap_is_elsewhere(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+    gap_mm: float,
+):
+    set_mock_value(dcm_adjusted_for_7_5_kev.undulator_ref().current_gap, gap_mm)
+
+    assert not run_engine(
+        is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5)
+    ).plan_result  # type: ignore
+
+
+def test_is_not_adjusted_for_energy_if_the_dcm_offset_is_elsewhere(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+):
+    set_mock_value(
+        dcm_adjusted_for_7_5_kev.dcm_ref().offset_in_mm.user_readback,
+        dcm_adjusted_for_7_5_kev.dcm_fixed_offset_mm + 0.1,
+    )
+
+    assert not run_engine(
+        is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5)
+    ).plan_result  # type: ignore
+
+
+def test_is_adjusted_for_energy_raises_if_the_undulator_is_disabled(
+    dcm_adjusted_for_7_5_kev: UndulatorDCM,
+    vfm: FocusingMirrorWithStripes,
+    run_engine: RunEngine,
+):
+    set_mock_value(
+        dcm_adjusted_for_7_5_kev.undulator_ref().gap_access,
+        EnabledDisabledUpper.DISABLED,
+    )
+
+    with pytest.raises(AccessError):
+        run_engine(is_adjusted_for_energy(dcm_adjusted_for_7_5_kev, vfm, 7.5))
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 from bluesky import plan_stubs as bps
 from bluesky.run_engine import RunEngine
+from bluesky.simulators import RunEngineSimulator, assert_message_and_return_remaining
 from dodal.devices.oav.oav_detector import OAV
 from dodal.devices.oav.oav_parameters import OAVParameters
 from dodal.devices.oav.pin_image_recognition import PinTipDetection
@@ -37,3 +38,27 @@ def test_when_set_up_oav_then_only_waits_on_oav_to_finish(
         yield from pre_centring_setup_oav(oav, mock_parameters, ophyd_pin_tip_detection)
 
     run_engine(my_plan())
+
+
+def test_set_up_oav_waits_for_the_zoom_before_setting_up_pin_tip_detection(
+    mock_parameters: OAVParameters,
+    oav: OAV,
+    ophyd_pin_tip_detection: PinTipDetection,
+    sim_run_engine: RunEngineSimulator,
+):
+    msgs = sim_run_engine.simulate_plan(
+        pre_centring_setup_oav(oav, mock_parameters, ophyd_pin_tip_detection)
+    )
+
+    msgs = assert_message_and_return_remaining(
+        msgs, lambda msg: msg.command == "set" and msg.obj is oav.zoom_controller
+    )
+    assert msgs[1].command == "wait"
+    assert msgs[1].kwargs["group"] == msgs[0].kwargs["group"]
+    assert_message_and_return_remaining(
+        msgs[2:],
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj is ophyd_pin_tip_detection.preprocess_operation
+        ),
+    )
@@ -5,15 +5,19 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import yaml
 from bluesky.plan_stubs import null
 from bluesky.run_engine import RunEngine
 from bluesky.simulators import RunEngineSimulator, assert_message_and_return_remaining
 from dodal.common.types import UpdatingPathProvider
 from dodal.devices.fast_grid_scan import PandAGridScanParams
 from dodal.devices.smargon import Smargon
+from ophyd_async.core import walk_rw_signals
 from ophyd_async.fastcs.panda import HDFPanda, SeqTable, SeqTrigger
 
+from mx_bluesky.common.device_setup_plans.setup_panda import get_panda_config_manager
 from mx_bluesky.common.parameters.constants import DeviceSettingsConstants
+from mx_bluesky.common.utils.setpoint_cache import SetpointCache, set_setpoint_cache
 from mx_bluesky.hyperion.device_setup_plans.setup_panda import (
     MM_TO_ENCODER_COUNTS,
     PULSE_WIDTH_US,
@@ -76,6 +80,94 @@ def test_setup_panda_performs_correct_plans(sim_run_engine, panda, smargon):
     assert num_of_waits == 5
 
 
+@patch("mx_bluesky.hyperion.device_setup_plans.setup_panda.load_panda_from_yaml")
+def test_setup_panda_homes_each_encoder_before_configuring_the_rest(
+    mock_load_panda: MagicMock,
+    sim_run_engine: RunEngineSimulator,
+    panda: HDFPanda,
+    smargon: Smargon,
+):
+    msgs = sim_run_engine.simulate_plan(
+        setup_panda_for_flyscan(
+            panda,
+            PandAGridScanParams(transmission_fraction=0.01),
+            smargon,
+            0.1,
+            100.1,
+            get_smargon_speed(0.1, 1),
+        )
+    )
+
+    for encoder in (1, 2, 3):
+        msgs = assert_message_and_return_remaining(
+            msgs,
+            lambda msg, encoder=encoder: (
+                msg.command == "set" and msg.obj is panda.inenc[encoder].setp  # type: ignore
+            ),
+        )
+        # Each encoder is waited for before anything else is set
+        assert msgs[1].command == "wait"
+        assert msgs[1].kwargs["group"] == msgs[0].kwargs["group"]
+        msgs = msgs[2:]
+    assert_message_and_return_remaining(
+        msgs, lambda msg: msg.command == "set" and msg.obj is panda.pulse[1].width
+    )
+
+
+def _write_gridscan_settings_for_mock_panda(panda: HDFPanda, directory: Path):
+    """Write the gridscan settings for the signals that the mock PandA has."""
+    file_name = f"{DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_FILENAME}.yaml"
+    with open(Path(DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_DIR, file_name)) as f:
+        settings = yaml.safe_load(f)
+    signal_names = walk_rw_signals(panda).keys()
+    with open(directory / file_name, "w") as f:
+        yaml.safe_dump({k: v for k, v in settings.items() if k in signal_names}, f)
+
+
+def test_setup_panda_does_not_set_anything_twice_when_skipping_unchanged_setpoints(
+    run_engine: RunEngine, panda: HDFPanda, smargon: Smargon, tmp_path: Path
+):
+    _write_gridscan_settings_for_mock_panda(panda, tmp_path)
+    sets: list[str] = []
+    run_engine.msg_hook = lambda msg: (  # type: ignore
+        sets.append(msg.obj.name) if msg.command == "set" else None
+    )
+    set_setpoint_cache(SetpointCache())
+    try:
+        with patch.object(
+            DeviceSettingsConstants, "PANDA_FLYSCAN_SETTINGS_DIR", str(tmp_path)
+        ):
+            for _ in range(2):
+                run_engine(disarm_panda_for_gridscan(panda))
+                sets.clear()
+                run_engine(
+                    setup_panda_for_flyscan(
+                        panda,
+                        PandAGridScanParams(transmission_fraction=0.01),
+                        smargon,
+                        0.1,
+                        100.1,
+                        get_smargon_speed(0.1, 1),
+                    )
+                )
+    finally:
+        set_setpoint_cache(None)
+        get_panda_config_manager().clear()
+
+    # The yaml settings, sequencer table and pulse width are all unchanged, so only the
+    # encoders are homed again and the PandA enabled and armed after being disarmed
+    assert sets == [
+        "panda-inenc-1-setp",
+        "panda-inenc-2-setp",
+        "panda-inenc-3-setp",
+        "panda-pcap-enable",
+        "panda-seq-1-enable",
+        "panda-pulse-1-enable",
+        "panda-counter-1-enable",
+        "panda-pcap-arm",
+    ]
+
+
 @pytest.mark.parametrize(
     "x_steps, x_step_size, x_start, run_up_distance_mm, time_between_x_steps_ms, exposure_time_s",
     [
@@ -127,9 +219,11 @@ def test_setup_panda_correctly_configures_table(
 
     assert_message_and_return_remaining(
         msgs,
-        lambda msg: msg.command == "set"
-        and msg.obj.name == "panda-pulse-1-width"
-        and msg.args[0] == exposure_time_s,
+        lambda msg: (
+            msg.command == "set"
+            and msg.obj.name == "panda-pulse-1-width"
+            and msg.args[0] == exposure_time_s
+        ),
     )
 
     table_msg = [
@@ -256,7 +256,8 @@ class TestFlyscanXrayCentrePlan:
         )
 
         mock_set_panda_directory.assert_called_with(tmp_path / "xraycentring/123456")
-        mock_load_panda.assert_called_once_with(
+        mock_load_panda.assert_called_once()
+        assert mock_load_panda.call_args.args == (
             DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_DIR,
             DeviceSettingsConstants.PANDA_FLYSCAN_SETTINGS_FILENAME,
             fgs_composite_with_panda_pcap.panda,
@@ -96,7 +96,7 @@ class TestHyperionGridDetectThenXrayCentrePlan:
 
     @patch("bluesky.plan_stubs.sleep", autospec=True)
     @patch(
-        "mx_bluesky.common.experiment_plans.inner_plans.do_fgs.check_topup_and_wait_if_necessary",
+        "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     )
     @patch(
         "mx_bluesky.common.experiment_plans.common_grid_detect_then_xray_centre_plan.grid_detection_plan",
@@ -191,7 +191,7 @@ def mock_multi_rotation_scan():
         ),
         patch(
             "mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan.rotation_scan_internal",
-            side_effect=lambda _, __, ___: iter([Msg(command="multi_rotation_scan")]),
+            side_effect=lambda *_, **__: iter([Msg(command="multi_rotation_scan")]),
         ) as mock_rotation,
     ):
         yield mock_rotation
@@ -755,6 +755,62 @@ def test_load_centre_collect_full_sorts_collections_by_distance_from_pin_tip(
     assert actual_ids == expected_sample_ids
 
 
+@patch(
+    "mx_bluesky.hyperion.experiment_plans.robot_load_then_centre_plan.pin_centre_then_flyscan_plan",
+    new=MagicMock(
+        return_value=iter(
+            [
+                Msg(
+                    "open_run",
+                    xray_centre_results=[
+                        dataclasses.asdict(
+                            dataclasses.replace(
+                                FLYSCAN_RESULT_MED,
+                                centre_of_mass_mm=np.array(coords),
+                                sample_id=sample_id,
+                            )
+                        )
+                        for (coords, sample_id) in [
+                            ([0.1, 0, 0], 1),
+                            ([0.2, 1, 0], 2),
+                            ([0.3, 0, 0], 3),
+                        ]
+                    ],
+                    run=CONST.PLAN.FLYSCAN_RESULTS,
+                ),
+                Msg("close_run"),
+            ]
+        )
+    ),
+)
+@patch("mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan.LOGGER")
+def test_load_centre_collect_full_orders_collections_to_minimise_gonio_travel(
+    mock_logger: MagicMock,
+    mock_multi_rotation_scan: MagicMock,
+    sim_run_engine: RunEngineSimulator,
+    load_centre_collect_with_top_n_params: LoadCentreCollect,
+    oav_parameters_for_rotation: OAVParameters,
+    composite: LoadCentreCollectComposite,
+):
+    sim_run_engine.add_handler_for_callback_subscribes()
+    sim_fire_event_on_open_run(sim_run_engine, CONST.PLAN.FLYSCAN_RESULTS)
+    sim_run_engine.simulate_plan(
+        load_centre_collect_full(
+            composite,
+            load_centre_collect_with_top_n_params,
+            oav_parameters_for_rotation,
+        )
+    )
+
+    params: RotationScan = mock_multi_rotation_scan.mock_calls[0].args[1]
+    actual_ids = [scan.sample_id for scan in list(params.single_rotation_scans)]
+    assert actual_ids == [1, 1, 3, 3, 2, 2]
+    assert any(
+        "less than in order of x" in call_args.args[0]
+        for call_args in mock_logger.info.call_args_list
+    )
+
+
 def _rotation_at(
     chi: float,
     position: dict,
@@ -1,6 +1,6 @@
 import asyncio
 from typing import Literal
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -16,13 +16,18 @@ from mx_bluesky.hyperion.experiment_plans.optimise_attenuation_plan import (
     AttenuationOptimisationFailedError,
     Direction,
     OptimizeAttenuationComposite,
+    Search,
+    TransmissionBracket,
     calculate_new_direction,
     check_parameters,
     deadtime_calc_new_transmission,
     deadtime_optimisation,
+    deadtime_search_optimisation,
     is_counts_within_target,
     is_deadtime_optimised,
+    predict_deadtime_transmission,
     total_counts_optimisation,
+    total_counts_search_optimisation,
 )
 
 
@@ -237,12 +242,18 @@ def test_is_counts_within_target_is_false(
 def test_total_count_exception_raised_after_max_cycles_reached(
     run_engine: RunEngine, fake_composite_mocked_sets: OptimizeAttenuationComposite
 ):
-    optimise_attenuation_plan.is_counts_within_target = MagicMock(return_value=False)
     set_mock_value(
         fake_composite_mocked_sets.xspress3mini.dt_corrected_latest_mca[1],
         np.array([1, 1, 1, 1, 1, 1]),
     )
-    with pytest.raises(AttenuationOptimisationFailedError):
+    with (
+        patch.object(
+            optimise_attenuation_plan,
+            "is_counts_within_target",
+            MagicMock(return_value=False),
+        ),
+        pytest.raises(AttenuationOptimisationFailedError),
+    ):
         run_engine(
             total_counts_optimisation(
                 fake_composite_mocked_sets, 1, 0, 10, 0, 5, 2, 1, 0, 0
@@ -369,6 +380,7 @@ def test_optimisation_attenuation_plan_runs_correct_functions(
         optimise_attenuation_plan.optimise_attenuation_plan(
             fake_composite,
             optimisation_type=optimisation_type,
+            search=Search.STEPWISE,
         )
     )
 
@@ -381,3 +393,208 @@ def test_optimisation_attenuation_plan_runs_correct_functions(
     fake_composite.attenuator.set.assert_called_once()
     mock_check_parameters.assert_called_once()
     fake_composite.xspress3mini.acquire_time.set.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "optimisation_type, search, expected_function",
+    [
+        ("total_counts", Search.MODEL, "total_counts_search_optimisation"),
+        ("total_counts", Search.STEPWISE, "total_counts_optimisation"),
+        ("deadtime", Search.MODEL, "deadtime_search_optimisation"),
+        ("deadtime", Search.STEPWISE, "deadtime_optimisation"),
+    ],
+)
+def test_optimisation_attenuation_plan_uses_requested_search(
+    optimisation_type: str,
+    search: Search,
+    expected_function: str,
+    run_engine: RunEngine,
+    fake_composite: OptimizeAttenuationComposite,
+):
+    fake_composite.attenuator.set = MagicMock(return_value=get_good_status())
+    with patch.multiple(
+        optimise_attenuation_plan,
+        total_counts_search_optimisation=DEFAULT,
+        total_counts_optimisation=DEFAULT,
+        deadtime_search_optimisation=DEFAULT,
+        deadtime_optimisation=DEFAULT,
+    ) as mocks:
+        run_engine(
+            optimise_attenuation_plan.optimise_attenuation_plan(
+                fake_composite,
+                optimisation_type=optimisation_type,
+                search=search,
+                initial_transmission=0.01,
+                increment=1.5,
+                deadtime_threshold=0.01,
+            )
+        )
+
+    for function, mock in mocks.items():
+        assert mock.called == (function == expected_function)
+    if optimisation_type == "deadtime":
+        assert mocks[expected_function].call_args.kwargs == {
+            "increment": 1.5,
+            "deadtime_threshold": 0.01,
+            "max_cycles": 10,
+            "upper_transmission_limit": 0.1,
+            "lower_transmission_limit": 1.0e-6,
+        }
+
+
+def test_predicted_deadtime_transmission_gives_threshold_for_paralysable_detector():
+    rate = 0.3
+    transmission = 0.05
+    deadtime = 1 - np.exp(-rate * transmission)
+
+    predicted = predict_deadtime_transmission(transmission, deadtime, 0.002)
+
+    assert 1 - np.exp(-rate * predicted) == pytest.approx(0.002)
+    assert predict_deadtime_transmission(transmission, 0, 0.002) == np.inf
+
+
+@pytest.mark.parametrize(
+    "below_target, above_target, predicted, expected",
+    [
+        (None, None, 0.05, 0.05),
+        (None, None, 5, 1),
+        (0.01, None, 0.015, 0.02),
+        (0.01, None, 0.5, 0.5),
+        (None, 0.1, 0.08, 0.05),
+        (0.001, 0.1, 1, 0.05),
+        (0.001, 0.1, 0, 0.002),
+        (0.001, 0.1, 0.01, 0.01),
+        (0.01, 0.03, 0.02, np.sqrt(0.01 * 0.03)),
+    ],
+)
+def test_transmission_bracket_keeps_prediction_within_bracket(
+    below_target: float | None,
+    above_target: float | None,
+    predicted: float,
+    expected: float,
+):
+    bracket = TransmissionBracket(1, 1e-6)
+    bracket.below_target = below_target
+    bracket.above_target = above_target
+
+    assert bracket.next_transmission(predicted, 2) == pytest.approx(expected)
+
+
+def test_transmission_bracket_raises_error_below_lower_transmission_limit():
+    bracket = TransmissionBracket(1, 0.01)
+    bracket.add(0.015, True)
+
+    with pytest.raises(AttenuationOptimisationFailedError):
+        bracket.next_transmission(0.001, 2)
+
+
+def simulate_deadtime(composite: OptimizeAttenuationComposite, rate: float):
+    """Make the xspress3mini measure the deadtime of a paralysable detector seeing a
+    count rate proportional to the transmission"""
+
+    def set_transmission(transmission: float):
+        deadtime = 1 - np.exp(-rate * transmission)
+        set_mock_value(composite.xspress3mini.channels[1].total_time, 1e6)
+        set_mock_value(composite.xspress3mini.channels[1].reset_ticks, 1e6 * deadtime)
+        return AsyncStatus(asyncio.sleep(0))
+
+    composite.attenuator.set = MagicMock(side_effect=set_transmission)
+
+
+def test_deadtime_search_finds_highest_transmission_below_threshold_within_increment(
+    run_engine: RunEngine,
+    fake_composite_mocked_sets: OptimizeAttenuationComposite,
+):
+    rate = 2.0
+    threshold = 0.002
+    simulate_deadtime(fake_composite_mocked_sets, rate)
+
+    transmission = run_engine(
+        deadtime_search_optimisation(
+            fake_composite_mocked_sets,
+            transmission=1e-5,
+            increment=1.1,
+            deadtime_threshold=threshold,
+            max_cycles=10,
+            upper_transmission_limit=0.1,
+            lower_transmission_limit=1e-6,
+        )
+    ).plan_result  # type: ignore
+
+    optimal_transmission = -np.log(1 - threshold) / rate
+    assert optimal_transmission / 1.1 <= transmission <= optimal_transmission
+    assert fake_composite_mocked_sets.xspress3mini.stage.call_count == 3  # type: ignore
+
+
+def test_deadtime_search_returns_upper_transmission_limit_if_deadtime_is_acceptable(
+    run_engine: RunEngine,
+    fake_composite_mocked_sets: OptimizeAttenuationComposite,
+):
+    simulate_deadtime(fake_composite_mocked_sets, 0.001)
+
+    transmission = run_engine(
+        deadtime_search_optimisation(
+            fake_composite_mocked_sets,
+            transmission=0.1,
+            increment=2,
+            deadtime_threshold=0.002,
+            max_cycles=10,
+            upper_transmission_limit=0.1,
+            lower_transmission_limit=1e-6,
+        )
+    ).plan_result  # type: ignore
+
+    assert transmission == 0.1
+    assert fake_composite_mocked_sets.xspress3mini.stage.call_count == 1  # type: ignore
+
+
+def test_deadtime_search_raises_error_after_max_cycles(
+    run_engine: RunEngine,
+    fake_composite_mocked_sets: OptimizeAttenuationComposite,
+):
+    simulate_deadtime(fake_composite_mocked_sets, 2.0)
+
+    with pytest.raises(AttenuationOptimisationFailedError):
+        run_engine(
+            deadtime_search_optimisation(
+                fake_composite_mocked_sets,
+                transmission=1e-5,
+                increment=1.0001,
+                deadtime_threshold=0.002,
+                max_cycles=2,
+                upper_transmission_limit=0.1,
+                lower_transmission_limit=1e-6,
+            )
+        )
+
+
+def test_total_counts_search_gets_within_target_even_if_counts_are_not_linear(
+    run_engine: RunEngine,
+    fake_composite_mocked_sets: OptimizeAttenuationComposite,
+):
+    def set_transmission(transmission: float):
+        counts = 1e6 * transmission**0.5
+        set_mock_value(
+            fake_composite_mocked_sets.xspress3mini.dt_corrected_latest_mca[1],
+            np.array([counts]),
+        )
+        return AsyncStatus(asyncio.sleep(0))
+
+    fake_composite_mocked_sets.attenuator.set = MagicMock(side_effect=set_transmission)
+
+    transmission = run_engine(
+        total_counts_search_optimisation(
+            fake_composite_mocked_sets,
+            transmission=0.1,
+            low_roi=0,
+            high_roi=1,
+            lower_count_limit=20000,
+            upper_count_limit=50000,
+            target_count=35000,
+            max_cycles=10,
+            upper_transmission_limit=0.1,
+            lower_transmission_limit=1e-6,
+        )
+    ).plan_result  # type: ignore
+
+    assert 20000 <= 1e6 * transmission**0.5 <= 50000
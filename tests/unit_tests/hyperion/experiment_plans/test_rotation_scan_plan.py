@@ -38,13 +38,17 @@ from mx_bluesky.common.external_interaction.ispyb.ispyb_store import (
     StoreInIspyb,
 )
 from mx_bluesky.common.external_interaction.nexus.nexus_utils import AxisDirection
+from mx_bluesky.common.parameters.components import WithSnapshot
 from mx_bluesky.common.parameters.constants import DocDescriptorNames
 from mx_bluesky.common.utils.exceptions import ISPyBDepositionNotMadeError
+from mx_bluesky.common.utils.snapshot_policy import GridSnapshotGeometry
 from mx_bluesky.hyperion.experiment_plans.rotation_scan_plan import (
     RotationMotionProfile,
     RotationScanComposite,
     calculate_motion_profile,
+    estimate_rotation_s,
     rotation_scan,
+    rotation_scan_internal,
     rotation_scan_plan,
 )
 from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
@@ -195,6 +199,18 @@ def test_rotation_scan_calculations(test_rotation_params: RotationScan):
     assert motion_values.distance_to_move_deg == -180.3075
 
 
+def test_rotation_duration_estimated_from_motion_profile(
+    test_rotation_params: RotationScan,
+):
+    params = next(test_rotation_params.single_rotation_scans)
+    params.exposure_time_s = 0.2
+
+    estimate_s = estimate_rotation_s(params, 0.005, 224)
+
+    # 180.3075 deg at 0.5 deg/s, exposing for 360s plus offsets
+    assert estimate_s == pytest.approx(360.615)
+
+
 @patch(
     "dodal.common.beamlines.beamline_utils.active_device_is_same_type",
     lambda a, b: True,
@@ -363,7 +379,9 @@ def test_rotation_plan_reads_hardware(
     )
     msgs_in_event = list(takewhile(lambda msg: msg.command != "save", msgs))
     assert_message_and_return_remaining(
-        msgs_in_event, lambda msg: msg.command == "read" and msg.obj.name == "smargon"
+        msgs_in_event,
+        lambda msg: msg.command == "read"
+        and fake_create_rotation_devices.smargon in msg.obj.readables,
     )
 
 
@@ -1079,7 +1097,7 @@ def _run_multi_rotation_plan(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_docs_emitted(
@@ -1151,7 +1169,7 @@ def test_full_multi_rotation_plan_docs_emitted(
     "mx_bluesky.hyperion.external_interaction.callbacks.rotation.nexus_callback.NexusWriter"
 )
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_nexus_writer_called_correctly(
@@ -1192,7 +1210,7 @@ def test_full_multi_rotation_plan_nexus_writer_called_correctly(
 
 @pytest.mark.timeout(3)
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_nexus_files_written_correctly(
@@ -1312,7 +1330,7 @@ def test_full_multi_rotation_plan_nexus_files_written_correctly(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_ispyb_called_correctly(
@@ -1351,7 +1369,7 @@ def test_full_multi_rotation_plan_ispyb_called_correctly(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_ispyb_interaction_end_to_end(
@@ -1411,7 +1429,7 @@ def test_full_multi_rotation_plan_ispyb_interaction_end_to_end(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_full_multi_rotation_plan_arms_eiger_asynchronously_and_disarms(
@@ -1444,7 +1462,7 @@ def test_full_multi_rotation_plan_arms_eiger_asynchronously_and_disarms(
     "mx_bluesky.hyperion.external_interaction.callbacks.rotation.ispyb_callback.StoreInIspyb"
 )
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_zocalo_callback_end_only_gets_called_after_eiger_unstage(
@@ -1489,7 +1507,7 @@ def test_zocalo_callback_end_only_gets_called_after_eiger_unstage(
     "mx_bluesky.hyperion.external_interaction.callbacks.rotation.ispyb_callback.StoreInIspyb"
 )
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_zocalo_start_and_end_not_triggered_if_ispyb_ids_not_present(
@@ -1519,7 +1537,7 @@ def test_zocalo_start_and_end_not_triggered_if_ispyb_ids_not_present(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_ispyb_triggered_before_zocalo(
@@ -1561,7 +1579,7 @@ def test_ispyb_triggered_before_zocalo(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_zocalo_start_and_end_called_once_for_each_collection(
@@ -1600,7 +1618,7 @@ def test_zocalo_start_and_end_called_once_for_each_collection(
 
 
 @patch(
-    "mx_bluesky.hyperion.experiment_plans.rotation_scan_plan.check_topup_and_wait_if_necessary",
+    "mx_bluesky.common.plan_stubs.check_topup.check_topup_and_wait_if_necessary",
     autospec=True,
 )
 def test_given_different_sample_ids_for_each_collection_then_each_ispyb_entry_uses_a_different_sample_id(
@@ -1684,3 +1702,72 @@ def test_multi_rotation_scan_does_not_verify_undulator_gap_until_before_run(
     msgs = assert_message_and_return_remaining(
         msgs, lambda msg: msg.command == "open_run"
     )
+
+
+@pytest.mark.parametrize(
+    "snapshot_omegas_deg, chi_at_grid_snapshots_deg, expected_omegas_triggered",
+    [
+        ([0, 270], 23.85, []),
+        ([0, 270], 0, [0, 270]),
+        ([0, 90], 23.85, [0, 90]),
+        ([0.0, 90.0, 180.0, 270.0], 23.85, [90.0, 180.0]),
+        ([0.0, 90.0, 180.0, 270.0], 0, [0.0, 90.0, 180.0, 270.0]),
+    ],
+)
+def test_rotation_snapshots_generated_from_grid_snapshots_if_sample_still_in_view(
+    sim_run_engine: RunEngineSimulator,
+    fake_create_rotation_devices: RotationScanComposite,
+    test_rotation_params: RotationScan,
+    oav_parameters_for_rotation: OAVParameters,
+    snapshot_omegas_deg: list[float],
+    chi_at_grid_snapshots_deg: float,
+    expected_omegas_triggered: list[float],
+):
+    test_rotation_params.snapshot_omegas_deg = snapshot_omegas_deg
+    _add_sim_handlers_for_normal_operation(fake_create_rotation_devices, sim_run_engine)
+    for signal, size in (("x_size", 1024), ("y_size", 768)):
+        sim_run_engine.add_read_handler_for(
+            getattr(fake_create_rotation_devices.oav.grid_snapshot, signal), size
+        )
+    grid_snapshots = [
+        GridSnapshotGeometry(
+            sample_pos_mm=(0.1, 0.1, 0.1),
+            omega_deg=omega_deg,
+            chi_deg=chi_at_grid_snapshots_deg,
+            phi_deg=0.47,
+            beam_centre_px=(512, 384),
+            microns_per_pixel=(1.5, 1.5),
+        )
+        for omega_deg in (0, -90)
+    ]
+
+    msgs = sim_run_engine.simulate_plan(
+        rotation_scan_internal(
+            fake_create_rotation_devices,
+            test_rotation_params,
+            oav_parameters_for_rotation,
+            grid_snapshots=grid_snapshots,
+        )
+    )
+
+    omegas_triggered = []
+    omega_deg = None
+    for msg in msgs:
+        if msg.command == "set" and msg.obj.name == "smargon-omega":
+            omega_deg = msg.args[0]
+        elif msg.command == "trigger" and msg.obj.name == "oav-snapshot":
+            omegas_triggered.append(omega_deg)
+    assert omegas_triggered == expected_omegas_triggered
+    rotation_start = next(
+        msg
+        for msg in msgs
+        if msg.command == "open_run"
+        and msg.kwargs.get("subplan_name") == CONST.PLAN.ROTATION_OUTER
+    )
+    with_snapshot = WithSnapshot.model_validate_json(
+        rotation_start.kwargs["with_snapshot"]
+    )
+    assert with_snapshot.use_grid_snapshots == (
+        expected_omegas_triggered != snapshot_omegas_deg
+    )
+    assert (with_snapshot.snapshot_omegas_deg or []) == expected_omegas_triggered
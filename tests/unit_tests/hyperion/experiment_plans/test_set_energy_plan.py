@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from bluesky.plan_stubs import null
 from bluesky.simulators import assert_message_and_return_remaining
 from bluesky.utils import Msg
 from dodal.devices.xbpm_feedback import Pause
@@ -89,3 +90,30 @@ def test_set_energy_does_nothing_if_no_energy_specified(
 ):
     messages = sim_run_engine.simulate_plan(set_energy_plan(None, set_energy_composite))
     assert not messages
+
+
+@patch(
+    "mx_bluesky.hyperion.experiment_plans.set_energy_plan.dcm_pitch_roll_mirror_adjuster.adjust_dcm_pitch_roll_vfm_from_lut",
+    return_value=iter([Msg("adjust_dcm_pitch_roll_vfm_from_lut")]),
+)
+def test_set_energy_does_nothing_if_already_at_energy(
+    mock_dcm_pra,
+    sim_run_engine,
+    set_energy_composite,
+):
+    def already_adjusted(*args):
+        yield from null()
+        return True
+
+    with patch(
+        "mx_bluesky.hyperion.experiment_plans.set_energy_plan.is_adjusted_for_energy",
+        side_effect=already_adjusted,
+    ) as mock_is_adjusted:
+        messages = sim_run_engine.simulate_plan(
+            set_energy_plan(11100, set_energy_composite)
+        )
+
+    mock_is_adjusted.assert_called_once_with(
+        set_energy_composite.undulator_dcm, set_energy_composite.vfm, 11.1
+    )
+    assert [msg.command for msg in messages] == ["null"]
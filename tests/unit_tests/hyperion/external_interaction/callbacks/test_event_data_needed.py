@@ -0,0 +1,89 @@
+import ast
+import inspect
+
+import pytest
+
+from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    setup_callbacks,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.event_data_needed import (
+    CALLBACKS_USING_EVENT_DATA,
+    event_data_needed_by_callbacks,
+)
+
+
+def _is_event_data(node: ast.expr) -> bool:
+    """Whether the node is doc["data"] or a variable named data taken from it."""
+    if isinstance(node, ast.Name):
+        return node.id == "data"
+    return (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.slice, ast.Constant)
+        and node.slice.value == "data"
+    )
+
+
+def _event_data_keys_read(source: str) -> set[str]:
+    keys = set()
+    for node in ast.walk(ast.parse(source)):
+        match node:
+            case ast.Subscript(
+                value=value, slice=ast.Constant(value=str() as key), ctx=ast.Load()
+            ) if _is_event_data(value):
+                keys.add(key)
+            case ast.Call(
+                func=ast.Attribute(value=value, attr="get"),
+                args=[ast.Constant(value=str() as key), *_],
+            ) if _is_event_data(value):
+                keys.add(key)
+    return keys
+
+
+def test_event_data_needed_by_callbacks_covers_every_callback_and_what_it_emits_to():
+    callbacks = setup_callbacks()
+    needed = event_data_needed_by_callbacks()
+    while callbacks:
+        callback = callbacks.pop()
+        for descriptor_name, data_keys in getattr(
+            callback, "EVENT_DATA_NEEDED", {}
+        ).items():
+            assert descriptor_name in needed
+            assert needed[descriptor_name] is None or set(data_keys) <= set(
+                needed[descriptor_name]
+            )
+        if emit := getattr(callback, "emit_cb", None):
+            callbacks.append(emit)
+
+
+@pytest.mark.parametrize(
+    "callback", CALLBACKS_USING_EVENT_DATA, ids=lambda callback: callback.__name__
+)
+def test_every_event_data_key_a_callback_reads_is_declared(callback: type):
+    declared = callback.EVENT_DATA_NEEDED.values()
+    if None in declared:
+        return
+    declared_keys = set().union(*declared)
+    keys_read = set()
+    for cls in callback.__mro__:
+        if "EVENT_DATA_NEEDED" in vars(cls):
+            keys_read |= _event_data_keys_read(
+                inspect.getsource(inspect.getmodule(cls))
+            )
+
+    assert keys_read - declared_keys == set()
+
+
+def test_event_data_keys_read_finds_subscripts_and_gets():
+    source = (
+        'a = doc["data"]["read-by-subscript"]\n'
+        'b = doc["data"].get("read-by-get", None)\n'
+        'data = doc["data"]\n'
+        'c = data["read-from-variable"]\n'
+        'data["written"] = 1\n'
+    )
+
+    assert _event_data_keys_read(source) == {
+        "read-by-subscript",
+        "read-by-get",
+        "read-from-variable",
+    }
@@ -10,8 +10,12 @@ from dodal.log import LOGGER as DODAL_LOGGER
 from mx_bluesky.common.external_interaction.alerting.log_based_service import (
     LoggingAlertService,
 )
+from mx_bluesky.common.external_interaction.callbacks.common.document_publisher import (
+    deserialise_document,
+)
 from mx_bluesky.common.utils.log import ISPYB_ZOCALO_CALLBACK_LOGGER, NEXUS_LOGGER
 from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    log_new_memory_watermark,
     main,
     setup_callbacks,
     setup_logging,
@@ -77,6 +81,7 @@ def test_setup_threads(_):
     proxy, dispatcher, start_proxy, start_dispatcher = setup_threads()
     assert isinstance(proxy, Proxy)
     assert isinstance(dispatcher, RemoteDispatcher)
+    assert dispatcher._deserializer is deserialise_document
     assert isinstance(start_proxy, Callable)
     assert isinstance(start_dispatcher, Callable)
 
@@ -90,3 +95,18 @@ def test_wait_for_threads_forever_calls_time_sleep(mock_sleep: MagicMock):
 
     wait_for_threads_forever(mock_threads)
     assert mock_sleep.call_count == 1
+
+
+@patch("mx_bluesky.hyperion.external_interaction.callbacks.__main__.log_info")
+@patch("mx_bluesky.hyperion.external_interaction.callbacks.__main__.resource")
+def test_memory_watermark_is_only_logged_when_peak_memory_grows_enough(
+    mock_resource: MagicMock, mock_log_info: MagicMock
+):
+    mock_resource.getrusage.return_value.ru_maxrss = 105 * 1024
+    assert log_new_memory_watermark(100 * 1024) == 100 * 1024
+    mock_log_info.assert_not_called()
+
+    mock_resource.getrusage.return_value.ru_maxrss = 120 * 1024
+    assert log_new_memory_watermark(100 * 1024) == 120 * 1024
+    mock_log_info.assert_called_once()
+    assert "120 MB" in mock_log_info.call_args.args[0]
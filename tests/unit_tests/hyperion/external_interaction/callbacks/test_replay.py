@@ -0,0 +1,173 @@
+import os
+from pathlib import Path
+from time import monotonic
+
+import ispyb
+import pytest
+from bluesky import plan_stubs as bps
+from bluesky import preprocessors as bpp
+from bluesky.callbacks import CallbackBase
+from bluesky.run_engine import RunEngine
+from ophyd_async.core import soft_signal_rw
+
+import mx_bluesky.common.external_interaction.callbacks.common.zocalo_callback as zocalo_callback
+from mx_bluesky.common.external_interaction.callbacks.common.document_filter import (
+    DocumentForwardingFilter,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.document_publisher import (
+    deserialise_document,
+    serialise_document,
+)
+from mx_bluesky.common.external_interaction.callbacks.common.document_recorder import (
+    DocumentRecorder,
+)
+from mx_bluesky.hyperion.experiment_plans.rotation_scan_plan import rotation_scan
+from mx_bluesky.hyperion.external_interaction.callbacks.__main__ import (
+    create_rotation_callbacks,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.event_data_needed import (
+    event_data_needed_by_callbacks,
+)
+from mx_bluesky.hyperion.external_interaction.callbacks.replay import (
+    main,
+    replay_documents,
+    stand_in_external_services,
+)
+from mx_bluesky.hyperion.parameters.rotation import RotationScan
+
+from .....conftest import raw_params_from_file
+
+
+class CountingCallback(CallbackBase):
+    def __init__(self):
+        super().__init__()
+        self.starts = 0
+
+    def start(self, doc):
+        self.starts += 1
+
+
+class FailingCallback(CallbackBase):
+    def event(self, doc):
+        raise ValueError("Failed")
+
+
+@pytest.fixture
+def recording(run_engine: RunEngine, tmp_path: Path) -> Path:
+    path = tmp_path / "run.pkl.gz"
+    signal = soft_signal_rw(float, name="signal")
+    with DocumentRecorder(path) as recorder:
+        run_engine.subscribe(recorder)
+        run_engine(bpp.run_wrapper(bps.trigger_and_read([signal])))
+    return path
+
+
+def test_replay_times_each_callback_and_counts_errors(recording: Path):
+    counting, failing = CountingCallback(), FailingCallback()
+
+    report = replay_documents(recording, [counting, failing])
+
+    assert counting.starts == 1
+    assert report.documents == 4
+    assert report.documents_per_s > 0
+    assert report.peak_memory_bytes is not None
+    counting_timing, failing_timing = report.callback_timings
+    assert counting_timing.callback == "CountingCallback"
+    assert counting_timing.documents == failing_timing.documents == 4
+    assert counting_timing.errors == 0
+    assert failing_timing.errors == 1
+    assert "FailingCallback" in str(report)
+
+
+def test_replay_in_realtime_keeps_recorded_spacing(tmp_path: Path):
+    path = tmp_path / "run.pkl.gz"
+    with DocumentRecorder(path) as recorder:
+        recorder("start", {"uid": "run"})
+        start = monotonic()
+        while monotonic() - start < 0.2:
+            pass
+        recorder("stop", {"uid": "stop", "run_start": "run"})
+
+    fast = replay_documents(path, [CountingCallback()], trace_memory=False)
+    realtime = replay_documents(path, [CountingCallback()], realtime=True)
+
+    assert fast.elapsed_s < 0.1
+    assert realtime.elapsed_s >= 0.2
+    assert fast.peak_memory_bytes is None
+
+
+def test_stand_ins_are_removed_afterwards():
+    original_open = ispyb.open
+    original_trigger = zocalo_callback.ZocaloTrigger
+    original_config = os.environ.get("ISPYB_CONFIG_PATH")
+
+    with stand_in_external_services():
+        assert ispyb.open is not original_open
+        assert os.environ["ISPYB_CONFIG_PATH"] != original_config
+
+    assert ispyb.open is original_open
+    assert zocalo_callback.ZocaloTrigger is original_trigger
+    assert os.environ.get("ISPYB_CONFIG_PATH") == original_config
+
+
+@pytest.fixture
+def params(tmp_path):
+    return RotationScan(
+        **raw_params_from_file(
+            "tests/test_data/parameter_json_files/good_test_one_multi_rotation_scan_parameters.json",
+            tmp_path,
+        )
+    )
+
+
+@pytest.mark.timeout(5)
+@pytest.mark.parametrize(
+    "published_with_msgpack, filtered", [(False, False), (True, False), (True, True)]
+)
+def test_recorded_rotation_scan_replays_into_callbacks_with_stand_ins(
+    params: RotationScan,
+    fake_create_rotation_devices,
+    oav_parameters_for_rotation,
+    run_engine: RunEngine,
+    tmp_path: Path,
+    published_with_msgpack: bool,
+    filtered: bool,
+):
+    path = tmp_path / "rotation.pkl.gz"
+    with DocumentRecorder(path) as recorder:
+        publisher = (
+            (
+                lambda name, doc: recorder(
+                    name, deserialise_document(serialise_document(doc))
+                )
+            )
+            if published_with_msgpack
+            else recorder
+        )
+        document_filter = DocumentForwardingFilter(
+            publisher, event_data_needed_by_callbacks()
+        )
+        run_engine.subscribe(document_filter if filtered else publisher)
+        run_engine(
+            rotation_scan(
+                fake_create_rotation_devices, params, oav_parameters_for_rotation
+            )
+        )
+
+    with stand_in_external_services() as stand_in_calls:
+        report = replay_documents(path, create_rotation_callbacks())
+
+    assert report.documents == recorder.documents_recorded
+    assert all(timing.errors == 0 for timing in report.callback_timings)
+    assert stand_in_calls.calls["ispyb.upsert_data_collection_group"] >= 1
+    assert stand_in_calls.calls["zocalo.run_start"] == 1
+    assert stand_in_calls.calls["zocalo.run_end"] == 1
+    assert stand_in_calls.calls["nexus.create_nexus_file"] == 1
+
+
+def test_main_prints_report(recording: Path, capsys: pytest.CaptureFixture):
+    main([str(recording)])
+
+    output = capsys.readouterr().out
+    assert "Replayed 4 documents" in output
+    assert "GridscanISPyBCallback" in output
@@ -2,6 +2,7 @@ import json
 from collections.abc import Generator
 from math import isclose
 from pathlib import PosixPath
+from threading import Event, Thread, current_thread
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,12 +10,16 @@ from dodal.devices.zebra.zebra import RotationDirection
 
 from mx_bluesky.common.parameters.constants import GridscanParamConstants
 from mx_bluesky.hyperion.external_interaction.agamemnon import (
+    AGAMEMNON_TIMEOUT_S,
+    AgamemnonComparisonService,
+    AgamemnonInstructionPrefetcher,
     _get_next_instruction,
     _get_pin_type_from_agamemnon_collect_parameters,
     _get_withenergy_parameters_from_agamemnon,
     _get_withvisit_parameters_from_agamemnon,
     _instruction_and_data,
     _PinType,
+    _session,
     _SinglePin,
     compare_params,
     create_parameters_from_agamemnon,
@@ -126,63 +131,64 @@ def test_given_unrecognised_multipin_in_parameters_then_warning_logged_single_pi
     assert "Expected multipin format" in str(e.value)
 
 
-def configure_mock_agamemnon(mock_requests: MagicMock, loop_type: str | None):
-    mock_requests.get.return_value.content = json.dumps(
+def configure_mock_agamemnon(mock_session: MagicMock, loop_type: str | None):
+    mock_session.get.return_value.content = json.dumps(
         {"collect": set_up_agamemnon_params(loop_type, "", 255, 0.9)}
     )
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_when_get_next_instruction_called_then_expected_agamemnon_url_queried(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
 ):
-    configure_mock_agamemnon(mock_requests, None)
+    configure_mock_agamemnon(mock_session, None)
     _get_next_instruction("i03")
-    mock_requests.get.assert_called_once_with(
+    mock_session.get.assert_called_once_with(
         "http://agamemnon.diamond.ac.uk/getnextcollect/i03",
         headers={"Accept": "application/json"},
+        timeout=AGAMEMNON_TIMEOUT_S,
     )
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_given_agamemnon_returns_an_unexpected_response_then_exception_is_thrown(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
 ):
-    mock_requests.get.return_value.content = json.dumps({"not_collect": ""})
+    mock_session.get.return_value.content = json.dumps({"not_collect": ""})
     with pytest.raises(KeyError) as e:
         create_parameters_from_agamemnon()
     assert "not_collect" in str(e.value)
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_given_agamemnon_returns_multipin_when_get_next_pin_type_from_agamemnon_called_then_multipin_returned(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
 ):
-    configure_mock_agamemnon(mock_requests, "multipin_6x50+98.1")
+    configure_mock_agamemnon(mock_session, "multipin_6x50+98.1")
     instruction, params = _instruction_and_data(_get_next_instruction("i03"))
     assert _get_pin_type_from_agamemnon_collect_parameters(params) == _PinType(
         6, 50, 98.1
     )
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_update_params_from_agamemnon_leaves_parameters_unchanged_when_agamemnon_fails(
-    mock_requests: MagicMock, load_centre_collect_params: LoadCentreCollect
+    mock_session: MagicMock, load_centre_collect_params: LoadCentreCollect
 ):
-    mock_requests.get.side_effect = Exception("Bad")
+    mock_session.get.side_effect = Exception("Bad")
     old_grid_width = load_centre_collect_params.robot_load_then_centre.grid_width_um
     params = update_params_from_agamemnon(load_centre_collect_params)
     assert params.robot_load_then_centre.grid_width_um == old_grid_width
 
 
 @patch("mx_bluesky.hyperion.external_interaction.agamemnon.compare_params")
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_update_params_from_agamemnon_changes_params_to_single_pin_when_agamemnon_gives_single_pin(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     mock_compare_params: MagicMock,
     load_centre_collect_params: LoadCentreCollect,
 ):
-    configure_mock_agamemnon(mock_requests, None)
+    configure_mock_agamemnon(mock_session, None)
     load_centre_collect_params.robot_load_then_centre.grid_width_um = 0
     load_centre_collect_params.select_centres.n = 0
     params = update_params_from_agamemnon(load_centre_collect_params)
@@ -194,13 +200,13 @@ def test_update_params_from_agamemnon_changes_params_to_single_pin_when_agamemno
 
 
 @patch("mx_bluesky.hyperion.external_interaction.agamemnon.compare_params")
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_update_params_from_agamemnon_applies_multipin_attribs_given_agamemnon_returns_multipin(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     mock_compare_params: MagicMock,
     load_centre_collect_params: LoadCentreCollect,
 ):
-    configure_mock_agamemnon(mock_requests, "multipin_6x50+10")
+    configure_mock_agamemnon(mock_session, "multipin_6x50+10")
     params = update_params_from_agamemnon(load_centre_collect_params)
     assert params.robot_load_then_centre.grid_width_um == 270
     assert params.select_centres.n == 6
@@ -208,25 +214,26 @@ def test_update_params_from_agamemnon_applies_multipin_attribs_given_agamemnon_r
     assert not params.multi_rotation_scan.snapshot_omegas_deg
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_update_params_from_agamemnon_deduces_correct_url_given_set_of_parameters(
-    mock_requests: MagicMock, load_centre_collect_params: LoadCentreCollect
+    mock_session: MagicMock, load_centre_collect_params: LoadCentreCollect
 ):
     update_params_from_agamemnon(load_centre_collect_params)
-    mock_requests.get.assert_called_once_with(
+    mock_session.get.assert_called_once_with(
         "http://agamemnon.diamond.ac.uk/getnextcollect/i03",
         headers={"Accept": "application/json"},
+        timeout=AGAMEMNON_TIMEOUT_S,
     )
 
 
 @patch("mx_bluesky.hyperion.external_interaction.agamemnon.LOGGER")
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_update_params_from_agamemnon_logs_warning_when_exception_occurs(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     mock_logger: MagicMock,
     load_centre_collect_params: LoadCentreCollect,
 ):
-    configure_mock_agamemnon(mock_requests, "multipin_unknown")
+    configure_mock_agamemnon(mock_session, "multipin_unknown")
 
     update_params_from_agamemnon(load_centre_collect_params)
 
@@ -282,7 +289,7 @@ def test_no_prefix_raises_exception():
         (Exception(), "Unexpected error occurred. Failed to compare parameters: "),
     ],
 )
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 @patch("mx_bluesky.hyperion.external_interaction.agamemnon.LOGGER")
 @patch(
     "mx_bluesky.hyperion.external_interaction.agamemnon._populate_parameters_from_agamemnon"
@@ -290,12 +297,12 @@ def test_no_prefix_raises_exception():
 def test_compare_params_logs_exception_if_fails_to_populate_parameters_from_hyperion(
     mock_populate_params,
     mock_logger,
-    mock_requests,
+    mock_session,
     mock_error,
     mock_log,
     load_centre_collect_params: LoadCentreCollect,
 ):
-    configure_mock_agamemnon(mock_requests, None)
+    configure_mock_agamemnon(mock_session, None)
     mock_populate_params.side_effect = mock_error
     compare_params(
         load_centre_collect_params,
@@ -322,12 +329,12 @@ def agamemnon_response(request) -> Generator[str, None, None]:
     with (
         patch("mx_bluesky.common.parameters.components.os", new=MagicMock()),
         patch(
-            "mx_bluesky.hyperion.external_interaction.agamemnon.requests"
-        ) as mock_requests,
+            "mx_bluesky.hyperion.external_interaction.agamemnon._session"
+        ) as mock_session,
         open(request.param) as json_file,
     ):
         example_json = json_file.read()
-        mock_requests.get.return_value.content = example_json
+        mock_session.get.return_value.content = example_json
         yield example_json
 
 
@@ -513,20 +520,20 @@ def test_get_withenergy_parameters_from_agamemnon_when_no_wavelength():
     assert demand_energy_ev["demand_energy_ev"] is None
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_create_parameters_from_agamemnon_returns_empty_list_if_collect_instruction_is_empty(
-    mock_requests,
+    mock_session,
 ):
-    mock_requests.get.return_value.content = json.dumps({"collect": {}})
+    mock_session.get.return_value.content = json.dumps({"collect": {}})
     params = create_parameters_from_agamemnon()
     assert params == []
 
 
-@patch("mx_bluesky.hyperion.external_interaction.agamemnon.requests")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
 def test_create_parameters_from_agamemnon_returns_empty_list_if_no_instruction(
-    mock_requests,
+    mock_session,
 ):
-    mock_requests.get.return_value.content = json.dumps({})
+    mock_session.get.return_value.content = json.dumps({})
     params = create_parameters_from_agamemnon()
     assert params == []
 
@@ -551,3 +558,210 @@ def test_create_parameters_from_agamemnon_creates_wait(agamemnon_response):
     assert len(params) == 1
     assert isinstance(params[0], Wait)
     assert params[0].duration_s == 12.34
+
+
+def _prefetch_and_wait(prefetcher: AgamemnonInstructionPrefetcher, sample_id: int):
+    prefetcher.start(sample_id)
+    prefetcher._prefetch.exception(timeout=1)  # type: ignore
+
+
+def test_agamemnon_session_is_reused_between_requests():
+    with patch(
+        "mx_bluesky.hyperion.external_interaction.agamemnon._session"
+    ) as mock_session:
+        mock_session.get.return_value.content = json.dumps({})
+        create_parameters_from_agamemnon()
+        create_parameters_from_agamemnon()
+    assert mock_session.get.call_count == 2
+
+
+def test_prefetcher_returns_prefetched_instruction_without_fetching_again(
+    load_centre_collect_params: LoadCentreCollect,
+):
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    fetch = MagicMock(return_value=[next_params])
+    prefetcher = AgamemnonInstructionPrefetcher(fetch)
+
+    _prefetch_and_wait(prefetcher, 1)
+
+    assert prefetcher.next_instruction() == [next_params]
+    fetch.assert_called_once()
+
+
+def test_prefetcher_fetches_if_nothing_prefetched(
+    load_centre_collect_params: LoadCentreCollect,
+):
+    fetch = MagicMock(return_value=[load_centre_collect_params])
+    prefetcher = AgamemnonInstructionPrefetcher(fetch)
+
+    assert prefetcher.next_instruction() == [load_centre_collect_params]
+    fetch.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "prefetched",
+    [[], Exception("Agamemnon unavailable"), "current_sample"],
+    ids=["empty", "failed", "current_sample"],
+)
+def test_prefetcher_fetches_again_if_prefetched_instruction_cannot_be_used(
+    prefetched, load_centre_collect_params: LoadCentreCollect
+):
+    if prefetched == "current_sample":
+        prefetched = [load_centre_collect_params]
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    fetch = MagicMock(side_effect=[prefetched, [next_params]])
+    prefetcher = AgamemnonInstructionPrefetcher(fetch)
+
+    _prefetch_and_wait(prefetcher, load_centre_collect_params.sample_id)
+
+    assert prefetcher.next_instruction() == [next_params]
+    assert fetch.call_count == 2
+
+
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.monotonic")
+def test_prefetcher_fetches_again_if_prefetched_instruction_is_too_old(
+    mock_monotonic: MagicMock, load_centre_collect_params: LoadCentreCollect
+):
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    later_params = load_centre_collect_params.model_copy(update={"sample_id": 3})
+    fetch = MagicMock(side_effect=[[next_params], [later_params]])
+    prefetcher = AgamemnonInstructionPrefetcher(fetch, max_age_s=60)
+    mock_monotonic.side_effect = [100, 161]
+
+    _prefetch_and_wait(prefetcher, 1)
+
+    assert prefetcher.next_instruction() == [later_params]
+
+
+def test_prefetcher_fetches_again_if_prefetch_does_not_finish_in_time(
+    load_centre_collect_params: LoadCentreCollect,
+):
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    prefetch_stalled = Event()
+
+    def fetch():
+        if current_thread().name == "agamemnon_prefetch":
+            prefetch_stalled.wait(timeout=5)
+            return []
+        return [next_params]
+
+    prefetcher = AgamemnonInstructionPrefetcher(fetch, timeout_s=0.1)
+    prefetcher.start(1)
+
+    assert prefetcher.next_instruction() == [next_params]
+    prefetch_stalled.set()
+
+
+def test_agamemnon_requests_in_different_threads_use_different_sessions():
+    sessions = []
+
+    def get_session():
+        sessions.append(_session.session)
+
+    thread = Thread(target=get_session)
+    thread.start()
+    thread.join()
+    get_session()
+
+    assert sessions[0] is not sessions[1]
+
+
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.LOGGER")
+def test_prefetcher_warns_when_unused_collection_is_discarded(
+    mock_logger: MagicMock, load_centre_collect_params: LoadCentreCollect
+):
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    prefetcher = AgamemnonInstructionPrefetcher(MagicMock(return_value=[next_params]))
+
+    _prefetch_and_wait(prefetcher, 1)
+    prefetcher.discard()
+
+    mock_logger.warning.assert_called_once_with(
+        "Discarding unused prefetched collection of samples [2]"
+    )
+
+
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.compare_params")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
+def test_comparison_service_fetches_once_to_update_and_compare(
+    mock_session: MagicMock,
+    mock_compare_params: MagicMock,
+    load_centre_collect_params: LoadCentreCollect,
+):
+    configure_mock_agamemnon(mock_session, "multipin_6x50+10")
+    service = AgamemnonComparisonService()
+
+    params = service.update_and_compare(load_centre_collect_params)
+    service.shutdown()
+
+    mock_session.get.assert_called_once()
+    assert params.select_centres.n == 6
+    compared_params, instruction = mock_compare_params.call_args.args
+    assert compared_params == params
+    assert compared_params is not params
+    assert instruction == json.loads(mock_session.get.return_value.content)
+
+
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.compare_params")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
+def test_comparison_service_returns_before_comparison_is_complete(
+    mock_session: MagicMock,
+    mock_compare_params: MagicMock,
+    load_centre_collect_params: LoadCentreCollect,
+):
+    configure_mock_agamemnon(mock_session, None)
+    release_comparison = Event()
+    comparison_finished = Event()
+
+    def slow_comparison(*args):
+        release_comparison.wait(1)
+        comparison_finished.set()
+
+    mock_compare_params.side_effect = slow_comparison
+    service = AgamemnonComparisonService()
+
+    service.update_and_compare(load_centre_collect_params)
+    assert not comparison_finished.is_set()
+    release_comparison.set()
+    service.shutdown()
+    assert comparison_finished.is_set()
+
+
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.compare_params")
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon._session")
+def test_comparison_service_leaves_parameters_unchanged_if_agamemnon_fails(
+    mock_session: MagicMock,
+    mock_compare_params: MagicMock,
+    load_centre_collect_params: LoadCentreCollect,
+):
+    mock_session.get.side_effect = Exception("Bad")
+    old_grid_width = load_centre_collect_params.robot_load_then_centre.grid_width_um
+    service = AgamemnonComparisonService()
+
+    params = service.update_and_compare(load_centre_collect_params)
+    service.shutdown()
+
+    assert params.robot_load_then_centre.grid_width_um == old_grid_width
+    mock_compare_params.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "agamemnon_response",
+    ["tests/test_data/agamemnon/example_native.json"],
+    indirect=True,
+)
+@patch("mx_bluesky.hyperion.external_interaction.agamemnon.LOGGER")
+@patch("mx_bluesky.hyperion.parameters.rotation.os", new=MagicMock())
+@patch("dodal.devices.detector.detector.Path", new=MagicMock())
+@patch("dodal.utils.os", new=MagicMock())
+def test_compare_params_uses_supplied_instruction_without_fetching(
+    mock_logger: MagicMock,
+    agamemnon_response: str,
+    load_centre_collect_params: LoadCentreCollect,
+):
+    with patch(
+        "mx_bluesky.hyperion.external_interaction.agamemnon._session"
+    ) as mock_session:
+        compare_params(load_centre_collect_params, json.loads(agamemnon_response))
+    mock_session.get.assert_not_called()
+    mock_logger.warning.assert_not_called()
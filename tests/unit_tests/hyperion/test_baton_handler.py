@@ -3,14 +3,14 @@ from asyncio import run_coroutine_threadsafe, sleep
 from concurrent.futures import Executor
 from contextlib import nullcontext
 from dataclasses import fields
-from threading import Event
-from typing import Any
+from threading import Event, Timer
 from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 from blueapi.core import BlueskyContext
 from bluesky import Msg
 from bluesky import plan_stubs as bps
+from bluesky import preprocessors as bpp
 from bluesky.run_engine import RunEngine
 from bluesky.simulators import RunEngineSimulator, assert_message_and_return_remaining
 from dodal.devices.baton import Baton
@@ -23,6 +23,7 @@ from mx_bluesky.common.parameters.components import (
     MxBlueskyParameters,
 )
 from mx_bluesky.common.parameters.constants import Status
+from mx_bluesky.common.plan_stubs.wait_for_signal import wait_for_signal_value
 from mx_bluesky.common.utils.context import (
     device_composite_from_context,
     find_device_in_context,
@@ -41,6 +42,7 @@ from mx_bluesky.hyperion.experiment_plans.load_centre_collect_full_plan import (
 )
 from mx_bluesky.hyperion.external_interaction.alerting.constants import Subjects
 from mx_bluesky.hyperion.parameters.components import Wait
+from mx_bluesky.hyperion.parameters.constants import CONST
 from mx_bluesky.hyperion.parameters.load_centre_collect import LoadCentreCollect
 from mx_bluesky.hyperion.plan_runner import PlanError, PlanRunner
 from mx_bluesky.hyperion.utils.context import setup_context
@@ -229,7 +231,7 @@ def udc_runner(bluesky_context: BlueskyContext, run_engine: RunEngine) -> PlanRu
 @pytest.fixture
 def mock_load_centre_collect():
     with (
-        patch("mx_bluesky.hyperion.baton_handler.create_devices"),
+        patch("mx_bluesky.hyperion.plan_runner.DeviceCompositeFactory.create"),
         patch(
             "mx_bluesky.hyperion.baton_handler.load_centre_collect_full"
         ) as mock_plan,
@@ -247,28 +249,61 @@ def mock_create_params_from_agamemnon():
 
 
 @patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
-@patch("mx_bluesky.hyperion.baton_handler.bps.sleep")
+@patch("mx_bluesky.common.plan_stubs.wait_for_signal.bps.sleep")
 @pytest.mark.timeout(10)
-def test_loop_until_hyperion_requested(
+def test_wait_until_hyperion_requested_without_polling(
     mock_sleep: MagicMock,
     udc_runner: PlanRunner,
     bluesky_context: BlueskyContext,
     mock_create_params_from_agamemnon: MagicMock,
+    run_engine: RunEngine,
 ):
     baton = baton_with_requested_user(bluesky_context, NO_USER)
-    number_of_sleep_calls = 5
 
-    def set_hyperion_requested(*args):
-        yield from bps.null()
-        set_mock_value(baton.requested_user, HYPERION_USER)
+    def request_baton_for_hyperion():
+        run_engine.loop.call_soon_threadsafe(
+            set_mock_value, baton.requested_user, HYPERION_USER
+        )
 
-    mock_calls: list[Any] = [MagicMock()] * (number_of_sleep_calls - 1)
-    mock_calls.append(set_hyperion_requested())
-    mock_sleep.side_effect = mock_calls
+    request_timer = Timer(0.2, request_baton_for_hyperion)
+    request_timer.start()
 
     run_udc_when_requested(bluesky_context, udc_runner)
 
-    assert mock_sleep.call_count == number_of_sleep_calls
+    request_timer.join()
+    mock_sleep.assert_not_called()
+    assert get_mock_put(baton.current_user).mock_calls[0] == call(
+        HYPERION_USER, wait=True
+    )
+
+
+@patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
+@patch("mx_bluesky.hyperion.baton_handler.BATON_MONITOR_TIMEOUT_S", new=0.05)
+@pytest.mark.timeout(10)
+def test_wait_for_baton_resubscribes_after_monitor_timeout(
+    udc_runner: PlanRunner,
+    bluesky_context: BlueskyContext,
+    mock_create_params_from_agamemnon: MagicMock,
+    run_engine: RunEngine,
+):
+    baton = baton_with_requested_user(bluesky_context, NO_USER)
+
+    def request_baton_for_hyperion():
+        run_engine.loop.call_soon_threadsafe(
+            set_mock_value, baton.requested_user, HYPERION_USER
+        )
+
+    request_timer = Timer(0.3, request_baton_for_hyperion)
+    request_timer.start()
+
+    with patch(
+        "mx_bluesky.hyperion.baton_handler.wait_for_signal_value",
+        side_effect=wait_for_signal_value,
+    ) as mock_wait:
+        run_udc_when_requested(bluesky_context, udc_runner)
+
+    request_timer.join()
+    assert mock_wait.call_count > 1
 
 
 @patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
@@ -467,6 +502,95 @@ def test_initialise_udc_reloads_all_devices(dont_patch_clear_devices):
         )
 
 
+@patch.dict(os.environ, {"BEAMLINE": "i03"})
+def test_initialise_udc_with_incremental_reconnect_keeps_connected_devices(
+    dont_patch_clear_devices,
+):
+    context = setup_context(True)
+    devices_before_reset: LoadCentreCollectComposite = device_composite_from_context(
+        context, LoadCentreCollectComposite
+    )
+
+    _initialise_udc(context, True, incremental_reconnect=True)
+
+    devices_after_reset: LoadCentreCollectComposite = device_composite_from_context(
+        context, LoadCentreCollectComposite
+    )
+
+    for f in fields(devices_after_reset):
+        assert getattr(devices_before_reset, f.name) is getattr(
+            devices_after_reset, f.name
+        )
+
+
+@patch("mx_bluesky.hyperion.baton_handler.reconnect_devices", new=MagicMock())
+@patch("mx_bluesky.hyperion.baton_handler.set_commissioning_signal", new=MagicMock())
+@patch("mx_bluesky.hyperion.baton_handler._get_baton", new=MagicMock())
+@patch("mx_bluesky.hyperion.baton_handler.get_panda_config_manager")
+@patch("mx_bluesky.hyperion.baton_handler.get_setpoint_cache")
+def test_initialise_udc_forgets_setpoints_of_the_previous_session(
+    mock_get_setpoint_cache: MagicMock, mock_get_panda_config_manager: MagicMock
+):
+    _initialise_udc(MagicMock(), True, incremental_reconnect=True)
+    mock_get_setpoint_cache.return_value.clear.assert_called_once()
+    mock_get_panda_config_manager.return_value.clear.assert_called_once()
+
+
+@patch("mx_bluesky.hyperion.baton_handler.reconnect_devices")
+@patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
+def test_run_udc_when_requested_uses_incremental_reconnect_if_configured(
+    mock_reconnect_devices: MagicMock,
+    patch_setup_devices: MagicMock,
+    bluesky_context: BlueskyContext,
+    mock_create_params_from_agamemnon: MagicMock,
+):
+    udc_runner = PlanRunner(bluesky_context, True, incremental_device_reconnect=True)
+
+    run_udc_when_requested(bluesky_context, udc_runner)
+
+    mock_reconnect_devices.assert_called_once_with(bluesky_context, True)
+    patch_setup_devices.assert_not_called()
+
+
+@patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
+def test_run_udc_when_requested_clears_device_composites_of_the_previous_session(
+    bluesky_context: BlueskyContext,
+    mock_create_params_from_agamemnon: MagicMock,
+):
+    udc_runner = PlanRunner(bluesky_context, True)
+
+    with patch.object(udc_runner.composite_factory, "clear") as mock_clear:
+        run_udc_when_requested(bluesky_context, udc_runner)
+
+    mock_clear.assert_called_once()
+
+
+@patch("mx_bluesky.hyperion.baton_handler.create_parameters_from_agamemnon")
+@patch("mx_bluesky.hyperion.baton_handler._move_to_udc_default_state", new=MagicMock())
+def test_run_udc_when_requested_uses_prefetched_instructions_if_configured(
+    agamemnon: MagicMock,
+    bluesky_context: BlueskyContext,
+    mock_load_centre_collect: MagicMock,
+    load_centre_collect_params: LoadCentreCollect,
+    dont_patch_clear_devices,
+):
+    next_params = load_centre_collect_params.model_copy(update={"sample_id": 2})
+    agamemnon.side_effect = [[load_centre_collect_params], [next_params], [], []]
+    mock_load_centre_collect.side_effect = lambda *_: bpp.run_wrapper(
+        bps.null(), md={"subplan_name": CONST.PLAN.ROTATION_MULTI}
+    )
+    udc_runner = PlanRunner(bluesky_context, True, prefetch_agamemnon_instructions=True)
+
+    run_udc_when_requested(bluesky_context, udc_runner)
+
+    assert [c.args[1] for c in mock_load_centre_collect.call_args_list] == [
+        load_centre_collect_params,
+        next_params,
+    ]
+    # The final empty prefetch is confirmed before the baton is released
+    assert agamemnon.call_count == 4
+
+
 @patch(
     "mx_bluesky.hyperion.baton_handler.create_parameters_from_agamemnon",
     MagicMock(
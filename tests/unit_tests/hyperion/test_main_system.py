@@ -409,6 +409,87 @@ def test_cli_args_parse(arg_list, parsed_arg_values):
     assert test_args.dev_mode == parsed_arg_values[0]
 
 
+@pytest.mark.parametrize(
+    "arg_list, expected_incremental_reconnect",
+    [(["--incremental-device-reconnect"], True), ([], False)],
+)
+def test_cli_args_parse_incremental_device_reconnect(
+    arg_list, expected_incremental_reconnect
+):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.incremental_device_reconnect == expected_incremental_reconnect
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_prefetch",
+    [(["--prefetch-agamemnon-instructions"], True), ([], False)],
+)
+def test_cli_args_parse_prefetch_agamemnon_instructions(arg_list, expected_prefetch):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.prefetch_agamemnon_instructions == expected_prefetch
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_virtual_time",
+    [(["--dev", "--virtual-time"], True), (["--dev"], False)],
+)
+def test_cli_args_parse_virtual_time(arg_list, expected_virtual_time):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.virtual_time == expected_virtual_time
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_queued_publisher",
+    [(["--queued-publisher"], True), ([], False)],
+)
+def test_cli_args_parse_queued_publisher(arg_list, expected_queued_publisher):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.queued_publisher == expected_queued_publisher
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_filter",
+    [(["--filter-published-documents"], True), ([], False)],
+)
+def test_cli_args_parse_filter_published_documents(arg_list, expected_filter):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.filter_published_documents == expected_filter
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_elide",
+    [(["--elide-unchanged-setpoints"], True), ([], False)],
+)
+def test_cli_args_parse_elide_unchanged_setpoints(arg_list, expected_elide):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.elide_unchanged_setpoints == expected_elide
+
+
+@pytest.mark.parametrize(
+    "arg_list, expected_metrics_file",
+    [
+        (["--metrics-file", "/tmp/metrics.jsonl"], Path("/tmp/metrics.jsonl")),
+        ([], None),
+    ],
+)
+def test_cli_args_parse_metrics_file(arg_list, expected_metrics_file):
+    argv[1:] = arg_list
+    test_args = parse_cli_args()
+    assert test_args.metrics_file == expected_metrics_file
+
+
+def test_cli_args_reject_virtual_time_without_dev_mode():
+    argv[1:] = ["--virtual-time"]
+    with pytest.raises(SystemExit):
+        parse_cli_args()
+
+
 @pytest.mark.skip(
     "Wait for connection doesn't play nice with ophyd-async. See https://github.com/DiamondLightSource/hyperion/issues/1159"
 )
@@ -566,6 +647,47 @@ def test_context_created_with_dev_mode(dev_mode: bool, mock_setup_context: Magic
     mock_setup_context.assert_called_once_with(dev_mode=dev_mode)
 
 
+@pytest.mark.parametrize("virtual_time", [False, True])
+@patch("mx_bluesky.hyperion.__main__.use_virtual_time")
+def test_virtual_time_used_only_if_requested(
+    mock_use_virtual_time: MagicMock, virtual_time: bool, mock_setup_context: MagicMock
+):
+    with (
+        patch(
+            "sys.argv",
+            new=["hyperion", "--dev", *(["--virtual-time"] if virtual_time else [])],
+        ),
+        patch("mx_bluesky.hyperion.__main__.create_app"),
+        patch("mx_bluesky.hyperion.__main__.GDARunner.wait_on_queue"),
+    ):
+        main()
+
+    if virtual_time:
+        run_engine, timings = mock_use_virtual_time.call_args.args
+        assert run_engine is mock_setup_context.return_value.run_engine
+        assert timings.distribution_for("robot") is not None
+    else:
+        mock_use_virtual_time.assert_not_called()
+
+
+@patch("mx_bluesky.hyperion.__main__.AgamemnonComparisonService")
+def test_agamemnon_comparison_service_shut_down_when_gda_runner_shuts_down(
+    mock_comparison_service: MagicMock, mock_setup_context: MagicMock
+):
+    with (
+        patch("sys.argv", new=["hyperion", "--dev"]),
+        patch("mx_bluesky.hyperion.__main__.create_app") as mock_create_app,
+        patch("mx_bluesky.hyperion.__main__.GDARunner.wait_on_queue"),
+    ):
+        main()
+
+    assert (
+        mock_create_app.call_args.kwargs["comparison_service"]
+        is mock_comparison_service.return_value
+    )
+    mock_comparison_service.return_value.shutdown.assert_called_once()
+
+
 @patch("mx_bluesky.hyperion.__main__.do_default_logging_setup")
 @patch("mx_bluesky.hyperion.__main__.alerting.set_alerting_service")
 def test_initialise_configures_logging(
@@ -580,6 +702,25 @@ def test_initialise_configures_logging(
     )
 
 
+@pytest.mark.parametrize("metrics_file", [Path("/tmp/metrics.jsonl"), None])
+@patch("mx_bluesky.hyperion.__main__.setup_tracing")
+@patch("mx_bluesky.hyperion.__main__.do_default_logging_setup", MagicMock())
+@patch("mx_bluesky.hyperion.__main__.alerting.set_alerting_service", MagicMock())
+def test_initialise_writes_metrics_to_file_only_if_requested(
+    mock_setup_tracing: MagicMock, metrics_file: Path | None
+):
+    args = HyperionArgs(mode=HyperionMode.GDA, metrics_file=metrics_file)
+
+    initialise_globals(args)
+
+    if metrics_file:
+        mock_setup_tracing.assert_called_once_with(
+            metrics_file=metrics_file, export_otlp=False
+        )
+    else:
+        mock_setup_tracing.assert_not_called()
+
+
 @patch("mx_bluesky.hyperion.__main__.do_default_logging_setup")
 @patch("mx_bluesky.hyperion.__main__.alerting.set_alerting_service")
 def test_initialise_configures_alerting(
@@ -649,6 +790,21 @@ def test_hyperion_in_gda_mode_doesnt_start_udc_loop(
     mock_gda_runner.assert_called_once()
 
 
+@patch("mx_bluesky.hyperion.__main__.setup_context", MagicMock())
+@patch("mx_bluesky.hyperion.baton_handler.find_device_in_context", MagicMock())
+@patch("mx_bluesky.hyperion.runner.GDARunner.wait_on_queue", MagicMock())
+@patch("mx_bluesky.hyperion.__main__.run_forever", MagicMock())
+@patch("mx_bluesky.hyperion.runner.BaseRunner.close_publisher")
+@pytest.mark.parametrize("mode", ["gda", "udc"])
+def test_hyperion_sends_queued_documents_on_shutdown(
+    mock_close_publisher: MagicMock, mock_flask_thread: MagicMock, mode: str
+):
+    with patch("sys.argv", new=["hyperion", "--mode", mode, "--queued-publisher"]):
+        main()
+
+    mock_close_publisher.assert_called_once()
+
+
 @patch("mx_bluesky.hyperion.__main__.Api")
 @patch("mx_bluesky.hyperion.__main__.setup_context", MagicMock())
 @patch("mx_bluesky.hyperion.baton_handler.find_device_in_context", MagicMock())
@@ -698,7 +854,10 @@ def test_sending_main_process_sigterm_in_udc_mode_performs_clean_prompt_shutdown
         plan_runner = mock_create_udc_server.mock_calls[0].args[0]
         context = plan_runner.context
         baton = find_device_in_context(context, "baton", Baton)
-        set_mock_value(baton.requested_user, HYPERION_USER)
+        # The baton is monitored, so the mock value must be set on the event loop
+        plan_runner.run_engine.loop.call_soon_threadsafe(
+            set_mock_value, baton.requested_user, HYPERION_USER
+        )
         while len(mock_create_parameters_from_agamemnon.mock_calls) == 0:
             sleep(0.2)
         os.kill(os.getpid(), signal.SIGTERM)
@@ -6,6 +6,7 @@ import pytest
 from blueapi.core import BlueskyContext
 from bluesky import RunEngine
 from bluesky.utils import MsgGenerator
+from ophyd_async.core import soft_signal_rw
 
 from mx_bluesky.common.parameters.constants import Actions, Status
 from mx_bluesky.common.utils.exceptions import WarningError
@@ -99,3 +100,63 @@ def test_wait_on_queue_stop_interrupts_running_plan(
     stop_task = launch_test_in_runner_event_loop(wait_and_then_stop, runner, executor)
     runner.wait_on_queue()
     assert stop_task.done()
+
+
+@pytest.mark.parametrize("queued_publisher", [False, True])
+@patch("mx_bluesky.hyperion.runner.QueuedPublisher")
+@patch("mx_bluesky.hyperion.runner.Publisher")
+def test_runner_publishes_documents_with_the_requested_publisher(
+    mock_publisher: MagicMock,
+    mock_queued_publisher: MagicMock,
+    context: BlueskyContext,
+    queued_publisher: bool,
+):
+    runner = GDARunner(context, queued_publisher=queued_publisher)
+
+    expected, other = (
+        (mock_queued_publisher, mock_publisher)
+        if queued_publisher
+        else (mock_publisher, mock_queued_publisher)
+    )
+    expected.assert_called_once_with("localhost:5577")
+    other.assert_not_called()
+    assert runner._publisher is expected.return_value
+
+
+@patch("mx_bluesky.hyperion.runner.QueuedPublisher")
+def test_runner_sends_queued_documents_when_publisher_closed(
+    mock_queued_publisher: MagicMock, context: BlueskyContext
+):
+    runner = GDARunner(context, queued_publisher=True)
+
+    runner.close_publisher()
+
+    mock_queued_publisher.return_value.close.assert_called_once()
+
+
+@pytest.mark.parametrize("filter_published_documents", [False, True])
+@patch("mx_bluesky.hyperion.runner.Publisher")
+def test_runner_filters_published_documents_only_if_requested(
+    mock_publisher: MagicMock,
+    run_engine: RunEngine,
+    filter_published_documents: bool,
+):
+    GDARunner(
+        MagicMock(run_engine=run_engine),
+        filter_published_documents=filter_published_documents,
+    )
+
+    signal = soft_signal_rw(float, name="signal")
+
+    def plan():
+        yield from bps.open_run()
+        yield from bps.trigger_and_read([signal], name="not_needed_by_callbacks")
+        yield from bps.close_run()
+
+    run_engine(plan())
+
+    published = [c.args[0] for c in mock_publisher.return_value.call_args_list]
+    if filter_published_documents:
+        assert published == ["start", "stop"]
+    else:
+        assert published == ["start", "descriptor", "event", "stop"]
@@ -1,3 +1,5 @@
+import asyncio
+from typing import get_type_hints
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pydantic
@@ -7,10 +9,17 @@ from bluesky import RunEngine
 from ophyd.device import Device
 
 from mx_bluesky.common.utils.context import (
+    DeviceCompositeFactory,
     device_composite_from_context,
     find_device_in_context,
 )
-from mx_bluesky.hyperion.utils.context import setup_devices
+from mx_bluesky.hyperion.utils.context import (
+    DeviceConnectionAction,
+    _representative_signal,
+    clear_all_device_caches,
+    reconnect_devices,
+    setup_devices,
+)
 
 
 class _DeviceType1(Device):
@@ -77,6 +86,89 @@ def test_device_composite_from_context():
     assert isinstance(composite.device2, _DeviceType2)
 
 
+def _make_composite_type():
+    @pydantic.dataclasses.dataclass(config={"arbitrary_types_allowed": True})
+    class _Composite:
+        device1: _DeviceType1
+        device2: _DeviceType2
+
+    return _Composite
+
+
+def _context_with_devices(devices: dict[str, Device]) -> MagicMock:
+    context = MagicMock()
+    context.find_device = devices.get
+    return context
+
+
+def test_device_composite_from_context_resolves_type_hints_once_per_type():
+    composite_type = _make_composite_type()
+    context = _context_with_devices(
+        {
+            "device1": MagicMock(spec=_DeviceType1),
+            "device2": MagicMock(spec=_DeviceType2),
+        }
+    )
+
+    with patch(
+        "mx_bluesky.common.utils.context.get_type_hints", side_effect=get_type_hints
+    ) as mock_get_type_hints:
+        device_composite_from_context(context, composite_type)
+        device_composite_from_context(context, composite_type)
+
+    mock_get_type_hints.assert_called_once_with(composite_type)
+
+
+def test_device_composite_factory_reuses_composite_if_devices_unchanged():
+    composite_type = _make_composite_type()
+    context = _context_with_devices(
+        {
+            "device1": MagicMock(spec=_DeviceType1),
+            "device2": MagicMock(spec=_DeviceType2),
+        }
+    )
+    factory = DeviceCompositeFactory(context)
+
+    assert factory.create(composite_type) is factory.create(composite_type)
+
+
+def test_device_composite_factory_recreates_composite_when_devices_change():
+    composite_type = _make_composite_type()
+    devices: dict[str, Device] = {
+        "device1": MagicMock(spec=_DeviceType1),
+        "device2": MagicMock(spec=_DeviceType2),
+    }
+    factory = DeviceCompositeFactory(_context_with_devices(devices))
+    first_composite = factory.create(composite_type)
+
+    new_device2 = MagicMock(spec=_DeviceType2)
+    devices["device2"] = new_device2
+    second_composite = factory.create(composite_type)
+
+    assert second_composite is not first_composite
+    assert second_composite.device1 is first_composite.device1
+    assert second_composite.device2 is new_device2
+
+
+def test_device_composite_factory_logs_build_time():
+    composite_type = _make_composite_type()
+    context = _context_with_devices(
+        {
+            "device1": MagicMock(spec=_DeviceType1),
+            "device2": MagicMock(spec=_DeviceType2),
+        }
+    )
+    factory = DeviceCompositeFactory(context)
+
+    with patch("mx_bluesky.common.utils.context.LOGGER") as mock_logger:
+        factory.create(composite_type)
+        factory.create(composite_type)
+
+    info_messages = [c.args[0] for c in mock_logger.info.mock_calls]
+    assert info_messages[0].startswith("Created _Composite in ")
+    assert info_messages[1].startswith("Reused _Composite in ")
+
+
 def test_setup_devices_raises_on_exception(use_beamline_t01, run_engine: RunEngine):
     context = BlueskyContext(run_engine=run_engine)
 
@@ -87,3 +179,102 @@ def test_setup_devices_raises_on_exception(use_beamline_t01, run_engine: RunEngi
     ):
         with pytest.raises(ExceptionGroup):
             setup_devices(context, True)
+
+
+def test_reconnect_devices_reuses_connected_devices(
+    use_beamline_t01, run_engine: RunEngine
+):
+    context = BlueskyContext(run_engine=run_engine)
+    setup_devices(context, True)
+    devices_before = dict(context.devices)
+
+    reports = reconnect_devices(context, True)
+
+    assert context.devices == devices_before
+    assert {name: report.action for name, report in reports.items()} == {
+        "baton": DeviceConnectionAction.REUSED,
+        "xbpm_feedback": DeviceConnectionAction.REUSED,
+    }
+
+
+def test_reconnect_devices_creates_and_connects_missing_devices(
+    use_beamline_t01, run_engine: RunEngine
+):
+    context = BlueskyContext(run_engine=run_engine)
+    clear_all_device_caches(context)
+
+    reports = reconnect_devices(context, True)
+
+    assert set(context.devices.keys()) == {"baton", "xbpm_feedback"}
+    assert all(
+        report.action == DeviceConnectionAction.CONNECTED for report in reports.values()
+    )
+
+
+def test_reconnect_devices_only_reconnects_stale_devices(
+    use_beamline_t01, run_engine: RunEngine
+):
+    context = BlueskyContext(run_engine=run_engine)
+    clear_all_device_caches(context)
+    baton = use_beamline_t01.baton()
+    context.register_device(baton)
+    setup_devices(context, True)
+
+    with patch(
+        "mx_bluesky.hyperion.utils.context._is_live",
+        AsyncMock(side_effect=lambda device: device is not baton),
+    ):
+        reports = reconnect_devices(context, True)
+
+    assert reports["baton"].action == DeviceConnectionAction.CONNECTED
+    assert reports["xbpm_feedback"].action == DeviceConnectionAction.REUSED
+
+
+def test_reconnect_devices_reconnects_devices_that_no_longer_respond(
+    use_beamline_t01, run_engine: RunEngine
+):
+    context = BlueskyContext(run_engine=run_engine)
+    setup_devices(context, True)
+    baton = use_beamline_t01.baton()
+    signal = _representative_signal(baton)
+    assert signal is not None
+
+    with patch.object(signal, "read", AsyncMock(side_effect=TimeoutError())):
+        reports = reconnect_devices(context, True)
+
+    assert reports["baton"].action == DeviceConnectionAction.CONNECTED
+    assert reports["xbpm_feedback"].action == DeviceConnectionAction.REUSED
+
+
+def test_reconnect_devices_raises_on_exception(use_beamline_t01, run_engine: RunEngine):
+    context = BlueskyContext(run_engine=run_engine)
+    clear_all_device_caches(context)
+
+    with patch.object(
+        use_beamline_t01.baton(),
+        "connect",
+        AsyncMock(side_effect=RuntimeError("Simulated exception")),
+    ):
+        with pytest.raises(ExceptionGroup):
+            reconnect_devices(context, True)
+
+
+def test_reconnect_devices_reports_the_time_spent_checking_reused_devices(
+    use_beamline_t01, run_engine: RunEngine
+):
+    context = BlueskyContext(run_engine=run_engine)
+    setup_devices(context, True)
+
+    async def slow_liveness_check(device):
+        await asyncio.sleep(0.05)
+        return True
+
+    with patch(
+        "mx_bluesky.hyperion.utils.context._is_live", side_effect=slow_liveness_check
+    ):
+        reports = reconnect_devices(context, True)
+
+    assert all(
+        report.action == DeviceConnectionAction.REUSED and report.duration_s >= 0.05
+        for report in reports.values()
+    )
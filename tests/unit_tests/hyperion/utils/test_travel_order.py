@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from bluesky.run_engine import RunEngine
+from dodal.devices.smargon import Smargon
+from ophyd_async.testing import set_mock_value
+
+from mx_bluesky.hyperion.utils.travel_order import (
+    DEFAULT_ACCELERATION_TIME_S,
+    DEFAULT_OMEGA_VELOCITY_DEG_S,
+    EXACT_ORDERING_LIMIT,
+    AxisMotion,
+    GonioMotion,
+    order_for_least_travel,
+    read_gonio_motion,
+    travel_time_s,
+)
+
+AXIS = AxisMotion(velocity=2, acceleration_time_s=0.5)
+MOTION = GonioMotion(AXIS, AXIS, AXIS, AxisMotion(100, 0.5))
+ORIGIN = np.array([0, 0, 0])
+
+
+@pytest.mark.parametrize(
+    "distance, expected_time_s",
+    [(0, 0), (0.25, 0.5), (-0.25, 0.5), (1, 1), (3, 2)],
+)
+def test_move_time_accelerates_to_velocity_and_back(
+    distance: float, expected_time_s: float
+):
+    assert AXIS.move_time_s(distance) == pytest.approx(expected_time_s)
+
+
+def test_translation_time_is_that_of_the_slowest_axis():
+    motion = GonioMotion(AXIS, AxisMotion(1, 0.5), AXIS, AXIS)
+    assert motion.translation_time_s(
+        ORIGIN, np.array([3000, 2000, 0])
+    ) == pytest.approx(2.5)
+
+
+def test_omega_moves_hide_translations_made_at_the_same_time():
+    locations_um = [np.array([3000, 0, 0]), np.array([4000, 0, 0])]
+
+    assert travel_time_s(MOTION, ORIGIN, locations_um, [0, 0]) == pytest.approx(3)
+    assert travel_time_s(MOTION, ORIGIN, locations_um, [5, 0]) == pytest.approx(6)
+
+
+def test_omega_moves_made_after_translations_add_to_their_time():
+    locations_um = [np.array([3000, 0, 0]), np.array([4000, 0, 0])]
+
+    assert travel_time_s(
+        MOTION, ORIGIN, locations_um, [5, 0], omega_after_translation=True
+    ) == pytest.approx(8)
+
+
+def test_order_only_relies_on_omega_hiding_translations_if_they_are_made_together():
+    locations_um = [np.array([3000, 0, 0]), np.array([0, 1000, 0])]
+
+    assert order_for_least_travel(MOTION, ORIGIN, locations_um, [3, 0]) == [0, 1]
+    assert order_for_least_travel(
+        MOTION, ORIGIN, locations_um, [3, 0], omega_after_translation=True
+    ) == [1, 0]
+
+
+def test_order_avoids_moving_back_and_forth():
+    locations_um = [
+        np.array([100, 0, 0]),
+        np.array([200, 1000, 0]),
+        np.array([300, 0, 0]),
+    ]
+
+    assert order_for_least_travel(MOTION, ORIGIN, locations_um, [0, 0, 0]) == [
+        0,
+        2,
+        1,
+    ]
+
+
+def test_order_is_unchanged_if_nothing_is_quicker():
+    locations_um = [np.array([100, 0, 0]), np.array([-100, 0, 0])]
+
+    assert order_for_least_travel(MOTION, ORIGIN, locations_um, [0, 0]) == [0, 1]
+
+
+def test_many_locations_are_ordered_by_heuristic():
+    locations_um = [np.array([x * 100, 0, 0]) for x in range(EXACT_ORDERING_LIMIT + 3)]
+    shuffled = np.random.default_rng(0).permutation(len(locations_um))
+
+    order = order_for_least_travel(
+        MOTION,
+        ORIGIN,
+        [locations_um[i] for i in shuffled],
+        [0] * len(locations_um),
+    )
+
+    assert [shuffled[i] for i in order] == list(range(len(locations_um)))
+
+
+def test_gonio_motion_uses_the_velocity_moves_are_made_at(
+    run_engine: RunEngine, smargon: Smargon
+):
+    set_mock_value(smargon.x.velocity, 1.5)
+    set_mock_value(smargon.x.max_velocity, 3)
+    set_mock_value(smargon.x.acceleration_time, 0.1)
+
+    motion: GonioMotion = run_engine(read_gonio_motion(smargon)).plan_result  # type: ignore
+
+    assert motion.x == AxisMotion(1.5, 0.1)
+
+
+def test_gonio_motion_falls_back_to_max_velocity_then_defaults_if_not_reported(
+    run_engine: RunEngine, smargon: Smargon
+):
+    set_mock_value(smargon.x.velocity, 0)
+    set_mock_value(smargon.x.max_velocity, 3)
+    set_mock_value(smargon.x.acceleration_time, 0.1)
+    set_mock_value(smargon.omega.velocity, 0)
+    set_mock_value(smargon.omega.max_velocity, 0)
+
+    motion: GonioMotion = run_engine(read_gonio_motion(smargon)).plan_result  # type: ignore
+
+    assert motion.x == AxisMotion(3, 0.1)
+    assert motion.omega == AxisMotion(
+        DEFAULT_OMEGA_VELOCITY_DEG_S, DEFAULT_ACCELERATION_TIME_S
+    )